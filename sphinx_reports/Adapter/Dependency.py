@@ -1,26 +1,296 @@
-from importlib.metadata import metadata as importlib_metadata
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Adapter resolving the transitive dependencies of installed Python distributions.**
 
-from packaging import metadata
-from pyTooling.Decorators import export, readonly
+:class:`DistributionIndex` indexes all installed distributions by normalized name. :class:`DependencyScanner` walks the
+``Requires-Dist`` entries of a distribution's metadata and builds a graph of
+:class:`~sphinx_reports.DataModel.Dependency.Distribution` instances.
+"""
+from importlib.metadata import Distribution as importlib_Distribution, PackageMetadata, distributions
+from sys                import path as sys_path
+from typing             import ClassVar, Dict, Iterable, List, Optional as Nullable, Set, Tuple
 
-from sphinx_reports.DataModel.Dependency import Distribution
+from packaging.markers      import UndefinedEnvironmentName
+from packaging.requirements import Requirement, InvalidRequirement
+from packaging.utils        import canonicalize_name
+from pyTooling.Decorators   import export, readonly
+
+from sphinx_reports.Common               import ReportExtensionError
+from sphinx_reports.DataModel.Dependency import Distribution, VersionSpecifier, License
 
 # Further Reading:
 # * https://stackoverflow.com/questions/17194301/is-there-any-way-to-show-the-dependency-trees-for-pip-packages
 # * https://www.python.org/success-stories/building-a-dependency-graph-of-our-python-codebase/
 # * https://github.com/thebjorn/pydeps
 # * https://docs.python.org/3/library/importlib.metadata.html
+# * https://packaging.python.org/en/latest/specifications/core-metadata/
+
+
+@export
+class DependencyError(ReportExtensionError):
+	pass
+
+
+@export
+class DistributionIndex:
+	"""
+	An index of all installed distributions, keyed by normalized distribution name.
+
+	The index is created by a single iteration of :func:`importlib.metadata.distributions`. Names are derived from the
+	``*.dist-info`` directory names, so no metadata file is read while indexing. A distribution's metadata is parsed on
+	first access and memoized afterwards.
+
+	If a distribution is found multiple times on the search path, the first one wins like in :mod:`importlib.metadata`.
+	"""
+	_indices:       ClassVar[Dict[Tuple[str, ...], "DistributionIndex"]] = {}
+
+	_distributions: Dict[str, importlib_Distribution]
+	_metadata:      Dict[str, PackageMetadata]
+	_requirements:  Dict[str, List[Requirement]]
+
+	def __init__(self, paths: Nullable[Iterable[str]] = None) -> None:
+		"""
+		Index all distributions found on the given search paths.
+
+		:param paths: List of search paths. If ``None``, :data:`sys.path` is used.
+		"""
+		self._distributions = {}
+		self._metadata = {}
+		self._requirements = {}
+
+		found = distributions() if paths is None else distributions(path=list(paths))
+		for distribution in found:
+			# PathDistribution derives the name from the directory name, other finders might read the metadata.
+			name = getattr(distribution, "_normalized_name", None)
+			if name is None:
+				metadata = distribution.metadata
+				if metadata is None or metadata.get("Name") is None:
+					continue
+				name = metadata.get("Name")
+
+			self._distributions.setdefault(canonicalize_name(name), distribution)
+
+	@classmethod
+	def Default(cls) -> "DistributionIndex":
+		"""
+		Return a shared index for the current :data:`sys.path`.
+
+		The index is created once per search path and shared by all directives of a Sphinx run.
+
+		:returns: The index of installed distributions.
+		"""
+		key = tuple(sys_path)
+		try:
+			return cls._indices[key]
+		except KeyError:
+			index = cls._indices[key] = cls()
+			return index
+
+	def __len__(self) -> int:
+		return len(self._distributions)
+
+	def __contains__(self, name: str) -> bool:
+		return canonicalize_name(name) in self._distributions
+
+	def Metadata(self, name: str) -> Nullable[PackageMetadata]:
+		"""
+		Return the (memoized) metadata of an installed distribution.
+
+		:param name: Distribution name (normalized or not).
+		:returns:    The distribution's metadata or ``None`` if the distribution isn't installed.
+		"""
+		key = canonicalize_name(name)
+		try:
+			return self._metadata[key]
+		except KeyError:
+			pass
+
+		try:
+			distribution = self._distributions[key]
+		except KeyError:
+			return None
+
+		metadata = self._metadata[key] = distribution.metadata
+		return metadata
+
+	def Requirements(self, name: str) -> List[Requirement]:
+		"""
+		Return the (memoized) parsed ``Requires-Dist`` entries of an installed distribution.
+
+		Malformed entries are skipped.
+
+		:param name: Distribution name (normalized or not).
+		:returns:    List of requirements. Empty, if the distribution isn't installed.
+		"""
+		key = canonicalize_name(name)
+		try:
+			return self._requirements[key]
+		except KeyError:
+			pass
+
+		requirements = []
+		if (metadata := self.Metadata(key)) is not None:
+			for line in metadata.get_all("Requires-Dist") or []:
+				try:
+					requirements.append(Requirement(line))
+				except InvalidRequirement:
+					pass
+
+		self._requirements[key] = requirements
+		return requirements
+
+
+def _Licenses(metadata: PackageMetadata) -> List[License]:
+	"""
+	Extract license names from a distribution's metadata.
+
+	An SPDX ``License-Expression`` is preferred, then ``License :: ...`` trove classifiers and finally a short ``License``
+	field. Full license texts (which some projects put into the ``License`` field) are ignored.
+
+	:param metadata: Metadata of a distribution.
+	:returns:        List of licenses.
+	"""
+	if (expression := metadata.get("License-Expression")) is not None:
+		return [License(expression)]
+
+	licenses = [License(classifier.rsplit("::", 1)[1].strip()) for classifier in metadata.get_all("Classifier") or [] if classifier.startswith("License ::") and classifier.count("::") >= 2]
+	if len(licenses) > 0:
+		return licenses
+
+	if (license := metadata.get("License")) is not None and 0 < len(license) <= 64 and "\n" not in license.strip() and license.strip() != "UNKNOWN":
+		return [License(license.strip())]
+
+	return []
 
 
 @export
 class DependencyScanner:
-	_distribution: Distribution
+	"""
+	Resolve the transitive dependencies of an installed distribution.
+
+	Requirements are filtered by their environment markers, evaluated for the running interpreter. Extras requested in
+	the distribution name (e.g. ``sphinx-reports[doc]``) or by a requirement are followed. Each distribution is
+	represented by a single :class:`~sphinx_reports.DataModel.Dependency.Distribution` instance, so the result is a
+	graph and cycles are handled.
+	"""
+	_index:          DistributionIndex
+	_distributions:  Dict[str, Distribution]
+	_resolvedExtras: Dict[str, Set[str]]
+	_distribution:   Distribution
+
+	def __init__(self, distributionName: str, index: Nullable[DistributionIndex] = None) -> None:
+		"""
+		Resolve a distribution and its dependencies.
+
+		:param distributionName: Name of the distribution, optionally with extras.
+		:param index:            Index of installed distributions. If ``None``, a shared index is used.
+		:raises DependencyError: If the distribution name is malformed or the distribution isn't installed.
+		"""
+		self._index = DistributionIndex.Default() if index is None else index
+		self._distributions = {}
+		self._resolvedExtras = {}
+
+		try:
+			requirement = Requirement(distributionName)
+		except InvalidRequirement as ex:
+			raise DependencyError(f"Malformed distribution name '{distributionName}'.") from ex
+
+		if requirement.name not in self._index:
+			raise DependencyError(f"Distribution '{requirement.name}' is not installed.")
 
-	def __init__(self, distributionName: str) -> None:
-		md1 = importlib_metadata(distributionName)
+		self._distribution = self._Resolve(requirement)
 
-		self._distribution = Distribution(distributionName)
+	def _GetDistribution(self, name: str) -> Distribution:
+		key = canonicalize_name(name)
+		try:
+			return self._distributions[key]
+		except KeyError:
+			pass
+
+		if (metadata := self._index.Metadata(key)) is None:
+			distribution = Distribution(name)
+		else:
+			distribution = Distribution(metadata.get("Name"), VersionSpecifier(metadata.get("Version")), _Licenses(metadata))
+
+		self._distributions[key] = distribution
+		self._resolvedExtras[key] = set()
+		return distribution
+
+	def _Resolve(self, requirement: Requirement) -> Distribution:
+		root = self._GetDistribution(requirement.name)
+
+		# An empty extra ("") denotes a distribution's unconditional requirements.
+		worklist = [(canonicalize_name(requirement.name), {""} | {canonicalize_name(extra) for extra in requirement.extras})]
+		while worklist:
+			key, extras = worklist.pop()
+			extras = extras - self._resolvedExtras[key]
+			if len(extras) == 0:
+				continue
+
+			self._resolvedExtras[key] |= extras
+			distribution = self._distributions[key]
+			for dependency in self._index.Requirements(key):
+				if not self._IsRequired(dependency, extras):
+					continue
+
+				specifier = VersionSpecifier(str(dependency.specifier)) if len(dependency.specifier) > 0 else None
+				distribution.AddDependency(self._GetDistribution(dependency.name), specifier)
+				worklist.append((canonicalize_name(dependency.name), {""} | {canonicalize_name(extra) for extra in dependency.extras}))
+
+		return root
+
+	@staticmethod
+	def _IsRequired(requirement: Requirement, extras: Set[str]) -> bool:
+		if requirement.marker is None:
+			return "" in extras
+
+		for extra in extras:
+			try:
+				if requirement.marker.evaluate({"extra": extra}):
+					return True
+			except UndefinedEnvironmentName:
+				return False
+
+		return False
 
 	@readonly
 	def Distribution(self) -> Distribution:
 		return self._distribution
+
+	@readonly
+	def Distributions(self) -> Dict[str, Distribution]:
+		"""
+		Read-only property to access all resolved distributions.
+
+		:returns: A dictionary of distributions, keyed by normalized distribution name.
+		"""
+		return self._distributions
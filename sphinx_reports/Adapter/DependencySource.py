@@ -0,0 +1,349 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Adapter reading declared dependencies from project files without inspecting installed distributions.**
+
+Supported files are:
+
+* ``pyproject.toml`` (``[project]`` dependencies, optional dependencies, dependency groups, dynamic dependencies read
+  from files by setuptools and ``[build-system]`` requirements),
+* pip requirement files like ``requirements.txt`` (including ``-r`` includes) and
+* lock files: ``poetry.lock``, ``pdm.lock``, ``uv.lock``, ``pylock.toml`` and ``Pipfile.lock``.
+"""
+from hashlib  import sha256
+from json     import loads as json_loads
+from pathlib  import Path
+from tomllib  import loads as toml_loads, TOMLDecodeError
+from typing   import Any, ClassVar, Dict, Iterable, List, Optional as Nullable, Set, Tuple
+
+from packaging.requirements import Requirement, InvalidRequirement
+from packaging.utils        import canonicalize_name
+from pyTooling.Decorators   import export, readonly
+
+from sphinx_reports.Adapter.Dependency   import DependencyError
+from sphinx_reports.DataModel.Dependency import Distribution, VersionSpecifier
+
+
+@export
+class DependencySource:
+	"""
+	Read the declared dependencies of a project from a ``pyproject.toml``, requirement or lock file.
+
+	The root :class:`~sphinx_reports.DataModel.Dependency.Distribution` represents the file (or the project declared in
+	it). Requirements are not resolved against installed distributions, therefore versions are only known for lock files.
+
+	Instances are cached by :meth:`Load`. A cached instance is reused as long as the SHA-256 hashes of all files read
+	(including ``-r`` includes) are unchanged.
+	"""
+	_sources:      ClassVar[Dict[Path, "DependencySource"]] = {}
+
+	_file:         Path
+	_files:        Dict[Path, str]
+	_distribution: Distribution
+
+	def __init__(self, file: Path) -> None:
+		"""
+		Read a dependency source file.
+
+		:param file:             Path to a ``pyproject.toml``, requirement or lock file.
+		:raises DependencyError: If the file doesn't exist, is malformed or its kind isn't supported.
+		"""
+		self._file = file.resolve()
+		self._files = {}
+
+		name = self._file.name.lower()
+		if name == "pyproject.toml":
+			self._distribution = self._ReadPyProject(self._file)
+		elif name in ("poetry.lock", "pdm.lock", "uv.lock"):
+			self._distribution = self._ReadLockFile(self._file, "package")
+		elif name == "pylock.toml" or (name.startswith("pylock.") and name.endswith(".toml")):
+			self._distribution = self._ReadLockFile(self._file, "packages")
+		elif name == "pipfile.lock":
+			self._distribution = self._ReadPipfileLock(self._file)
+		elif name.endswith((".txt", ".in")):
+			self._distribution = Distribution(self._file.name)
+			self._ReadRequirementsFile(self._file, self._distribution)
+		else:
+			raise DependencyError(f"Unsupported dependency source file '{file}'.")
+
+	@classmethod
+	def Load(cls, file: Path) -> "DependencySource":
+		"""
+		Return a (cached) dependency source for the given file.
+
+		:param file:             Path to a ``pyproject.toml``, requirement or lock file.
+		:returns:                The dependency source.
+		:raises DependencyError: If the file can't be read.
+		"""
+		key = file.resolve()
+		try:
+			source = cls._sources[key]
+		except KeyError:
+			pass
+		else:
+			if all(cls._Hash(f) == h for f, h in source._files.items()):
+				return source
+
+		source = cls._sources[key] = cls(key)
+		return source
+
+	@staticmethod
+	def _Hash(file: Path) -> Nullable[str]:
+		try:
+			return sha256(file.read_bytes()).hexdigest()
+		except OSError:
+			return None
+
+	def _ReadText(self, file: Path) -> str:
+		try:
+			content = file.read_bytes()
+		except OSError as ex:
+			raise DependencyError(f"Can't read dependency source file '{file}'.") from ex
+
+		self._files[file] = sha256(content).hexdigest()
+		try:
+			return content.decode("utf-8")
+		except UnicodeDecodeError as ex:
+			raise DependencyError(f"Dependency source file '{file}' isn't UTF-8 encoded.") from ex
+
+	def _ReadTOML(self, file: Path) -> Dict[str, Any]:
+		try:
+			return toml_loads(self._ReadText(file))
+		except TOMLDecodeError as ex:
+			raise DependencyError(f"Malformed TOML file '{file}'.") from ex
+
+	@staticmethod
+	def _Specifier(requirement: Requirement) -> Nullable[VersionSpecifier]:
+		# Everything except the name: extras, specifier or URL and marker.
+		spec = str(requirement)[len(requirement.name):].strip()
+		return VersionSpecifier(spec) if spec != "" else None
+
+	def _AddRequirements(self, parent: Distribution, requirements: Iterable[str], location: Path) -> None:
+		for line in requirements:
+			try:
+				requirement = Requirement(line)
+			except InvalidRequirement as ex:
+				raise DependencyError(f"Malformed requirement '{line}' in '{location}'.") from ex
+
+			parent.AddDependency(Distribution(requirement.name), self._Specifier(requirement))
+
+	def _ReadRequirementsFile(self, file: Path, parent: Distribution, visited: Nullable[Set[Path]] = None) -> None:
+		"""
+		Read a pip requirement file and add all requirements to ``parent``.
+
+		Included files (``-r``/``--requirement``) are resolved relative to the including file and read once per top-level
+		file, so a file included by several top-level files adds its requirements to each parent. Constraint files,
+		editable installs, URLs and global options are ignored.
+
+		:param file:    The requirement file.
+		:param parent:  The distribution to add requirements to.
+		:param visited: Files already read for the current top-level file.
+		"""
+		if visited is None:
+			visited = set()
+		elif file in visited:
+			return
+		visited.add(file)
+
+		content = self._ReadText(file)
+		for line in content.replace("\\\n", "").splitlines():
+			line = line.split(" #", 1)[0].strip()
+			if line == "" or line.startswith("#"):
+				continue
+
+			if line.startswith("-"):
+				option, _, argument = line.replace("=", " ", 1).partition(" ")
+				if option in ("-r", "--requirement"):
+					self._ReadRequirementsFile((file.parent / argument.strip()).resolve(), parent, visited)
+				continue
+
+			# Drop pip's per-requirement options like '--hash=...'.
+			line = line.split(" --", 1)[0].strip()
+			try:
+				requirement = Requirement(line)
+			except InvalidRequirement:
+				continue
+
+			parent.AddDependency(Distribution(requirement.name), self._Specifier(requirement))
+
+	def _ReadPyProject(self, file: Path) -> Distribution:
+		pyproject = self._ReadTOML(file)
+		project = pyproject.get("project", {})
+
+		version = project.get("version")
+		root = Distribution(project.get("name", file.parent.name), None if version is None else VersionSpecifier(version))
+
+		self._AddRequirements(root, project.get("dependencies", []), file)
+
+		# setuptools: dependencies = { file = ["requirements.txt"] }
+		dynamic = pyproject.get("tool", {}).get("setuptools", {}).get("dynamic", {})
+		if "dependencies" in project.get("dynamic", []):
+			for requirementsFile in self._DynamicFiles(dynamic.get("dependencies")):
+				self._ReadRequirementsFile((file.parent / requirementsFile).resolve(), root)
+
+		groups: List[Tuple[str, Distribution]] = []
+		for extra, requirements in project.get("optional-dependencies", {}).items():
+			group = Distribution(f"{root.Name}[{extra}]")
+			self._AddRequirements(group, requirements, file)
+			groups.append((extra, group))
+
+		if "optional-dependencies" in project.get("dynamic", []):
+			for extra, files in dynamic.get("optional-dependencies", {}).items():
+				group = Distribution(f"{root.Name}[{extra}]")
+				for requirementsFile in self._DynamicFiles(files):
+					self._ReadRequirementsFile((file.parent / requirementsFile).resolve(), group)
+				groups.append((extra, group))
+
+		for groupName, entries in pyproject.get("dependency-groups", {}).items():
+			group = Distribution(f"{root.Name} (group: {groupName})")
+			# PEP 735: entries are requirement strings or tables including other groups.
+			self._AddRequirements(group, [entry for entry in entries if isinstance(entry, str)], file)
+			groups.append((groupName, group))
+
+		if len(buildRequirements := pyproject.get("build-system", {}).get("requires", [])) > 0:
+			group = Distribution(f"{root.Name} (build-system)")
+			self._AddRequirements(group, buildRequirements, file)
+			groups.append(("build-system", group))
+
+		for _, group in groups:
+			root.AddDependency(group)
+
+		return root
+
+	@staticmethod
+	def _DynamicFiles(entry: Any) -> List[str]:
+		if not isinstance(entry, dict):
+			return []
+
+		files = entry.get("file", [])
+		return [files] if isinstance(files, str) else list(files)
+
+	def _ReadLockFile(self, file: Path, packagesKey: str) -> Distribution:
+		"""
+		Read a TOML lock file (Poetry, PDM, uv or PEP 751) and build the locked dependency graph.
+
+		Packages not required by any other package become direct dependencies of the root.
+		"""
+		lock = self._ReadTOML(file)
+
+		distributions: Dict[str, Distribution] = {}
+		edges: Dict[str, List[Tuple[str, Nullable[VersionSpecifier]]]] = {}
+		for package in lock.get(packagesKey, []):
+			name = package.get("name")
+			if name is None or (key := canonicalize_name(name)) in distributions:
+				continue
+
+			version = package.get("version")
+			distributions[key] = Distribution(name, None if version is None else VersionSpecifier(version))
+			edges[key] = list(self._LockedDependencies(package.get("dependencies", []), file))
+
+		required = set()
+		for key, dependencies in edges.items():
+			for name, specifier in dependencies:
+				dependencyKey = canonicalize_name(name)
+				if dependencyKey not in distributions:
+					distributions[dependencyKey] = Distribution(name)
+				distributions[key].AddDependency(distributions[dependencyKey], specifier)
+				required.add(dependencyKey)
+
+		root = Distribution(file.name)
+		for key in edges:
+			if key not in required:
+				root.AddDependency(distributions[key])
+
+		# Packages only reachable via a cycle become direct dependencies of the root, too (in lock file order).
+		reachable = {id(distribution) for distribution in root.IterateTransitiveDependencies()}
+		for key in edges:
+			if id(distribution := distributions[key]) not in reachable:
+				root.AddDependency(distribution)
+				reachable.add(id(distribution))
+				reachable.update(id(dependency) for dependency in distribution.IterateTransitiveDependencies())
+
+		return root
+
+	def _LockedDependencies(self, dependencies: Any, file: Path) -> Iterable[Tuple[str, Nullable[VersionSpecifier]]]:
+		# Poetry: { name = "spec" | { version = "spec", ... } | [{ version = "spec", markers = "..." }, ...] }
+		if isinstance(dependencies, dict):
+			for name, spec in dependencies.items():
+				# Multiple constraints apply under different markers, so they are listed as alternatives.
+				versions: List[str] = []
+				for constraint in (spec if isinstance(spec, list) else [spec]):
+					if isinstance(constraint, dict):
+						constraint = constraint.get("version")
+					if isinstance(constraint, str) and constraint != "*" and constraint not in versions:
+						versions.append(constraint)
+				yield name, VersionSpecifier(" | ".join(versions)) if len(versions) > 0 else None
+			return
+
+		for dependency in dependencies:
+			# uv, PEP 751: { name = "...", ... }
+			if isinstance(dependency, dict):
+				if (name := dependency.get("name")) is not None:
+					yield name, None
+			# PDM: requirement strings
+			else:
+				try:
+					requirement = Requirement(dependency)
+				except InvalidRequirement as ex:
+					raise DependencyError(f"Malformed requirement '{dependency}' in '{file}'.") from ex
+
+				yield requirement.name, self._Specifier(requirement)
+
+	def _ReadPipfileLock(self, file: Path) -> Distribution:
+		try:
+			lock = json_loads(self._ReadText(file))
+		except ValueError as ex:
+			raise DependencyError(f"Malformed JSON file '{file}'.") from ex
+
+		root = Distribution(file.name)
+		for section in ("default", "develop"):
+			for name, package in lock.get(section, {}).items():
+				version = package.get("version", "").lstrip("=")
+				root.AddDependency(Distribution(name, VersionSpecifier(version) if version != "" else None))
+
+		return root
+
+	@readonly
+	def File(self) -> Path:
+		return self._file
+
+	@readonly
+	def Files(self) -> List[Path]:
+		"""
+		Read-only property to access all files read, including included requirement files.
+
+		:returns: List of file paths.
+		"""
+		return list(self._files)
+
+	@readonly
+	def Distribution(self) -> Distribution:
+		return self._distribution
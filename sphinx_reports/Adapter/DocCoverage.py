@@ -0,0 +1,333 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Adapters providing documentation coverage data.**
+
+:class:`IncrementalDocStrCoverage` analyzes a package's source files using a per-file result cache.
+:class:`DocCoverageJSONReport` reads a precomputed report.
+:class:`AutodocCoverage` derives coverage from objects collected by Sphinx while reading.
+"""
+from json               import dumps, loads
+from pathlib            import Path
+from typing             import Dict, Iterable, List, Mapping, Optional as Nullable, Tuple
+
+from pyTooling.Decorators                        import export, readonly
+from pyEDAA.Reports.DocumentationCoverage.Python import PackageCoverage, ModuleCoverage, AggregatedCoverage
+
+from sphinx_reports.Common              import ReportExtensionError
+from sphinx_reports.Adapter.Incremental import IncrementalSourceAnalyzer
+
+
+@export
+class DocCoverageError(ReportExtensionError):
+	pass
+
+
+def _AnalyzeFiles(files: List[Path]) -> List[Tuple[Path, int, int, int]]:
+	"""
+	Analyze docstrings of multiple source files.
+
+	This function is executed in worker processes, therefore it's defined at module level.
+
+	:param files: List of Python source files.
+	:return:      List of file, needed, found and missing docstring counts.
+	"""
+	from docstr_coverage import analyze
+
+	report = analyze(files, show_progress=False)
+	results = []
+	for file, fileResult in report.files():
+		count = fileResult.count_aggregate()
+		results.append((Path(file), count.needed, count.found, count.missing))
+
+	return results
+
+
+@export
+class IncrementalDocStrCoverage(IncrementalSourceAnalyzer):
+	"""
+	An analyzer for docstring coverage, which only re-analyzes changed source files.
+
+	Only changed or new files are passed to ``docstr_coverage``. The package's coverage tree is then assembled from all
+	cached per-file results in sorted order, so the result doesn't depend on the number of workers.
+	"""
+
+	_analyzeFiles = staticmethod(_AnalyzeFiles)
+	_cacheVersion = 2
+	_error =        DocCoverageError
+
+	_results:       Dict[str, Tuple[int, int, str, int, int, int]]
+
+	def Convert(self) -> PackageCoverage:
+		"""
+		Assemble a package coverage tree from the per-file results.
+
+		:return: The root package's coverage (not aggregated).
+		"""
+		return _BuildPackageCoverage(
+			self._packageName,
+			self._directory,
+			((relativePath, needed, found, missing) for relativePath, (_, _, _, needed, found, missing) in self._results.items())
+		)
+
+	def WriteJSONReport(self, jsonFile: Path) -> None:
+		"""
+		Write the per-file results as a documentation coverage report readable by :class:`DocCoverageJSONReport`.
+
+		:param jsonFile:          Path of the JSON report file to write.
+		:raises DocCoverageError: If the file can't be written.
+		"""
+		report = {
+			"format":  DocCoverageJSONReport.reportFormat,
+			"package": self._packageName,
+			"files":   {
+				relativePath: {"needed": needed, "found": found, "missing": missing}
+				for relativePath, (_, _, _, needed, found, missing) in sorted(self._results.items())
+			}
+		}
+
+		try:
+			jsonFile.write_text(dumps(report, indent=2), encoding="utf-8")
+		except OSError as ex:
+			raise DocCoverageError(f"Writing documentation coverage report '{jsonFile}' failed.") from ex
+
+
+@export
+class DocCoverageJSONReport:
+	"""
+	A reader for precomputed documentation coverage reports in JSON format.
+
+	The report maps source files (relative to the package's root directory) to the number of needed, found and missing
+	docstrings:
+
+	.. code-block:: JSON
+
+	   {
+	     "format": 1,
+	     "package": "myPackage",
+	     "files": {
+	       "__init__.py":      {"needed": 2, "found": 2, "missing": 0},
+	       "sub/MyModule.py":  {"needed": 7, "found": 5, "missing": 2}
+	     }
+	   }
+
+	Such a report is written by :meth:`IncrementalDocStrCoverage.WriteJSONReport`. As per-file entries of docstr_coverage's
+	JSON output use the same keys, its ``files`` section is accepted, too. In this case, absolute file paths are made
+	relative by the optional top-level ``directory`` entry.
+	"""
+
+	reportFormat = 1
+
+	_packageName: str
+	_jsonFile:    Path
+	_files:       List[Tuple[str, int, int, int]]
+
+	def __init__(self, packageName: str, jsonFile: Path) -> None:
+		"""
+		Read a JSON documentation coverage report.
+
+		:param packageName:       Name of the Python package.
+		:param jsonFile:          JSON file containing per-file docstring counts.
+		:raises DocCoverageError: If the file doesn't exist, can't be parsed or has an unsupported format.
+		"""
+		if not jsonFile.exists():
+			raise DocCoverageError(f"JSON documentation coverage report '{jsonFile}' not found.") from FileNotFoundError(jsonFile)
+
+		self._packageName = packageName
+		self._jsonFile = jsonFile
+
+		try:
+			report = loads(jsonFile.read_text(encoding="utf-8"))
+		except (OSError, ValueError) as ex:
+			raise DocCoverageError(f"Reading JSON documentation coverage report '{jsonFile}' failed.") from ex
+
+		if (reportFormat := report.get("format", self.reportFormat)) != self.reportFormat:
+			raise DocCoverageError(f"Format '{reportFormat}' of documentation coverage report '{jsonFile}' is not supported.")
+
+		directory = Path(report["directory"]) if "directory" in report else None
+
+		self._files = []
+		try:
+			for file, counts in report["files"].items():
+				path = Path(file)
+				if directory is not None and path.is_absolute():
+					path = path.relative_to(directory)
+
+				self._files.append((path.as_posix(), int(counts["needed"]), int(counts["found"]), int(counts["missing"])))
+		except (KeyError, TypeError, ValueError, AttributeError) as ex:
+			raise DocCoverageError(f"Documentation coverage report '{jsonFile}' has an invalid 'files' section.") from ex
+
+	@readonly
+	def PackageName(self) -> str:
+		"""
+		Read-only property to access the package's name.
+
+		:return: Name of the Python package.
+		"""
+		return self._packageName
+
+	@readonly
+	def JSONFile(self) -> Path:
+		"""
+		Read-only property to access the JSON report file.
+
+		:return: Path to the JSON report.
+		"""
+		return self._jsonFile
+
+	def Convert(self) -> PackageCoverage:
+		"""
+		Convert the report into a package coverage tree.
+
+		:return: The root package's coverage (not aggregated).
+		"""
+		return _BuildPackageCoverage(self._packageName, Path("."), self._files)
+
+
+@export
+class AutodocCoverage:
+	"""
+	Documentation coverage derived from objects known to Sphinx (e.g. documented by autodoc).
+
+	Each object is given by its fully qualified name, its object type (``module``, ``class``, ``function``, ...) and
+	whether it has a docstring. Objects are assigned to the module with the longest matching name prefix. A module is
+	treated as a package, if other modules are nested in it.
+	"""
+
+	_packageName: str
+	_objects:     Dict[str, Tuple[str, bool]]
+
+	def __init__(self, packageName: str, objects: Mapping[str, Tuple[str, bool]]) -> None:
+		"""
+		Select all objects of a package.
+
+		:param packageName: Name of the Python package.
+		:param objects:     Mapping of fully qualified object names to object type and documentation state.
+		"""
+		self._packageName = packageName
+		prefix = f"{packageName}."
+		self._objects = {name: entry for name, entry in objects.items() if name == packageName or name.startswith(prefix)}
+
+	@readonly
+	def PackageName(self) -> str:
+		"""
+		Read-only property to access the package's name.
+
+		:return: Name of the Python package.
+		"""
+		return self._packageName
+
+	@readonly
+	def Objects(self) -> Dict[str, Tuple[str, bool]]:
+		"""
+		Read-only property to access all objects of the package.
+
+		:return: Mapping of fully qualified object names to object type and documentation state.
+		"""
+		return self._objects
+
+	def _PerModuleCounts(self) -> List[Tuple[str, int, int, int]]:
+		modules = {name for name, (objectType, _) in self._objects.items() if objectType == "module"}
+		modules.add(self._packageName)
+		packages = {name.rpartition(".")[0] for name in modules} & modules
+		packages.add(self._packageName)
+
+		counts: Dict[str, List[int]] = {module: [0, 0] for module in modules}
+		for name, (_, documented) in self._objects.items():
+			module = name
+			while module not in modules:
+				module = module.rpartition(".")[0]
+
+			count = counts[module]
+			count[0] += 1
+			if documented:
+				count[1] += 1
+
+		results = []
+		for module, (needed, found) in counts.items():
+			parts = module.split(".")[len(self._packageName.split(".")):]
+			if module in packages:
+				relativePath = "/".join((*parts, "__init__.py"))
+			else:
+				relativePath = "/".join(parts) + ".py"
+
+			results.append((relativePath, needed, found, needed - found))
+
+		return results
+
+	def Convert(self) -> PackageCoverage:
+		"""
+		Convert the collected objects into a package coverage tree.
+
+		:return: The root package's coverage (not aggregated).
+		"""
+		return _BuildPackageCoverage(self._packageName, Path("."), self._PerModuleCounts())
+
+
+def _BuildPackageCoverage(packageName: str, directory: Path, results: Iterable[Tuple[str, int, int, int]]) -> PackageCoverage:
+	"""
+	Assemble a package coverage tree from per-file docstring counts.
+
+	Files are inserted in sorted order, so the resulting tree doesn't depend on the order of results.
+
+	:param packageName: Name of the root package.
+	:param directory:   Source directory of the root package.
+	:param results:     Iterable of relative path, needed, found and missing docstring counts.
+	:return:            The root package's coverage (not aggregated).
+	"""
+	rootPackageCoverage = PackageCoverage(packageName, directory / "__init__.py")
+
+	for relativePath, needed, found, missing in sorted(results):
+		path = Path(relativePath)
+
+		currentCoverageObject: AggregatedCoverage = rootPackageCoverage
+		for name in path.parent.parts:
+			try:
+				currentCoverageObject = currentCoverageObject[name]
+			except KeyError:
+				currentCoverageObject = PackageCoverage(name, path, currentCoverageObject)
+
+		if path.stem != "__init__":
+			currentCoverageObject = ModuleCoverage(path.stem, path, currentCoverageObject)
+
+		currentCoverageObject._expected = needed
+		currentCoverageObject._covered = found
+		currentCoverageObject._uncovered = missing
+
+		if needed != 0:
+			currentCoverageObject._coverage = found / needed
+		else:
+			currentCoverageObject._coverage = 1.0
+
+		if missing != needed - found:
+			currentCoverageObject._coverage = -2.0
+
+	return rootPackageCoverage
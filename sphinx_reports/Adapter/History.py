@@ -0,0 +1,188 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A local SQLite database storing testcase durations of multiple builds.**
+"""
+from pathlib  import Path
+from sqlite3  import connect, Connection, Error as SQLiteError
+from time     import time
+from typing   import Iterable, List, Tuple
+
+from pyTooling.Decorators  import export, readonly
+
+from sphinx_reports.Common import ReportExtensionError
+
+
+@export
+class HistoryError(ReportExtensionError):
+	pass
+
+
+@export
+class DurationHistory:
+	"""
+	A history of testcase durations stored in a local SQLite database.
+
+	Each build is identified by a build identifier. Durations are stored per build and testcase. Testcase names are
+	normalized into a separate table, so the durations table only contains integers and floats. The primary key
+	``(testcase_id, build_id)`` serves lookups of a testcase across builds; a secondary index on ``build_id`` serves
+	lookups of all testcases in a build.
+	"""
+
+	_schema = (
+		"CREATE TABLE IF NOT EXISTS builds (id INTEGER PRIMARY KEY, build TEXT NOT NULL UNIQUE, timestamp REAL NOT NULL)",
+		"CREATE TABLE IF NOT EXISTS testcases (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)",
+		"CREATE TABLE IF NOT EXISTS durations ("
+		"build_id INTEGER NOT NULL REFERENCES builds(id), "
+		"testcase_id INTEGER NOT NULL REFERENCES testcases(id), "
+		"duration REAL NOT NULL, "
+		"PRIMARY KEY (testcase_id, build_id)"
+		") WITHOUT ROWID",
+		"CREATE INDEX IF NOT EXISTS durations_build ON durations (build_id)",
+	)
+
+	_databaseFile: Path
+	_connection:   Connection
+
+	def __init__(self, databaseFile: Path) -> None:
+		"""
+		Open (or create) a duration history database.
+
+		:param databaseFile:  Path to the SQLite database file.
+		:raises HistoryError: If the database can't be opened or initialized.
+		"""
+		self._databaseFile = databaseFile
+
+		try:
+			databaseFile.parent.mkdir(parents=True, exist_ok=True)
+			self._connection = connect(databaseFile)
+			with self._connection:
+				for statement in self._schema:
+					self._connection.execute(statement)
+		except (OSError, SQLiteError) as ex:
+			raise HistoryError(f"Opening duration history database '{databaseFile}' failed.") from ex
+
+	def __enter__(self) -> "DurationHistory":
+		return self
+
+	def __exit__(self, *_) -> None:
+		self.Close()
+
+	@readonly
+	def DatabaseFile(self) -> Path:
+		"""
+		Read-only property to access the database file.
+
+		:return: Path to the SQLite database file.
+		"""
+		return self._databaseFile
+
+	def Close(self) -> None:
+		"""
+		Close the database connection.
+		"""
+		self._connection.close()
+
+	def _GetBuildID(self, build: str) -> int:
+		row = self._connection.execute("SELECT id FROM builds WHERE build = ?", (build,)).fetchone()
+		if row is None:
+			raise HistoryError(f"Build '{build}' not found in duration history database '{self._databaseFile}'.")
+
+		return row[0]
+
+	def AddBuild(self, build: str, durations: Iterable[Tuple[str, float]]) -> None:
+		"""
+		Add (or replace) all testcase durations of a build.
+
+		All records are written within a single transaction using batched inserts. If the build identifier already exists,
+		its durations are replaced, but the build keeps its position in the history.
+
+		:param build:         Build identifier.
+		:param durations:     Iterable of testcase name and duration (in seconds) tuples.
+		:raises HistoryError: If writing to the database failed.
+		"""
+		records = list(durations)
+
+		try:
+			with self._connection as connection:
+				connection.execute(
+					"INSERT INTO builds (build, timestamp) VALUES (?, ?) ON CONFLICT (build) DO UPDATE SET timestamp = excluded.timestamp",
+					(build, time())
+				)
+				buildID = self._GetBuildID(build)
+
+				connection.executemany("INSERT OR IGNORE INTO testcases (name) VALUES (?)", ((name,) for name, _ in records))
+				connection.execute("CREATE TEMP TABLE IF NOT EXISTS staging (name TEXT NOT NULL, duration REAL NOT NULL)")
+				connection.execute("DELETE FROM staging")
+				connection.executemany("INSERT INTO staging (name, duration) VALUES (?, ?)", records)
+
+				connection.execute("DELETE FROM durations WHERE build_id = ?", (buildID,))
+				connection.execute(
+					"INSERT OR REPLACE INTO durations (build_id, testcase_id, duration) "
+					"SELECT ?, testcases.id, staging.duration FROM staging JOIN testcases ON testcases.name = staging.name",
+					(buildID,)
+				)
+				connection.execute("DELETE FROM staging")
+		except SQLiteError as ex:
+			raise HistoryError(f"Writing build '{build}' to duration history database '{self._databaseFile}' failed.") from ex
+
+	def Regressions(self, build: str, window: int, threshold: float, minimum: float) -> List[Tuple[str, float, float, int]]:
+		"""
+		Find testcases, whose duration in a build grew compared to a rolling baseline.
+
+		The baseline of a testcase is the mean duration within the previous ``window`` builds. A testcase is reported, if
+		its duration exceeds ``baseline * threshold`` and the absolute difference is at least ``minimum`` seconds.
+
+		:param build:         Build identifier of the build to check.
+		:param window:        Number of previous builds forming the baseline.
+		:param threshold:     Relative growth factor (e.g. ``1.2`` for 20 % slower).
+		:param minimum:       Minimal absolute growth in seconds.
+		:return:              List of testcase name, baseline, current duration and number of baseline samples tuples,
+		                      sorted by descending absolute growth.
+		:raises HistoryError: If reading from the database failed.
+		"""
+		try:
+			buildID = self._GetBuildID(build)
+
+			return self._connection.execute(
+				"WITH baseline_builds AS (SELECT id FROM builds WHERE id < :build ORDER BY id DESC LIMIT :window) "
+				"SELECT testcases.name, AVG(previous.duration) AS baseline, current.duration, COUNT(previous.duration) "
+				"FROM durations AS current "
+				"JOIN durations AS previous ON previous.testcase_id = current.testcase_id AND previous.build_id IN baseline_builds "
+				"JOIN testcases ON testcases.id = current.testcase_id "
+				"WHERE current.build_id = :build "
+				"GROUP BY current.testcase_id "
+				"HAVING current.duration > baseline * :threshold AND current.duration - baseline >= :minimum "
+				"ORDER BY current.duration - baseline DESC, testcases.name",
+				{"build": buildID, "window": window, "threshold": threshold, "minimum": minimum}
+			).fetchall()
+		except SQLiteError as ex:
+			raise HistoryError(f"Reading regressions for build '{build}' from duration history database '{self._databaseFile}' failed.") from ex
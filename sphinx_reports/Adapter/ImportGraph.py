@@ -0,0 +1,315 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Adapter building the static import graph of a Python package from its source files.**
+"""
+from ast     import parse, stmt, expr, Import, ImportFrom, If, Try, TryStar, With, Name, Attribute
+from pathlib import Path
+from sys     import stdlib_module_names
+from typing  import Dict, Iterable, List, Optional as Nullable, Set, Tuple
+
+from pyTooling.Decorators import export
+
+from sphinx_reports.Common                import ReportExtensionError
+from sphinx_reports.DataModel.ImportGraph import Imports, ModuleImports, PackageImports, ImportGraph
+from sphinx_reports.Adapter.Incremental   import IncrementalSourceAnalyzer
+
+
+@export
+class ImportGraphError(ReportExtensionError):
+	pass
+
+
+#: Third-party packages known for expensive imports. Importing them at module level makes every importer pay the cost.
+defaultHeavyImports = (
+	"aiohttp", "boto3", "botocore", "cv2", "django", "docutils", "flask", "IPython", "jax", "jinja2", "lxml",
+	"matplotlib", "networkx", "numba", "numpy", "pandas", "PIL", "polars", "pyarrow", "pygments", "requests", "scipy",
+	"sklearn", "sphinx", "sqlalchemy", "sympy", "tensorflow", "torch", "transformers",
+)
+
+#: An import statement as stored per file: module name (without leading dots), relative import level and imported names
+#: (empty for ``import x``).
+RawImport = Tuple[str, int, List[str]]
+
+
+def _IsTypeCheckingGuard(test: expr) -> bool:
+	return (isinstance(test, Name) and test.id == "TYPE_CHECKING") or (isinstance(test, Attribute) and test.attr == "TYPE_CHECKING")
+
+
+def _ModuleLevelImports(statements: Iterable[stmt]) -> Iterable[RawImport]:
+	"""
+	Yield import statements executed when a module is imported.
+
+	Conditional and guarded blocks (``if``, ``try``, ``with``) at module level are included, except ``if TYPE_CHECKING:``
+	blocks. Function and class bodies are skipped.
+	"""
+	for statement in statements:
+		if isinstance(statement, Import):
+			for alias in statement.names:
+				yield alias.name, 0, []
+		elif isinstance(statement, ImportFrom):
+			yield statement.module or "", statement.level, [alias.name for alias in statement.names]
+		elif isinstance(statement, If):
+			if not _IsTypeCheckingGuard(statement.test):
+				yield from _ModuleLevelImports(statement.body)
+			yield from _ModuleLevelImports(statement.orelse)
+		elif isinstance(statement, (Try, TryStar)):
+			yield from _ModuleLevelImports(statement.body)
+			for handler in statement.handlers:
+				yield from _ModuleLevelImports(handler.body)
+			yield from _ModuleLevelImports(statement.orelse)
+			yield from _ModuleLevelImports(statement.finalbody)
+		elif isinstance(statement, With):
+			yield from _ModuleLevelImports(statement.body)
+
+
+def _ScanImports(files: List[Path]) -> List[Tuple[Path, List[RawImport], Nullable[str]]]:
+	"""
+	Collect module-level import statements of multiple source files.
+
+	This function is executed in worker processes, therefore it's defined at module level. Results don't depend on the
+	package name, so they can be cached per file.
+
+	:param files: List of Python source files.
+	:return:      List of file, import statements and an error message, if the file couldn't be parsed.
+	"""
+	results: List[Tuple[Path, List[RawImport], Nullable[str]]] = []
+	for file in files:
+		try:
+			tree = parse(file.read_bytes(), filename=str(file))
+		except (SyntaxError, ValueError) as ex:
+			results.append((file, [], f"{ex.__class__.__name__}: {ex}"))
+			continue
+
+		results.append((file, list(_ModuleLevelImports(tree.body)), None))
+
+	return results
+
+
+@export
+class ImportGraphAnalyzer(IncrementalSourceAnalyzer):
+	"""
+	Build the static import graph of a Python package.
+
+	Source files are parsed with :mod:`ast` incrementally, optionally in parallel, and per-file results are cached (see
+	:class:`~sphinx_reports.Adapter.Incremental.IncrementalSourceAnalyzer`). Resolving imports to modules and detecting
+	cycles is done on the cached results, which is cheap compared to parsing.
+	"""
+
+	_analyzeFiles = staticmethod(_ScanImports)
+	_cacheVersion = 1
+	_error =        ImportGraphError
+
+	_results:       Dict[str, Tuple[int, int, str, List[RawImport], Nullable[str]]]
+
+	def Convert(self, heavyImports: Iterable[str] = defaultHeavyImports) -> ImportGraph:
+		"""
+		Assemble the import graph from the per-file results.
+
+		:param heavyImports: Top-level names of third-party packages considered expensive to import.
+		:return:             The package's import graph.
+		"""
+		root = PackageImports(self._packageName, Path("__init__.py"))
+		graph = ImportGraph(root)
+		graph._modules[root._fullName] = root
+
+		# Create the module tree in sorted order.
+		rawImports: Dict[str, List[RawImport]] = {}
+		isPackage: Dict[str, bool] = {}
+		for relativePath, (_, _, _, imports, error) in sorted(self._results.items()):
+			path = Path(relativePath)
+
+			current: PackageImports = root
+			for name in path.parent.parts:
+				try:
+					current = current._packages[name]
+				except KeyError:
+					current = PackageImports(name, path.parent / "__init__.py", current)
+					graph._modules[current._fullName] = current
+
+			module: Imports = current
+			if path.stem != "__init__":
+				module = ModuleImports(path.stem, path, current)
+				graph._modules[module._fullName] = module
+
+			module._error = error
+			rawImports[module._fullName] = [(name, level, names) for name, level, names in imports]
+			isPackage[module._fullName] = isinstance(module, PackageImports)
+
+		heavy = set(heavyImports)
+		for fullName, imports in rawImports.items():
+			module = graph._modules[fullName]
+
+			internal: Set[str] = set()
+			external: Set[str] = set()
+			for target in self._ResolveImports(fullName, isPackage[fullName], imports):
+				if target == self._packageName or target.startswith(f"{self._packageName}."):
+					knownModule = self._LongestKnownModule(target, graph._modules)
+					if knownModule is not None and knownModule != fullName:
+						internal.add(knownModule)
+				else:
+					topLevel = target.partition(".")[0]
+					if topLevel not in stdlib_module_names and topLevel not in ("__future__", ""):
+						external.add(topLevel)
+
+			module._imports = sorted(internal)
+			module._externalImports = sorted(external)
+			module._heavyImports = sorted(external & heavy)
+			for target in internal:
+				graph._modules[target]._importedBy.append(fullName)
+
+		for module in graph._modules.values():
+			module._importedBy.sort()
+
+		graph._cycles = self._FindCycles(graph._modules)
+		for cycle in graph._cycles:
+			for name in cycle:
+				graph._modules[name]._inCycle = True
+
+		return graph
+
+	@staticmethod
+	def _ResolveImports(fullName: str, isPackage: bool, imports: Iterable[RawImport]) -> Iterable[str]:
+		"""
+		Resolve import statements to absolute module names.
+
+		For ``from x import y``, the name ``x.y`` is yielded, because ``y`` might be a submodule. It's reduced to the longest
+		known module name later.
+		"""
+		parts = fullName.split(".")
+		if not isPackage:
+			parts = parts[:-1]
+
+		for moduleName, level, names in imports:
+			if level > 0:
+				if level - 1 > len(parts):
+					continue
+				base = ".".join(parts[:len(parts) - (level - 1)])
+				moduleName = f"{base}.{moduleName}" if moduleName != "" else base
+
+			if len(names) == 0:
+				yield moduleName
+			else:
+				for name in names:
+					yield moduleName if name == "*" else f"{moduleName}.{name}"
+
+	@staticmethod
+	def _LongestKnownModule(name: str, modules: Dict[str, Imports]) -> Nullable[str]:
+		while name not in modules:
+			name, dot, _ = name.rpartition(".")
+			if dot == "":
+				return None
+
+		return name
+
+	@staticmethod
+	def _FindCycles(modules: Dict[str, Imports]) -> List[List[str]]:
+		"""
+		Find import cycles using Tarjan's algorithm for strongly connected components (iterative).
+
+		For each component, one concrete cycle is returned, starting at the component's smallest module name.
+
+		:param modules: All modules of the graph.
+		:return:        List of cycles, sorted by their first module.
+		"""
+		index: Dict[str, int] = {}
+		lowLink: Dict[str, int] = {}
+		onStack: Set[str] = set()
+		stack: List[str] = []
+		components: List[List[str]] = []
+
+		for start in sorted(modules):
+			if start in index:
+				continue
+
+			work = [(start, 0)]
+			while work:
+				node, childIndex = work.pop()
+				if childIndex == 0:
+					index[node] = lowLink[node] = len(index)
+					stack.append(node)
+					onStack.add(node)
+
+				imports = modules[node]._imports
+				for i in range(childIndex, len(imports)):
+					child = imports[i]
+					if child not in index:
+						work.append((node, i + 1))
+						work.append((child, 0))
+						break
+					elif child in onStack:
+						lowLink[node] = min(lowLink[node], index[child])
+				else:
+					if lowLink[node] == index[node]:
+						component = []
+						while True:
+							member = stack.pop()
+							onStack.discard(member)
+							component.append(member)
+							if member == node:
+								break
+
+						if len(component) > 1:
+							components.append(sorted(component))
+
+					if work:
+						parent = work[-1][0]
+						lowLink[parent] = min(lowLink[parent], lowLink[node])
+
+		cycles = []
+		for component in components:
+			members = set(component)
+			start = component[0]
+
+			# Breadth-first search for the shortest path from 'start' back to 'start' within the component.
+			predecessors: Dict[str, str] = {}
+			queue = [start]
+			found: Nullable[str] = None
+			while queue and found is None:
+				node = queue.pop(0)
+				for child in modules[node]._imports:
+					if child == start:
+						found = node
+						break
+					if child in members and child not in predecessors:
+						predecessors[child] = node
+						queue.append(child)
+
+			# A strongly connected component with more than one member always contains a cycle through 'start'.
+			if found is None:
+				continue
+
+			cycle = [found]
+			while cycle[-1] != start:
+				cycle.append(predecessors[cycle[-1]])
+			cycles.append(list(reversed(cycle)))
+
+		return sorted(cycles)
@@ -0,0 +1,185 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Adapter reading import time logs written by ``python -X importtime``.**
+"""
+from pathlib import Path
+from typing  import Dict, Iterable, List, Tuple
+
+from pyTooling.Decorators import export, readonly
+
+from sphinx_reports.Common               import ReportExtensionError
+from sphinx_reports.DataModel.ImportTime import ImportedModule, ImportTimeReport
+
+
+@export
+class ImportTimeError(ReportExtensionError):
+	pass
+
+
+@export
+class ImportTimeLog:
+	"""
+	Parse a log written by ``python -X importtime`` to *stderr*.
+
+	The interpreter emits one line per module *after* the module and its nested imports are finished. The nesting depth is
+	encoded by the indentation of the module name (2 spaces per level). Thus, a module's nested imports are all pending
+	entries one level deeper, which allows to build the import tree in a single pass over the log, with memory
+	proportional to the tree only. Lines not emitted by ``-X importtime`` (e.g. other *stderr* output) are skipped.
+	"""
+	_file:    Path
+	_imports: List[ImportedModule]
+
+	def __init__(self, file: Path) -> None:
+		"""
+		Read and parse an import time log.
+
+		:param file:             Path to the log file.
+		:raises ImportTimeError: If the log file can't be read or contains no import time lines.
+		"""
+		self._file = file
+
+		try:
+			with file.open("r", encoding="utf-8", errors="replace") as f:
+				self._imports = self.Parse(f)
+		except OSError as ex:
+			raise ImportTimeError(f"Can't read import time log '{file}'.") from ex
+
+		if len(self._imports) == 0:
+			raise ImportTimeError(f"Log file '{file}' contains no '-X importtime' output.")
+
+	@staticmethod
+	def Parse(lines: Iterable[str]) -> List[ImportedModule]:
+		"""
+		Build the import tree from ``-X importtime`` lines.
+
+		:param lines: Iterable of lines, e.g. an open file.
+		:returns:     List of top-level imports in import order.
+		"""
+		pending: Dict[int, List[ImportedModule]] = {}
+		for line in lines:
+			if not line.startswith("import time:"):
+				continue
+
+			fields = line[12:].split("|", 2)
+			if len(fields) != 3:
+				continue
+
+			try:
+				selfTime = int(fields[0])
+				cumulativeTime = int(fields[1])
+			except ValueError:
+				# Header line or cached imports ('-X importtime=2').
+				continue
+
+			name = fields[2].rstrip("\r\n")
+			stripped = name.lstrip(" ")
+			depth = (len(name) - len(stripped) - 1) // 2
+
+			module = ImportedModule(stripped, selfTime, cumulativeTime)
+			for child in pending.pop(depth + 1, []):
+				ImportTimeLog._AddImport(module, child)
+
+			pending.setdefault(depth, []).append(module)
+
+		# Entries deeper than the top-level remain, if the log was truncated.
+		return [module for depth in sorted(pending) for module in pending[depth]]
+
+	@staticmethod
+	def _AddImport(parent: ImportedModule, module: ImportedModule) -> None:
+		# A module can be listed twice below the same parent, e.g. if its first import failed. Times are summed up.
+		try:
+			existing = parent._imports[module._name]
+		except KeyError:
+			module._parent = parent
+			parent._imports[module._name] = module
+			return
+
+		existing._selfTime += module._selfTime
+		existing._cumulativeTime += module._cumulativeTime
+		for child in module._imports.values():
+			ImportTimeLog._AddImport(existing, child)
+
+	@readonly
+	def File(self) -> Path:
+		return self._file
+
+	@readonly
+	def Imports(self) -> List[ImportedModule]:
+		return self._imports
+
+
+@export
+class ImportTimeReader:
+	"""
+	Read one or more import time logs and merge them into an :class:`~sphinx_reports.DataModel.ImportTime.ImportTimeReport`.
+	"""
+	_name:  str
+	_files: List[Path]
+
+	def __init__(self, name: str, files: Iterable[Path]) -> None:
+		self._name = name
+		self._files = list(files)
+
+	def Convert(self) -> ImportTimeReport:
+		"""
+		Parse all logs and merge the import trees.
+
+		Modules are matched by their import path. Times are averaged over all logs, so a module imported in only some runs
+		contributes proportionally.
+
+		:returns:                The merged import time report.
+		:raises ImportTimeError: If a log can't be read.
+		"""
+		report = ImportTimeReport(self._name, len(self._files))
+		runs = len(self._files)
+
+		merged: Dict[Tuple[str, ...], ImportedModule] = {}
+
+		def merge(module: ImportedModule, parent: ImportedModule, path: Tuple[str, ...]) -> None:
+			path = path + (module._name,)
+			try:
+				target = merged[path]
+			except KeyError:
+				target = merged[path] = ImportedModule(module._name, parent=parent)
+				if parent is None:
+					report._imports[module._name] = target
+
+			target._selfTime += module._selfTime / runs
+			target._cumulativeTime += module._cumulativeTime / runs
+			for child in module._imports.values():
+				merge(child, target, path)
+
+		for file in self._files:
+			for module in ImportTimeLog(file).Imports:
+				merge(module, None, ())
+
+		return report
@@ -0,0 +1,315 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Base-class for analyzers, which process a package's Python source files incrementally.**
+"""
+from hashlib import sha256
+from json    import dumps, loads
+from os      import cpu_count, getpid, scandir
+from pathlib import Path
+from time    import time_ns
+from typing  import Any, Callable, ClassVar, Dict, Iterable, List, Optional as Nullable, Tuple, Type
+
+from pyTooling.Decorators import export, readonly
+
+from sphinx_reports.Common import ReportExtensionError
+
+
+@export
+class IncrementalSourceAnalyzer:
+	"""
+	An analyzer for Python source files, which only re-analyzes changed source files.
+
+	Analysis results are stored per file, keyed by the file's relative path. A cache entry is reused, if the file's size
+	and modification time are unchanged. Otherwise, the file's SHA-256 hash is compared, so touching a file (e.g. by a
+	checkout) doesn't trigger an analysis. Only changed or new files are passed to :attr:`_analyzeFiles`.
+
+	Like git's "racily clean" entries, a modification time within :attr:`_racyGranule` of the time it was read isn't
+	trusted: the file might be changed again within the same timestamp granule. Such modification times are recorded as
+	``-1``, so the next analysis compares the hash (or re-lists the directory) instead.
+
+	If a cache file is given, results are persisted as JSON between builds.
+
+	If more than one worker is configured, changed files are distributed in chunks over a process pool. As results are
+	stored per file, the result is identical to a serial analysis.
+
+	Derived classes define:
+
+	* :attr:`_analyzeFiles` - a module-level function (so it can be sent to worker processes) accepting a list of files
+	  and returning a list of tuples with the file path as first element, followed by the per-file result.
+	* :attr:`_cacheVersion` - a version number of the cache file's layout.
+	* :attr:`_error` - the exception type raised on errors.
+	"""
+
+	_analyzeFiles: ClassVar["staticmethod[[List[Path]], List[Tuple[Any, ...]]]"]
+	_cacheVersion: ClassVar[int]
+	_error:        ClassVar[Type[ReportExtensionError]] = ReportExtensionError
+	_racyGranule:  ClassVar[int] = 2_000_000_000  #: Coarsest timestamp resolution in ns (FAT: 2 s).
+
+	_packageName: str
+	_directory:   Path
+	_cacheFile:   Nullable[Path]
+	_workers:     int
+	_results:     Dict[str, Tuple[Any, ...]]
+	_directories: Dict[str, Tuple[int, List[str], List[str]]]
+	_analyzed:    List[str]
+
+	def __init__(self, packageName: str, directory: Path, cacheFile: Nullable[Path] = None, workers: int = 1) -> None:
+		"""
+		Create an incremental analyzer and load persisted results.
+
+		An unreadable or incompatible cache file is ignored.
+
+		:param packageName: Name of the Python package.
+		:param directory:   Source directory of the Python package.
+		:param cacheFile:   Optional JSON file to persist per-file results.
+		:param workers:     Number of worker processes. ``0`` uses one worker per CPU; ``1`` analyzes serially.
+		:raises _error:     If the source directory doesn't exist.
+		"""
+		if not directory.exists():
+			raise self._error(f"Package source directory '{directory}' does not exist.") from FileNotFoundError(directory)
+
+		self._packageName = packageName
+		self._directory = directory
+		self._cacheFile = cacheFile
+		self._workers = workers if workers > 0 else (cpu_count() or 1)
+		self._results = {}
+		self._directories = {}
+		self._analyzed = []
+
+		if cacheFile is not None and cacheFile.exists():
+			try:
+				cache = loads(cacheFile.read_text(encoding="utf-8"))
+				if cache["version"] == self._cacheVersion and cache["package"] == packageName:
+					self._results = {file: tuple(entry) for file, entry in cache["files"].items()}
+					self._directories = {directory: tuple(entry) for directory, entry in cache["directories"].items()}
+			except (OSError, ValueError, KeyError, TypeError):
+				self._results = {}
+				self._directories = {}
+
+	@readonly
+	def PackageName(self) -> str:
+		"""
+		Read-only property to access the analyzed package's name.
+
+		:return: Name of the Python package.
+		"""
+		return self._packageName
+
+	@readonly
+	def Directory(self) -> Path:
+		"""
+		Read-only property to access the package's source directory.
+
+		:return: Source directory.
+		"""
+		return self._directory
+
+	@readonly
+	def Workers(self) -> int:
+		"""
+		Read-only property to access the number of worker processes.
+
+		:return: Number of worker processes.
+		"""
+		return self._workers
+
+	@readonly
+	def SourceFiles(self) -> List[Path]:
+		"""
+		Read-only property to access all Python source files found by the last call of :meth:`Analyze`.
+
+		:return: List of source file paths.
+		"""
+		return [self._directory / relativePath for relativePath in sorted(self._results)]
+
+	@readonly
+	def AnalyzedFiles(self) -> List[str]:
+		"""
+		Read-only property to access the relative paths of files re-analyzed by the last call of :meth:`Analyze`.
+
+		:return: List of relative paths.
+		"""
+		return self._analyzed
+
+	def Analyze(self) -> None:
+		"""
+		Update per-file results for all Python source files in the package directory.
+
+		Results of deleted files are dropped. If a cache file is configured and results changed, the cache is written.
+
+		:raises _error: If a source file can't be read or analyzed.
+		"""
+		results: Dict[str, Tuple[Any, ...]] = {}
+		changed: Dict[str, Tuple[int, int, str]] = {}
+		readTime = time_ns()
+
+		try:
+			previousDirectories = self._directories
+			for relativePath in self._ScanDirectories():
+				file = self._directory / relativePath
+				stat = file.stat()
+
+				try:
+					size, mtime, contentHash, *result = self._results[relativePath]
+				except KeyError:
+					pass
+				else:
+					if size == stat.st_size and mtime == stat.st_mtime_ns:
+						results[relativePath] = self._results[relativePath]
+						continue
+
+					if size == stat.st_size:
+						currentHash = sha256(file.read_bytes()).hexdigest()
+						if currentHash == contentHash:
+							results[relativePath] = (stat.st_size, self._TrustedMTime(stat.st_mtime_ns, readTime), contentHash, *result)
+							continue
+
+				changed[relativePath] = (stat.st_size, self._TrustedMTime(stat.st_mtime_ns, readTime), sha256(file.read_bytes()).hexdigest())
+		except OSError as ex:
+			raise self._error(f"Reading Python source files in '{self._directory}' failed.") from ex
+
+		if len(changed) > 0:
+			try:
+				for file, *result in self._AnalyzeChangedFiles([self._directory / file for file in changed]):
+					relativePath = file.relative_to(self._directory).as_posix()
+					results[relativePath] = (*changed[relativePath], *result)
+			except Exception as ex:
+				raise self._error(f"Analyzing Python source files in '{self._directory}' failed.") from ex
+
+		modified = len(changed) > 0 or results.keys() != self._results.keys() or previousDirectories != self._directories
+		self._results = results
+		self._analyzed = sorted(changed)
+
+		if modified and self._cacheFile is not None:
+			self._WriteCache(self._cacheFile)
+
+	def ScanSourceFiles(self) -> List[str]:
+		"""
+		Find all Python source files without analyzing them.
+
+		:return: Sorted relative paths of all Python source files.
+		"""
+		try:
+			return sorted(self._ScanDirectories())
+		except OSError as ex:
+			raise self._error(f"Reading Python source files in '{self._directory}' failed.") from ex
+
+	def _ScanDirectories(self) -> List[str]:
+		"""
+		Find all Python source files using :func:`os.scandir`.
+
+		A directory's listing is reused from the previous scan, if the directory's modification time is unchanged. Adding,
+		removing or renaming an entry changes the modification time of the containing directory. Thus, an unchanged
+		source tree costs only one ``stat`` call per directory. A directory modified within :attr:`_racyGranule` of the
+		scan is listed again by the next scan. Symbolic links to directories aren't followed.
+
+		:return: Relative paths of all Python source files.
+		"""
+		directories: Dict[str, Tuple[int, List[str], List[str]]] = {}
+		files: List[str] = []
+		scanTime = time_ns()
+
+		pending = [""]
+		while len(pending) > 0:
+			relativeDirectory = pending.pop()
+			directory = self._directory / relativeDirectory
+			mtime = directory.stat().st_mtime_ns
+
+			cached = self._directories.get(relativeDirectory)
+			if cached is not None and cached[0] == mtime:
+				_, subdirectories, sourceFiles = cached
+			else:
+				subdirectories = []
+				sourceFiles = []
+				with scandir(directory) as entries:
+					for entry in entries:
+						if entry.is_dir(follow_symlinks=False):
+							subdirectories.append(entry.name)
+						elif entry.name.endswith(".py") and entry.is_file():
+							sourceFiles.append(entry.name)
+
+				subdirectories.sort()
+				sourceFiles.sort()
+
+			directories[relativeDirectory] = (self._TrustedMTime(mtime, scanTime), subdirectories, sourceFiles)
+
+			prefix = f"{relativeDirectory}/" if relativeDirectory != "" else ""
+			files.extend(f"{prefix}{name}" for name in sourceFiles)
+			pending.extend(f"{prefix}{name}" for name in subdirectories)
+
+		self._directories = directories
+
+		return files
+
+	def _TrustedMTime(self, mtime: int, readTime: int) -> int:
+		"""
+		Return a modification time to be compared by the next analysis.
+
+		:param mtime:    Modification time in ns.
+		:param readTime: Time in ns before the file or directory was read.
+		:return:         The modification time or ``-1``, if it's within one granule of the read time.
+		"""
+		return mtime if mtime <= readTime - self._racyGranule else -1
+
+	def _AnalyzeChangedFiles(self, files: List[Path]) -> Iterable[Tuple[Any, ...]]:
+		analyzeFiles = type(self)._analyzeFiles
+
+		workers = min(self._workers, len(files))
+		if workers <= 1:
+			return analyzeFiles(files)
+
+		# Use several chunks per worker to balance uneven file sizes, but keep the per-task overhead low.
+		chunkSize = max(1, len(files) // (workers * 4))
+		chunks = [files[i:i + chunkSize] for i in range(0, len(files), chunkSize)]
+
+		from concurrent.futures import ProcessPoolExecutor
+
+		with ProcessPoolExecutor(max_workers=workers) as executor:
+			return [result for chunkResults in executor.map(analyzeFiles, chunks) for result in chunkResults]
+
+	def _WriteCache(self, cacheFile: Path) -> None:
+		cache = {
+			"version":     self._cacheVersion,
+			"package":     self._packageName,
+			"files":       self._results,
+			"directories": self._directories
+		}
+
+		# Write to a temporary file first, so an interrupted build can't leave a truncated cache behind. The file name is
+		# unique per process, as parallel read workers might write the same cache.
+		temporaryFile = cacheFile.with_suffix(f".{getpid()}.tmp")
+		try:
+			cacheFile.parent.mkdir(parents=True, exist_ok=True)
+			temporaryFile.write_text(dumps(cache, sort_keys=True), encoding="utf-8")
+			temporaryFile.replace(cacheFile)
+		except OSError as ex:
+			raise self._error(f"Writing analysis cache '{cacheFile}' failed.") from ex
@@ -0,0 +1,541 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Lightweight streaming scanners for JUnit XML files.**
+
+:class:`JUnitCounts` tallies testcases per status without building an object model.
+
+:class:`JUnitIndex` records, per testcase, the byte ranges of detail elements like ``<failure>`` or ``<system-out>``,
+but not their content. The content is read on demand by seeking into the file.
+"""
+from copy              import copy
+from io                import BytesIO
+from pathlib           import Path
+from typing            import BinaryIO, Dict, List, Optional as Nullable, Tuple
+from xml.parsers.expat import ParserCreate, ExpatError
+
+from pyTooling.Decorators       import export, readonly
+from pyEDAA.Reports.Unittesting        import TestcaseStatus
+
+from sphinx_reports.Common import ReportExtensionError
+
+
+@export
+class JUnitIndexError(ReportExtensionError):
+	pass
+
+
+@export
+class DetailSpan:
+	"""
+	Byte range of a detail element (e.g. ``<failure>``) within a JUnit XML file.
+
+	The range starts at the element's start tag and ends at the beginning of the element's end tag (or after ``/>`` for
+	empty elements).
+	"""
+
+	_kind:  str
+	_start: int
+	_stop:  int
+
+	def __init__(self, kind: str, start: int, stop: int) -> None:
+		self._kind = kind
+		self._start = start
+		self._stop = stop
+
+	@readonly
+	def Kind(self) -> str:
+		"""
+		Read-only property to access the element name (``failure``, ``error``, ``skipped``, ``system-out`` or ``system-err``).
+
+		:return: Element name.
+		"""
+		return self._kind
+
+	@readonly
+	def Start(self) -> int:
+		"""
+		Read-only property to access the byte offset of the element's start tag.
+
+		:return: Byte offset.
+		"""
+		return self._start
+
+	@readonly
+	def Stop(self) -> int:
+		"""
+		Read-only property to access the byte offset after the element's content.
+
+		:return: Byte offset.
+		"""
+		return self._stop
+
+	def __len__(self) -> int:
+		return self._stop - self._start
+
+
+@export
+class IndexedTestcase:
+	"""
+	A testcase entry in a :class:`JUnitIndex`.
+	"""
+
+	_testsuite: str
+	_classname: str
+	_name:      str
+	_duration:  Nullable[float]
+	_status:    TestcaseStatus
+	_details:   Tuple[DetailSpan, ...]
+
+	def __init__(self, testsuite: str, classname: str, name: str, duration: Nullable[float], details: Tuple[DetailSpan, ...]) -> None:
+		self._testsuite = testsuite
+		self._classname = classname
+		self._name = name
+		self._duration = duration
+		self._details = details
+
+		kinds = {detail._kind for detail in details}
+		if "error" in kinds:
+			self._status = TestcaseStatus.Errored
+		elif "failure" in kinds:
+			self._status = TestcaseStatus.Failed
+		elif "skipped" in kinds:
+			self._status = TestcaseStatus.Skipped
+		else:
+			self._status = TestcaseStatus.Passed
+
+	@readonly
+	def Testsuite(self) -> str:
+		"""
+		Read-only property to access the names of all enclosing testsuites, separated by ``::``.
+
+		:return: Testsuite path.
+		"""
+		return self._testsuite
+
+	@readonly
+	def Classname(self) -> str:
+		"""
+		Read-only property to access the testcase's ``classname`` attribute.
+
+		:return: Classname or empty string.
+		"""
+		return self._classname
+
+	@readonly
+	def Name(self) -> str:
+		"""
+		Read-only property to access the testcase's name.
+
+		:return: Name of the testcase.
+		"""
+		return self._name
+
+	@readonly
+	def FullName(self) -> str:
+		"""
+		Read-only property to access the testcase's name qualified by its classname.
+
+		:return: ``classname.name`` or ``name``.
+		"""
+		return f"{self._classname}.{self._name}" if self._classname != "" else self._name
+
+	@readonly
+	def Duration(self) -> Nullable[float]:
+		"""
+		Read-only property to access the testcase's duration.
+
+		:return: Duration in seconds or ``None``, if not specified.
+		"""
+		return self._duration
+
+	@readonly
+	def Status(self) -> TestcaseStatus:
+		"""
+		Read-only property to access the testcase's status derived from its detail elements.
+
+		:return: ``Errored``, ``Failed``, ``Skipped`` or ``Passed``.
+		"""
+		return self._status
+
+	@readonly
+	def Details(self) -> Tuple[DetailSpan, ...]:
+		"""
+		Read-only property to access the byte ranges of the testcase's detail elements.
+
+		:return: Tuple of detail spans in document order.
+		"""
+		return self._details
+
+
+@export
+class JUnitCounts:
+	"""
+	Headline numbers of a JUnit XML file as computed by :meth:`JUnitCounts.Scan`.
+
+	A testcase is counted once, even if it contains multiple ``<failure>`` or ``<error>`` elements. Errors take precedence
+	over failures and failures take precedence over skips.
+	"""
+
+	_tests:    int
+	_failed:   int
+	_errored:  int
+	_skipped:  int
+	_duration: float
+
+	def __init__(self, tests: int = 0, failed: int = 0, errored: int = 0, skipped: int = 0, duration: float = 0.0) -> None:
+		self._tests = tests
+		self._failed = failed
+		self._errored = errored
+		self._skipped = skipped
+		self._duration = duration
+
+	@classmethod
+	def Scan(cls, xmlFile: Path) -> "JUnitCounts":
+		"""
+		Count testcases per status and sum up their durations in a single streaming pass over a JUnit XML file.
+
+		No object model is created; only ``<testcase>``, ``<failure>``, ``<error>`` and ``<skipped>`` elements are looked
+		at.
+
+		:param xmlFile:          Path to the JUnit XML file.
+		:return:                 The counts.
+		:raises JUnitIndexError: If the file can't be read or isn't well-formed XML.
+		"""
+		counts = cls()
+		parser = ParserCreate()
+		depth = -1
+		outcome = ""
+
+		def startElement(name: str, attributes: Dict[str, str]) -> None:
+			nonlocal depth, outcome
+
+			if depth >= 0:
+				depth += 1
+				if depth == 1 and name in ("failure", "error", "skipped"):
+					# Precedence: error > failure > skipped
+					if name == "error" or outcome == "" or (name == "failure" and outcome == "skipped"):
+						outcome = name
+			elif name == "testcase":
+				depth = 0
+				outcome = ""
+				counts._tests += 1
+				try:
+					counts._duration += float(attributes["time"])
+				except (KeyError, ValueError):
+					pass
+
+		def endElement(_: str) -> None:
+			nonlocal depth
+
+			if depth == 0:
+				if outcome == "error":
+					counts._errored += 1
+				elif outcome == "failure":
+					counts._failed += 1
+				elif outcome == "skipped":
+					counts._skipped += 1
+			if depth >= 0:
+				depth -= 1
+
+		parser.StartElementHandler = startElement
+		parser.EndElementHandler = endElement
+
+		try:
+			with xmlFile.open("rb") as file:
+				parser.ParseFile(file)
+		except OSError as ex:
+			raise JUnitIndexError(f"Reading JUnit file '{xmlFile}' failed.") from ex
+		except ExpatError as ex:
+			raise JUnitIndexError(f"Parsing JUnit file '{xmlFile}' failed.") from ex
+
+		return counts
+
+	@readonly
+	def Tests(self) -> int:
+		"""
+		Read-only property to access the number of testcases.
+
+		:return: Number of testcases.
+		"""
+		return self._tests
+
+	@readonly
+	def Passed(self) -> int:
+		"""
+		Read-only property to access the number of testcases without failure, error or skip.
+
+		:return: Number of passed testcases.
+		"""
+		return self._tests - self._failed - self._errored - self._skipped
+
+	@readonly
+	def Failed(self) -> int:
+		"""
+		Read-only property to access the number of failed testcases.
+
+		:return: Number of testcases containing a ``<failure>`` element.
+		"""
+		return self._failed
+
+	@readonly
+	def Errored(self) -> int:
+		"""
+		Read-only property to access the number of errored testcases.
+
+		:return: Number of testcases containing an ``<error>`` element.
+		"""
+		return self._errored
+
+	@readonly
+	def Skipped(self) -> int:
+		"""
+		Read-only property to access the number of skipped testcases.
+
+		:return: Number of testcases containing a ``<skipped>`` element.
+		"""
+		return self._skipped
+
+	@readonly
+	def Duration(self) -> float:
+		"""
+		Read-only property to access the summed up durations of all testcases.
+
+		:return: Total runtime in seconds.
+		"""
+		return self._duration
+
+
+@export
+class JUnitIndex:
+	"""
+	A byte-offset index into a JUnit XML file.
+
+	The file is scanned once using a streaming expat parser. Neither an object model nor the content of detail elements is
+	kept in memory. The content of a detail element is read by :meth:`ReadDetail`, which seeks to the recorded offset and
+	parses only the requested range.
+	"""
+
+	_detailElements = frozenset(("failure", "error", "skipped", "system-out", "system-err"))
+
+	_xmlFile:   Path
+	_encoding:  Nullable[str]
+	_testcases: List[IndexedTestcase]
+	_content:   Nullable[bytes]
+
+	def __init__(self, xmlFile: Path) -> None:
+		"""
+		Scan a JUnit XML file and create the index.
+
+		:param xmlFile:          Path to the JUnit XML file.
+		:raises JUnitIndexError: If the file can't be read or isn't well-formed XML.
+		"""
+		self._xmlFile = xmlFile
+		self._encoding = None
+		self._testcases = []
+		self._content = None
+
+		try:
+			with xmlFile.open("rb") as file:
+				self._Scan(file)
+		except OSError as ex:
+			raise JUnitIndexError(f"Reading JUnit file '{xmlFile}' failed.") from ex
+		except ExpatError as ex:
+			raise JUnitIndexError(f"Parsing JUnit file '{xmlFile}' failed.") from ex
+
+	def _Scan(self, file: BinaryIO) -> None:
+		parser = ParserCreate()
+		testsuites: List[str] = []
+		testcase: Nullable[Tuple[str, str, Nullable[float]]] = None
+		details: List[DetailSpan] = []
+		detailStart: Nullable[Tuple[str, int]] = None
+		depth = 0
+
+		def xmlDeclaration(version: str, encoding: Nullable[str], standalone: int) -> None:
+			self._encoding = encoding
+
+		def startElement(name: str, attributes: Dict[str, str]) -> None:
+			nonlocal testcase, detailStart, depth
+
+			if testcase is not None:
+				depth += 1
+				if depth == 1 and name in self._detailElements:
+					detailStart = (name, parser.CurrentByteIndex)
+			elif name == "testsuite":
+				testsuites.append(attributes.get("name", ""))
+			elif name == "testcase":
+				try:
+					duration = float(attributes["time"])
+				except (KeyError, ValueError):
+					duration = None
+				testcase = (attributes.get("classname", ""), attributes.get("name", ""), duration)
+				depth = 0
+
+		def endElement(name: str) -> None:
+			nonlocal testcase, detailStart, depth
+
+			if testcase is not None:
+				if depth == 0:
+					classname, testcaseName, duration = testcase
+					self._testcases.append(IndexedTestcase("::".join(testsuites), classname, testcaseName, duration, tuple(details)))
+					details.clear()
+					testcase = None
+				else:
+					if depth == 1 and detailStart is not None:
+						details.append(DetailSpan(detailStart[0], detailStart[1], parser.CurrentByteIndex))
+						detailStart = None
+					depth -= 1
+			elif name == "testsuite":
+				testsuites.pop()
+
+		parser.XmlDeclHandler = xmlDeclaration
+		parser.StartElementHandler = startElement
+		parser.EndElementHandler = endElement
+		parser.ParseFile(file)
+
+	@readonly
+	def XMLFile(self) -> Path:
+		"""
+		Read-only property to access the indexed JUnit XML file.
+
+		:return: Path to the JUnit XML file.
+		"""
+		return self._xmlFile
+
+	@readonly
+	def Testcases(self) -> List[IndexedTestcase]:
+		"""
+		Read-only property to access all testcases in document order.
+
+		:return: List of indexed testcases.
+		"""
+		return self._testcases
+
+	def Open(self) -> BinaryIO:
+		"""
+		Open the indexed file for reading details.
+
+		:return:                 A binary file object to be passed to :meth:`ReadDetail`.
+		:raises JUnitIndexError: If the file can't be opened, e.g. because it was deleted or moved.
+		"""
+		if self._content is not None:
+			return BytesIO(self._content)
+
+		try:
+			return self._xmlFile.open("rb")
+		except OSError as ex:
+			raise JUnitIndexError(f"Opening JUnit file '{self._xmlFile}' failed.") from ex
+
+	def Embed(self, statuses: TestcaseStatus = TestcaseStatus.Failed | TestcaseStatus.Errored) -> "JUnitIndex":
+		"""
+		Create a copy of the index, which holds the detail elements of testcases with the given statuses in memory.
+
+		The copy doesn't need the JUnit XML file anymore, e.g. when it's stored in an artifact. Detail spans of other
+		testcases are dropped, but their status is kept.
+
+		:param statuses:         Statuses of testcases, whose details are embedded.
+		:return:                 The copied index.
+		:raises JUnitIndexError: If the file can't be read.
+		"""
+		embedded = copy(self)
+		embedded._testcases = []
+		content = bytearray()
+
+		try:
+			with self.Open() as file:
+				for testcase in self._testcases:
+					details = []
+					if testcase._status in statuses:
+						for span in testcase._details:
+							file.seek(span._start)
+							details.append(DetailSpan(span._kind, len(content), len(content) + len(span)))
+							content += file.read(len(span))
+
+					testcase = copy(testcase)
+					testcase._details = tuple(details)
+					embedded._testcases.append(testcase)
+		except OSError as ex:
+			raise JUnitIndexError(f"Reading JUnit file '{self._xmlFile}' failed.") from ex
+
+		embedded._content = bytes(content)
+		return embedded
+
+	def ReadDetail(self, file: BinaryIO, span: DetailSpan, maxCharacters: int, chunkSize: int = 16384) -> Tuple[Dict[str, str], str, bool]:
+		"""
+		Read the attributes and text content of a detail element.
+
+		Only the bytes of the given span are read. Reading stops as soon as more than ``maxCharacters`` characters of text
+		content were decoded, so the costs are bounded by the limit, not by the size of the element.
+
+		:param file:             A binary file object returned by :meth:`Open`.
+		:param span:             The detail span to read.
+		:param maxCharacters:    Maximal number of characters of text content to return.
+		:param chunkSize:        Number of bytes read per step.
+		:return:                 A tuple of the element's attributes, its (truncated) text content and a flag indicating
+		                         truncation.
+		:raises JUnitIndexError: If the span can't be read or parsed.
+		"""
+		parser = ParserCreate(self._encoding)
+		attributes: Dict[str, str] = {}
+		text: List[str] = []
+		length = 0
+
+		def startElement(name: str, attrs: Dict[str, str]) -> None:
+			# Only the first start tag is the detail element itself.
+			parser.StartElementHandler = None
+			attributes.update(attrs)
+
+		def characterData(data: str) -> None:
+			nonlocal length
+			text.append(data)
+			length += len(data)
+
+		parser.StartElementHandler = startElement
+		parser.CharacterDataHandler = characterData
+
+		try:
+			file.seek(span._start)
+			remaining = span._stop - span._start
+			while remaining > 0 and length <= maxCharacters:
+				chunk = file.read(min(remaining, chunkSize))
+				if len(chunk) == 0:
+					break
+				remaining -= len(chunk)
+				parser.Parse(chunk, False)
+		except OSError as ex:
+			raise JUnitIndexError(f"Reading '{span._kind}' at offset {span._start} in JUnit file '{self._xmlFile}' failed.") from ex
+		except ExpatError as ex:
+			raise JUnitIndexError(f"Parsing '{span._kind}' at offset {span._start} in JUnit file '{self._xmlFile}' failed.") from ex
+
+		content = "".join(text)
+		truncated = remaining > 0 or len(content) > maxCharacters
+
+		return attributes, content[:maxCharacters], truncated
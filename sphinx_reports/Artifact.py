@@ -0,0 +1,312 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""
+**Pre-converted report artifacts.**
+
+An artifact is a report store file (see :mod:`sphinx_reports.Store`) holding the converted model of a single report. It
+is created outside of Sphinx, e.g. by a CI job right after tests finished, using ``python -m sphinx_reports convert``.
+Configuration entries like ``xml_report`` or ``json_report`` can point to an artifact instead of the original report.
+Then, the model is memory-mapped and deserialized instead of converted.
+
+Entries are keyed by the report kind (``codecov``, ``doccov`` or ``unittest``). Unittest artifacts have additional
+entries used by badges (``unittest/counts``) and failure details (``unittest/index``, holding the detail elements of
+failed and errored testcases). The fingerprint of an entry is ``<sphinx-reports version>:<SHA-256>`` of the
+converted report. As models are pickled (except code coverage models, see :mod:`~sphinx_reports.Codec`), an artifact can
+only be loaded by the sphinx-reports version, which created it.
+"""
+from hashlib import sha256
+from json    import loads
+from pathlib import Path
+from typing  import Any, ClassVar, Dict, Optional as Nullable, Tuple
+
+from pyTooling.Decorators import export
+
+from sphinx_reports.Codec import CodeCoverageView
+from sphinx_reports.Store import ReportStore, ReportStoreError
+
+
+ARTIFACT_SUFFIX = ".spxrpt"  #: File extension of artifacts created by ``python -m sphinx_reports convert``.
+
+
+@export
+class ReportArtifactError(ReportStoreError):
+	pass
+
+
+@export
+class ReportArtifact:
+	"""
+	Create, load and validate pre-converted report artifacts.
+
+	Opened artifacts are cached per process and re-opened, if the file's modification time or size changes.
+	"""
+
+	kinds:      ClassVar[Tuple[str, ...]] = ("codecov", "doccov", "unittest")  #: Supported report kinds.
+	namedKinds: ClassVar[Tuple[str, ...]] = ("codecov", "doccov")              #: Report kinds, which require a package name.
+
+	_artifacts: ClassVar[Dict[Path, Tuple[Tuple[int, int], ReportStore]]] = {}
+
+	@staticmethod
+	def IsArtifact(file: Path) -> bool:
+		"""
+		Check if a configured report file is an artifact.
+
+		:param file: The report file.
+		:returns:    True, if the file is an artifact.
+		"""
+		return ReportStore.IsStoreFile(file)
+
+	@classmethod
+	def DetectKind(cls, source: Path) -> str:
+		"""
+		Detect the kind of a report.
+
+		Directories are analyzed for documentation coverage and XML files are JUnit reports. JSON files are Coverage.py
+		reports, except documentation coverage reports written by sphinx-reports.
+
+		:param source:              The report file or directory.
+		:returns:                   The report kind.
+		:raises ReportArtifactError: If the kind can't be detected.
+		"""
+		if source.is_dir():
+			return "doccov"
+		elif source.suffix == ".xml":
+			return "unittest"
+		elif source.suffix == ".json":
+			from sphinx_reports.Adapter.DocCoverage import DocCoverageJSONReport
+
+			try:
+				report = loads(source.read_text(encoding="utf-8"))
+			except (OSError, ValueError) as ex:
+				raise ReportArtifactError(f"Reading JSON report '{source}' failed.") from ex
+
+			return "doccov" if isinstance(report, dict) and report.get("format") == DocCoverageJSONReport.reportFormat and "package" in report else "codecov"
+
+		raise ReportArtifactError(f"Can't detect the report kind of '{source}'. Use '<kind>:{source}' with kind one of {', '.join(cls.kinds)}.")
+
+	@staticmethod
+	def _Fingerprint(source: Path) -> str:
+		from sphinx_reports import __version__
+
+		digest = sha256()
+		if source.is_dir():
+			for file in sorted(source.rglob("*.py")):
+				digest.update(file.relative_to(source).as_posix().encode("utf-8") + b"\0")
+				digest.update(file.read_bytes())
+		else:
+			digest.update(source.read_bytes())
+
+		return f"{__version__}:{digest.hexdigest()}"
+
+	@classmethod
+	def Convert(cls, kind: str, source: Path, name: str) -> Dict[str, Any]:
+		"""
+		Convert a report into the entries of an artifact.
+
+		The same converters as in a Sphinx build are used, so loading an artifact yields the same model.
+
+		:param kind:                  The report kind.
+		:param source:                The report file or the package directory (documentation coverage).
+		:param name:                  The package name (code and documentation coverage).
+		:returns:                     A dictionary of entry keys and models.
+		:raises ReportExtensionError: If the report can't be read or converted.
+		"""
+		if kind == "codecov":
+			from sphinx_reports.Adapter.Coverage import Analyzer
+
+			return {kind: Analyzer(name, source).Convert()}
+		elif kind == "doccov":
+			from sphinx_reports.Adapter.DocCoverage import DocCoverageJSONReport, IncrementalDocStrCoverage
+
+			if source.is_dir():
+				analyzer = IncrementalDocStrCoverage(name, source)
+				analyzer.Analyze()
+				coverage = analyzer.Convert()
+			else:
+				coverage = DocCoverageJSONReport(name, source).Convert()
+
+			# Documentation coverage models can only be pickled after all fields were assigned by aggregation.
+			coverage.Aggregate()
+			return {kind: coverage}
+		elif kind == "unittest":
+			from sphinx_reports.Adapter.JUnit import JUnitCounts, JUnitIndex
+			from sphinx_reports.Unittest      import UnittestBase
+
+			return {
+				kind:             UnittestBase._ConvertTestsuiteSummary(source),
+				f"{kind}/counts": JUnitCounts.Scan(source),
+				f"{kind}/index":  JUnitIndex(source).Embed(),
+			}
+
+		raise ReportArtifactError(f"Unknown report kind '{kind}'. Supported kinds: {', '.join(cls.kinds)}.")
+
+	@classmethod
+	def Create(cls, kind: str, source: Path, file: Path, name: Nullable[str] = None) -> Path:
+		"""
+		Convert a report and write it as an artifact.
+
+		:param kind:                  The report kind.
+		:param source:                The report file or the package directory (documentation coverage).
+		:param file:                  The artifact file to write. An existing file is replaced.
+		:param name:                  The package name. It's required for code and documentation coverage reports.
+		:returns:                     The written artifact file.
+		:raises ReportExtensionError: If the report can't be converted or the artifact can't be written.
+		"""
+		if not source.exists():
+			raise ReportArtifactError(f"Report '{source}' doesn't exist.") from FileNotFoundError(source)
+		elif name is None and kind in cls.namedKinds:
+			raise ReportArtifactError(f"A package name is required for {kind} report '{source}'.")
+
+		entries = cls.Convert(kind, source, "" if name is None else name)
+		fingerprint = cls._Fingerprint(source)
+
+		file.unlink(missing_ok=True)
+		store = ReportStore(file)
+		for key, model in entries.items():
+			store.Put(key, fingerprint, model)
+		store.Commit()
+		store.Close()
+
+		return file
+
+	@classmethod
+	def _Open(cls, file: Path) -> ReportStore:
+		try:
+			stat = file.stat()
+		except OSError as ex:
+			raise ReportArtifactError(f"Artifact '{file}' doesn't exist.") from ex
+
+		fileKey = (stat.st_mtime_ns, stat.st_size)
+		path = file.resolve()
+		try:
+			cachedKey, store = cls._artifacts[path]
+			if cachedKey == fileKey:
+				return store
+			store.Close()
+		except KeyError:
+			pass
+
+		store = ReportStore(path)
+		if len(store) == 0:
+			raise ReportArtifactError(f"'{file}' is not a valid artifact.")
+
+		cls._artifacts[path] = (fileKey, store)
+		return store
+
+	@classmethod
+	def _OpenEntry(cls, file: Path, key: str) -> ReportStore:
+		from sphinx_reports import __version__
+
+		store = cls._Open(file)
+		if key not in store:
+			kind = store.Keys[0].split("/")[0]
+			raise ReportArtifactError(f"Artifact '{file}' contains a '{kind}' report, but a '{key.split('/')[0]}' report is required.")
+
+		version = store.Fingerprint(key).split(":")[0]
+		if version != __version__:
+			raise ReportArtifactError(f"Artifact '{file}' was created by sphinx-reports {version}, but {__version__} is used. Recreate the artifact.")
+
+		return store
+
+	@classmethod
+	def Load(cls, file: Path, key: str) -> Any:
+		"""
+		Load a model from an artifact.
+
+		:param file:                 The artifact file.
+		:param key:                  The entry's key, e.g. ``unittest`` or ``unittest/counts``.
+		:returns:                    The deserialized model.
+		:raises ReportArtifactError: If the artifact has no such entry or was created by another sphinx-reports version.
+		"""
+		store = cls._OpenEntry(file, key)
+		try:
+			return store.Load(key)
+		except ReportArtifactError:
+			raise
+		except ReportStoreError as ex:
+			raise ReportArtifactError(f"Loading '{key}' from artifact '{file}' failed.") from ex
+
+	@classmethod
+	def View(cls, file: Path, key: str) -> CodeCoverageView:
+		"""
+		Return a random-access view of a code coverage model in an artifact.
+
+		:param file:                 The artifact file.
+		:param key:                  The entry's key, e.g. ``codecov``.
+		:returns:                    A view of the entry.
+		:raises ReportArtifactError: If the artifact has no such entry, was created by another sphinx-reports version or
+		                             the entry doesn't support random access.
+		"""
+		store = cls._OpenEntry(file, key)
+		try:
+			return store.View(key)
+		except ReportStoreError as ex:
+			raise ReportArtifactError(f"Reading '{key}' from artifact '{file}' failed.") from ex
+
+	@classmethod
+	def Validate(cls, file: Path) -> str:
+		"""
+		Check that all entries of an artifact can be loaded and have the expected types.
+
+		:param file:                 The artifact file.
+		:returns:                    A short description of the artifact's content.
+		:raises ReportArtifactError: If the artifact is invalid.
+		"""
+		store = cls._Open(file)
+		kinds = {key.split("/")[0] for key in store.Keys}
+		if len(kinds) != 1 or (kind := kinds.pop()) not in cls.kinds or kind not in store:
+			raise ReportArtifactError(f"Artifact '{file}' contains unexpected entries: {', '.join(store.Keys)}.")
+
+		models = {key: cls.Load(file, key) for key in store.Keys}
+		if kind == "unittest":
+			from pyEDAA.Reports.Unittesting   import TestsuiteSummary
+			from sphinx_reports.Adapter.JUnit import JUnitCounts, JUnitIndex
+
+			testsuiteSummary, executions = models[kind]
+			counts = models.get(f"{kind}/counts")
+			index = models.get(f"{kind}/index")
+			if not (isinstance(testsuiteSummary, TestsuiteSummary) and isinstance(executions, list) and isinstance(counts, JUnitCounts) and isinstance(index, JUnitIndex)):
+				raise ReportArtifactError(f"Artifact '{file}' contains an invalid unittest model.")
+
+			return f"unittest: {counts.Tests} testcases ({counts.Failed} failed, {counts.Errored} errored, {counts.Skipped} skipped)"
+		elif kind == "codecov":
+			from sphinx_reports.DataModel.CodeCoverage import PackageCoverage as CodeCoveragePackage
+
+			if not isinstance(models[kind], CodeCoveragePackage):
+				raise ReportArtifactError(f"Artifact '{file}' contains an invalid code coverage model.")
+		else:
+			from pyEDAA.Reports.DocumentationCoverage.Python import PackageCoverage as DocCoveragePackage
+
+			if not isinstance(models[kind], DocCoveragePackage):
+				raise ReportArtifactError(f"Artifact '{file}' contains an invalid documentation coverage model.")
+
+		return f"{kind}: package '{models[kind].Name}'"
@@ -32,7 +32,7 @@
 **Report code coverage as Sphinx documentation page(s).**
 """
 from pathlib import Path
-from typing  import Dict, Tuple, Any, List, Mapping, Generator, TypedDict, Union, Optional as Nullable, ClassVar
+from typing  import Dict, Tuple, Any, List, Mapping, Generator, TypedDict, Union, Optional as Nullable, ClassVar, Set
 
 from docutils                              import nodes
 from docutils.parsers.rst.directives       import flag
@@ -40,14 +40,18 @@ from sphinx.addnodes                       import toctree
 from sphinx.application                    import Sphinx
 from sphinx.config                         import Config
 from sphinx.directives.code                import LiteralIncludeReader
+from sphinx.environment                    import BuildEnvironment
 from sphinx.util.docutils                  import new_document
+from sphinx.util.logging                   import getLogger
 from pyTooling.Decorators                  import export
 
 from sphinx_reports.Common                 import ReportExtensionError, LegendStyle
 from sphinx_reports.Sphinx                 import strip, stripAndNormalize, BaseDirective
 from sphinx_reports.Node                   import Landscape
 from sphinx_reports.DataModel.CodeCoverage import PackageCoverage, Coverage, ModuleCoverage
-from sphinx_reports.Adapter.Coverage       import Analyzer
+from sphinx_reports.Artifact               import ReportArtifact
+from sphinx_reports.Codec                  import CoverageRecord
+from sphinx_reports.Store                  import ReportStore, ReportStoreError
 
 
 class package_DictType(TypedDict):
@@ -123,7 +127,7 @@ class CodeCoverageBase(BaseDirective):
 
 		:param sphinxApplication:   Sphinx application instance.
 		"""
-		print(f"[REPORT] Reading code coverage reports ...")
+		getLogger(__name__).info("[REPORT] Reading code coverage reports ...")
 
 	@classmethod
 	def _CheckLevelsConfiguration(cls, sphinxConfiguration: Config) -> None:
@@ -246,6 +250,99 @@ class CodeCoverageBase(BaseDirective):
 				"levels": levelDefinition
 			}
 
+	@classmethod
+	def _LoadCoverage(cls, reportID: str) -> PackageCoverage:
+		"""
+		Load and convert the coverage report referenced by a reportid.
+
+		The converted model is cached in the report store. The entry is invalidated if the report file's modification time
+		or size changes. If the report is an artifact created by ``python -m sphinx_reports convert``, the model is loaded
+		from the artifact instead.
+
+		:param reportID:              The reportid as used in ``report_codecov_packages``.
+		:return:                      The package coverage.
+		:raises ReportExtensionError: If the report can't be read.
+		"""
+		packageConfiguration = cls._packageConfigurations[reportID]
+		jsonReport = packageConfiguration["json_report"]
+
+		if ReportArtifact.IsArtifact(jsonReport):
+			return ReportArtifact.Load(jsonReport, cls.configPrefix)
+
+		try:
+			stat = jsonReport.stat()
+		except OSError as ex:
+			raise ReportExtensionError(f"JSON coverage report '{jsonReport}' not found.") from ex
+
+		from sphinx_reports.Adapter.Coverage import Analyzer
+
+		return ReportStore.Default().Get(
+			f"{cls.configPrefix}/{reportID}",
+			f"{stat.st_mtime_ns}:{stat.st_size}",
+			lambda: Analyzer(packageConfiguration["name"], jsonReport).Convert()
+		)
+
+	@classmethod
+	def _LoadModuleCoverage(cls, reportID: str, moduleName: str) -> CoverageRecord:
+		"""
+		Read the coverage record of a single package or module without deserializing the whole coverage model.
+
+		If the cached model is outdated, the report is converted first (see :meth:`_LoadCoverage`). Otherwise, the record is
+		read in place from the report store (or artifact) in compact format.
+
+		:param reportID:              The reportid as used in ``report_codecov_packages``.
+		:param moduleName:            Qualified name of the package or module, e.g. ``pkg.sub.module``.
+		:return:                      The package's or module's coverage record.
+		:raises ReportExtensionError: If the report can't be read or has no such package or module.
+		"""
+		jsonReport = cls._packageConfigurations[reportID]["json_report"]
+
+		if ReportArtifact.IsArtifact(jsonReport):
+			view = ReportArtifact.View(jsonReport, cls.configPrefix)
+		else:
+			try:
+				stat = jsonReport.stat()
+			except OSError as ex:
+				raise ReportExtensionError(f"JSON coverage report '{jsonReport}' not found.") from ex
+
+			store = ReportStore.Default()
+			key = f"{cls.configPrefix}/{reportID}"
+			fingerprint = f"{stat.st_mtime_ns}:{stat.st_size}"
+			if key not in store or store.Fingerprint(key) != fingerprint:
+				cls._LoadCoverage(reportID)
+
+			try:
+				view = store.View(key)
+			except ReportStoreError:
+				# Entry was written in another format, e.g. by an older sphinx-reports version.
+				store.Put(key, fingerprint, cls._LoadCoverage(reportID))
+				view = store.View(key)
+
+		with view:
+			try:
+				return view[moduleName]
+			except KeyError as ex:
+				raise ReportExtensionError(f"Module '{moduleName}' not found in coverage report '{jsonReport}'.") from ex
+
+	@classmethod
+	def PreloadReports(cls, env: BuildEnvironment, reportIDs: Nullable[Set[str]]) -> None:
+		"""
+		Convert coverage reports before documents are read by parallel workers.
+
+		Errors are ignored here. They are reported by the directive.
+
+		:param env:       The Sphinx build environment.
+		:param reportIDs: Reportids of reports to convert or ``None`` for all reports.
+		"""
+		for reportID in cls._packageConfigurations:
+			if reportIDs is not None and reportID not in reportIDs:
+				continue
+
+			try:
+				cls._LoadCoverage(reportID)
+			except ReportExtensionError:
+				pass
+
 	def _ConvertToColor(self, currentLevel: float, configKey: str) -> str:
 		if currentLevel < 0.0:
 			return self._levels["error"][configKey]
@@ -428,9 +525,16 @@ class CodeCoverage(CodeCoverageBase):
 			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
 			return self._internalError(container, __name__, message, ex)
 
-		# Assemble a list of Python source files
-		analyzer = Analyzer(self._packageName, self._jsonReport)
-		self._coverage = analyzer.Convert()
+		try:
+			self._coverage = self._LoadCoverage(self._reportID)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when reading coverage report '{self._jsonReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		self.env.note_dependency(str(self._jsonReport.resolve()))
+		from sphinx_reports import ReportDomain
+
+		ReportDomain.Get(self.env).NoteReport(self.env.docname, self.configPrefix, self._reportID)
 		# self._coverage.Aggregate()
 
 		self._CreatePages()
@@ -601,7 +705,7 @@ class ModuleCoverage(CodeCoverageBase):
 	optional_arguments = 2
 
 	option_spec = CodeCoverageBase.option_spec | {
-		"module": stripAndNormalize
+		"module": strip
 	}
 
 	_packageName:      str
@@ -633,13 +737,20 @@ class ModuleCoverage(CodeCoverageBase):
 			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
 			return self._internalError(container, __name__, message, ex)
 
-		# Assemble a list of Python source files
-		analyzer = Analyzer(self._packageName, self._jsonReport)
-		self._coverage = analyzer.Convert()
+		try:
+			record = self._LoadModuleCoverage(self._reportID, self._moduleName)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when reading coverage report '{self._jsonReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		self.env.note_dependency(str(self._jsonReport.resolve()))
+		from sphinx_reports import ReportDomain
+
+		ReportDomain.Get(self.env).NoteReport(self.env.docname, self.configPrefix, self._reportID)
 
 		sourceFile = "../../sphinx_reports/__init__.py"
 
-		container += nodes.paragraph(text=f"Code coverage of {self._moduleName}")
+		container += nodes.paragraph(text=f"Code coverage of {self._moduleName}: {record.Coverage:.1%}")
 
 		# lexer = get_lexer_by_name("python", tabsize=2)
 		# tokens = lex(code, lexer)
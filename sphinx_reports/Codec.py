@@ -0,0 +1,466 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""
+**Compact binary formats for converted report models.**
+
+Models in the report store are pickled by default. Unpickling a large object tree (e.g. code coverage of 50 000 files)
+is slow and doesn't allow reading a single record. Therefore, code coverage models are stored in a columnar format:
+counters are packed into arrays, which are read in place via :class:`memoryview` casts, strings are deduplicated into a
+string table and the package hierarchy is stored as parent indices.
+
+.. rubric:: Code coverage format (version 1)
+
+All integers are little-endian. Each array starts at an offset (relative to the payload's start) aligned to its item
+size.
+
+* Header: magic ``SRCC`` (4 bytes), format version (``uint16``), reserved (``uint16``), number of records N
+  (``uint32``), number of strings S (``uint32``), length of the string data (``uint32``), reserved (``uint32``).
+* Coverage: N ``float64``.
+* Counters: N × 8 ``uint32`` (total, excluded, covered and missing statements; total, covered, partial and missing
+  branches).
+* Parents: N ``int32``, the index of the parent record or -1 for the root package. Parents precede their children.
+* Names and files: 2 × N ``uint32`` string indices.
+* Order: N ``uint32`` record indices sorted by qualified name (e.g. ``pkg.sub.module``) for binary search. Qualified
+  names aren't stored, they are derived from the parent indices.
+* String offsets: S + 1 ``uint32`` byte offsets into the string data.
+* Kinds: N ``uint8``, 0 for packages and 1 for modules.
+* String data: UTF-8 strings, each terminated by a NUL byte.
+"""
+from array   import array
+from pathlib import Path
+from struct  import Struct, error as StructError
+from sys     import byteorder
+from typing  import Any, Dict, List, Sequence, Tuple, Union, cast
+
+from pyTooling.Decorators import export, readonly
+
+from sphinx_reports.Common                 import ReportExtensionError
+from sphinx_reports.DataModel.CodeCoverage import PackageCoverage, ModuleCoverage
+
+
+_header = Struct("<4sHHIIII")
+
+_magic =   b"SRCC"
+_version = 1
+
+_package = 0
+_module =  1
+
+_counterFields = (
+	"_totalStatements", "_excludedStatements", "_coveredStatements", "_missingStatements",
+	"_totalBranches", "_coveredBranches", "_partialBranches", "_missingBranches"
+)
+_fields = {
+	PackageCoverage: frozenset(("_name", "_parent", "_file", "_coverage", "_modules", "_packages", *_counterFields)),
+	ModuleCoverage:  frozenset(("_name", "_parent", "_file", "_coverage", *_counterFields)),
+}  #: Fields written by the format. Objects with other fields are rejected, so decoded models are never incomplete.
+
+
+@export
+class CodecError(ReportExtensionError):
+	pass
+
+
+def _Array(typecode: str, values: Sequence[Union[int, float]]) -> bytes:
+	data = array(typecode, values)
+	if byteorder != "little":
+		data.byteswap()
+
+	return data.tobytes()
+
+
+def _Padding(length: int, alignment: int = 8) -> bytes:
+	return b"\0" * (-length % alignment)
+
+
+@export
+class CoverageRecord:
+	"""
+	A single package or module record read from a :class:`CodeCoverageView`.
+	"""
+
+	_index:         int
+	_name:          str
+	_qualifiedName: str
+	_file:          Path
+	_isPackage:     bool
+	_parent:        int
+	_counters:      Tuple[int, ...]
+	_coverage:      float
+
+	def __init__(self, index: int, name: str, qualifiedName: str, file: Path, isPackage: bool, parent: int, counters: Tuple[int, ...], coverage: float) -> None:
+		self._index = index
+		self._name = name
+		self._qualifiedName = qualifiedName
+		self._file = file
+		self._isPackage = isPackage
+		self._parent = parent
+		self._counters = counters
+		self._coverage = coverage
+
+	@readonly
+	def Index(self) -> int:
+		return self._index
+
+	@readonly
+	def Name(self) -> str:
+		return self._name
+
+	@readonly
+	def QualifiedName(self) -> str:
+		return self._qualifiedName
+
+	@readonly
+	def File(self) -> Path:
+		return self._file
+
+	@readonly
+	def IsPackage(self) -> bool:
+		return self._isPackage
+
+	@readonly
+	def Parent(self) -> int:
+		"""
+		Read-only property to access the index of the parent record.
+
+		:returns: Index of the parent record or -1 for the root package.
+		"""
+		return self._parent
+
+	@readonly
+	def Counters(self) -> Dict[str, int]:
+		"""
+		Read-only property to access the record's counters.
+
+		:returns: A dictionary of counter names (e.g. ``TotalStatements``) and values.
+		"""
+		return {field[1].upper() + field[2:]: value for field, value in zip(_counterFields, self._counters)}
+
+	@readonly
+	def Coverage(self) -> float:
+		return self._coverage
+
+
+@export
+class CodeCoverageView:
+	"""
+	Random access to a code coverage model in the compact format without deserializing the whole model.
+
+	On little-endian machines, arrays are read in place from the given buffer. Call :meth:`Release` (or use the view as a
+	context manager) to release the buffer, e.g. before a memory-mapped file is closed.
+	"""
+
+	_buffer:         memoryview
+	_count:          int
+	_counters:       Any
+	_coverage:       Any
+	_parents:        Any
+	_names:          Any
+	_files:          Any
+	_order:          Any
+	_stringOffsets:  Any
+	_kinds:          memoryview
+	_strings:        memoryview
+
+	def __init__(self, buffer: Union[bytes, bytearray, memoryview]) -> None:
+		"""
+		Parse the header and map all arrays.
+
+		:param buffer:     A payload written by :meth:`CodeCoverageCodec.Encode`.
+		:raises CodecError: If the payload isn't in a supported format or is truncated.
+		"""
+		self._buffer = memoryview(buffer).cast("B")
+
+		try:
+			magic, version, _, count, strings, stringLength, _ = _header.unpack_from(self._buffer, 0)
+		except StructError as ex:
+			raise CodecError("Code coverage payload is truncated.") from ex
+
+		if magic != _magic:
+			raise CodecError("Payload is not a code coverage model.")
+		elif version != _version:
+			raise CodecError(f"Unsupported code coverage format version {version}.")
+
+		self._count = count
+		position = _header.size
+		self._coverage,      position = self._Map(position, "d", count)
+		self._counters,      position = self._Map(position, "I", 8 * count)
+		self._parents,       position = self._Map(position, "i", count)
+		self._names,         position = self._Map(position, "I", count)
+		self._files,         position = self._Map(position, "I", count)
+		self._order,         position = self._Map(position, "I", count)
+		self._stringOffsets, position = self._Map(position, "I", strings + 1)
+
+		if position + count + stringLength > len(self._buffer):
+			raise CodecError("Code coverage payload is truncated.")
+
+		self._kinds = self._buffer[position:position + count]
+		self._strings = self._buffer[position + count:position + count + stringLength]
+
+	def _Map(self, position: int, typecode: str, count: int) -> Tuple[Any, int]:
+		end = position + count * array(typecode).itemsize
+		if end > len(self._buffer):
+			raise CodecError("Code coverage payload is truncated.")
+
+		if byteorder == "little":
+			values: Any = self._buffer[position:end].cast(cast(Any, typecode))
+		else:
+			values = array(typecode, self._buffer[position:end])
+			values.byteswap()
+
+		return values, end + len(_Padding(end))
+
+	def __len__(self) -> int:
+		return self._count
+
+	def __enter__(self) -> "CodeCoverageView":
+		return self
+
+	def __exit__(self, *_: Any) -> None:
+		self.Release()
+
+	def _String(self, index: int) -> str:
+		return str(self._strings[self._stringOffsets[index]:self._stringOffsets[index + 1] - 1], "utf-8")
+
+	def _QualifiedName(self, index: int) -> str:
+		names = []
+		while index >= 0:
+			names.append(self._String(self._names[index]))
+			index = self._parents[index]
+
+		return ".".join(reversed(names))
+
+	def Find(self, qualifiedName: str) -> int:
+		"""
+		Find a record by its qualified name using a binary search.
+
+		:param qualifiedName: Qualified name of a package or module, e.g. ``pkg.sub.module``.
+		:returns:             Index of the record.
+		:raises KeyError:     If no record has this name.
+		"""
+		low, high = 0, self._count
+		while low < high:
+			middle = (low + high) // 2
+			if self._QualifiedName(self._order[middle]) < qualifiedName:
+				low = middle + 1
+			else:
+				high = middle
+
+		if low < self._count and self._QualifiedName(self._order[low]) == qualifiedName:
+			return int(self._order[low])
+
+		raise KeyError(qualifiedName)
+
+	def Record(self, index: int) -> CoverageRecord:
+		"""
+		Read a single record.
+
+		:param index:       Index of the record.
+		:returns:           The record.
+		:raises IndexError: If the index is out of range.
+		"""
+		if not (0 <= index < self._count):
+			raise IndexError(index)
+
+		return CoverageRecord(
+			index,
+			self._String(self._names[index]),
+			self._QualifiedName(index),
+			Path(self._String(self._files[index])),
+			self._kinds[index] == _package,
+			self._parents[index],
+			tuple(self._counters[8 * index:8 * index + 8]),
+			self._coverage[index]
+		)
+
+	def __getitem__(self, qualifiedName: str) -> CoverageRecord:
+		return self.Record(self.Find(qualifiedName))
+
+	def ToModel(self) -> PackageCoverage:
+		"""
+		Deserialize the whole model.
+
+		:returns: The root package's coverage.
+		"""
+		strings = str(self._strings, "utf-8").split("\0")
+		counters = self._counters.tolist()
+		paths: Dict[int, Path] = {}
+		objects: List[Union[PackageCoverage, ModuleCoverage]] = []
+		obj: Union[PackageCoverage, ModuleCoverage]
+
+		records = zip(self._names.tolist(), self._files.tolist(), self._parents.tolist(), self._kinds.tolist(), self._coverage.tolist())
+		for index, (name, file, parent, kind, coverage) in enumerate(records):
+			try:
+				path = paths[file]
+			except KeyError:
+				path = paths[file] = Path(strings[file])
+
+			name = strings[name]
+			parent = cast(PackageCoverage, objects[parent]) if parent >= 0 else None
+			offset = 8 * index
+			fields = {
+				"_name":               name,
+				"_parent":             parent,
+				"_file":               path,
+				"_totalStatements":    counters[offset],
+				"_excludedStatements": counters[offset + 1],
+				"_coveredStatements":  counters[offset + 2],
+				"_missingStatements":  counters[offset + 3],
+				"_totalBranches":      counters[offset + 4],
+				"_coveredBranches":    counters[offset + 5],
+				"_partialBranches":    counters[offset + 6],
+				"_missingBranches":    counters[offset + 7],
+				"_coverage":           coverage
+			}
+
+			if kind == _package:
+				obj = PackageCoverage.__new__(PackageCoverage)
+				fields["_modules"] = {}
+				fields["_packages"] = {}
+				if parent is not None:
+					parent._packages[name] = obj
+			else:
+				obj = ModuleCoverage.__new__(ModuleCoverage)
+				cast(PackageCoverage, parent)._modules[name] = obj
+
+			obj.__dict__ = fields
+			objects.append(obj)
+
+		return cast(PackageCoverage, objects[0])
+
+	def Release(self) -> None:
+		"""
+		Release the buffer. The view can't be used afterwards.
+		"""
+		for name in ("_counters", "_coverage", "_parents", "_names", "_files", "_order", "_stringOffsets", "_kinds", "_strings", "_buffer"):
+			values = getattr(self, name, None)
+			if isinstance(values, memoryview):
+				values.release()
+
+
+@export
+class CodeCoverageCodec:
+	"""
+	Writer and reader of code coverage models in the compact format.
+	"""
+
+	@staticmethod
+	def Encode(root: PackageCoverage) -> bytes:
+		"""
+		Serialize a code coverage model.
+
+		:param root:        The root package's coverage.
+		:returns:           The payload.
+		:raises CodecError: If the model contains objects or fields, which can't be represented by the format.
+		"""
+		records: List[Tuple[Union[PackageCoverage, ModuleCoverage], int, int, str]] = []
+
+		def check(obj: Union[PackageCoverage, ModuleCoverage]) -> None:
+			if type(obj) not in _fields or obj.__dict__.keys() != _fields[type(obj)]:
+				raise CodecError(f"'{obj._name}' ({obj.__class__.__name__}) can't be represented by the code coverage format.")
+
+		def visit(package: PackageCoverage, parent: int, qualifiedName: str) -> None:
+			check(package)
+			index = len(records)
+			records.append((package, _package, parent, qualifiedName))
+			for child in package._packages.values():
+				visit(child, index, f"{qualifiedName}.{child._name}")
+			for module in package._modules.values():
+				check(module)
+				records.append((module, _module, index, f"{qualifiedName}.{module._name}"))
+
+		visit(root, -1, root._name)
+
+		strings: Dict[str, int] = {}
+
+		def intern(value: str) -> int:
+			try:
+				return strings[value]
+			except KeyError:
+				strings[value] = len(strings)
+				return strings[value]
+
+		names = [intern(obj._name) for obj, _, _, _ in records]
+		files = [intern(obj._file.as_posix()) for obj, _, _, _ in records]
+		order = sorted(range(len(records)), key=lambda index: records[index][3])
+
+		encoded = [value.encode("utf-8") + b"\0" for value in strings]
+		offsets = [0]
+		for value in encoded:
+			offsets.append(offsets[-1] + len(value))
+		stringData = b"".join(encoded)
+
+		try:
+			sections = [
+				_header.pack(_magic, _version, 0, len(records), len(strings), len(stringData), 0),
+				_Array("d", [obj._coverage for obj, _, _, _ in records]),
+				_Array("I", [getattr(obj, field) for obj, _, _, _ in records for field in _counterFields]),
+				_Array("i", [parent for _, _, parent, _ in records]),
+				_Array("I", names),
+				_Array("I", files),
+				_Array("I", order),
+				_Array("I", offsets),
+			]
+		except OverflowError as ex:
+			raise CodecError("Code coverage counter exceeds the format's range.") from ex
+
+		payload = bytearray()
+		for section in sections:
+			payload += section
+			payload += _Padding(len(payload))
+		payload += bytes(kind for _, kind, _, _ in records)
+		payload += stringData
+
+		return bytes(payload)
+
+	@staticmethod
+	def View(buffer: Union[bytes, bytearray, memoryview]) -> CodeCoverageView:
+		"""
+		Create a random-access view of a payload.
+
+		:param buffer:      The payload.
+		:returns:           The view.
+		:raises CodecError: If the payload isn't in a supported format.
+		"""
+		return CodeCoverageView(buffer)
+
+	@staticmethod
+	def Decode(buffer: Union[bytes, bytearray, memoryview]) -> PackageCoverage:
+		"""
+		Deserialize a code coverage model.
+
+		:param buffer:      The payload.
+		:returns:           The root package's coverage.
+		:raises CodecError: If the payload isn't in a supported format.
+		"""
+		with CodeCoverageView(buffer) as view:
+			return view.ToModel()
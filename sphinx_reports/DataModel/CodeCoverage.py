@@ -34,8 +34,7 @@
 from pathlib import Path
 from typing  import Optional as Nullable, Dict, Union, Generic, TypeVar
 
-from pyTooling.Decorators                        import export, readonly
-from pyEDAA.Reports.DocumentationCoverage.Python import PackageCoverage
+from pyTooling.Decorators import export, readonly
 
 
 _ParentType = TypeVar("_ParentType", bound="Base")
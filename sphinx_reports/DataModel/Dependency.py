@@ -28,8 +28,10 @@
 # SPDX-License-Identifier: Apache-2.0                                                                                  #
 # ==================================================================================================================== #
 #
-""""""
-from typing import List, Iterable
+"""
+**Abstract data model for Python distributions and their dependencies.**
+"""
+from typing import Optional as Nullable, List, Iterable, Dict
 
 from pyTooling.Decorators import export, readonly
 
@@ -41,6 +43,13 @@ class VersionSpecifier:
 	def __init__(self, spec: str) -> None:
 		self._spec = spec
 
+	@readonly
+	def Spec(self) -> str:
+		return self._spec
+
+	def __str__(self) -> str:
+		return self._spec
+
 
 @export
 class License:
@@ -49,31 +58,98 @@ class License:
 	def __init__(self, name: str) -> None:
 		self._name = name
 
+	@readonly
+	def Name(self) -> str:
+		return self._name
+
+	def __str__(self) -> str:
+		return self._name
+
 
 @export
 class Distribution:
 	_name:         str
 	_packages:     List[str]
-	_version:      VersionSpecifier
+	_version:      Nullable[VersionSpecifier]
 	_licenses:     List[License]
-	_dependencies: List["Distribution"]
+	_dependencies: Dict[str, "Distribution"]
+	_requirements: Dict[str, Nullable[VersionSpecifier]]
 
-	def __init__(self, name: str) -> None:
+	def __init__(self, name: str, version: Nullable[VersionSpecifier] = None, licenses: Nullable[Iterable[License]] = None) -> None:
 		self._name = name
 
 		self._packages = []
-		self._version = None
-		self._licenses = []
-		self._dependencies = []
+		self._version = version
+		self._licenses = [] if licenses is None else list(licenses)
+		self._dependencies = {}
+		self._requirements = {}
 
 	@readonly
 	def Name(self) -> str:
 		return self._name
 
 	@readonly
-	def Version(self) -> VersionSpecifier:
+	def Version(self) -> Nullable[VersionSpecifier]:
 		return self._version
 
+	@readonly
+	def IsInstalled(self) -> bool:
+		return self._version is not None
+
 	@readonly
 	def Licenses(self) -> Iterable[License]:
 		return self._licenses
+
+	@readonly
+	def Dependencies(self) -> Dict[str, "Distribution"]:
+		"""
+		Read-only property to access direct dependencies.
+
+		:returns: A dictionary of directly required distributions, keyed by distribution name.
+		"""
+		return self._dependencies
+
+	@readonly
+	def Requirements(self) -> Dict[str, Nullable[VersionSpecifier]]:
+		"""
+		Read-only property to access the version specifiers of direct dependencies.
+
+		:returns: A dictionary of version specifiers (``None`` if unconstrained), keyed by distribution name.
+		"""
+		return self._requirements
+
+	def AddDependency(self, dependency: "Distribution", requirement: Nullable[VersionSpecifier] = None) -> None:
+		"""
+		Add a direct dependency.
+
+		If the same distribution is required more than once (e.g. via extras), the first version specifier is kept.
+
+		:param dependency:  Required distribution.
+		:param requirement: Version specifier of the requirement.
+		"""
+		key = dependency._name
+		if key not in self._dependencies:
+			self._dependencies[key] = dependency
+			self._requirements[key] = requirement
+
+	def IterateTransitiveDependencies(self) -> Iterable["Distribution"]:
+		"""
+		Iterate all transitive dependencies exactly once (depth-first, pre-order).
+
+		Cycles in the dependency graph are handled.
+
+		:returns: A generator yielding all distributions this distribution depends on.
+		"""
+		visited = {id(self)}
+		stack = list(reversed(self._dependencies.values()))
+		while stack:
+			distribution = stack.pop()
+			if id(distribution) in visited:
+				continue
+
+			visited.add(id(distribution))
+			yield distribution
+			stack.extend(reversed(distribution._dependencies.values()))
+
+	def __str__(self) -> str:
+		return self._name if self._version is None else f"{self._name} {self._version}"
@@ -0,0 +1,231 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Abstract data model for the static import graph of a Python package.**
+"""
+from pathlib import Path
+from typing  import Optional as Nullable, Dict, List, Tuple
+
+from pyTooling.Decorators import export, readonly
+
+
+@export
+class Imports:
+	"""
+	Module-level imports of a Python module or package.
+
+	Imports of other modules within the same package are recorded as fully qualified module names. Imports of other
+	distributions are recorded by their top-level module name. Standard library imports are ignored.
+	"""
+	_name:            str
+	_fullName:        str
+	_file:            Path
+	_parent:          Nullable["PackageImports"]
+	_imports:         List[str]
+	_importedBy:      List[str]
+	_externalImports: List[str]
+	_heavyImports:    List[str]
+	_inCycle:         bool
+	_error:           Nullable[str]
+
+	def __init__(self, name: str, file: Path, parent: Nullable["PackageImports"] = None) -> None:
+		self._name = name
+		self._fullName = name if parent is None else f"{parent._fullName}.{name}"
+		self._file = file
+		self._parent = parent
+		self._imports = []
+		self._importedBy = []
+		self._externalImports = []
+		self._heavyImports = []
+		self._inCycle = False
+		self._error = None
+
+	@readonly
+	def Name(self) -> str:
+		return self._name
+
+	@readonly
+	def FullName(self) -> str:
+		return self._fullName
+
+	@readonly
+	def File(self) -> Path:
+		return self._file
+
+	@readonly
+	def Parent(self) -> Nullable["PackageImports"]:
+		return self._parent
+
+	@readonly
+	def Imports(self) -> List[str]:
+		"""
+		Read-only property to access modules of the same package imported at module level.
+
+		:returns: Sorted list of fully qualified module names.
+		"""
+		return self._imports
+
+	@readonly
+	def ImportedBy(self) -> List[str]:
+		"""
+		Read-only property to access modules of the same package importing this module at module level.
+
+		:returns: Sorted list of fully qualified module names.
+		"""
+		return self._importedBy
+
+	@readonly
+	def ExternalImports(self) -> List[str]:
+		"""
+		Read-only property to access third-party top-level modules imported at module level.
+
+		:returns: Sorted list of top-level module names.
+		"""
+		return self._externalImports
+
+	@readonly
+	def HeavyImports(self) -> List[str]:
+		"""
+		Read-only property to access heavy third-party modules imported at module level.
+
+		These imports are candidates to be deferred into the functions using them.
+
+		:returns: Sorted list of top-level module names.
+		"""
+		return self._heavyImports
+
+	@readonly
+	def FanIn(self) -> int:
+		return len(self._importedBy)
+
+	@readonly
+	def FanOut(self) -> int:
+		return len(self._imports)
+
+	@readonly
+	def InCycle(self) -> bool:
+		return self._inCycle
+
+	@readonly
+	def Error(self) -> Nullable[str]:
+		"""
+		Read-only property to access the error message, if the module couldn't be parsed.
+
+		:returns: Error message or ``None``.
+		"""
+		return self._error
+
+
+@export
+class ModuleImports(Imports):
+	"""
+	Module-level imports of a Python module.
+	"""
+	def __init__(self, name: str, file: Path, parent: Nullable["PackageImports"] = None) -> None:
+		super().__init__(name, file, parent)
+
+		if parent is not None:
+			parent._modules[name] = self
+
+
+@export
+class PackageImports(Imports):
+	"""
+	Module-level imports of a Python package's ``__init__.py`` and its modules and sub-packages.
+	"""
+	_modules:  Dict[str, ModuleImports]
+	_packages: Dict[str, "PackageImports"]
+
+	def __init__(self, name: str, file: Path, parent: Nullable["PackageImports"] = None) -> None:
+		super().__init__(name, file, parent)
+
+		if parent is not None:
+			parent._packages[name] = self
+
+		self._modules = {}
+		self._packages = {}
+
+	@readonly
+	def Modules(self) -> Dict[str, ModuleImports]:
+		return self._modules
+
+	@readonly
+	def Packages(self) -> Dict[str, "PackageImports"]:
+		return self._packages
+
+
+@export
+class ImportGraph:
+	"""
+	The static import graph of a Python package.
+	"""
+	_root:    PackageImports
+	_modules: Dict[str, Imports]
+	_cycles:  List[List[str]]
+
+	def __init__(self, root: PackageImports) -> None:
+		self._root = root
+		self._modules = {}
+		self._cycles = []
+
+	@readonly
+	def Root(self) -> PackageImports:
+		return self._root
+
+	@readonly
+	def Modules(self) -> Dict[str, Imports]:
+		"""
+		Read-only property to access all modules and packages.
+
+		:returns: A dictionary of modules, keyed by fully qualified module name.
+		"""
+		return self._modules
+
+	@readonly
+	def Cycles(self) -> List[List[str]]:
+		"""
+		Read-only property to access import cycles.
+
+		Each cycle is a list of fully qualified module names, where the first module imports the second and so on. The last
+		module imports the first one.
+
+		:returns: List of cycles, one per strongly connected component of the import graph.
+		"""
+		return self._cycles
+
+	@readonly
+	def HeavyImports(self) -> List[Tuple[str, List[str]]]:
+		"""
+		Read-only property to access modules with heavy third-party imports.
+
+		:returns: Sorted list of fully qualified module names and their heavy imports.
+		"""
+		return [(name, module._heavyImports) for name, module in sorted(self._modules.items()) if len(module._heavyImports) > 0]
@@ -0,0 +1,163 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Abstract data model for Python import times.**
+"""
+from typing import Optional as Nullable, Dict, Generator, List
+
+from pyTooling.Decorators import export, readonly
+
+
+@export
+class ImportedModule:
+	"""
+	A module as imported during interpreter startup.
+
+	Times are given in microseconds like in the output of ``python -X importtime``. The self time excludes the time spent
+	in nested imports, the cumulative time includes it.
+	"""
+	_name:           str
+	_parent:         Nullable["ImportedModule"]
+	_selfTime:       float
+	_cumulativeTime: float
+	_imports:        Dict[str, "ImportedModule"]
+
+	def __init__(self, name: str, selfTime: float = 0.0, cumulativeTime: float = 0.0, parent: Nullable["ImportedModule"] = None) -> None:
+		self._name = name
+		self._parent = parent
+		self._selfTime = selfTime
+		self._cumulativeTime = cumulativeTime
+		self._imports = {}
+
+		if parent is not None:
+			parent._imports[name] = self
+
+	@readonly
+	def Name(self) -> str:
+		return self._name
+
+	@readonly
+	def Parent(self) -> Nullable["ImportedModule"]:
+		return self._parent
+
+	@readonly
+	def SelfTime(self) -> float:
+		return self._selfTime
+
+	@readonly
+	def CumulativeTime(self) -> float:
+		return self._cumulativeTime
+
+	@readonly
+	def Imports(self) -> Dict[str, "ImportedModule"]:
+		"""
+		Read-only property to access modules imported (for the first time) while importing this module.
+
+		:returns: A dictionary of imported modules, keyed by module name.
+		"""
+		return self._imports
+
+	def IterateModules(self) -> Generator["ImportedModule", None, None]:
+		"""
+		Iterate this module and all nested imports (depth-first, pre-order).
+
+		:returns: A generator yielding modules.
+		"""
+		stack = [self]
+		while stack:
+			module = stack.pop()
+			yield module
+			stack.extend(reversed(module._imports.values()))
+
+
+@export
+class ImportTimeReport:
+	"""
+	Import times of one or more interpreter runs.
+
+	If multiple runs are merged, modules are matched by their import path and times are averaged over all runs.
+	"""
+	_name:    str
+	_imports: Dict[str, ImportedModule]
+	_runs:    int
+
+	def __init__(self, name: str, runs: int = 1) -> None:
+		self._name = name
+		self._imports = {}
+		self._runs = runs
+
+	@readonly
+	def Name(self) -> str:
+		return self._name
+
+	@readonly
+	def Runs(self) -> int:
+		return self._runs
+
+	@readonly
+	def Imports(self) -> Dict[str, ImportedModule]:
+		"""
+		Read-only property to access top-level imports.
+
+		:returns: A dictionary of modules imported at top-level, keyed by module name.
+		"""
+		return self._imports
+
+	@readonly
+	def TotalTime(self) -> float:
+		"""
+		Read-only property to access the total import time in microseconds.
+
+		:returns: Sum of cumulative times of all top-level imports.
+		"""
+		return sum(module._cumulativeTime for module in self._imports.values())
+
+	@readonly
+	def ModuleCount(self) -> int:
+		return sum(1 for _ in self.IterateModules())
+
+	def IterateModules(self) -> Generator[ImportedModule, None, None]:
+		"""
+		Iterate all modules (depth-first, pre-order).
+
+		:returns: A generator yielding modules.
+		"""
+		for module in self._imports.values():
+			yield from module.IterateModules()
+
+	def TopOffenders(self, count: int) -> List[ImportedModule]:
+		"""
+		Return the modules with the highest self time.
+
+		:param count: Number of modules to return.
+		:returns:     List of modules, sorted by descending self time.
+		"""
+		return sorted(self.IterateModules(), key=lambda module: module._selfTime, reverse=True)[:count]
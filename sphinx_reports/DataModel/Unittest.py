@@ -0,0 +1,289 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Abstract data models derived from unittest reports.**
+"""
+from bisect     import bisect_right
+from math       import ceil, log10
+from typing     import Dict, Iterable, List, Optional as Nullable, Tuple
+
+from pyTooling.Decorators import export, readonly
+
+
+@export
+class DurationHistogram:
+	"""
+	A histogram of testcase durations using logarithmically scaled buckets.
+
+	The bucket edges are computed from a lower and upper bound as well as the number of buckets per decade. Two
+	additional open-ended buckets collect durations below the lower bound and at or above the upper bound.
+	"""
+
+	_edges:     Tuple[float, ...]
+	_counts:    List[int]
+	_durations: List[float]
+
+	def __init__(self, lower: float = 0.001, upper: float = 100.0, bucketsPerDecade: int = 1) -> None:
+		"""
+		Initialize an empty histogram.
+
+		:param lower:            Lower bound (in seconds) of the first closed bucket.
+		:param upper:            Upper bound (in seconds) of the last closed bucket.
+		:param bucketsPerDecade: Number of buckets per factor of 10.
+		:raises ValueError:      If bounds or number of buckets are out of range.
+		"""
+		if lower <= 0.0:
+			raise ValueError("Parameter 'lower' must be greater than 0.")
+		elif upper <= lower:
+			raise ValueError("Parameter 'upper' must be greater than parameter 'lower'.")
+		elif bucketsPerDecade < 1:
+			raise ValueError("Parameter 'bucketsPerDecade' must be greater than 0.")
+
+		steps = ceil(round(log10(upper / lower) * bucketsPerDecade, 9))
+		self._edges = tuple(lower * 10 ** (i / bucketsPerDecade) for i in range(steps + 1))
+
+		self._counts =    [0] * (len(self._edges) + 1)
+		self._durations = [0.0] * (len(self._edges) + 1)
+
+	@readonly
+	def Edges(self) -> Tuple[float, ...]:
+		"""
+		Read-only property to access the bucket edges in seconds.
+
+		:return: Ascending tuple of bucket edges.
+		"""
+		return self._edges
+
+	@readonly
+	def Counts(self) -> List[int]:
+		"""
+		Read-only property to access the number of durations per bucket.
+
+		:return: List of counts. Bucket ``0`` is below the first edge, the last bucket is at or above the last edge.
+		"""
+		return self._counts
+
+	@readonly
+	def Durations(self) -> List[float]:
+		"""
+		Read-only property to access the summed durations (in seconds) per bucket.
+
+		:return: List of summed durations.
+		"""
+		return self._durations
+
+	@readonly
+	def TotalCount(self) -> int:
+		return sum(self._counts)
+
+	@readonly
+	def TotalDuration(self) -> float:
+		return sum(self._durations)
+
+	def Bucket(self, index: int) -> Tuple[float, float]:
+		"""
+		Return the bounds of a bucket.
+
+		:param index: Index of the bucket.
+		:return:      Tuple of lower (inclusive) and upper (exclusive) bound in seconds.
+		"""
+		lower = 0.0 if index == 0 else self._edges[index - 1]
+		upper = float("inf") if index == len(self._edges) else self._edges[index]
+
+		return lower, upper
+
+	def Add(self, durations: Iterable[float]) -> None:
+		"""
+		Sort all given durations into buckets in a single pass.
+
+		:param durations: Durations in seconds.
+		"""
+		edges = self._edges
+		counts = self._counts
+		sums = self._durations
+
+		for duration in durations:
+			index = bisect_right(edges, duration)
+			counts[index] += 1
+			sums[index] += duration
+
+
+@export
+class Worker:
+	"""
+	A worker (host or process) executing testsuites sequentially.
+
+	Each execution interval is stored as a tuple of name, start and end time in seconds relative to the timeline's
+	origin.
+	"""
+
+	_name:      str
+	_intervals: List[Tuple[str, float, float]]
+
+	def __init__(self, name: str) -> None:
+		self._name = name
+		self._intervals = []
+
+	@readonly
+	def Name(self) -> str:
+		return self._name
+
+	@readonly
+	def Intervals(self) -> List[Tuple[str, float, float]]:
+		"""
+		Read-only property to access all execution intervals sorted by start time.
+
+		:return: List of name, start and end tuples.
+		"""
+		return self._intervals
+
+	@readonly
+	def Start(self) -> float:
+		return self._intervals[0][1]
+
+	@readonly
+	def End(self) -> float:
+		return max(end for _, _, end in self._intervals)
+
+	@readonly
+	def Duration(self) -> float:
+		"""
+		Read-only property to access the summed durations of all intervals.
+
+		:return: Summed duration in seconds. Overlapping intervals are counted multiple times.
+		"""
+		return sum(end - start for _, start, end in self._intervals)
+
+	@readonly
+	def Busy(self) -> float:
+		"""
+		Read-only property to access the time this worker was executing any testsuite.
+
+		:return: Length of the union of all intervals in seconds.
+		"""
+		busy = 0.0
+		current = float("-inf")
+		for _, start, end in self._intervals:
+			if end > current:
+				busy += end - max(start, current)
+				current = end
+
+		return busy
+
+	@readonly
+	def Gaps(self) -> List[Tuple[float, float]]:
+		"""
+		Read-only property to access all idle gaps between the first start and the last end of this worker.
+
+		:return: List of gap start and end tuples in seconds.
+		"""
+		gaps = []
+		current = self._intervals[0][2]
+		for _, start, end in self._intervals[1:]:
+			if start > current:
+				gaps.append((current, start))
+			current = max(current, end)
+
+		return gaps
+
+
+@export
+class ExecutionTimeline:
+	"""
+	An execution timeline of testsuites distributed to multiple workers.
+	"""
+
+	_workers: Dict[str, Worker]
+	_origin:  float
+
+	def __init__(self, executions: Iterable[Tuple[str, str, float, float]]) -> None:
+		"""
+		Create a timeline from testsuite executions.
+
+		:param executions: Iterable of worker name, testsuite name, absolute start time (POSIX timestamp) and duration
+		                   (in seconds) tuples.
+		"""
+		self._workers = {}
+
+		records = sorted(executions, key=lambda record: (record[2], record[1]))
+		self._origin = records[0][2] if len(records) > 0 else 0.0
+
+		for workerName, name, start, duration in records:
+			try:
+				worker = self._workers[workerName]
+			except KeyError:
+				worker = self._workers[workerName] = Worker(workerName)
+
+			begin = start - self._origin
+			worker._intervals.append((name, begin, begin + duration))
+
+	@readonly
+	def Workers(self) -> Dict[str, Worker]:
+		return self._workers
+
+	@readonly
+	def Origin(self) -> float:
+		"""
+		Read-only property to access the start time of the first testsuite.
+
+		:return: POSIX timestamp of the timeline's origin.
+		"""
+		return self._origin
+
+	@readonly
+	def WallClock(self) -> float:
+		"""
+		Read-only property to access the wall-clock time from the first start to the last end.
+
+		:return: Wall-clock time in seconds.
+		"""
+		return max((worker.End for worker in self._workers.values()), default=0.0)
+
+	@readonly
+	def Duration(self) -> float:
+		"""
+		Read-only property to access the summed durations of all testsuites.
+
+		:return: Summed duration in seconds.
+		"""
+		return sum(worker.Duration for worker in self._workers.values())
+
+	@readonly
+	def CriticalWorker(self) -> Nullable[Worker]:
+		"""
+		Read-only property to access the worker finishing last.
+
+		As testsuites on different workers don't depend on each other, the sequence of testsuites executed by this worker
+		is the critical path determining the wall-clock time.
+
+		:return: The worker finishing last or ``None`` if the timeline is empty.
+		"""
+		return max(self._workers.values(), key=lambda worker: worker.End, default=None)
@@ -29,32 +29,37 @@
 # ==================================================================================================================== #
 #
 """
-**Report unit test results as Sphinx documentation page(s).**
+**Report the dependencies of a Python distribution as Sphinx documentation page(s).**
 """
-from typing import Dict, Tuple, Any, List, Mapping, Generator
+from pathlib import Path
+from typing  import Dict, Tuple, Any, List, Optional as Nullable, Set
 
 from docutils                          import nodes
 from pyTooling.Decorators              import export
 from sphinx.application import Sphinx
 from sphinx.config import Config
+from sphinx.environment import BuildEnvironment
 
-from sphinx_reports.Common               import ReportExtensionError
-from sphinx_reports.Sphinx               import stripAndNormalize, BaseDirective
-from sphinx_reports.DataModel.Dependency import Distribution
-from sphinx_reports.Adapter.Dependency   import DependencyScanner
+from sphinx_reports.Common                   import ReportExtensionError
+from sphinx_reports.Sphinx                   import strip, stripAndNormalize, BaseDirective
+from sphinx_reports.DataModel.Dependency     import Distribution, VersionSpecifier
 
 
 @export
 class DependencyTable(BaseDirective):
 	"""
-	This directive will be replaced by a table representing dependencies.
+	This directive will be replaced by a table representing the transitive dependencies of an installed distribution.
+
+	Alternatively, dependencies are read from a ``pyproject.toml``, requirement or lock file given by option ``source``
+	(relative to the current document). This doesn't require the dependencies to be installed.
 	"""
 	has_content = False
 	required_arguments = 0
 	optional_arguments = 1
 
 	option_spec = {
-		"package":       stripAndNormalize
+		"package":       stripAndNormalize,
+		"source":        strip,
 	}
 
 	directiveName: str = "dependency-table"
@@ -63,7 +68,8 @@ class DependencyTable(BaseDirective):
 		# f"{configPrefix}_testsuites": ({}, "env", Dict)
 	}  #: A dictionary of all configuration values used by unittest directives.
 
-	_packageName:  str
+	_packageName:  Nullable[str]
+	_source:       Nullable[Path]
 
 	_distribution: Distribution
 
@@ -71,7 +77,16 @@ class DependencyTable(BaseDirective):
 		"""
 		Parse all directive options or use default values.
 		"""
-		self._packageName = self._ParseStringOption("package")
+		if "source" in self.options:
+			if "package" in self.options:
+				raise ReportExtensionError(f"{self.directiveName}: Options 'package' and 'source' are mutually exclusive.")
+
+			_, source = self.env.relfn2path(self._ParseStringOption("source", regexp=".+"), self.env.docname)
+			self._packageName = None
+			self._source = Path(source)
+		else:
+			self._packageName = self._ParseStringOption("package")
+			self._source = None
 
 	@classmethod
 	def CheckConfiguration(cls, sphinxApplication: Sphinx, sphinxConfiguration: Config) -> None:
@@ -83,51 +98,126 @@ class DependencyTable(BaseDirective):
 		"""
 		pass
 
+	@classmethod
+	def PreloadReports(cls, env: BuildEnvironment, reportIDs: Nullable[Set[str]]) -> None:
+		"""
+		Resolve dependencies before documents are read by parallel workers.
+
+		Dependency tables aren't configured in :file:`conf.py`, so only tables used in the previous build are known.
+		Errors are ignored here. They are reported by the directive.
+
+		:param env:       The Sphinx build environment.
+		:param reportIDs: Distribution names or absolute paths of dependency sources. ``None`` preloads nothing.
+		"""
+		from sphinx_reports.Adapter.Dependency       import DependencyScanner
+		from sphinx_reports.Adapter.DependencySource import DependencySource
+
+		for reportID in reportIDs or ():
+			try:
+				if Path(reportID).is_absolute():
+					DependencySource.Load(Path(reportID))
+				else:
+					DependencyScanner(reportID)
+			except ReportExtensionError:
+				pass
+
 	def _GenerateDependencyTable(self) -> nodes.table:
-		# Create a table and table header with 8 columns
+		# Create a table and table header with 4 columns
 		columns = [
-			("Package", 5),
+			("Package", 4),
 			("Version", 1),
-			("License", 1),
+			("Requirement", 1),
+			("License", 2),
 		]
 
 		tableGroup = self._CreateSingleTableHeader(
-			identifier=self._packageName,
+			identifier=self._distribution.Name,
 			columns=columns,
 			classes=["report-dependency-table"]
 		)
 		tableBody = nodes.tbody()
 		tableGroup += tableBody
 
-		# def sortedValues(d: Mapping[str, Testsuite]) -> Generator[Testsuite, None, None]:
-		# 	for key in sorted(d.keys()):
-		# 		yield d[key]
+		# Each distribution's subtree is expanded on its first occurrence only. Later occurrences (shared dependencies and
+		# cycles) are listed without children, which keeps the table linear in the size of the dependency graph.
+		expanded = set()
+
+		def renderDistribution(distribution: Distribution, requirement: Nullable[VersionSpecifier], level: int) -> None:
+			classes = ["report-dependency-table-row", "report-dependency"]
+			if not distribution.IsInstalled and self._source is None:
+				classes.append("report-dependency-missing")
+
+			repeated = id(distribution) in expanded and len(distribution.Dependencies) > 0
+			if repeated:
+				classes.append("report-dependency-repeated")
+
+			tableBody.append(nodes.row("",
+				nodes.entry("", nodes.Text(f"{'  ' * level}{distribution.Name}{' (see above)' if repeated else ''}")),
+				nodes.entry("", nodes.Text(f"{distribution.Version}" if distribution.IsInstalled else ("" if self._source is not None else "not installed"))),
+				nodes.entry("", nodes.Text("" if requirement is None else f"{requirement}")),
+				nodes.entry("", nodes.Text(", ".join(f"{license}" for license in distribution.Licenses))),
+				classes=classes
+			))
+
+			if id(distribution) in expanded:
+				return
+			expanded.add(id(distribution))
+
+			for name, dependency in distribution.Dependencies.items():
+				renderDistribution(dependency, distribution.Requirements[name], level + 1)
+
+		renderDistribution(self._distribution, None, 0)
+
+		# Add a summary row
+		dependencies = list(self._distribution.IterateTransitiveDependencies())
+		tableBody.append(nodes.row("",
+			nodes.entry("", nodes.Text(f"{len(dependencies)} dependencies ({len(self._distribution.Dependencies)} direct)")),
+			nodes.entry("", nodes.Text("")),
+			nodes.entry("", nodes.Text("")),
+			nodes.entry("", nodes.Text("" if self._source is not None else f"{sum(1 for dependency in dependencies if not dependency.IsInstalled)} not installed")),
+			classes=["report-dependency-table-row", "report-summary"]
+		))
 
-		def renderRoot(tableBody: nodes.tbody, distribution: Distribution) -> None:
-			tableRow = nodes.row("", classes=["report-dependency-table-row", "report-dependency"])
-			tableBody += tableRow
+		return tableGroup.parent
 
-			tableRow += nodes.entry("", nodes.Text(f"{distribution.Name}"))
-			tableRow += nodes.entry("", nodes.Text(f"{distribution.Version}"))
-			tableRow += nodes.entry("", nodes.Text(f"{distribution.Licenses}"))
+	def run(self) -> List[nodes.Node]:
+		container = nodes.container()
 
-			# for ts in sortedValues(testsuite._testsuites):
-			# 	renderTestsuite(tableBody, ts, 0)
+		try:
+			self._CheckOptions()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
+			return self._internalError(container, __name__, message, ex)
 
-		renderRoot(tableBody, self._distribution)
+		from sphinx_reports.Adapter.Dependency       import DependencyScanner
+		from sphinx_reports.Adapter.DependencySource import DependencySource
 
-		# # Add a summary row
+		if self._source is not None:
+			try:
+				source = DependencySource.Load(self._source)
+			except ReportExtensionError as ex:
+				message = f"Caught {ex.__class__.__name__} when reading dependencies from '{self._source}'."
+				return self._internalError(container, __name__, message, ex)
 
-		return tableGroup.parent
+			for file in source.Files:
+				self.env.note_dependency(file)
 
-	def run(self) -> List[nodes.Node]:
-		self._CheckOptions()
+			self._distribution = source.Distribution
+			reportID = str(source.File)
+		elif self._packageName is not None:
+			try:
+				scanner = DependencyScanner(self._packageName)
+			except ReportExtensionError as ex:
+				message = f"Caught {ex.__class__.__name__} when resolving dependencies of '{self._packageName}'."
+				return self._internalError(container, __name__, message, ex)
 
-		# Assemble a list of Python source files
-		scanner = DependencyScanner(self._packageName)
-		self._distribution = scanner.Distribution
+			self._distribution = scanner.Distribution
+			reportID = self._packageName
+
+		from sphinx_reports import ReportDomain
+
+		ReportDomain.Get(self.env).NoteReport(self.env.docname, self.configPrefix, reportID)
 
-		container = nodes.container()
 		container += self._GenerateDependencyTable()
 
 		return [container]
@@ -32,24 +32,34 @@
 **Report documentation coverage as Sphinx documentation page(s).**
 """
 from pathlib              import Path
-from typing               import Dict, Tuple, Any, List, Mapping, Generator, TypedDict, Union, ClassVar
+from typing               import TYPE_CHECKING, Dict, Tuple, Any, List, Mapping, Generator, TypedDict, Union, ClassVar, Optional as Nullable, Set, cast
 
 from docutils             import nodes
+from docutils.transforms  import Transform
 from sphinx.application   import Sphinx
 from sphinx.config        import Config
+from sphinx.environment   import BuildEnvironment
 from pyTooling.Decorators import export
-from pyEDAA.Reports.DocumentationCoverage.Python import DocStrCoverage as DocStrCovAnalyzer
-from pyEDAA.Reports.DocumentationCoverage.Python import PackageCoverage, AggregatedCoverage
 
-from sphinx_reports.Common                          import ReportExtensionError, LegendStyle
-from sphinx_reports.Sphinx                          import strip, stripAndNormalize, BaseDirective
+from sphinx_reports.Common          import ReportExtensionError, LegendStyle
+from sphinx_reports.Sphinx          import strip, stripAndNormalize, BaseDirective, cacheDirectory
+from sphinx_reports.Node            import DocCoveragePlaceholder
+from sphinx_reports.Instrumentation import Instrumentation
+from sphinx_reports.Artifact        import ReportArtifact
+
+if TYPE_CHECKING:
+	from pyEDAA.Reports.DocumentationCoverage.Python import PackageCoverage, AggregatedCoverage
+	from sphinx_reports.Adapter.DocCoverage          import IncrementalDocStrCoverage
 
 
 class package_DictType(TypedDict):
-	name:       str
-	directory:  Path
-	fail_below: int
-	levels:     Union[str, Dict[Union[int, str], Dict[str, str]]]
+	name:        str
+	directory:   Nullable[Path]
+	json_report: Nullable[Path]
+	autodoc:     bool
+	fail_below:  int
+	levels:      Union[str, Dict[Union[int, str], Dict[str, str]]]
+	workers:     int
 
 
 @export
@@ -81,10 +91,12 @@ class DocCoverageBase(BaseDirective):
 	configValues: Dict[str, Tuple[Any, str, Any]] = {
 		f"{configPrefix}_packages": ({}, "env", Dict),
 		f"{configPrefix}_levels": (defaultCoverageDefinitions, "env", Dict),
+		f"{configPrefix}_workers": (1, "env", int),
 	}  #: A dictionary of all configuration values used by documentation coverage directives.
 
 	_coverageLevelDefinitions: ClassVar[Dict[str, Dict[Union[int, str], Dict[str, str]]]] = {}
 	_packageConfigurations:    ClassVar[Dict[str, package_DictType]] = {}
+	_defaultWorkers:           ClassVar[int] = 1
 
 	_cssClasses: List[str]
 	_reportID:   str
@@ -108,6 +120,7 @@ class DocCoverageBase(BaseDirective):
 		:param sphinxConfiguration: Sphinx configuration instance.
 		"""
 		cls._CheckLevelsConfiguration(sphinxConfiguration)
+		cls._CheckWorkersConfiguration(sphinxConfiguration)
 		cls._CheckPackagesConfiguration(sphinxConfiguration)
 
 	@classmethod
@@ -159,6 +172,19 @@ class DocCoverageBase(BaseDirective):
 					"desc": description
 				}
 
+	@classmethod
+	def _CheckWorkersConfiguration(cls, sphinxConfiguration: Config) -> None:
+		from sphinx_reports import ReportDomain
+
+		variableName = f"{ReportDomain.name}_{cls.configPrefix}_workers"
+
+		try:
+			workers = sphinxConfiguration[variableName]
+		except (KeyError, AttributeError) as ex:
+			raise ReportExtensionError(f"Configuration option '{variableName}' is not configured.") from ex
+
+		cls._defaultWorkers = cls._ParseWorkers(f"conf.py: {variableName}", workers)
+
 	@classmethod
 	def _CheckPackagesConfiguration(cls, sphinxConfiguration: Config) -> None:
 		from sphinx_reports import ReportDomain
@@ -166,7 +192,7 @@ class DocCoverageBase(BaseDirective):
 		variableName = f"{ReportDomain.name}_{cls.configPrefix}_packages"
 
 		try:
-			allPackages: Dict[str, package_DictType] = sphinxConfiguration[f"{ReportDomain.name}_{cls.configPrefix}_packages"]
+			allPackages: Dict[str, Dict[str, Any]] = sphinxConfiguration[f"{ReportDomain.name}_{cls.configPrefix}_packages"]
 		except (KeyError, AttributeError) as ex:
 			raise ReportExtensionError(f"Configuration option '{variableName}' is not configured.") from ex
 
@@ -178,13 +204,23 @@ class DocCoverageBase(BaseDirective):
 			except KeyError as ex:
 				raise ReportExtensionError(f"{configurationName}.name: Configuration is missing.") from ex
 
-			try:
-				directory = Path(packageConfiguration["directory"])
-			except KeyError as ex:
-				raise ReportExtensionError(f"{configurationName}.directory: Configuration is missing.") from ex
+			directory = None
+			jsonReport = None
+			autodoc = bool(packageConfiguration.get("autodoc", False))
+			if ("directory" in packageConfiguration) + ("json_report" in packageConfiguration) + autodoc > 1:
+				raise ReportExtensionError(f"{configurationName}: Only one of 'directory', 'json_report' or 'autodoc' can be configured.")
 
-			if not directory.exists():
-				raise ReportExtensionError(f"{configurationName}.directory: Directory '{directory}' doesn't exist.") from FileNotFoundError(directory)
+			if "directory" in packageConfiguration:
+
+				directory = Path(packageConfiguration["directory"])
+				if not directory.exists():
+					raise ReportExtensionError(f"{configurationName}.directory: Directory '{directory}' doesn't exist.") from FileNotFoundError(directory)
+			elif "json_report" in packageConfiguration:
+				jsonReport = Path(packageConfiguration["json_report"])
+				if not jsonReport.exists():
+					raise ReportExtensionError(f"{configurationName}.json_report: Documentation coverage report file '{jsonReport}' doesn't exist.") from FileNotFoundError(jsonReport)
+			elif not autodoc:
+				raise ReportExtensionError(f"{configurationName}.directory: Configuration is missing (or use 'json_report' or 'autodoc').")
 
 			try:
 				failBelow = int(packageConfiguration["fail_below"]) / 100
@@ -218,11 +254,16 @@ class DocCoverageBase(BaseDirective):
 			else:
 				raise ReportExtensionError(f"")
 
+			workers = cls._ParseWorkers(f"{configurationName}.workers", packageConfiguration.get("workers", cls._defaultWorkers))
+
 			cls._packageConfigurations[reportID] = {
 				"name": packageName,
 				"directory": directory,
+				"json_report": jsonReport,
+				"autodoc": autodoc,
 				"fail_below": failBelow,
-				"levels": levelDefinition
+				"levels": levelDefinition,
+				"workers": workers
 			}
 
 	def _ConvertToColor(self, currentLevel: float, configKey: str) -> str:
@@ -250,9 +291,12 @@ class DocCoverage(DocCoverageBase):
 	option_spec = DocCoverageBase.option_spec
 
 	_packageName: str
-	_directory:   Path
+	_directory:   Nullable[Path]
+	_jsonReport:  Nullable[Path]
+	_autodoc:     bool
 	_failBelow:   float
-	_coverage:    PackageCoverage
+	_workers:     int
+	_coverage:    "PackageCoverage"
 
 	def _CheckOptions(self) -> None:
 		"""
@@ -263,8 +307,11 @@ class DocCoverage(DocCoverageBase):
 		packageConfiguration = self._packageConfigurations[self._reportID]
 		self._packageName = packageConfiguration["name"]
 		self._directory =   packageConfiguration["directory"]
+		self._jsonReport =  packageConfiguration["json_report"]
+		self._autodoc =     packageConfiguration["autodoc"]
 		self._failBelow =   packageConfiguration["fail_below"]
 		self._levels =      packageConfiguration["levels"]
+		self._workers =     packageConfiguration["workers"]
 
 	def _GenerateCoverageTable(self) -> nodes.table:
 		cssClasses = ["report-doccov-table", f"report-doccov-{self._reportID}"]
@@ -305,11 +352,11 @@ class DocCoverage(DocCoverageBase):
 
 		return tableGroup.parent
 
-	def _sortedValues(self, d: Mapping[str, AggregatedCoverage]) -> Generator[AggregatedCoverage, None, None]:
+	def _sortedValues(self, d: Mapping[str, "AggregatedCoverage"]) -> Generator["AggregatedCoverage", None, None]:
 		for key in sorted(d.keys()):
 			yield d[key]
 
-	def _renderlevel(self, tableBody: nodes.tbody, packageCoverage: PackageCoverage, level: int = 0) -> None:
+	def _renderlevel(self, tableBody: nodes.tbody, packageCoverage: "PackageCoverage", level: int = 0) -> None:
 		tableBody += nodes.row(
 			"",
 			nodes.entry("", nodes.Text(f"{' '*level}📦{packageCoverage.Name}")),
@@ -343,6 +390,136 @@ class DocCoverage(DocCoverageBase):
 
 @export
 class DocStrCoverage(DocCoverage):
+	_analyzers: ClassVar[Dict[str, "IncrementalDocStrCoverage"]] = {}
+
+	@classmethod
+	def _GetAnalyzer(cls, env: BuildEnvironment, reportID: str) -> "IncrementalDocStrCoverage":
+		try:
+			return cls._analyzers[reportID]
+		except KeyError:
+			pass
+
+		from sphinx_reports.Adapter.DocCoverage import IncrementalDocStrCoverage
+
+		packageConfiguration = cls._packageConfigurations[reportID]
+		if (directory := packageConfiguration["directory"]) is None:
+			raise ReportExtensionError(f"No source directory configured for '{reportID}'.")
+
+		analyzer = IncrementalDocStrCoverage(
+			packageConfiguration["name"],
+			directory,
+			cacheDirectory(env) / f"doccov-{reportID}.json",
+			packageConfiguration["workers"]
+		)
+		cls._analyzers[reportID] = analyzer
+
+		return analyzer
+
+	@classmethod
+	def PreloadReports(cls, env: BuildEnvironment, reportIDs: Nullable[Set[str]]) -> None:
+		"""
+		Analyze packages before documents are read by parallel workers.
+
+		Errors are ignored here. They are reported by the directive.
+
+		:param env:       The Sphinx build environment.
+		:param reportIDs: Reportids of packages to analyze or ``None`` for all packages analyzed from a source directory.
+		"""
+		for reportID, packageConfiguration in cls._packageConfigurations.items():
+			if packageConfiguration["directory"] is None or (reportIDs is not None and reportID not in reportIDs):
+				continue
+
+			try:
+				cls._GetAnalyzer(env, reportID).Analyze()
+			except ReportExtensionError:
+				pass
+
+	@classmethod
+	def CheckSourceFiles(cls, sphinxApplication: Sphinx, env: BuildEnvironment, added: Set[str], changed: Set[str], removed: Set[str]) -> List[str]:
+		"""
+		Call back for Sphinx ``env-get-outdated`` event.
+
+		Changed and removed source files are tracked as dependencies of documents with a documentation coverage table.
+		Added source files are detected here by comparing the package's current list of source files with the list
+		recorded when the document was read.
+
+		:param sphinxApplication: The Sphinx application.
+		:param env:               The Sphinx build environment.
+		:param added:             Added documents.
+		:param changed:           Changed documents.
+		:param removed:           Removed documents.
+		:return:                  Documents to be read again.
+		"""
+		from sphinx_reports import ReportDomain
+
+		reportDomain = ReportDomain.Get(env)
+
+		outdated = set()
+		for reportID, sourceFiles in reportDomain.DocCoverageSources.items():
+			if reportID not in cls._packageConfigurations or cls._packageConfigurations[reportID]["directory"] is None:
+				continue
+
+			try:
+				currentSourceFiles = cls._GetAnalyzer(env, reportID).ScanSourceFiles()
+			except ReportExtensionError:
+				currentSourceFiles = []
+
+			if currentSourceFiles != sourceFiles:
+				outdated.add(reportID)
+
+		return sorted(
+			docname
+			for docname, reportIDs in reportDomain.DocCoverageDocuments.items()
+			if not outdated.isdisjoint(reportIDs) and docname not in removed
+		)
+
+	def _AnalyzePackage(self) -> "PackageCoverage":
+		"""
+		Analyze the package incrementally or load a precomputed report and return its aggregated coverage.
+
+		Per-file results are persisted in Sphinx's cache directory, so only files changed since the previous build (or
+		directive invocation) are parsed again. If a JSON report or an artifact is configured, no analysis is done at all.
+
+		:return: The aggregated package coverage.
+		"""
+		if self._jsonReport is not None:
+			from sphinx_reports.Adapter.DocCoverage import DocCoverageJSONReport
+
+			self.env.note_dependency(str(self._jsonReport.resolve()))
+
+			report = f"{self.configPrefix}/{self._reportID}"
+			coverage: "PackageCoverage"
+			if ReportArtifact.IsArtifact(self._jsonReport):
+				coverage = ReportArtifact.Load(self._jsonReport, self.configPrefix)
+			else:
+				with Instrumentation.Span("convert", str(self._jsonReport), report=report):
+					coverage = DocCoverageJSONReport(self._packageName, self._jsonReport).Convert()
+			with Instrumentation.Span("aggregate", self._packageName, report=report):
+				coverage.Aggregate()
+
+			return coverage
+
+		report = f"{self.configPrefix}/{self._reportID}"
+		analyzer = self._GetAnalyzer(self.env, self._reportID)
+		with Instrumentation.Span("load", self._packageName, report=report):
+			analyzer.Analyze()
+
+		# Re-read this document, if a source file is changed or removed. Added files are detected by CheckSourceFiles.
+		for sourceFile in analyzer.SourceFiles:
+			self.env.note_dependency(str(sourceFile.resolve()))
+		from sphinx_reports import ReportDomain
+
+		reportDomain = ReportDomain.Get(self.env)
+		reportDomain.NoteDocCoverageSources(self.env.docname, self._reportID, analyzer.ScanSourceFiles())
+		reportDomain.NoteReport(self.env.docname, self.configPrefix, self._reportID)
+
+		with Instrumentation.Span("convert", self._packageName, report=report):
+			coverage = analyzer.Convert()
+		with Instrumentation.Span("aggregate", self._packageName, report=report):
+			coverage.Aggregate()
+
+		return coverage
+
 	def run(self) -> List[nodes.Node]:
 		container = nodes.container()
 
@@ -352,18 +529,144 @@ class DocStrCoverage(DocCoverage):
 			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
 			return self._internalError(container, __name__, message, ex)
 
-		# Assemble a list of Python source files
-		docStrCov = DocStrCovAnalyzer(self._packageName, self._directory)
-		docStrCov.Analyze()
-		self._coverage = docStrCov.Convert()
-		# self._coverage.CalculateCoverage()
-		self._coverage.Aggregate()
+		if self._autodoc:
+			# Objects documented by autodoc are known only after all documents were read.
+			placeholder = DocCoveragePlaceholder(reportid=self._reportID, cssclasses=self._cssClasses)
+			container += placeholder
+
+			return [container]
+
+		try:
+			self._coverage = self._AnalyzePackage()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when analyzing package '{self._packageName}' in '{self._directory or self._jsonReport}'."
+			return self._internalError(container, __name__, message, ex)
 
 		container += self._GenerateCoverageTable()
 
 		return [container]
 
 
+	@classmethod
+	def CollectAutodocDocstring(cls, sphinxApplication: Sphinx, what: str, name: str, obj: Any, options: Any, lines: List[str]) -> None:
+		"""
+		Call back for autodoc's ``autodoc-process-docstring`` event.
+
+		Records whether an object of a package configured with ``autodoc`` mode has a docstring.
+
+		:param sphinxApplication: The Sphinx application.
+		:param what:              Type of the object (``module``, ``class``, ``function``, ...).
+		:param name:              Fully qualified name of the object.
+		:param obj:               The object itself.
+		:param options:           Options given to the autodoc directive.
+		:param lines:             Lines of the (processed) docstring.
+		"""
+		if not any(
+			packageConfiguration["autodoc"] and (name == packageConfiguration["name"] or name.startswith(f"{packageConfiguration['name']}."))
+			for packageConfiguration in cls._packageConfigurations.values()
+		):
+			return
+
+		documented = any(line.strip() != "" for line in lines)
+		env = sphinxApplication.env
+		from sphinx_reports import ReportDomain
+
+		ReportDomain.Get(env).NoteDocCoverageObject(env.docname, name, what, documented)
+
+	@classmethod
+	def ComputeAutodocCoverage(cls, sphinxApplication: Sphinx, env: BuildEnvironment) -> List[str]:
+		"""
+		Call back for Sphinx ``env-updated`` event.
+
+		Computes documentation coverage of all packages configured with ``autodoc`` mode from objects collected while
+		reading and from all objects in the ``py`` domain's inventory. Python objects described manually (without autodoc)
+		are counted as documented.
+
+		:param sphinxApplication: The Sphinx application.
+		:param env:               The Sphinx build environment.
+		:return:                  Documents containing placeholders, which need to be written again.
+		"""
+		autodocPackages = {reportID: config for reportID, config in cls._packageConfigurations.items() if config["autodoc"]}
+		if len(autodocPackages) == 0:
+			return []
+
+		from sphinx.domains.python import PythonDomain
+
+		objects: Dict[str, Tuple[str, bool]] = {}
+		for name, entry in cast(PythonDomain, env.get_domain("py")).objects.items():
+			if not entry.aliased:
+				objects[name] = (entry.objtype, True)
+
+		# Docstring presence collected from autodoc overrides the py domain's entries.
+		from sphinx_reports import ReportDomain
+
+		reportDomain = ReportDomain.Get(env)
+		for docObjects in reportDomain.DocCoverageObjects.values():
+			objects.update(docObjects)
+
+		from sphinx_reports.Adapter.DocCoverage import AutodocCoverage
+
+		changed = set()
+		for reportID, packageConfiguration in autodocPackages.items():
+			coverage = AutodocCoverage(packageConfiguration["name"], objects)
+			if reportDomain.SetDocCoverageResult(reportID, coverage.Objects):
+				changed.add(reportID)
+
+		return sorted(
+			docname
+			for docname, reportIDs in reportDomain.DocCoveragePlaceholders.items()
+			if not changed.isdisjoint(reportIDs)
+		)
+
+	@classmethod
+	def GeneratePlaceholderTable(cls, reportID: str, cssClasses: List[str], coverage: "PackageCoverage") -> nodes.table:
+		"""
+		Generate the coverage table replacing a placeholder.
+
+		A directive instance is bound to the reST parser's state machine, which doesn't exist anymore when placeholders
+		are resolved. Thus, a renderer instance is created without calling the directive's constructor.
+
+		:param reportID:   The placeholder's reportid.
+		:param cssClasses: The placeholder's user-defined CSS classes.
+		:param coverage:   The aggregated package coverage.
+		:return:           The coverage table.
+		"""
+		renderer = cls.__new__(cls)
+		renderer._reportID = reportID
+		renderer._cssClasses = cssClasses
+		renderer._levels = cls._packageConfigurations[reportID]["levels"]
+		renderer._coverage = coverage
+
+		return renderer._GenerateCoverageTable()
+
+
+@export
+class ResolveDocCoveragePlaceholders(Transform):
+	"""
+	Replace documentation coverage placeholders by coverage tables computed at ``env-updated``.
+	"""
+	default_priority = 400
+
+	def apply(self, **kwargs: Any) -> None:
+		from sphinx_reports                     import ReportDomain
+		from sphinx_reports.Adapter.DocCoverage import AutodocCoverage
+
+		sphinxEnvironment = self.document.settings.env
+		reportDomain = ReportDomain.Get(sphinxEnvironment)
+
+		for placeholder in list(self.document.findall(DocCoveragePlaceholder)):
+			reportID = placeholder["reportid"]
+			packageConfiguration = DocStrCoverage._packageConfigurations[reportID]
+
+			report = f"{DocStrCoverage.configPrefix}/{reportID}"
+			with Instrumentation.Span("convert", packageConfiguration["name"], report=report):
+				coverage = AutodocCoverage(packageConfiguration["name"], reportDomain.DocCoverageResult(reportID)).Convert()
+			with Instrumentation.Span("aggregate", packageConfiguration["name"], report=report):
+				coverage.Aggregate()
+
+			placeholder.replace_self(DocStrCoverage.GeneratePlaceholderTable(reportID, placeholder["cssclasses"], coverage))
+
+
 @export
 class DocCoverageLegend(DocCoverageBase):
 	"""
@@ -30,14 +30,15 @@
 #
 from typing                import Tuple
 
+from docutils.nodes        import SkipNode
 from sphinx.writers.html5  import HTML5Translator
 
 from pyTooling.Decorators  import export
 from sphinx_reports.Common import visitFunc, departFunc
-from sphinx_reports.Node   import Landscape
+from sphinx_reports.Node   import Landscape, InlineSVG
 
 
-__all__ = ["translateLandscape"]
+__all__ = ["translateLandscape", "translateInlineSVG"]
 
 @export
 def visit_Landscape(translator: HTML5Translator, node: Landscape) -> None:
@@ -65,3 +66,35 @@ def depart_Landscape(translator: HTML5Translator, node: Landscape) -> None:
 
 translateLandscape: Tuple[visitFunc, departFunc] = (visit_Landscape, depart_Landscape)
 """A tuple combining both ``visit_*`` and ``depart_*`` call back functions for a :class:`Landscape` node."""
+
+
+@export
+def visit_InlineSVG(translator: HTML5Translator, node: InlineSVG) -> None:
+	"""
+	Call back function for visiting a :class:`InlineSVG`.
+
+	This function emits the SVG graphic wrapped in a ``<div>`` and skips all child nodes (fallback content).
+
+	:param translator: The HTML5 translator instance.
+	:param node:       The current node being visited.
+	"""
+	classes = " ".join(["report-svg"] + node.get("classes", []))
+	translator.body.append(f"<div class=\"{classes}\">\n{node['svg']}\n</div>\n")
+
+	raise SkipNode()
+
+
+@export
+def depart_InlineSVG(translator: HTML5Translator, node: InlineSVG) -> None:
+	"""
+	Call back function for departing a :class:`InlineSVG`.
+
+	This function has no actions for HTML5, because child nodes are skipped.
+
+	:param translator: The HTML5 translator instance.
+	:param node:       The current node being departed.
+	"""
+
+
+translateInlineSVG: Tuple[visitFunc, departFunc] = (visit_InlineSVG, depart_InlineSVG)
+"""A tuple combining both ``visit_*`` and ``depart_*`` call back functions for a :class:`InlineSVG` node."""
@@ -0,0 +1,382 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Report the static import graph of a Python package as Sphinx documentation page(s).**
+"""
+from pathlib import Path
+from typing  import Dict, Tuple, Any, List, TypedDict, ClassVar, Generator, Mapping, Optional as Nullable, Set
+
+from docutils             import nodes
+from pyTooling.Decorators import export
+from sphinx.application   import Sphinx
+from sphinx.config        import Config
+from sphinx.environment   import BuildEnvironment
+
+from sphinx_reports.Common                import ReportExtensionError
+from sphinx_reports.Sphinx                import strip, stripAndNormalize, BaseDirective, cacheDirectory
+from sphinx_reports.DataModel.ImportGraph import Imports, PackageImports, ImportGraph as ImportGraphModel
+from sphinx_reports.Adapter.ImportGraph   import ImportGraphAnalyzer, defaultHeavyImports
+from sphinx_reports.Instrumentation       import Instrumentation
+
+
+class package_DictType(TypedDict):
+	name:          str
+	directory:     Path
+	heavy_imports: List[str]
+	workers:       int
+
+
+@export
+class ImportGraphBase(BaseDirective):
+	"""
+	Base-class for all directives visualizing the static import graph of a Python package.
+
+	It handles the configuration variables and creates and caches an incremental analyzer per reportid.
+	"""
+	option_spec = {
+		"class":    strip,
+		"reportid": stripAndNormalize,
+	}
+
+	configPrefix:  str = "importgraph"
+	configValues:  Dict[str, Tuple[Any, str, Any]] = {
+		f"{configPrefix}_packages":      ({}, "env", Dict),
+		f"{configPrefix}_heavy_imports": (list(defaultHeavyImports), "env", (list, tuple)),
+		f"{configPrefix}_workers":       (1, "env", int),
+	}  #: A dictionary of all configuration values used by import graph directives.
+
+	_packageConfigurations: ClassVar[Dict[str, package_DictType]] = {}
+	_analyzers:             ClassVar[Dict[str, ImportGraphAnalyzer]] = {}
+
+	_cssClasses: List[str]
+	_reportID:   str
+
+	def _CheckOptions(self) -> None:
+		"""
+		Parse all directive options or use default values.
+		"""
+		cssClasses = self._ParseStringOption("class", "", r"(\w+)?( +\w+)*")
+
+		self._cssClasses = [] if cssClasses == "" else cssClasses.split(" ")
+		self._reportID = self._ParseStringOption("reportid")
+
+		if self._reportID not in self._packageConfigurations:
+			raise ReportExtensionError(f"No import graph configuration item for '{self._reportID}'.")
+
+	@classmethod
+	def CheckConfiguration(cls, sphinxApplication: Sphinx, sphinxConfiguration: Config) -> None:
+		"""
+		Check configuration fields and load necessary values.
+
+		:param sphinxApplication:   Sphinx application instance.
+		:param sphinxConfiguration: Sphinx configuration instance.
+		"""
+		from sphinx_reports import ReportDomain
+
+		packagesVariableName = f"{ReportDomain.name}_{cls.configPrefix}_packages"
+		heavyVariableName = f"{ReportDomain.name}_{cls.configPrefix}_heavy_imports"
+		workersVariableName = f"{ReportDomain.name}_{cls.configPrefix}_workers"
+
+		try:
+			allPackages: Dict[str, Dict[str, Any]] = sphinxConfiguration[packagesVariableName]
+			heavyImports: List[str] = sphinxConfiguration[heavyVariableName]
+			workers = sphinxConfiguration[workersVariableName]
+		except (KeyError, AttributeError) as ex:
+			raise ReportExtensionError(f"Configuration option '{packagesVariableName}', '{heavyVariableName}' or '{workersVariableName}' is not configured.") from ex
+
+		defaultWorkers = cls._ParseWorkers(f"conf.py: {workersVariableName}", workers)
+
+		for reportID, packageConfiguration in allPackages.items():
+			configurationName = f"conf.py: {packagesVariableName}:[{reportID}]"
+
+			try:
+				packageName = packageConfiguration["name"]
+			except KeyError as ex:
+				raise ReportExtensionError(f"{configurationName}.name: Configuration is missing.") from ex
+
+			try:
+				directory = Path(packageConfiguration["directory"])
+			except KeyError as ex:
+				raise ReportExtensionError(f"{configurationName}.directory: Configuration is missing.") from ex
+
+			if not directory.exists():
+				raise ReportExtensionError(f"{configurationName}.directory: Directory '{directory}' doesn't exist.") from FileNotFoundError(directory)
+
+			packageHeavyImports = packageConfiguration.get("heavy_imports", heavyImports)
+			if isinstance(packageHeavyImports, str) or not all(isinstance(name, str) for name in packageHeavyImports):
+				raise ReportExtensionError(f"{configurationName}.heavy_imports: Not a list of top-level module names.")
+
+			cls._packageConfigurations[reportID] = {
+				"name":          packageName,
+				"directory":     directory,
+				"heavy_imports": list(packageHeavyImports),
+				"workers":       cls._ParseWorkers(f"{configurationName}.workers", packageConfiguration.get("workers", defaultWorkers))
+			}
+
+	@classmethod
+	def _GetAnalyzer(cls, env: BuildEnvironment, reportID: str) -> ImportGraphAnalyzer:
+		try:
+			return cls._analyzers[reportID]
+		except KeyError:
+			pass
+
+		packageConfiguration = cls._packageConfigurations[reportID]
+		analyzer = ImportGraphAnalyzer(
+			packageConfiguration["name"],
+			packageConfiguration["directory"],
+			cacheDirectory(env) / f"importgraph-{reportID}.json",
+			packageConfiguration["workers"]
+		)
+		cls._analyzers[reportID] = analyzer
+
+		return analyzer
+
+	@classmethod
+	def PreloadReports(cls, env: BuildEnvironment, reportIDs: Nullable[Set[str]]) -> None:
+		"""
+		Analyze packages before documents are read by parallel workers.
+
+		Errors are ignored here. They are reported by the directive.
+
+		:param env:       The Sphinx build environment.
+		:param reportIDs: Reportids of packages to analyze or ``None`` for all packages.
+		"""
+		for reportID in cls._packageConfigurations:
+			if reportIDs is not None and reportID not in reportIDs:
+				continue
+
+			try:
+				cls._GetAnalyzer(env, reportID).Analyze()
+			except ReportExtensionError:
+				pass
+
+	@classmethod
+	def CheckSourceFiles(cls, sphinxApplication: Sphinx, env: BuildEnvironment, added: Set[str], changed: Set[str], removed: Set[str]) -> List[str]:
+		"""
+		Call back for Sphinx ``env-get-outdated`` event.
+
+		Changed and removed source files are tracked as dependencies of documents with an import graph. Added source files
+		are detected here by comparing the package's current list of source files with the list recorded when the document
+		was read.
+
+		:param sphinxApplication: The Sphinx application.
+		:param env:               The Sphinx build environment.
+		:param added:             Added documents.
+		:param changed:           Changed documents.
+		:param removed:           Removed documents.
+		:return:                  Documents to be read again.
+		"""
+		from sphinx_reports import ReportDomain
+
+		reportDomain = ReportDomain.Get(env)
+
+		outdated = set()
+		for reportID, sourceFiles in reportDomain.ImportGraphSources.items():
+			if reportID not in cls._packageConfigurations:
+				continue
+
+			try:
+				currentSourceFiles = cls._GetAnalyzer(env, reportID).ScanSourceFiles()
+			except ReportExtensionError:
+				currentSourceFiles = []
+
+			if currentSourceFiles != sourceFiles:
+				outdated.add(reportID)
+
+		return sorted(
+			docname
+			for docname, reportIDs in reportDomain.ImportGraphDocuments.items()
+			if not outdated.isdisjoint(reportIDs) and docname not in removed
+		)
+
+
+@export
+class ImportGraph(ImportGraphBase):
+	"""
+	This directive will be replaced by a table representing the package's module-level imports and a list of import
+	cycles.
+
+	Modules in an import cycle and modules importing heavy third-party packages at module level are highlighted.
+	"""
+	directiveName: str = "import-graph"
+
+	has_content = False
+	required_arguments = 0
+	optional_arguments = ImportGraphBase.optional_arguments + 0
+
+	option_spec = ImportGraphBase.option_spec
+
+	_packageName: str
+	_directory:   Path
+	_graph:       ImportGraphModel
+
+	def _CheckOptions(self) -> None:
+		"""
+		Parse all directive options or use default values.
+		"""
+		super()._CheckOptions()
+
+		packageConfiguration = self._packageConfigurations[self._reportID]
+		self._packageName = packageConfiguration["name"]
+		self._directory =   packageConfiguration["directory"]
+
+	def _AnalyzePackage(self) -> ImportGraphModel:
+		"""
+		Scan the package's source files incrementally and build its import graph.
+
+		Per-file results are persisted in Sphinx's cache directory, so only files changed since the previous build are parsed
+		again.
+
+		:return: The import graph.
+		"""
+		report = f"{self.configPrefix}/{self._reportID}"
+		analyzer = self._GetAnalyzer(self.env, self._reportID)
+		with Instrumentation.Span("load", self._packageName, report=report):
+			analyzer.Analyze()
+
+		# Re-read this document, if a source file is changed or removed. Added files are detected by CheckSourceFiles.
+		for sourceFile in analyzer.SourceFiles:
+			self.env.note_dependency(str(sourceFile.resolve()))
+		from sphinx_reports import ReportDomain
+
+		reportDomain = ReportDomain.Get(self.env)
+		reportDomain.NoteImportGraphSources(self.env.docname, self._reportID, analyzer.ScanSourceFiles())
+		reportDomain.NoteReport(self.env.docname, self.configPrefix, self._reportID)
+
+		with Instrumentation.Span("convert", self._packageName, report=report):
+			return analyzer.Convert(self._packageConfigurations[self._reportID]["heavy_imports"])
+
+	def _GenerateImportTable(self) -> nodes.table:
+		cssClasses = ["report-importgraph-table", f"report-importgraph-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		# Create a table and table header with 6 columns
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=self._reportID,
+			columns=[
+				("Package / Module", 4),
+				("Imports", 4),
+				("Fan-out", 1),
+				("Fan-in", 1),
+				("External", 3),
+				("Heavy", 2)
+			],
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		self._renderlevel(tableBody, self._graph.Root)
+
+		# Add a summary row
+		modules = self._graph.Modules.values()
+		tableBody += nodes.row(
+			"",
+			nodes.entry("", nodes.Text(f"Overall ({len(modules)} modules):")),
+			nodes.entry("", nodes.Text(f"{len(self._graph.Cycles)} cycles")),
+			nodes.entry("", nodes.Text(f"{sum(module.FanOut for module in modules)}")),
+			nodes.entry("", nodes.Text(f"{sum(module.FanIn for module in modules)}")),
+			nodes.entry("", nodes.Text(f"{len(set(name for module in modules for name in module.ExternalImports))}")),
+			nodes.entry("", nodes.Text(f"{len(self._graph.HeavyImports)} modules")),
+			classes=["report-summary"]
+		)
+
+		return tableGroup.parent
+
+	def _sortedValues(self, d: Mapping[str, Imports]) -> Generator[Imports, None, None]:
+		for key in sorted(d.keys()):
+			yield d[key]
+
+	def _rowClasses(self, module: Imports) -> List[str]:
+		classes = ["report-package" if isinstance(module, PackageImports) else "report-module"]
+		if module.Error is not None:
+			classes.append("report-cov-error")
+		elif module.InCycle:
+			classes.append("report-importgraph-cycle")
+		elif len(module.HeavyImports) > 0:
+			classes.append("report-importgraph-heavy")
+
+		return classes
+
+	def _renderrow(self, tableBody: nodes.tbody, module: Imports, name: str) -> None:
+		prefix = f"{self._packageName}."
+		imports = ", ".join(imported[len(prefix):] if imported.startswith(prefix) else imported for imported in module.Imports)
+
+		tableBody += nodes.row(
+			"",
+			nodes.entry("", nodes.Text(name)),
+			nodes.entry("", nodes.Text(imports if module.Error is None else module.Error)),
+			nodes.entry("", nodes.Text(f"{module.FanOut}")),
+			nodes.entry("", nodes.Text(f"{module.FanIn}")),
+			nodes.entry("", nodes.Text(", ".join(module.ExternalImports))),
+			nodes.entry("", nodes.Text(", ".join(module.HeavyImports))),
+			classes=self._rowClasses(module)
+		)
+
+	def _renderlevel(self, tableBody: nodes.tbody, package: PackageImports, level: int = 0) -> None:
+		self._renderrow(tableBody, package, f"{' '*level}📦{package.Name}")
+
+		for subpackage in self._sortedValues(package.Packages):
+			self._renderlevel(tableBody, subpackage, level + 1)
+
+		for module in self._sortedValues(package.Modules):
+			self._renderrow(tableBody, module, f"{' '*(level+1)} ⚙️{module.Name}")
+
+	def _GenerateCycleList(self) -> nodes.Element:
+		if len(self._graph.Cycles) == 0:
+			return nodes.paragraph(text=f"No import cycles found in package '{self._packageName}'.")
+
+		bulletList = nodes.bullet_list(classes=["report-importgraph-cycles"])
+		for cycle in self._graph.Cycles:
+			bulletList += nodes.list_item("", nodes.paragraph(text=" → ".join(cycle + cycle[:1])))
+
+		return bulletList
+
+	def run(self) -> List[nodes.Node]:
+		container = nodes.container()
+
+		try:
+			self._CheckOptions()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			self._graph = self._AnalyzePackage()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when analyzing package '{self._packageName}' in '{self._directory}'."
+			return self._internalError(container, __name__, message, ex)
+
+		container += self._GenerateImportTable()
+		container += nodes.rubric(text="Import cycles")
+		container += self._GenerateCycleList()
+
+		return [container]
@@ -0,0 +1,377 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Report Python import times as Sphinx documentation page(s).**
+"""
+from pathlib import Path
+from typing  import Dict, Tuple, Any, List, TypedDict, Union, ClassVar, Optional as Nullable, Set
+
+from docutils                            import nodes
+from docutils.parsers.rst.directives     import nonnegative_int
+from pyTooling.Decorators                import export
+from sphinx.application                  import Sphinx
+from sphinx.config                       import Config
+from sphinx.environment                  import BuildEnvironment
+
+from sphinx_reports.Common               import ReportExtensionError
+from sphinx_reports.Sphinx               import strip, stripAndNormalize, BaseDirective
+from sphinx_reports.DataModel.ImportTime import ImportedModule, ImportTimeReport
+from sphinx_reports.Adapter.ImportTime   import ImportTimeReader
+from sphinx_reports.Store                import ReportStore
+
+
+class log_DictType(TypedDict):
+	name:   str
+	logs:   List[Path]
+	levels: Dict[Union[int, str], Dict[str, str]]
+
+
+@export
+class ImportTimeBase(BaseDirective):
+	"""
+	Base-class for all directives visualizing import time logs.
+
+	It handles the configuration variables and loads and caches the import time logs referenced by a reportid.
+	"""
+	option_spec = {
+		"class":    strip,
+		"reportid": stripAndNormalize,
+	}
+
+	defaultLevelDefinitions = {
+		"default": {
+			1:       {"class": "report-cov-below100", "desc": "negligible"},
+			2:       {"class": "report-cov-below95",  "desc": "cheap"},
+			5:       {"class": "report-cov-below90",  "desc": "cheap"},
+			10:      {"class": "report-cov-below80",  "desc": "noticeable"},
+			20:      {"class": "report-cov-below60",  "desc": "expensive"},
+			35:      {"class": "report-cov-below40",  "desc": "expensive"},
+			50:      {"class": "report-cov-below20",  "desc": "very expensive"},
+			100:     {"class": "report-cov-below10",  "desc": "dominating"},
+			"error": {"class": "report-cov-error",    "desc": "internal error"},
+		}
+	}  #: Levels by share of the total import time in percent.
+
+	configPrefix:  str = "importtime"
+	configValues:  Dict[str, Tuple[Any, str, Any]] = {
+		f"{configPrefix}_logs":   ({}, "env", Dict),
+		f"{configPrefix}_levels": (defaultLevelDefinitions, "env", Dict),
+	}  #: A dictionary of all configuration values used by import time directives.
+
+	_logConfigurations: ClassVar[Dict[str, log_DictType]] = {}
+
+	_cssClasses: List[str]
+	_reportID:   str
+	_levels:     Dict[Union[int, str], Dict[str, str]]
+
+	def _CheckOptions(self) -> None:
+		"""
+		Parse all directive options or use default values.
+		"""
+		cssClasses = self._ParseStringOption("class", "", r"(\w+)?( +\w+)*")
+
+		self._cssClasses = [] if cssClasses == "" else cssClasses.split(" ")
+		self._reportID = self._ParseStringOption("reportid")
+
+		try:
+			logConfiguration = self._logConfigurations[self._reportID]
+		except KeyError as ex:
+			raise ReportExtensionError(f"No import time configuration item for '{self._reportID}'.") from ex
+
+		self._levels = logConfiguration["levels"]
+
+	@classmethod
+	def CheckConfiguration(cls, sphinxApplication: Sphinx, sphinxConfiguration: Config) -> None:
+		"""
+		Check configuration fields and load necessary values.
+
+		:param sphinxApplication:   Sphinx application instance.
+		:param sphinxConfiguration: Sphinx configuration instance.
+		"""
+		from sphinx_reports import ReportDomain
+
+		levelsVariableName = f"{ReportDomain.name}_{cls.configPrefix}_levels"
+		logsVariableName = f"{ReportDomain.name}_{cls.configPrefix}_logs"
+
+		try:
+			levelDefinitions: Dict[str, Dict[Union[int, str], Dict[str, str]]] = sphinxConfiguration[levelsVariableName]
+			allLogs: Dict[str, Dict[str, Any]] = sphinxConfiguration[logsVariableName]
+		except (KeyError, AttributeError) as ex:
+			raise ReportExtensionError(f"Configuration option '{logsVariableName}' or '{levelsVariableName}' is not configured.") from ex
+
+		for reportID, logConfiguration in allLogs.items():
+			configurationName = f"conf.py: {logsVariableName}:[{reportID}]"
+
+			try:
+				logs = logConfiguration["logs"]
+			except KeyError as ex:
+				raise ReportExtensionError(f"{configurationName}.logs: Configuration is missing.") from ex
+
+			logFiles = [Path(logs)] if isinstance(logs, (str, Path)) else [Path(log) for log in logs]
+			if len(logFiles) == 0:
+				raise ReportExtensionError(f"{configurationName}.logs: No import time log given.")
+
+			for logFile in logFiles:
+				if not logFile.exists():
+					raise ReportExtensionError(f"{configurationName}.logs: Import time log '{logFile}' doesn't exist.") from FileNotFoundError(logFile)
+
+			levels = logConfiguration.get("levels", "default")
+			if isinstance(levels, str):
+				try:
+					levelDefinition = levelDefinitions[levels]
+				except KeyError as ex:
+					raise ReportExtensionError(f"{configurationName}.levels: Referenced levels '{levels}' are not defined in conf.py variable '{levelsVariableName}'.") from ex
+			elif isinstance(levels, dict):
+				levelDefinition = levels
+			else:
+				raise ReportExtensionError(f"{configurationName}.levels: Neither a name of a level definition nor a dictionary.")
+
+			if 100 not in levelDefinition:
+				raise ReportExtensionError(f"{configurationName}.levels[100]: Configuration is missing.")
+			elif "error" not in levelDefinition:
+				raise ReportExtensionError(f"{configurationName}.levels[error]: Configuration is missing.")
+
+			cls._logConfigurations[reportID] = {
+				"name":   logConfiguration.get("name", reportID),
+				"logs":   logFiles,
+				"levels": levelDefinition
+			}
+
+	@classmethod
+	def _LoadReport(cls, reportID: str) -> ImportTimeReport:
+		"""
+		Load and merge the import time logs referenced by a reportid.
+
+		The report is cached in the report store. The entry is invalidated if any log file's modification time or size
+		changes.
+
+		:param reportID:              The reportid as used in ``report_importtime_logs``.
+		:return:                      The merged import time report.
+		:raises ReportExtensionError: If a log can't be read.
+		"""
+		logConfiguration = cls._logConfigurations[reportID]
+
+		fingerprint = ",".join(f"{stat.st_mtime_ns}:{stat.st_size}" for stat in (log.stat() for log in logConfiguration["logs"]))
+		report: ImportTimeReport = ReportStore.Default().Get(
+			f"{cls.configPrefix}/{reportID}",
+			fingerprint,
+			lambda: ImportTimeReader(logConfiguration["name"], logConfiguration["logs"]).Convert()
+		)
+
+		return report
+
+	@classmethod
+	def PreloadReports(cls, env: BuildEnvironment, reportIDs: Nullable[Set[str]]) -> None:
+		"""
+		Load import time logs before documents are read by parallel workers.
+
+		Errors are ignored here. They are reported by the directive.
+
+		:param env:       The Sphinx build environment.
+		:param reportIDs: Reportids of logs to load or ``None`` for all logs.
+		"""
+		for reportID in cls._logConfigurations:
+			if reportIDs is not None and reportID not in reportIDs:
+				continue
+
+			try:
+				cls._LoadReport(reportID)
+			except (ReportExtensionError, OSError):
+				pass
+
+	def _ConvertToColor(self, currentLevel: float, configKey: str) -> str:
+		if currentLevel < 0.0:
+			return self._levels["error"][configKey]
+
+		for levelLimit, levelConfig in self._levels.items():
+			if isinstance(levelLimit, int) and (currentLevel * 100) < levelLimit:
+				return levelConfig[configKey]
+
+		return self._levels[100][configKey]
+
+
+@export
+class ImportTime(ImportTimeBase):
+	"""
+	This directive will be replaced by a table of the slowest imports and a table representing the import tree.
+
+	Each row is colored by the module's share of the total import time (cumulative time for the tree, self time for the
+	top offenders).
+	"""
+	directiveName: str = "import-time"
+
+	has_content = False
+	required_arguments = 0
+	optional_arguments = ImportTimeBase.optional_arguments + 3
+
+	option_spec = ImportTimeBase.option_spec | {
+		"top":       nonnegative_int,
+		"max-depth": nonnegative_int,
+		"threshold": float,
+	}
+
+	_top:       int
+	_maxDepth:  int
+	_threshold: float
+	_report:    ImportTimeReport
+	_packages:  Set[str]
+
+	def _CheckOptions(self) -> None:
+		"""
+		Parse all directive options or use default values.
+		"""
+		super()._CheckOptions()
+
+		self._top = self.options.get("top", 10)
+		self._maxDepth = self.options.get("max-depth", 0)
+		self._threshold = self.options.get("threshold", 0.0) * 1000  # ms -> us
+
+	def _GenerateTopOffendersTable(self) -> nodes.table:
+		cssClasses = ["report-importtime-table", "report-importtime-top", f"report-importtime-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		# Create a table and table header with 4 columns
+		columns = [
+			("Module", 5),
+			("Self [ms]", 1),
+			("Share", 1),
+			("Imported by", 3),
+		]
+
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=f"{self._reportID}-top",
+			columns=columns,
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		totalTime = self._report.TotalTime
+		for module in self._report.TopOffenders(self._top):
+			share = module.SelfTime / totalTime if totalTime > 0 else 0.0
+			tableBody.append(nodes.row("",
+				nodes.entry("", nodes.Text(module.Name)),
+				nodes.entry("", nodes.Text(f"{module.SelfTime / 1000:.1f}")),
+				nodes.entry("", nodes.Text(f"{share:.1%}")),
+				nodes.entry("", nodes.Text("" if module.Parent is None else module.Parent.Name)),
+				classes=["report-module", self._ConvertToColor(share, "class")]
+			))
+
+		return tableGroup.parent
+
+	def _GenerateImportTreeTable(self) -> nodes.table:
+		cssClasses = ["report-importtime-table", f"report-importtime-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		# Create a table and table header with 4 columns
+		columns = [
+			("Module", 5),
+			("Self [ms]", 1),
+			("Cumulative [ms]", 1),
+			("Share", 1),
+		]
+
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=self._reportID,
+			columns=columns,
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		totalTime = self._report.TotalTime
+		for module in self.sortedModules(self._report.Imports):
+			self.renderlevel(tableBody, module, totalTime)
+
+		# Add a summary row
+		tableBody.append(nodes.row("",
+			nodes.entry("", nodes.Text(f"Overall ({self._report.ModuleCount} modules, {self._report.Runs} runs):")),
+			nodes.entry("", nodes.Text(f"{sum(module.SelfTime for module in self._report.IterateModules()) / 1000:.1f}")),
+			nodes.entry("", nodes.Text(f"{totalTime / 1000:.1f}")),
+			nodes.entry("", nodes.Text(f"{1.0:.1%}")),
+			classes=["report-summary"]
+		))
+
+		return tableGroup.parent
+
+	def sortedModules(self, d: Dict[str, ImportedModule]) -> List[ImportedModule]:
+		return sorted(d.values(), key=lambda module: module.CumulativeTime, reverse=True)
+
+	def renderlevel(self, tableBody: nodes.tbody, module: ImportedModule, totalTime: float, level: int = 0) -> None:
+		if module.CumulativeTime < self._threshold:
+			return
+
+		share = module.CumulativeTime / totalTime if totalTime > 0 else 0.0
+		isPackage = module.Name in self._packages
+		tableBody.append(nodes.row("",
+			nodes.entry("", nodes.Text(f"{' ' * level}{'📦' if isPackage else '⚙️'}{module.Name}")),
+			nodes.entry("", nodes.Text(f"{module.SelfTime / 1000:.1f}")),
+			nodes.entry("", nodes.Text(f"{module.CumulativeTime / 1000:.1f}")),
+			nodes.entry("", nodes.Text(f"{share:.1%}")),
+			classes=["report-package" if isPackage else "report-module", self._ConvertToColor(share, "class")]
+		))
+
+		if self._maxDepth == 0 or level + 1 < self._maxDepth:
+			for imported in self.sortedModules(module.Imports):
+				self.renderlevel(tableBody, imported, totalTime, level + 1)
+
+	def run(self) -> List[nodes.Node]:
+		container = nodes.container()
+
+		try:
+			self._CheckOptions()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			self._report = self._LoadReport(self._reportID)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when reading import time logs for '{self._reportID}'."
+			return self._internalError(container, __name__, message, ex)
+
+		for logFile in self._logConfigurations[self._reportID]["logs"]:
+			self.env.note_dependency(str(logFile.resolve()))
+		from sphinx_reports import ReportDomain
+
+		ReportDomain.Get(self.env).NoteReport(self.env.docname, self.configPrefix, self._reportID)
+
+		# A module is rendered as a package, if submodules of it were imported.
+		self._packages = {module.Name.rpartition(".")[0] for module in self._report.IterateModules()}
+
+		if self._top > 0:
+			container += nodes.rubric(text=f"Slowest imports of {self._report.Name}")
+			container += self._GenerateTopOffendersTable()
+			container += nodes.rubric(text="Import tree")
+
+		container += self._GenerateImportTreeTable()
+
+		return [container]
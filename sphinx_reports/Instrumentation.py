@@ -0,0 +1,351 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Opt-in instrumentation of the sphinx-reports build pipeline.**
+
+If ``report_instrumentation`` is enabled in :file:`conf.py`, spans are recorded for the phases of each report:
+
+* ``load`` – reading report files or deserializing converted models from the report store,
+* ``convert`` – converting a report into a model,
+* ``aggregate`` – aggregating a model's statistics,
+* ``render`` – running a directive (with the number of generated docutils nodes),
+* ``write`` – writing the report store.
+
+Spans recorded by parallel read workers are returned via the ``report`` domain's data. At ``build-finished``, a summary
+is logged and two files are written to the output directory:
+
+* :file:`sphinx-reports.stats.json` – aggregated timings per phase, report and directive, node counts and peak memory.
+* :file:`sphinx-reports.trace.json` – all spans in Chrome's trace event format (open in ``chrome://tracing`` or
+  https://ui.perfetto.dev).
+"""
+from contextlib import contextmanager
+from json       import dumps
+from os         import getpid
+from pathlib    import Path
+from sys        import platform
+from threading  import get_ident
+from time       import perf_counter_ns
+from typing     import Any, ClassVar, Dict, Generator, List, Optional as Nullable, Tuple, Type
+
+from docutils.parsers.rst import Directive
+from pyTooling.Decorators import export
+from sphinx.application   import Sphinx
+from sphinx.util.logging  import getLogger
+
+try:
+	from resource import getrusage, RUSAGE_SELF, RUSAGE_CHILDREN
+except ImportError:  # pragma: no cover
+	getrusage = None
+
+
+SpanRecord = Tuple[str, str, int, int, int, int, Dict[str, Any]]  #: A recorded span: phase, name, start (ns), duration (ns), process ID, thread ID and arguments.
+
+
+@export
+class Instrumentation:
+	"""
+	Records timing spans of the build pipeline and writes statistics and a trace at the end of a build.
+
+	All methods are classmethods, because spans are recorded from directives, transforms, callbacks and the report store.
+	If instrumentation is disabled, :meth:`Span` only yields and records nothing.
+	"""
+
+	phases: ClassVar[Tuple[str, ...]] = ("load", "convert", "aggregate", "render", "write")  #: Phases of the pipeline.
+
+	configValues: Dict[str, Tuple[Any, str, Any]] = {
+		"instrumentation": (False, "", bool),
+	}  #: A dictionary of all configuration values used by the instrumentation.
+
+	statsFile: ClassVar[str] = "sphinx-reports.stats.json"  #: Filename of the statistics file in the output directory.
+	traceFile: ClassVar[str] = "sphinx-reports.trace.json"  #: Filename of the trace event file in the output directory.
+
+	_enabled:    ClassVar[bool] =                                  False
+	_mainPID:    ClassVar[int] =                                   0
+	_buildStart: ClassVar[int] =                                   0
+	_spans:      ClassVar[List[SpanRecord]] =                      []
+	_directives: ClassVar[Dict[Type[Directive], Type[Directive]]] = {}
+
+	@classmethod
+	def IsEnabled(cls) -> bool:
+		"""
+		:returns: True, if spans are recorded.
+		"""
+		return cls._enabled
+
+	@classmethod
+	def Enable(cls) -> None:
+		"""
+		Start recording spans in this process and all processes forked from it.
+		"""
+		cls._enabled = True
+		cls._mainPID = getpid()
+		cls._buildStart = perf_counter_ns()
+		cls._spans = []
+
+	@classmethod
+	def Disable(cls) -> None:
+		"""
+		Stop recording spans and drop all recorded spans.
+		"""
+		cls._enabled = False
+		cls._spans = []
+
+	@classmethod
+	@contextmanager
+	def Span(cls, phase: str, name: str, **args: Any) -> Generator[Dict[str, Any], None, None]:
+		"""
+		Record the execution time of a ``with`` block as a span.
+
+		The yielded dictionary holds the span's arguments. Values added to it within the block are recorded, too.
+
+		:param phase: The pipeline phase (see :attr:`phases`).
+		:param name:  Name of the span, e.g. the report's store key.
+		:param args:  Additional arguments, e.g. ``report``.
+		:returns:     The span's arguments.
+		"""
+		if not cls._enabled:
+			yield args
+			return
+
+		start = perf_counter_ns()
+		try:
+			yield args
+		finally:
+			cls._spans.append((phase, name, start, perf_counter_ns() - start, getpid(), get_ident(), args))
+
+	@classmethod
+	def TakeWorkerSpans(cls) -> List[SpanRecord]:
+		"""
+		Remove and return spans recorded by a forked read worker.
+
+		Spans recorded in the main process are kept, because a forked worker starts with a copy of them.
+
+		:returns: Spans recorded by this process, if it's a worker process, otherwise an empty list.
+		"""
+		pid = getpid()
+		if not cls._enabled or pid == cls._mainPID:
+			return []
+
+		spans = [span for span in cls._spans if span[4] == pid]
+		cls._spans = [span for span in cls._spans if span[4] != pid]
+		return spans
+
+	@classmethod
+	def InstrumentDirective(cls, directiveClass: Type[Directive], fullname: str) -> Type[Directive]:
+		"""
+		Derive a directive class recording each directive run as a ``render`` span.
+
+		:param directiveClass: The directive class (adapter) returned by the domain.
+		:param fullname:       The directive's full name, e.g. ``report:unittest-summary``.
+		:returns:              The instrumented directive class.
+		"""
+		try:
+			return cls._directives[directiveClass]
+		except KeyError:
+			pass
+
+		class InstrumentedDirective(directiveClass):
+			def run(self) -> List[Any]:
+				configPrefix = getattr(self, "configPrefix", None)
+				reportID = self.options.get("reportid")
+				args = {"docname": self.env.docname}
+				if configPrefix is not None and reportID is not None:
+					args["report"] = f"{configPrefix}/{reportID}"
+
+				with cls.Span("render", fullname, **args) as spanArgs:
+					result = super().run()
+					spanArgs["nodes"] = sum(1 for node in result for _ in node.findall())
+
+				return result
+
+		cls._directives[directiveClass] = InstrumentedDirective
+		return InstrumentedDirective
+
+	@staticmethod
+	def _PeakMemory() -> Dict[str, Nullable[int]]:
+		"""
+		Return the peak resident memory of this process and of its terminated child processes (e.g. read workers).
+
+		:returns: Peak memory in KiB, or ``None`` if the platform doesn't support :mod:`resource`.
+		"""
+		if getrusage is None:
+			return {"main": None, "workers": None}
+
+		# ru_maxrss is reported in bytes on macOS and in KiB on other platforms.
+		scale = 1024 if platform == "darwin" else 1
+		return {
+			"main":    getrusage(RUSAGE_SELF).ru_maxrss // scale,
+			"workers": getrusage(RUSAGE_CHILDREN).ru_maxrss // scale,
+		}
+
+	@staticmethod
+	def _Nesting(spans: List[SpanRecord]) -> Tuple[List[int], List[Nullable[str]]]:
+		"""
+		Compute the duration of each span excluding directly nested spans and the report each span belongs to.
+
+		Spans nest per process and thread, e.g. an ``aggregate`` span within a ``convert`` span. A span without a
+		``report`` argument belongs to the report of its enclosing span.
+
+		:param spans: Recorded spans.
+		:returns:     Durations in ns excluding nested spans and reports, both in the order of ``spans``.
+		"""
+		selfDurations = [span[3] for span in spans]
+		reports: List[Nullable[str]] = [span[6].get("report") for span in spans]
+		order = sorted(range(len(spans)), key=lambda i: (spans[i][4], spans[i][5], spans[i][2], -spans[i][3]))
+
+		stack: List[int] = []
+		for index in order:
+			_, _, start, duration, pid, tid, _ = spans[index]
+			while len(stack) > 0 and (
+				spans[stack[-1]][4:6] != (pid, tid) or spans[stack[-1]][2] + spans[stack[-1]][3] <= start
+			):
+				stack.pop()
+
+			if len(stack) > 0:
+				parent = stack[-1]
+				selfDurations[parent] -= duration
+				if reports[index] is None:
+					reports[index] = reports[parent]
+
+			stack.append(index)
+
+		return selfDurations, reports
+
+	@classmethod
+	def Statistics(cls, spans: List[SpanRecord], buildDuration: int) -> Dict[str, Any]:
+		"""
+		Aggregate spans into statistics per phase, report and directive.
+
+		Durations of phases and reports exclude nested spans, so they add up to the time spent in sphinx-reports.
+
+		:param spans:         Recorded spans.
+		:param buildDuration: Wall-clock duration of the build in ns.
+		:returns:             A JSON-serializable dictionary.
+		"""
+		phases = {phase: {"count": 0, "duration_ms": 0.0} for phase in cls.phases}
+		reports: Dict[str, Dict[str, float]] = {}
+		directives: Dict[str, Dict[str, Any]] = {}
+		nodeCount = 0
+
+		selfDurations, spanReports = cls._Nesting(spans)
+		for (phase, name, _, duration, _, _, args), selfDuration, report in zip(spans, selfDurations, spanReports):
+			selfDuration /= 1e6
+			phaseStatistics = phases.setdefault(phase, {"count": 0, "duration_ms": 0.0})
+			phaseStatistics["count"] += 1
+			phaseStatistics["duration_ms"] += selfDuration
+
+			if report is not None:
+				reportStatistics = reports.setdefault(report, {})
+				reportStatistics[phase] = reportStatistics.get(phase, 0.0) + selfDuration
+
+			if phase == "render":
+				nodes = args.get("nodes", 0)
+				nodeCount += nodes
+				directiveStatistics = directives.setdefault(name, {"count": 0, "duration_ms": 0.0, "nodes": 0})
+				directiveStatistics["count"] += 1
+				directiveStatistics["duration_ms"] += duration / 1e6
+				directiveStatistics["nodes"] += nodes
+
+		return {
+			"build_ms":        buildDuration / 1e6,
+			"phases":          phases,
+			"reports":         reports,
+			"directives":      directives,
+			"nodes":           nodeCount,
+			"peak_memory_kib": cls._PeakMemory(),
+		}
+
+	@classmethod
+	def TraceEvents(cls, spans: List[SpanRecord]) -> Dict[str, Any]:
+		"""
+		Convert spans into Chrome's trace event format.
+
+		:param spans: Recorded spans.
+		:returns:     A JSON-serializable dictionary.
+		"""
+		events: List[Dict[str, Any]] = [
+			{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "sphinx (main)" if pid == cls._mainPID else "sphinx (worker)"}}
+			for pid in sorted({span[4] for span in spans} | {cls._mainPID})
+		]
+		for phase, name, start, duration, pid, tid, args in spans:
+			events.append({
+				"name": name,
+				"cat":  phase,
+				"ph":   "X",
+				"ts":   (start - cls._buildStart) / 1e3,
+				"dur":  duration / 1e3,
+				"pid":  pid,
+				"tid":  tid,
+				"args": args,
+			})
+
+		return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+	@classmethod
+	def Write(cls, outputDirectory: Path, workerSpans: List[SpanRecord], metadata: Dict[str, Any]) -> Dict[str, Any]:
+		"""
+		Write the statistics and the trace event file.
+
+		:param outputDirectory: Directory to write both files into.
+		:param workerSpans:     Spans returned by read workers.
+		:param metadata:        Additional build information for the statistics file (e.g. builder name).
+		:returns:               The statistics.
+		"""
+		spans = cls._spans + workerSpans
+		statistics = {"version": 1, **metadata, **cls.Statistics(spans, perf_counter_ns() - cls._buildStart)}
+
+		outputDirectory.mkdir(parents=True, exist_ok=True)
+		(outputDirectory / cls.statsFile).write_text(dumps(statistics, indent=2, default=str), encoding="utf-8")
+		(outputDirectory / cls.traceFile).write_text(dumps(cls.TraceEvents(spans), default=str), encoding="utf-8")
+
+		return statistics
+
+	@staticmethod
+	def LogSummary(statistics: Dict[str, Any]) -> None:
+		"""
+		Log a short summary of the statistics.
+
+		:param statistics: Statistics as returned by :meth:`Statistics`.
+		"""
+		logger = getLogger(__name__)
+
+		phases = ", ".join(
+			f"{phase} {values['duration_ms']:.1f} ms ({values['count']}x)"
+			for phase, values in statistics["phases"].items()
+		)
+		logger.info(f"[REPORT] Instrumentation: {phases}")
+
+		for report, values in sorted(statistics["reports"].items(), key=lambda item: -sum(item[1].values()))[:5]:
+			logger.info(f"[REPORT]   {report}: {sum(values.values()):.1f} ms")
+
+		peakMemory = statistics["peak_memory_kib"]
+		memory = "n/a" if peakMemory["main"] is None else f"{peakMemory['main'] / 1024:.1f} MiB (main), {peakMemory['workers'] / 1024:.1f} MiB (workers)"
+		logger.info(f"[REPORT]   {statistics['nodes']} nodes generated, peak memory {memory}")
@@ -35,10 +35,10 @@ from sphinx.writers.latex  import LaTeXTranslator
 
 from pyTooling.Decorators import export
 from sphinx_reports.Common import visitFunc, departFunc
-from sphinx_reports.Node   import Landscape
+from sphinx_reports.Node   import Landscape, InlineSVG
 
 
-__all__ = ["translateLandscape"]
+__all__ = ["translateLandscape", "translateInlineSVG"]
 
 
 @export
@@ -74,3 +74,32 @@ def depart_Landscape(translator: LaTeXTranslator, node: Landscape) -> None:
 
 translateLandscape: Tuple[visitFunc, departFunc] = (visit_Landscape, depart_Landscape)
 """A tuple combining both ``visit_*`` and ``depart_*`` call back functions for a :class:`Landscape` node."""
+
+
+@export
+def visit_InlineSVG(translator: LaTeXTranslator, node: InlineSVG) -> None:
+	"""
+	Call back function for visiting a :class:`InlineSVG`.
+
+	This function has no actions for LaTeX. The SVG graphic is ignored and the child nodes (fallback content) are
+	rendered instead.
+
+	:param translator: The LaTeX translator instance.
+	:param node:       The current node being visited.
+	"""
+
+
+@export
+def depart_InlineSVG(translator: LaTeXTranslator, node: InlineSVG) -> None:
+	"""
+	Call back function for departing a :class:`InlineSVG`.
+
+	This function has no actions for LaTeX.
+
+	:param translator: The LaTeX translator instance.
+	:param node:       The current node being departed.
+	"""
+
+
+translateInlineSVG: Tuple[visitFunc, departFunc] = (visit_InlineSVG, depart_InlineSVG)
+"""A tuple combining both ``visit_*`` and ``depart_*`` call back functions for a :class:`InlineSVG` node."""
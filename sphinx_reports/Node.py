@@ -28,7 +28,7 @@
 # SPDX-License-Identifier: Apache-2.0                                                                                  #
 # ==================================================================================================================== #
 #
-from docutils.nodes import container
+from docutils.nodes import container, General, Element
 
 from pyTooling.Decorators import export
 
@@ -38,3 +38,22 @@ class Landscape(container):
 	"""
 	A container node used in LaTeX to render content in landscape view in PDF pages.
 	"""
+
+
+@export
+class InlineSVG(container):
+	"""
+	A container node holding an inline SVG graphic in attribute ``svg``.
+
+	In HTML, the SVG graphic is emitted and all child nodes are skipped. Other formats like LaTeX render the child nodes
+	instead, e.g. a table as fallback.
+	"""
+
+
+@export
+class DocCoveragePlaceholder(General, Element):
+	"""
+	A placeholder node for a documentation coverage table, which can only be computed after all documents were read.
+
+	The attribute ``reportid`` references the package configuration. The node is replaced by a post-transform.
+	"""
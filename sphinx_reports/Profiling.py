@@ -0,0 +1,276 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**Optional profiling of selected report directives with cProfile and tracemalloc.**
+
+Profiling is configured by ``report_profile`` in :file:`conf.py`. Selected directive runs (loading and converting the
+report and rendering the doctree nodes) are profiled. Results are written per run into the :file:`_report_profiles`
+directory in the output directory:
+
+* :file:`<reportid>.<directive>.<docname>.L<line>.prof` – cProfile statistics (open with :mod:`pstats`, ``snakeviz``, ...).
+* :file:`<reportid>.<directive>.<docname>.L<line>.allocations.txt` – top allocations by source line (tracemalloc).
+
+The directive's line number keeps results of several runs in the same document apart.
+
+If ``report_profile`` is empty (default), directives aren't wrapped, thus profiling causes no overhead.
+"""
+from pathlib import Path
+from re      import sub as re_sub
+from typing  import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional as Nullable, Set, Tuple, Type
+
+from docutils.parsers.rst import Directive
+from pyTooling.Decorators import export
+from sphinx.application   import Sphinx
+from sphinx.config        import Config
+from sphinx.util.logging  import getLogger
+
+from sphinx_reports.Common import ReportExtensionError
+
+if TYPE_CHECKING:
+	from tracemalloc import Snapshot
+
+
+@export
+class Profiler:
+	"""
+	Wraps selected report directives in cProfile and/or tracemalloc.
+
+	.. code-block:: Python
+
+	   report_profile = {
+	     "directives": ["unittest-summary"],        # profile all runs of these directives
+	     "reportids":  ["src"],                     # profile all directives using these reportids
+	     "profilers":  ["cprofile", "tracemalloc"], # default: ["cprofile"]
+	     "top":        25,                          # number of allocation sites listed (default: 25)
+	   }
+	"""
+
+	profilers: ClassVar[Tuple[str, ...]] = ("cprofile", "tracemalloc")  #: Supported profilers.
+	directory: ClassVar[str] =             "_report_profiles"           #: Name of the profile directory in the output directory.
+
+	configValues: Dict[str, Tuple[Any, str, Any]] = {
+		"profile": ({}, "", dict),
+	}  #: A dictionary of all configuration values used for profiling.
+
+	_directives:      ClassVar[Set[str]] =                                           set()
+	_reportIDs:       ClassVar[Set[str]] =                                           set()
+	_profilers:       ClassVar[Set[str]] =                                           set()
+	_top:             ClassVar[int] =                                                25
+	_outputDirectory: ClassVar[Nullable[Path]] =                                     None
+	_wrapped:         ClassVar[Dict[Tuple[Type[Directive], str], Type[Directive]]] = {}
+
+	@classmethod
+	def CheckConfiguration(cls, sphinxApplication: Sphinx, sphinxConfiguration: Config) -> None:
+		"""
+		Check configuration fields and load necessary values.
+
+		:param sphinxApplication:     Sphinx application instance.
+		:param sphinxConfiguration:   Sphinx configuration instance.
+		:raises ReportExtensionError: If the profiling configuration is invalid.
+		"""
+		from sphinx_reports import ReportDomain
+
+		variableName = f"{ReportDomain.name}_profile"
+
+		try:
+			profileConfiguration: Dict[str, Any] = sphinxConfiguration[variableName]
+		except (KeyError, AttributeError) as ex:
+			raise ReportExtensionError(f"Configuration option '{variableName}' is not configured.") from ex
+
+		cls._directives = set()
+		cls._reportIDs = set()
+		cls._profilers = set()
+		cls._outputDirectory = Path(sphinxApplication.outdir) / cls.directory
+
+		for key in profileConfiguration:
+			if key not in ("directives", "reportids", "profilers", "top"):
+				raise ReportExtensionError(f"conf.py: {variableName}.{key}: Unknown configuration field.")
+
+		for field in ("directives", "reportids", "profilers"):
+			values = profileConfiguration.get(field, ["cprofile"] if field == "profilers" else [])
+			if isinstance(values, str) or not all(isinstance(value, str) for value in values):
+				raise ReportExtensionError(f"conf.py: {variableName}.{field}: Not a list of strings.")
+
+			if field == "directives":
+				cls._directives = {value.removeprefix(f"{ReportDomain.name}:") for value in values}
+			elif field == "reportids":
+				cls._reportIDs = set(values)
+			else:
+				for value in values:
+					if value not in cls.profilers:
+						raise ReportExtensionError(f"conf.py: {variableName}.profilers: Unsupported profiler '{value}' (supported: {', '.join(cls.profilers)}).")
+				cls._profilers = set(values)
+
+		top = profileConfiguration.get("top", 25)
+		if not isinstance(top, int) or top <= 0:
+			raise ReportExtensionError(f"conf.py: {variableName}.top: '{top}' is not a positive integer.")
+		cls._top = top
+
+	@classmethod
+	def IsEnabled(cls) -> bool:
+		"""
+		:returns: True, if any directive or reportid is selected for profiling.
+		"""
+		return len(cls._profilers) > 0 and (len(cls._directives) > 0 or len(cls._reportIDs) > 0)
+
+	@classmethod
+	def InstrumentDirective(cls, directiveClass: Type[Directive], name: str) -> Type[Directive]:
+		"""
+		Derive a directive class profiling selected directive runs.
+
+		If neither the directive nor any reportid is selected, the directive class is returned unchanged.
+
+		:param directiveClass: The directive class (adapter) returned by the domain.
+		:param name:           The directive's name without domain prefix, e.g. ``unittest-summary``.
+		:returns:              The profiling directive class.
+		"""
+		if name not in cls._directives and len(cls._reportIDs) == 0:
+			return directiveClass
+
+		try:
+			return cls._wrapped[(directiveClass, name)]
+		except KeyError:
+			pass
+
+		class ProfiledDirective(directiveClass):
+			def run(self) -> List[Any]:
+				reportID = self.options.get("reportid")
+				if name not in cls._directives and reportID not in cls._reportIDs:
+					return super().run()
+
+				return cls._Profile(super().run, name, reportID, self.env.docname, self.lineno)
+
+		cls._wrapped[(directiveClass, name)] = ProfiledDirective
+		return ProfiledDirective
+
+	@classmethod
+	def _Profile(cls, run: Callable[[], List[Any]], name: str, reportID: Nullable[str], docname: str, lineno: int) -> List[Any]:
+		"""
+		Run a directive with the configured profilers and write their results.
+
+		:param run:                   The directive's ``run`` method.
+		:param name:                  The directive's name.
+		:param reportID:              The directive's reportid, if any.
+		:param docname:               Name of the document containing the directive.
+		:param lineno:                Line number of the directive in the document.
+		:returns:                     The directive's nodes.
+		:raises ReportExtensionError: If profiling isn't configured.
+		"""
+		outputDirectory = cls._outputDirectory
+		if outputDirectory is None:
+			raise ReportExtensionError("Profiling isn't configured. Call 'Profiler.CheckConfiguration' first.")
+
+		import tracemalloc
+		from cProfile import Profile
+
+		logger = getLogger(__name__)
+		basename = re_sub(r"[^\w.-]+", "_", f"{reportID or 'noreport'}.{name}.{docname}.L{lineno}")
+
+		profile = None
+		if "cprofile" in cls._profilers:
+			profile = Profile()
+			try:
+				profile.enable()
+			except ValueError as ex:
+				# Since Python 3.12, only one profiler can be active at a time.
+				logger.warning(f"[REPORT] Can't profile '{basename}' with cProfile.\n  {ex}")
+				profile = None
+
+		startedTracing = False
+		before: Nullable["Snapshot"] = None
+		peak = 0
+		if "tracemalloc" in cls._profilers:
+			if not tracemalloc.is_tracing():
+				tracemalloc.start()
+				startedTracing = True
+			tracemalloc.reset_peak()
+			before = tracemalloc.take_snapshot()
+
+		try:
+			return run()
+		finally:
+			if profile is not None:
+				profile.disable()
+
+			after = None
+			if before is not None:
+				after = tracemalloc.take_snapshot()
+				_, peak = tracemalloc.get_traced_memory()
+				if startedTracing:
+					tracemalloc.stop()
+
+			try:
+				outputDirectory.mkdir(parents=True, exist_ok=True)
+
+				if profile is not None:
+					profileFile = outputDirectory / f"{basename}.prof"
+					profile.dump_stats(profileFile)
+					logger.info(f"[REPORT] cProfile statistics written to '{profileFile}'.")
+
+				if before is not None and after is not None:
+					allocationsFile = outputDirectory / f"{basename}.allocations.txt"
+					allocationsFile.write_text(cls._AllocationSummary(before, after, peak, name, reportID, docname), encoding="utf-8")
+					logger.info(f"[REPORT] Allocation summary written to '{allocationsFile}'.")
+			except OSError as ex:
+				logger.warning(f"Caught {ex.__class__.__name__} when writing profiling results of '{basename}'.\n  {ex}")
+
+	@classmethod
+	def _AllocationSummary(cls, before: "Snapshot", after: "Snapshot", peak: int, name: str, reportID: Nullable[str], docname: str) -> str:
+		"""
+		Format the top allocations of a directive run.
+
+		:param before:   tracemalloc snapshot taken before the directive run.
+		:param after:    tracemalloc snapshot taken after the directive run.
+		:param peak:     Peak traced memory in bytes during the directive run.
+		:param name:     The directive's name.
+		:param reportID: The directive's reportid, if any.
+		:param docname:  Name of the document containing the directive.
+		:returns:        The summary as text.
+		"""
+		import tracemalloc
+
+		filters = (
+			tracemalloc.Filter(False, tracemalloc.__file__),
+			tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+			tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+		)
+		statistics = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+		net = sum(statistic.size_diff for statistic in statistics)
+
+		lines = [
+			f"Top {cls._top} allocations of directive '{name}' (reportid: {reportID}, document: {docname})",
+			f"Peak traced memory: {peak / 1024:.1f} KiB, net allocated: {net / 1024:.1f} KiB",
+			"",
+		]
+		for index, statistic in enumerate(statistics[:cls._top], start=1):
+			lines.append(f"{index:3}. {statistic}")
+
+		return "\n".join(lines) + "\n"
@@ -31,11 +31,13 @@
 """
 **Helper functions and derived classes from Sphinx.**
 """
-from re     import match as re_match
-from typing import Optional as Nullable, Tuple, List
+from pathlib import Path
+from re      import match as re_match
+from typing  import Any, Optional as Nullable, Tuple, List, Sequence
 
 from docutils              import nodes
 from sphinx.directives     import ObjectDescription
+from sphinx.environment    import BuildEnvironment
 from pyTooling.Decorators  import export
 from sphinx.util.logging   import getLogger
 
@@ -52,6 +54,22 @@ def stripAndNormalize(option: str) -> str:
 	return option.strip().lower()
 
 
+@export
+def cacheDirectory(env: BuildEnvironment) -> Path:
+	"""
+	Return the cache directory of sphinx-reports within Sphinx's doctree directory.
+
+	Data stored in this directory persists between builds, but is removed together with the build directory.
+
+	:param env: The Sphinx build environment.
+	:return:    Path to the (created) cache directory.
+	"""
+	directory = Path(env.doctreedir) / "sphinx-reports"
+	directory.mkdir(parents=True, exist_ok=True)
+
+	return directory
+
+
 @export
 class BaseDirective(ObjectDescription):
 	has_content: bool = False
@@ -130,7 +148,19 @@ class BaseDirective(ObjectDescription):
 		except KeyError as ex:
 			raise ReportExtensionError(f"{self.directiveName}::{optionName}: Value '{option}' (transformed: '{identifier}') is not a valid member of 'LegendStyle'.") from ex
 
-	def _CreateSingleTableHeader(self, columns: List[Tuple[str, Nullable[int]]], identifier: str, classes: List[str]) -> nodes.tgroup:
+	@staticmethod
+	def _ParseWorkers(configurationName: str, workers: Any) -> int:
+		try:
+			count = int(workers)
+		except (TypeError, ValueError) as ex:
+			raise ReportExtensionError(f"{configurationName}: '{workers}' is not an integer.") from ex
+
+		if count < 0:
+			raise ReportExtensionError(f"{configurationName}: Number of workers must be 0 (one per CPU) or positive.")
+
+		return count
+
+	def _CreateSingleTableHeader(self, columns: Sequence[Tuple[str, Nullable[int]]], identifier: str, classes: List[str]) -> nodes.tgroup:
 		table = nodes.table("", identifier=identifier, classes=classes)
 		table += (tableGroup := nodes.tgroup(cols=(len(columns))))
 
@@ -203,6 +233,14 @@ class BaseDirective(ObjectDescription):
 
 		return tableGroup
 
+	def _CacheDirectory(self) -> Path:
+		"""
+		Return the cache directory of sphinx-reports within Sphinx's doctree directory.
+
+		:return: Path to the (created) cache directory.
+		"""
+		return cacheDirectory(self.env)
+
 	def _internalError(self, container: nodes.container, location: str, message: str, exception: Exception) -> List[nodes.Node]:
 		logger = getLogger(location)
 		logger.error(f"{message}")
@@ -0,0 +1,454 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+**A report store caching converted report models between Sphinx builds.**
+
+Converting a report (e.g. parsing a JUnit XML file) is done once. The converted model is serialized into a store file in
+Sphinx's cache directory, which is memory-mapped read-only, so the next build deserializes the model instead of
+converting the report again.
+
+Models stay in the memory of the process, which converted or deserialized them. When Sphinx reads documents in parallel,
+reports are preloaded before the worker processes are forked, so workers share these models (copy-on-write) and neither
+convert nor deserialize them again. Workers don't read the store file. Only code coverage models can be read in place
+(see :meth:`ReportStore.View`); all other models are Python object graphs, whose pages become private copies, when a
+worker touches them (e.g. by reference counting).
+
+.. rubric:: File format (version 1)
+
+All integers are little-endian.
+
+* Header: magic ``SPXRPTST`` (8 bytes), format version (``uint16``), number of entries (``uint32``).
+* Index, one record per entry: key length (``uint16``), key (UTF-8), fingerprint length (``uint16``), fingerprint
+  (UTF-8), codec (``uint8``), payload offset (``uint64``) and payload length (``uint64``). Offsets are relative to the
+  file's start.
+* Payloads, each aligned to 8 bytes.
+
+.. rubric:: Codecs
+
+=====  ===================================================================================================
+Codec  Payload
+=====  ===================================================================================================
+0      A pickled Python object.
+1      A code coverage model in the compact format of :class:`~sphinx_reports.Codec.CodeCoverageCodec`.
+=====  ===================================================================================================
+
+Code coverage models are stored in the compact format, which supports random access via :meth:`ReportStore.View`. All
+other models (and code coverage models with fields unknown to the format) are pickled.
+"""
+from mmap    import mmap, ACCESS_READ
+from os      import getpid
+from pathlib import Path
+from pickle  import dumps, loads, HIGHEST_PROTOCOL
+from struct  import Struct, error as StructError
+from typing  import Any, Callable, ClassVar, Dict, List, Optional as Nullable, Tuple, Union
+
+from pyTooling.Decorators import export, readonly
+
+from sphinx_reports.Codec                  import CodeCoverageCodec, CodeCoverageView, CodecError
+from sphinx_reports.Common                 import ReportExtensionError
+from sphinx_reports.DataModel.CodeCoverage import PackageCoverage
+from sphinx_reports.Instrumentation        import Instrumentation
+
+
+_header = Struct("<8sHI")
+_length = Struct("<H")
+_entry =  Struct("<BQQ")
+
+_magic =   b"SPXRPTST"
+_version = 1
+
+CODEC_PICKLE =  0  #: Payload is a pickled Python object.
+CODEC_CODECOV = 1  #: Payload is a code coverage model in the compact format.
+
+
+@export
+class ReportStoreError(ReportExtensionError):
+	pass
+
+
+@export
+class ReportStore:
+	"""
+	A key-value store of converted report models backed by a memory-mapped file.
+
+	Each entry has a fingerprint (e.g. modification time and size of the report file). If the fingerprint of a requested
+	entry doesn't match, the model is converted again. Models are deserialized at most once per process.
+
+	New entries are kept in memory until :meth:`Commit` writes a new store file. The previous file stays mapped until then,
+	so processes, which mapped the previous file, are not affected.
+	"""
+
+	_default: ClassVar[Nullable["ReportStore"]] = None
+
+	_file:    Nullable[Path]
+	_mapping: Nullable[mmap]
+	_index:   Dict[str, Tuple[str, int, int, int]]
+	_pending: Dict[str, Tuple[str, int, bytes]]
+	_models:  Dict[str, Tuple[str, Any]]
+
+	def __init__(self, file: Nullable[Path] = None) -> None:
+		"""
+		Open a store file.
+
+		A missing, truncated or incompatible store file is treated as an empty store.
+
+		:param file: The store file, or ``None`` for a store kept in memory.
+		"""
+		self._file = file
+		self._mapping = None
+		self._index = {}
+		self._pending = {}
+		self._models = {}
+
+		self._Map()
+
+	@classmethod
+	def Default(cls) -> "ReportStore":
+		"""
+		Return the store used by directives.
+
+		If no store was opened by :meth:`OpenDefault`, an in-memory store is created.
+
+		:returns: The default report store.
+		"""
+		if cls._default is None:
+			cls._default = cls()
+
+		return cls._default
+
+	@classmethod
+	def OpenDefault(cls, file: Path) -> "ReportStore":
+		"""
+		Open the store used by directives.
+
+		:param file: The store file.
+		:returns:    The default report store.
+		"""
+		if cls._default is None or cls._default._file != file:
+			if cls._default is not None:
+				cls._default.Close()
+			cls._default = cls(file)
+
+		return cls._default
+
+	@readonly
+	def File(self) -> Nullable[Path]:
+		return self._file
+
+	def __len__(self) -> int:
+		return len(self._index.keys() | self._pending.keys())
+
+	def __contains__(self, key: str) -> bool:
+		return key in self._pending or key in self._index
+
+	@readonly
+	def Keys(self) -> List[str]:
+		"""
+		Read-only property to access the keys of all entries (committed or not).
+
+		:returns: Sorted list of keys.
+		"""
+		return sorted(self._index.keys() | self._pending.keys())
+
+	@staticmethod
+	def IsStoreFile(file: Path) -> bool:
+		"""
+		Check if a file starts with the store file's magic bytes.
+
+		:param file: The file to check.
+		:returns:    True, if the file is a store file.
+		"""
+		try:
+			with file.open("rb") as f:
+				return f.read(len(_magic)) == _magic
+		except OSError:
+			return False
+
+	def _Map(self) -> None:
+		if self._file is None or not self._file.exists():
+			return
+
+		try:
+			with self._file.open("rb") as file:
+				mapping = mmap(file.fileno(), 0, access=ACCESS_READ)
+		except (OSError, ValueError):
+			return
+
+		try:
+			self._index = self._ReadIndex(mapping)
+		except (StructError, UnicodeDecodeError, ReportStoreError):
+			self._index = {}
+			mapping.close()
+			return
+
+		self._mapping = mapping
+
+	@staticmethod
+	def _ReadIndex(mapping: mmap) -> Dict[str, Tuple[str, int, int, int]]:
+		magic, version, count = _header.unpack_from(mapping, 0)
+		if magic != _magic or version != _version:
+			raise ReportStoreError("Unsupported store file format.")
+
+		index = {}
+		position = _header.size
+		for _ in range(count):
+			(keyLength,) = _length.unpack_from(mapping, position)
+			position += _length.size
+			key = bytes(mapping[position:position + keyLength]).decode("utf-8")
+			position += keyLength
+
+			(fingerprintLength,) = _length.unpack_from(mapping, position)
+			position += _length.size
+			fingerprint = bytes(mapping[position:position + fingerprintLength]).decode("utf-8")
+			position += fingerprintLength
+
+			codec, offset, length = _entry.unpack_from(mapping, position)
+			position += _entry.size
+
+			if offset + length > len(mapping):
+				raise ReportStoreError("Store file is truncated.")
+
+			index[key] = (fingerprint, codec, offset, length)
+
+		return index
+
+	def Get(self, key: str, fingerprint: str, convert: Callable[[], Any]) -> Any:
+		"""
+		Return a converted model.
+
+		The model is taken from this process' memory, from the mapped store file or converted by calling ``convert``. A
+		converted model is added to the store, when :meth:`Commit` is called.
+
+		:param key:         The entry's key, e.g. ``unittest/<reportid>``.
+		:param fingerprint: The fingerprint of the report file(s) the model is converted from.
+		:param convert:     A callable converting the report, if no matching entry exists.
+		:returns:           The converted model.
+		"""
+		try:
+			modelFingerprint, model = self._models[key]
+			if modelFingerprint == fingerprint:
+				return model
+		except KeyError:
+			pass
+
+		model = None
+		entry = self._index.get(key)
+		if entry is not None and entry[0] == fingerprint and key not in self._pending:
+			_, codec, offset, length = entry
+			try:
+				with Instrumentation.Span("load", key, report=key, bytes=length):
+					model = self._Decode(codec, self._Payload(offset, length))
+			except Exception:
+				model = None
+
+		if model is None:
+			with Instrumentation.Span("convert", key, report=key):
+				model = convert()
+			self.Put(key, fingerprint, model)
+		else:
+			self._models[key] = (fingerprint, model)
+
+		return model
+
+	def Put(self, key: str, fingerprint: str, model: Any) -> None:
+		"""
+		Add or replace an entry. The entry is written to the store file, when :meth:`Commit` is called.
+
+		:param key:         The entry's key.
+		:param fingerprint: The fingerprint of the report file(s) the model is converted from.
+		:param model:       The converted model.
+		"""
+		self._pending[key] = (fingerprint, *self._Encode(model))
+		self._models[key] = (fingerprint, model)
+
+	def Fingerprint(self, key: str) -> str:
+		"""
+		Return the fingerprint of an entry.
+
+		:param key:               The entry's key.
+		:returns:                 The entry's fingerprint.
+		:raises ReportStoreError: If the store has no such entry.
+		"""
+		try:
+			return self._pending[key][0]
+		except KeyError:
+			pass
+
+		try:
+			return self._index[key][0]
+		except KeyError as ex:
+			raise ReportStoreError(f"Report store '{self._file}' has no entry '{key}'.") from ex
+
+	def Load(self, key: str) -> Any:
+		"""
+		Return the model of an entry regardless of its fingerprint.
+
+		:param key:               The entry's key.
+		:returns:                 The deserialized model.
+		:raises ReportStoreError: If the store has no such entry or the entry can't be deserialized.
+		"""
+		try:
+			return self._models[key][1]
+		except KeyError:
+			pass
+
+		try:
+			fingerprint, codec, offset, length = self._index[key]
+		except KeyError as ex:
+			raise ReportStoreError(f"Report store '{self._file}' has no entry '{key}'.") from ex
+
+		try:
+			with Instrumentation.Span("load", key, report=key, bytes=length):
+				model = self._Decode(codec, self._Payload(offset, length))
+		except ReportStoreError:
+			raise
+		except Exception as ex:
+			raise ReportStoreError(f"Entry '{key}' of report store '{self._file}' can't be deserialized.") from ex
+
+		self._models[key] = (fingerprint, model)
+		return model
+
+	def View(self, key: str) -> CodeCoverageView:
+		"""
+		Return a random-access view of a code coverage entry without deserializing the whole model.
+
+		The view reads the mapped store file in place. Release the view, when it's not needed anymore.
+
+		:param key:               The entry's key.
+		:returns:                 A view of the entry's payload.
+		:raises ReportStoreError: If the store has no such entry or the entry isn't stored in the compact format.
+		"""
+		payload: Union[bytes, memoryview]
+		try:
+			_, codec, payload = self._pending[key]
+		except KeyError:
+			try:
+				_, codec, offset, length = self._index[key]
+			except KeyError as ex:
+				raise ReportStoreError(f"Report store '{self._file}' has no entry '{key}'.") from ex
+
+			payload = self._Payload(offset, length)
+
+		if codec != CODEC_CODECOV:
+			raise ReportStoreError(f"Entry '{key}' of report store '{self._file}' doesn't support random access.")
+
+		return CodeCoverageCodec.View(payload)
+
+	def _Payload(self, offset: int, length: int) -> memoryview:
+		if self._mapping is None:
+			raise ReportStoreError(f"Report store '{self._file}' is not mapped.")
+
+		return memoryview(self._mapping)[offset:offset + length]
+
+	@staticmethod
+	def _Encode(model: Any) -> Tuple[int, bytes]:
+		if type(model) is PackageCoverage:
+			try:
+				return CODEC_CODECOV, CodeCoverageCodec.Encode(model)
+			except CodecError:
+				pass
+
+		return CODEC_PICKLE, dumps(model, HIGHEST_PROTOCOL)
+
+	@staticmethod
+	def _Decode(codec: int, payload: memoryview) -> Any:
+		if codec == CODEC_PICKLE:
+			return loads(payload)
+		elif codec == CODEC_CODECOV:
+			return CodeCoverageCodec.Decode(payload)
+
+		raise ReportStoreError(f"Unknown codec {codec}.")
+
+	def Commit(self, release: bool = False) -> None:
+		"""
+		Write new entries to the store file and map it.
+
+		The file is written via a temporary file (unique per process) and replaces the previous store file.
+
+		:param release:           If true, deserialized models of this process are dropped, so forked processes don't
+		                          inherit them.
+		:raises ReportStoreError: If the store file can't be written.
+		"""
+		if self._file is not None and len(self._pending) > 0:
+			entries: Dict[str, Tuple[str, int, bytes]] = {}
+			for key, (fingerprint, codec, offset, length) in self._index.items():
+				entries[key] = (fingerprint, codec, bytes(self._Payload(offset, length)))
+			entries.update(self._pending)
+
+			self._Write(entries)
+
+			self.Close()
+			self._Map()
+			self._pending = {}
+
+		if release and self._file is not None:
+			self._models = {}
+
+	def _Write(self, entries: Dict[str, Tuple[str, int, bytes]]) -> None:
+		if self._file is None:
+			raise ReportStoreError("An in-memory report store can't be written.")
+
+		index = bytearray(_header.pack(_magic, _version, len(entries)))
+		encoded = [(key.encode("utf-8"), fingerprint.encode("utf-8"), codec, payload) for key, (fingerprint, codec, payload) in sorted(entries.items())]
+
+		offset = len(index) + sum(2 * _length.size + len(key) + len(fingerprint) + _entry.size for key, fingerprint, _, _ in encoded)
+		offset += -offset % 8
+		for key, fingerprint, codec, payload in encoded:
+			index += _length.pack(len(key)) + key + _length.pack(len(fingerprint)) + fingerprint
+			index += _entry.pack(codec, offset, len(payload))
+			offset += len(payload) + -len(payload) % 8
+
+		temporaryFile = self._file.with_suffix(f".{getpid()}.tmp")
+		try:
+			self._file.parent.mkdir(parents=True, exist_ok=True)
+			with temporaryFile.open("wb") as file:
+				file.write(index + b"\0" * (-len(index) % 8))
+				for _, _, _, payload in encoded:
+					file.write(payload)
+					file.write(b"\0" * (-len(payload) % 8))
+			temporaryFile.replace(self._file)
+		except OSError as ex:
+			raise ReportStoreError(f"Writing report store '{self._file}' failed.") from ex
+
+	def Close(self) -> None:
+		"""
+		Unmap the store file.
+
+		Entries not yet committed and deserialized models are kept. If views returned by :meth:`View` are still in use, the
+		file is unmapped after the last view is released.
+		"""
+		if self._mapping is not None:
+			try:
+				self._mapping.close()
+			except BufferError:
+				pass
+			self._mapping = None
+		self._index = {}
@@ -31,26 +31,54 @@
 """
 **Report unit test results as Sphinx documentation page(s).**
 """
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
+from hashlib  import sha256
 from enum     import Flag
+from html     import escape
 from pathlib  import Path
-from typing   import Dict, Tuple, Any, List, Mapping, Generator, TypedDict, ClassVar, Optional as Nullable
+from typing   import TYPE_CHECKING, Dict, FrozenSet, Tuple, Any, List, Mapping, Generator, TypedDict, ClassVar, Optional as Nullable, Set, TypeVar
 
 from docutils                          import nodes
-from docutils.parsers.rst.directives   import flag
+from docutils.parsers.rst.directives   import flag, nonnegative_int, positive_int
 from pyTooling.Decorators              import export
 from pyEDAA.Reports.Unittesting        import TestcaseStatus, TestsuiteStatus
-from pyEDAA.Reports.Unittesting.JUnit  import Testsuite, TestsuiteSummary, Testcase, Document
 from sphinx.application                import Sphinx
 from sphinx.config                     import Config
+from sphinx.environment                import BuildEnvironment
+from sphinx.util.logging               import getLogger
 
 from sphinx_reports.Common             import ReportExtensionError
-from sphinx_reports.Node               import Landscape
+from sphinx_reports.Node               import Landscape, InlineSVG
 from sphinx_reports.Sphinx             import strip, stripAndNormalize, BaseDirective
+from sphinx_reports.DataModel.Unittest import DurationHistogram, ExecutionTimeline
+from sphinx_reports.Adapter.JUnit      import JUnitCounts, JUnitIndex
+from sphinx_reports.Store              import ReportStore
+from sphinx_reports.Instrumentation    import Instrumentation
+from sphinx_reports.Artifact           import ReportArtifact
+
+if TYPE_CHECKING:
+	from pyEDAA.Reports.Unittesting import TestsuiteBase, Testsuite, TestsuiteSummary, Testcase
+
+Item = TypeVar("Item")
+
+
+class history_DictType(TypedDict):
+	database:  Path
+	build_id:  Nullable[str]
+	window:    int
+	threshold: float
+	minimum:   float
 
 
 class report_DictType(TypedDict):
 	xml_report: Path
+	history:    Nullable[history_DictType]
+
+
+class histogram_DictType(TypedDict):
+	lower:              float
+	upper:              float
+	buckets_per_decade: int
 
 
 @export
@@ -84,53 +112,49 @@ class ShowTestcases(Flag):
 
 
 @export
-class UnittestSummary(BaseDirective):
-	"""
-	This directive will be replaced by a table representing unit test results.
+class UnittestBase(BaseDirective):
 	"""
-	has_content = False
-	required_arguments = 0
-	optional_arguments = 6
+	Base-class for all directives visualizing unittest reports.
 
+	It handles the configuration variables and loads and caches the unittest reports referenced by a reportid.
+	"""
 	option_spec = {
-		"class":                  strip,
-		"reportid":               stripAndNormalize,
-		"testsuite-summary-name": strip,
-		"show-testcases":         stripAndNormalize,
-		"no-assertions":          flag,
-		"hide-testsuite-summary": flag
+		"class":    strip,
+		"reportid": stripAndNormalize,
+	}
+
+	defaultHistogramDefinition: ClassVar[histogram_DictType] = {
+		"lower":              0.001,
+		"upper":              100.0,
+		"buckets_per_decade": 1,
 	}
 
-	directiveName: str = "unittest-summary"
 	configPrefix:  str = "unittest"
 	configValues:  Dict[str, Tuple[Any, str, Any]] = {
-		f"{configPrefix}_testsuites": ({}, "env", Dict)
+		f"{configPrefix}_testsuites": ({}, "env", Dict),
+		f"{configPrefix}_histogram":  (defaultHistogramDefinition, "env", Dict),
 	}  #: A dictionary of all configuration values used by unittest directives.
 
-	_testSummaries:    ClassVar[Dict[str, report_DictType]] = {}
+	_testSummaries:          ClassVar[Dict[str, report_DictType]] = {}
+	_histogramConfiguration: ClassVar[histogram_DictType] = defaultHistogramDefinition
+	_testsuiteExecutions:    ClassVar[Dict[str, List[Tuple[str, str, Nullable[datetime], Nullable[timedelta]]]]] = {}
+	_reportHashes:           ClassVar[Dict[str, Tuple[Tuple[int, int], str]]] = {}
+	_junitIndices:           ClassVar[Dict[str, Tuple[Tuple[int, int], JUnitIndex]]] = {}
+	_junitCounts:            ClassVar[Dict[str, Tuple[Tuple[int, int], JUnitCounts]]] = {}
+	_historyBuilds:          ClassVar[Dict[str, str]] = {}
 
 	_cssClasses:           List[str]
 	_reportID:             str
-	_noAssertions:         bool
-	_hideTestsuiteSummary: bool
-	_testsuiteSummaryName: Nullable[str]
-	_showTestcases:        ShowTestcases
 	_xmlReport:            Path
-	_testsuite:            TestsuiteSummary
 
 	def _CheckOptions(self) -> None:
 		"""
 		Parse all directive options or use default values.
 		"""
 		cssClasses = self._ParseStringOption("class", "", r"(\w+)?( +\w+)*")
-		showTestcases = self._ParseStringOption("show-testcases", "all", r"all|not-passed")
 
 		self._cssClasses = [] if cssClasses == "" else cssClasses.split(" ")
 		self._reportID = self._ParseStringOption("reportid")
-		self._testsuiteSummaryName = self._ParseStringOption("testsuite-summary-name", "", r".+")
-		self._showTestcases = ShowTestcases[showTestcases.replace("-", "_")]
-		self._noAssertions = "no-assertions" in self.options
-		self._hideTestsuiteSummary = "hide-testsuite-summary" in self.options
 
 		try:
 			testSummary = self._testSummaries[self._reportID]
@@ -138,6 +162,11 @@ class UnittestSummary(BaseDirective):
 			raise ReportExtensionError(f"No unit testing configuration item for '{self._reportID}'.") from ex
 		self._xmlReport = testSummary["xml_report"]
 
+		self.env.note_dependency(str(self._xmlReport.resolve()))
+		from sphinx_reports import ReportDomain
+
+		ReportDomain.Get(self.env).NoteReport(self.env.docname, self.configPrefix, self._reportID)
+
 	@classmethod
 	def CheckConfiguration(cls, sphinxApplication: Sphinx, sphinxConfiguration: Config) -> None:
 		"""
@@ -147,6 +176,7 @@ class UnittestSummary(BaseDirective):
 		:param sphinxConfiguration: Sphinx configuration instance.
 		"""
 		cls._CheckConfiguration(sphinxConfiguration)
+		cls._CheckHistogramConfiguration(sphinxConfiguration)
 
 	@classmethod
 	def ReadReports(cls, sphinxApplication: Sphinx) -> None:
@@ -155,7 +185,45 @@ class UnittestSummary(BaseDirective):
 
 		:param sphinxApplication:   Sphinx application instance.
 		"""
-		print(f"[REPORT] Reading unittest reports ...")
+		getLogger(__name__).info("[REPORT] Reading unittest reports ...")
+
+		for reportID, testSummary in cls._testSummaries.items():
+			if (history := testSummary["history"]) is None:
+				continue
+
+			try:
+				cls._RecordHistory(reportID, history)
+			except ReportExtensionError as ex:
+				logger = getLogger(__name__)
+				logger.error(f"Caught {ex.__class__.__name__} when recording testcase durations for '{reportID}'.\n  {ex}")
+
+	@classmethod
+	def _RecordHistory(cls, reportID: str, history: history_DictType) -> None:
+		"""
+		Append the testcase durations of a unittest report to the report's duration history database.
+
+		If no build identifier is configured, the SHA-256 hash of the report file is used. Thus, rebuilding the
+		documentation for an unchanged report doesn't add duplicate builds to the history.
+
+		:param reportID:              The reportid as used in ``report_unittest_testsuites``.
+		:param history:               The report's history configuration.
+		:raises ReportExtensionError: If the report can't be loaded or the history database can't be written.
+		"""
+		if (buildID := history["build_id"]) is None:
+			buildID = cls._ReportHash(reportID)[:16]
+
+		from sphinx_reports.Adapter.History import DurationHistory
+
+		testsuiteSummary = cls._LoadTestsuiteSummary(reportID)
+
+		with DurationHistory(history["database"]) as database:
+			database.AddBuild(buildID, (
+				(key, testcase._totalDuration.total_seconds())
+				for key, testcase in cls._iterateTestcasesWithKey(testsuiteSummary)
+				if testcase._totalDuration is not None
+			))
+
+		cls._historyBuilds[reportID] = buildID
 
 	@classmethod
 	def _CheckConfiguration(cls, sphinxConfiguration: Config) -> None:
@@ -185,13 +253,334 @@ class UnittestSummary(BaseDirective):
 				raise ReportExtensionError(f"{summaryName}.xml_report: Unittest report file '{xmlReport}' doesn't exist.") from FileNotFoundError(xmlReport)
 
 			cls._testSummaries[reportID] = {
-				"xml_report": xmlReport
+				"xml_report": xmlReport,
+				"history":    cls._CheckHistoryConfiguration(summaryName, testSummary.get("history", None))
 			}
 
-	def _sortedValues(self, d: Mapping[str, Testsuite]) -> Generator[Testsuite, None, None]:
+	@classmethod
+	def _CheckHistoryConfiguration(cls, summaryName: str, history: Nullable[Mapping[str, Any]]) -> Nullable[history_DictType]:
+		if history is None:
+			return None
+
+		historyName = f"{summaryName}.history"
+
+		try:
+			database = Path(history["database"])
+		except KeyError as ex:
+			raise ReportExtensionError(f"{historyName}.database: Configuration is missing.") from ex
+
+		buildID = history.get("build_id", None)
+		if buildID is not None:
+			buildID = str(buildID)
+
+		try:
+			window = int(history.get("window", 5))
+		except (TypeError, ValueError) as ex:
+			raise ReportExtensionError(f"{historyName}.window: '{history['window']}' is not an integer.") from ex
+
+		try:
+			threshold = float(history.get("threshold", 1.2))
+		except (TypeError, ValueError) as ex:
+			raise ReportExtensionError(f"{historyName}.threshold: '{history['threshold']}' is not a number.") from ex
+
+		try:
+			minimum = float(history.get("minimum", 0.1))
+		except (TypeError, ValueError) as ex:
+			raise ReportExtensionError(f"{historyName}.minimum: '{history['minimum']}' is not a number.") from ex
+
+		if window < 1:
+			raise ReportExtensionError(f"{historyName}.window: Must be at least 1.")
+		elif threshold < 1.0:
+			raise ReportExtensionError(f"{historyName}.threshold: Must be at least 1.0.")
+		elif minimum < 0.0:
+			raise ReportExtensionError(f"{historyName}.minimum: Must not be negative.")
+
+		return {
+			"database":  database,
+			"build_id":  buildID,
+			"window":    window,
+			"threshold": threshold,
+			"minimum":   minimum
+		}
+
+	@classmethod
+	def _CheckHistogramConfiguration(cls, sphinxConfiguration: Config) -> None:
+		from sphinx_reports import ReportDomain
+
+		variableName = f"{ReportDomain.name}_{cls.configPrefix}_histogram"
+
+		try:
+			histogramConfiguration: Any = sphinxConfiguration[variableName]
+		except (KeyError, AttributeError) as ex:
+			raise ReportExtensionError(f"Configuration option '{variableName}' is not configured.") from ex
+
+		configurationName = f"conf.py: {variableName}"
+		if not isinstance(histogramConfiguration, dict):
+			raise ReportExtensionError(f"{configurationName}: Configuration is not a dictionary.")
+
+		histogramDefinition: Dict[str, Any] = {**cls.defaultHistogramDefinition, **histogramConfiguration}
+
+		try:
+			lower = float(histogramDefinition["lower"])
+			upper = float(histogramDefinition["upper"])
+		except (TypeError, ValueError) as ex:
+			raise ReportExtensionError(f"{configurationName}.lower/upper: Bucket bounds must be numbers.") from ex
+
+		try:
+			bucketsPerDecade = int(histogramDefinition["buckets_per_decade"])
+		except (TypeError, ValueError) as ex:
+			raise ReportExtensionError(f"{configurationName}.buckets_per_decade: '{histogramDefinition['buckets_per_decade']}' is not an integer.") from ex
+
+		if not (0.0 < lower < upper):
+			raise ReportExtensionError(f"{configurationName}.lower/upper: Bucket bounds must fulfill 0 < lower < upper.")
+		elif not (1 <= bucketsPerDecade <= 10):
+			raise ReportExtensionError(f"{configurationName}.buckets_per_decade: Is out of range 1..10.")
+
+		cls._histogramConfiguration = {
+			"lower":              lower,
+			"upper":              upper,
+			"buckets_per_decade": bucketsPerDecade
+		}
+
+	@classmethod
+	def PreloadReports(cls, env: BuildEnvironment, reportIDs: Nullable[Set[str]]) -> None:
+		"""
+		Convert JUnit reports before documents are read by parallel workers.
+
+		Errors are ignored here. They are reported by the directive.
+
+		:param env:       The Sphinx build environment.
+		:param reportIDs: Reportids of reports to convert or ``None`` for all reports.
+		"""
+		for reportID in cls._testSummaries:
+			if reportIDs is not None and reportID not in reportIDs:
+				continue
+
+			try:
+				cls._LoadTestsuiteSummary(reportID)
+			except (ReportExtensionError, OSError):
+				pass
+
+	@classmethod
+	def _LoadTestsuiteSummary(cls, reportID: str) -> "TestsuiteSummary[Any]":
+		"""
+		Load, convert and aggregate the JUnit report referenced by a reportid.
+
+		The resulting testsuite summary is cached in the report store, so multiple directives and processes referencing the
+		same report share one conversion. The entry is invalidated if the report file's modification time or size changes.
+		If the report is an artifact created by ``python -m sphinx_reports convert``, the summary is loaded from the artifact
+		instead.
+
+		:param reportID:              The reportid as used in ``report_unittest_testsuites``.
+		:return:                      The aggregated testsuite summary.
+		:raises ReportExtensionError: If the report can't be read, parsed or converted.
+		"""
+		xmlReport = cls._testSummaries[reportID]["xml_report"]
+
+		testsuiteSummary: "TestsuiteSummary[Any]"
+		if ReportArtifact.IsArtifact(xmlReport):
+			testsuiteSummary, executions = ReportArtifact.Load(xmlReport, cls.configPrefix)
+		else:
+			mtime, size = cls._FileKey(xmlReport)
+			testsuiteSummary, executions = ReportStore.Default().Get(
+				f"{cls.configPrefix}/{reportID}",
+				f"{mtime}:{size}",
+				lambda: cls._ConvertTestsuiteSummary(xmlReport)
+			)
+		cls._testsuiteExecutions[reportID] = executions
+
+		return testsuiteSummary
+
+	@staticmethod
+	def _FileKey(xmlReport: Path) -> Tuple[int, int]:
+		"""
+		Return the modification time and size of a JUnit report file, which invalidate cached results.
+
+		:param xmlReport:             The JUnit XML file.
+		:return:                      A tuple of modification time in ns and file size.
+		:raises ReportExtensionError: If the file doesn't exist anymore, e.g. it was deleted or moved after the build started.
+		"""
+		try:
+			stat = xmlReport.stat()
+		except OSError as ex:
+			raise ReportExtensionError(f"JUnit XML file '{xmlReport}' not found.") from ex
+
+		return stat.st_mtime_ns, stat.st_size
+
+	@staticmethod
+	def _ConvertTestsuiteSummary(xmlReport: Path) -> Tuple["TestsuiteSummary[Any]", List[Tuple[str, str, Nullable[datetime], Nullable[timedelta]]]]:
+		from pyEDAA.Reports.Unittesting.JUnit import Document
+
+		try:
+			with Instrumentation.Span("load", str(xmlReport)):
+				doc = Document(xmlReport, analyzeAndConvert=True)
+		except Exception as ex:
+			raise ReportExtensionError(f"Reading and parsing '{xmlReport}' failed.") from ex
+
+		with Instrumentation.Span("aggregate", "JUnit document"):
+			doc.Aggregate()
+
+		# Hostname and timestamp of testsuites are dropped when converting to a TestsuiteSummary.
+		executions = [
+			(testsuite._hostname, testsuite._name, testsuite._startTime, testsuite._duration)
+			for testsuite in doc._testsuites.values()
+		]
+
+		try:
+			testsuiteSummary = doc.ToTestsuiteSummary()
+		except Exception as ex:
+			raise ReportExtensionError(f"Converting JUnit document '{xmlReport}' to a TestsuiteSummary failed.") from ex
+
+		with Instrumentation.Span("aggregate", "testsuite summary"):
+			testsuiteSummary.Aggregate()
+
+		return testsuiteSummary, executions
+
+	@classmethod
+	def _LoadJUnitIndex(cls, reportID: str) -> JUnitIndex:
+		"""
+		Create a byte-offset index of the JUnit report referenced by a reportid.
+
+		The index is cached per reportid. The cache entry is invalidated if the report file's modification time or size
+		changes.
+
+		:param reportID:              The reportid as used in ``report_unittest_testsuites``.
+		:return:                      The JUnit index.
+		:raises ReportExtensionError: If the report can't be read or parsed.
+		"""
+		xmlReport = cls._testSummaries[reportID]["xml_report"]
+
+		if ReportArtifact.IsArtifact(xmlReport):
+			junitIndex: JUnitIndex = ReportArtifact.Load(xmlReport, f"{cls.configPrefix}/index")
+			return junitIndex
+
+		fileKey = cls._FileKey(xmlReport)
+
+		try:
+			cachedKey, junitIndex = cls._junitIndices[reportID]
+			if cachedKey == fileKey:
+				return junitIndex
+		except KeyError:
+			pass
+
+		junitIndex = JUnitIndex(xmlReport)
+		cls._junitIndices[reportID] = (fileKey, junitIndex)
+
+		return junitIndex
+
+	@classmethod
+	def _LoadJUnitCounts(cls, reportID: str) -> JUnitCounts:
+		"""
+		Count testcases per status in the JUnit report referenced by a reportid.
+
+		The counts are cached per reportid. The cache entry is invalidated if the report file's modification time or size
+		changes.
+
+		:param reportID:              The reportid as used in ``report_unittest_testsuites``.
+		:return:                      The testcase counts.
+		:raises ReportExtensionError: If the report can't be read or parsed.
+		"""
+		xmlReport = cls._testSummaries[reportID]["xml_report"]
+
+		if ReportArtifact.IsArtifact(xmlReport):
+			junitCounts: JUnitCounts = ReportArtifact.Load(xmlReport, f"{cls.configPrefix}/counts")
+			return junitCounts
+
+		fileKey = cls._FileKey(xmlReport)
+
+		try:
+			cachedKey, junitCounts = cls._junitCounts[reportID]
+			if cachedKey == fileKey:
+				return junitCounts
+		except KeyError:
+			pass
+
+		junitCounts = JUnitCounts.Scan(xmlReport)
+		cls._junitCounts[reportID] = (fileKey, junitCounts)
+
+		return junitCounts
+
+	@classmethod
+	def _ReportHash(cls, reportID: str) -> str:
+		"""
+		Compute the SHA-256 hash of the JUnit report file referenced by a reportid.
+
+		The hash is cached per reportid and recomputed if the report file's modification time or size changes.
+
+		:param reportID:              The reportid as used in ``report_unittest_testsuites``.
+		:return:                      Hexadecimal SHA-256 hash of the report file.
+		:raises ReportExtensionError: If the report can't be read.
+		"""
+		xmlReport = cls._testSummaries[reportID]["xml_report"]
+
+		fileKey = cls._FileKey(xmlReport)
+
+		try:
+			cachedKey, reportHash = cls._reportHashes[reportID]
+			if cachedKey == fileKey:
+				return reportHash
+		except KeyError:
+			pass
+
+		try:
+			reportHash = sha256(xmlReport.read_bytes()).hexdigest()
+		except OSError as ex:
+			raise ReportExtensionError(f"Reading JUnit XML file '{xmlReport}' failed.") from ex
+		cls._reportHashes[reportID] = (fileKey, reportHash)
+
+		return reportHash
+
+	def _sortedValues(self, d: Mapping[str, Item]) -> Generator[Item, None, None]:
 		for key in sorted(d.keys()):
 			yield d[key]
 
+	@classmethod
+	def _iterateTestcases(cls, testsuite: "TestsuiteBase[Any]") -> Generator["Testcase", None, None]:
+		"""
+		Iterate all testcases within the testsuites below the given testsuite or testsuite summary.
+
+		:param testsuite: Testsuite or testsuite summary to start from.
+		:return:          A generator of testcases in depth-first order.
+		"""
+		for ts in testsuite._testsuites.values():
+			yield from ts._testcases.values()
+			yield from cls._iterateTestcases(ts)
+
+	@classmethod
+	def _iterateTestsuitesWithKey(cls, testsuite: "TestsuiteBase[Any]", prefix: str = "") -> Generator[Tuple[str, "Testsuite[Any]"], None, None]:
+		"""
+		Iterate all testsuites below the given testsuite or testsuite summary.
+
+		Each testsuite is returned together with a key, which is unique within the report. It concatenates the names of
+		all testsuites separated by ``::``.
+
+		:param testsuite: Testsuite or testsuite summary to start from.
+		:param prefix:    Key prefix of the given testsuite.
+		:return:          A generator of key and testsuite tuples in pre-order.
+		"""
+		for ts in testsuite._testsuites.values():
+			tsKey = f"{prefix}{ts._name}"
+			yield tsKey, ts
+			yield from cls._iterateTestsuitesWithKey(ts, f"{tsKey}::")
+
+	@classmethod
+	def _iterateTestcasesWithKey(cls, testsuite: "TestsuiteBase[Any]", prefix: str = "") -> Generator[Tuple[str, "Testcase"], None, None]:
+		"""
+		Iterate all testcases within the testsuites below the given testsuite or testsuite summary.
+
+		Each testcase is returned together with a key, which is unique within the report. It concatenates the names of all
+		testsuites and the testcase's name separated by ``::``.
+
+		:param testsuite: Testsuite or testsuite summary to start from.
+		:param prefix:    Key prefix of the given testsuite.
+		:return:          A generator of key and testcase tuples in depth-first order.
+		"""
+		for ts in testsuite._testsuites.values():
+			tsKey = f"{prefix}{ts._name}::"
+			for testcase in ts._testcases.values():
+				yield f"{tsKey}{testcase._name}", testcase
+			yield from cls._iterateTestcasesWithKey(ts, tsKey)
+
 	def _convertTestcaseStatusToSymbol(self, status: TestcaseStatus) -> str:
 		if status is TestcaseStatus.Passed:
 			return "✅"
@@ -232,7 +621,7 @@ class UnittestSummary(BaseDirective):
 		else:
 			return "❌"
 
-	def _formatTimedelta(self, delta: timedelta) -> str:
+	def _formatTimedelta(self, delta: Nullable[timedelta]) -> str:
 		if delta is None:
 			return ""
 
@@ -244,6 +633,44 @@ class UnittestSummary(BaseDirective):
 		hours = minutes // 60
 		return f"{hours:02}:{minutes % 60:02}:{seconds % 60:02}.{milliseconds % 1000:03}"
 
+
+@export
+class UnittestSummary(UnittestBase):
+	"""
+	This directive will be replaced by a table representing unit test results.
+	"""
+	has_content = False
+	required_arguments = 0
+	optional_arguments = 6
+
+	option_spec = UnittestBase.option_spec | {
+		"testsuite-summary-name": strip,
+		"show-testcases":         stripAndNormalize,
+		"no-assertions":          flag,
+		"hide-testsuite-summary": flag
+	}
+
+	directiveName: str = "unittest-summary"
+
+	_noAssertions:         bool
+	_hideTestsuiteSummary: bool
+	_testsuiteSummaryName: Nullable[str]
+	_showTestcases:        ShowTestcases
+	_testsuite:            "TestsuiteSummary[Any]"
+
+	def _CheckOptions(self) -> None:
+		"""
+		Parse all directive options or use default values.
+		"""
+		super()._CheckOptions()
+
+		showTestcases = self._ParseStringOption("show-testcases", "all", r"all|not-passed")
+
+		self._testsuiteSummaryName = self._ParseStringOption("testsuite-summary-name", "", r".+")
+		self._showTestcases = ShowTestcases[showTestcases.replace("-", "_")]
+		self._noAssertions = "no-assertions" in self.options
+		self._hideTestsuiteSummary = "hide-testsuite-summary" in self.options
+
 	def _GenerateTestSummaryTable(self) -> nodes.table:
 		# Create a table and table header with 8 columns
 		columns = [
@@ -276,7 +703,7 @@ class UnittestSummary(BaseDirective):
 
 		return tableGroup.parent
 
-	def renderRoot(self, tableBody: nodes.tbody, testsuiteSummary: TestsuiteSummary, includeRoot: bool = True, testsuiteSummaryName: Nullable[str] = None) -> None:
+	def renderRoot(self, tableBody: nodes.tbody, testsuiteSummary: "TestsuiteSummary[Any]", includeRoot: bool = True, testsuiteSummaryName: Nullable[str] = None) -> None:
 		level = 0
 
 		if includeRoot:
@@ -301,7 +728,7 @@ class UnittestSummary(BaseDirective):
 
 		self.renderSummary(tableBody, testsuiteSummary)
 
-	def renderTestsuite(self, tableBody: nodes.tbody, testsuite: Testsuite, level: int) -> None:
+	def renderTestsuite(self, tableBody: nodes.tbody, testsuite: "Testsuite[Any]", level: int) -> None:
 		state = self._convertTestsuiteStatusToSymbol(testsuite._status)
 
 		tableRow = nodes.row("", classes=["report-testsuite", f"testsuite-{testsuite._status.name.lower()}"])
@@ -324,7 +751,7 @@ class UnittestSummary(BaseDirective):
 			if testcase._status == self._showTestcases:
 				self.renderTestcase(tableBody, testcase, level + 1)
 
-	def renderTestcase(self, tableBody: nodes.tbody, testcase: Testcase, level: int) -> None:
+	def renderTestcase(self, tableBody: nodes.tbody, testcase: "Testcase", level: int) -> None:
 		state = self._convertTestcaseStatusToSymbol(testcase._status)
 
 		tableRow =	nodes.row("", classes=["report-testcase", f"testcase-{testcase._status.name.lower()}"])
@@ -340,7 +767,7 @@ class UnittestSummary(BaseDirective):
 			tableRow += nodes.entry("", nodes.Text(f"{testcase.AssertionCount}"))
 		tableRow += nodes.entry("", nodes.Text(f"{self._formatTimedelta(testcase.TotalDuration)}"))
 
-	def renderSummary(self, tableBody: nodes.tbody, testsuiteSummary: TestsuiteSummary) -> None:
+	def renderSummary(self, tableBody: nodes.tbody, testsuiteSummary: "TestsuiteSummary[Any]") -> None:
 		state = self._convertTestsuiteStatusToSymbol(testsuiteSummary._status)
 
 		tableRow = nodes.row("", classes=["report-summary", f"testsuitesummary-{testsuiteSummary._status.name.lower()}"])
@@ -365,27 +792,1039 @@ class UnittestSummary(BaseDirective):
 			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
 			return self._internalError(container, __name__, message, ex)
 
-		# Assemble a list of Python source files
 		try:
-			doc = Document(self._xmlReport, analyzeAndConvert=True)
+			self._testsuite = self._LoadTestsuiteSummary(self._reportID)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when loading JUnit document '{self._xmlReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			container += self._GenerateTestSummaryTable()
 		except Exception as ex:
-			message = f"Caught {ex.__class__.__name__} when reading and parsing '{self._xmlReport}'."
+			message = f"Caught {ex.__class__.__name__} when generating the document structure for JUnit document '{self._xmlReport}'."
 			return self._internalError(container, __name__, message, ex)
 
-		doc.Aggregate()
+		return [container]
+
+
+@export
+class UnittestDurationHistogram(UnittestBase):
+	"""
+	This directive will be replaced by a histogram of testcase durations.
+
+	In HTML, the histogram is rendered as an inline SVG bar chart. Other formats show the histogram as a table.
+	"""
+	has_content = False
+	required_arguments = 0
+	optional_arguments = 2
+
+	option_spec = UnittestBase.option_spec
+
+	directiveName: str = "unittest-duration-histogram"
+
+	_histogram: DurationHistogram
+
+	def _formatSeconds(self, seconds: float) -> str:
+		if seconds == float("inf"):
+			return "∞"
+		elif seconds == 0.0:
+			return "0 s"
+		elif seconds < 0.001:
+			return f"{seconds * 1_000_000:.3g} µs"
+		elif seconds < 1.0:
+			return f"{seconds * 1_000:.3g} ms"
+		elif seconds < 60.0:
+			return f"{seconds:.3g} s"
+		else:
+			return f"{seconds / 60:.3g} min"
+
+	def _formatBucket(self, index: int) -> str:
+		lower, upper = self._histogram.Bucket(index)
+		if index == 0:
+			return f"< {self._formatSeconds(upper)}"
+		elif upper == float("inf"):
+			return f"≥ {self._formatSeconds(lower)}"
+		else:
+			return f"{self._formatSeconds(lower)} … {self._formatSeconds(upper)}"
+
+	def _CreateHistogram(self, testsuiteSummary: "TestsuiteSummary[Any]") -> DurationHistogram:
+		histogram = DurationHistogram(
+			self._histogramConfiguration["lower"],
+			self._histogramConfiguration["upper"],
+			self._histogramConfiguration["buckets_per_decade"]
+		)
+		histogram.Add(
+			testcase._totalDuration.total_seconds()
+			for testcase in self._iterateTestcases(testsuiteSummary)
+			if testcase._totalDuration is not None
+		)
+
+		return histogram
+
+	def _GenerateHistogramTable(self) -> nodes.table:
+		columns = [
+			("Duration", 3),
+			("Testcases", 1),
+			("Testcases in %", 1),
+			("Runtime (HH:MM:SS.sss)", 2),
+			("Runtime in %", 1),
+		]
+
+		cssClasses = ["report-unittest-histogram-table", f"report-unittest-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=f"{self._reportID}-histogram",
+			columns=columns,
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		totalCount = self._histogram.TotalCount
+		totalDuration = self._histogram.TotalDuration
+
+		for index, (count, duration) in enumerate(zip(self._histogram.Counts, self._histogram.Durations)):
+			tableRow = nodes.row("", classes=["report-histogram-bucket"])
+			tableBody += tableRow
+
+			tableRow += nodes.entry("", nodes.Text(self._formatBucket(index)))
+			tableRow += nodes.entry("", nodes.Text(f"{count}"))
+			tableRow += nodes.entry("", nodes.Text(f"{count / totalCount:.1%}" if totalCount > 0 else ""))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=duration))))
+			tableRow += nodes.entry("", nodes.Text(f"{duration / totalDuration:.1%}" if totalDuration > 0.0 else ""))
+
+		tableRow = nodes.row("", classes=["report-summary"])
+		tableBody += tableRow
+
+		tableRow += nodes.entry("", nodes.Text("Overall:"))
+		tableRow += nodes.entry("", nodes.Text(f"{totalCount}"))
+		tableRow += nodes.entry("", nodes.Text(""))
+		tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=totalDuration))))
+		tableRow += nodes.entry("", nodes.Text(""))
+
+		return tableGroup.parent
+
+	def _GenerateHistogramSVG(self) -> str:
+		counts = self._histogram.Counts
+		durations = self._histogram.Durations
+		totalCount = max(self._histogram.TotalCount, 1)
+		totalDuration = self._histogram.TotalDuration or 1.0
+
+		bucketWidth = 96
+		barWidth =    24
+		plotHeight =  160
+		top =         20
+		bottom =      top + plotHeight
+		width =       len(counts) * bucketWidth
+		height =      bottom + 40
+
+		lines = [
+			f'<svg xmlns="http://www.w3.org/2000/svg" class="report-histogram" viewBox="0 0 {width} {height}" width="{width}" height="{height}" role="img">',
+			f'<title>Testcase duration histogram for {escape(self._reportID)}</title>',
+			f'<line class="report-histogram-axis" x1="0" y1="{bottom}" x2="{width}" y2="{bottom}"/>',
+		]
+		for index, (count, duration) in enumerate(zip(counts, durations)):
+			x = index * bucketWidth + (bucketWidth - 2 * barWidth) // 2
+			countHeight = plotHeight * count / totalCount
+			durationHeight = plotHeight * duration / totalDuration
+			label = escape(self._formatBucket(index))
+
+			lines.append(
+				f'<rect class="report-histogram-count" x="{x}" y="{bottom - countHeight:.1f}" width="{barWidth}" height="{countHeight:.1f}">'
+				f'<title>{label}: {count} testcases ({count / totalCount:.1%})</title></rect>'
+			)
+			lines.append(
+				f'<rect class="report-histogram-runtime" x="{x + barWidth}" y="{bottom - durationHeight:.1f}" width="{barWidth}" height="{durationHeight:.1f}">'
+				f'<title>{label}: {self._formatSeconds(duration)} runtime ({duration / totalDuration:.1%})</title></rect>'
+			)
+			lines.append(f'<text class="report-histogram-label" x="{index * bucketWidth + bucketWidth // 2}" y="{bottom + 16}" text-anchor="middle">{label}</text>')
+			lines.append(f'<text class="report-histogram-value" x="{index * bucketWidth + bucketWidth // 2}" y="{bottom - max(countHeight, durationHeight) - 4:.1f}" text-anchor="middle">{count}</text>')
+
+		lines.append("</svg>")
+
+		return "\n".join(lines)
+
+	def run(self) -> List[nodes.Node]:
+		container = nodes.container()
 
 		try:
-			self._testsuite = doc.ToTestsuiteSummary()
-		except Exception as ex:
-			message = f"Caught {ex.__class__.__name__} when converting to a TestsuiteSummary for JUnit document '{self._xmlReport}'."
+			self._CheckOptions()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			testsuiteSummary = self._LoadTestsuiteSummary(self._reportID)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when loading JUnit document '{self._xmlReport}'."
 			return self._internalError(container, __name__, message, ex)
 
-		self._testsuite.Aggregate()
+		self._histogram = self._CreateHistogram(testsuiteSummary)
 
 		try:
-			container += self._GenerateTestSummaryTable()
+			svg = InlineSVG("", classes=["report-unittest-histogram"] + self._cssClasses)
+			svg["svg"] = self._GenerateHistogramSVG()
+			svg += self._GenerateHistogramTable()
+			container += svg
 		except Exception as ex:
-			message = f"Caught {ex.__class__.__name__} when generating the document structure for JUnit document '{self._xmlReport}'."
+			message = f"Caught {ex.__class__.__name__} when generating the duration histogram for JUnit document '{self._xmlReport}'."
 			return self._internalError(container, __name__, message, ex)
 
 		return [container]
+
+
+@export
+class UnittestRegressions(UnittestBase):
+	"""
+	This directive will be replaced by a table listing testcases, whose runtime grew compared to previous builds.
+
+	The previous durations are read from the duration history database configured for the reportid.
+	"""
+	has_content = False
+	required_arguments = 0
+	optional_arguments = 2
+
+	option_spec = UnittestBase.option_spec
+
+	directiveName: str = "unittest-regressions"
+
+	_history:     history_DictType
+	_regressions: List[Tuple[str, float, float, int]]
+
+	def _CheckOptions(self) -> None:
+		"""
+		Parse all directive options or use default values.
+		"""
+		super()._CheckOptions()
+
+		if (history := self._testSummaries[self._reportID]["history"]) is None:
+			raise ReportExtensionError(f"No duration history configured for '{self._reportID}'.")
+		elif self._reportID not in self._historyBuilds:
+			raise ReportExtensionError(f"Testcase durations of '{self._reportID}' have not been recorded in this build.")
+
+		self._history = history
+
+	def _GenerateRegressionTable(self) -> nodes.table:
+		columns = [
+			("Testcase", 6),
+			("Baseline (HH:MM:SS.sss)", 2),
+			("Current (HH:MM:SS.sss)", 2),
+			("Delta (HH:MM:SS.sss)", 2),
+			("Change in %", 1),
+		]
+
+		cssClasses = ["report-unittest-regressions-table", f"report-unittest-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=f"{self._reportID}-regressions",
+			columns=columns,
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		for name, baseline, current, _ in self._regressions:
+			tableRow = nodes.row("", classes=["report-testcase", "testcase-regression"])
+			tableBody += tableRow
+
+			tableRow += nodes.entry("", nodes.Text(name.replace("::", " ➜ ")))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=baseline))))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=current))))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=current - baseline))))
+			tableRow += nodes.entry("", nodes.Text(f"{(current - baseline) / baseline:+.1%}" if baseline > 0.0 else ""))
+
+		tableRow = nodes.row("", classes=["report-summary"])
+		tableBody += tableRow
+
+		tableRow += nodes.entry("", nodes.Text(
+			f"{len(self._regressions)} regressions (threshold: ×{self._history['threshold']}, window: {self._history['window']} builds)"
+		), morecols=4)
+
+		return tableGroup.parent
+
+	def run(self) -> List[nodes.Node]:
+		container = nodes.container()
+
+		try:
+			self._CheckOptions()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
+			return self._internalError(container, __name__, message, ex)
+
+		from sphinx_reports.Adapter.History import DurationHistory
+
+		try:
+			with DurationHistory(self._history["database"]) as database:
+				self._regressions = database.Regressions(
+					self._historyBuilds[self._reportID],
+					self._history["window"],
+					self._history["threshold"],
+					self._history["minimum"]
+				)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when reading the duration history for '{self._reportID}'."
+			return self._internalError(container, __name__, message, ex)
+
+		container += self._GenerateRegressionTable()
+
+		return [container]
+
+
+@export
+class UnittestDiff(UnittestBase):
+	"""
+	This directive will be replaced by tables comparing two unittest reports.
+
+	It lists newly failing, newly passing, added and removed testcases as well as runtime differences per testsuite.
+	"""
+	has_content = False
+	required_arguments = 0
+	optional_arguments = 3
+
+	option_spec = UnittestBase.option_spec | {
+		"baseline": stripAndNormalize
+	}
+
+	directiveName: str = "unittest-diff"
+
+	_failing: ClassVar[TestcaseStatus] = TestcaseStatus.Failed | TestcaseStatus.Errored | TestcaseStatus.SetupError | TestcaseStatus.Aborted
+	_passing: ClassVar[FrozenSet[TestcaseStatus]] = frozenset(
+		status | flag
+		for status in (TestcaseStatus.Passed, TestcaseStatus.Weak, TestcaseStatus.ExpectedFailed)
+		for flag in (TestcaseStatus.Unknown, TestcaseStatus.Warned)
+	)  #: Passing statuses, optionally with warnings.
+
+	@classmethod
+	def _IsFailing(cls, status: TestcaseStatus) -> bool:
+		"""
+		Check if a testcase status is a failing status, optionally with flags like :attr:`TestcaseStatus.Warned`.
+
+		``Unknown`` (no bits set) isn't failing.
+
+		:param status: The testcase's status.
+		:returns:      True, if the status has any failing bit set.
+		"""
+		return (status & cls._failing) != TestcaseStatus.Unknown
+
+	_baselineID:      str
+	_baselineReport:  Path
+	_testcaseChanges: Dict[str, List[Tuple[str, Nullable["Testcase"], Nullable["Testcase"]]]]
+	_testsuiteDeltas: List[Tuple[str, Nullable[timedelta], Nullable[timedelta]]]
+
+	def _CheckOptions(self) -> None:
+		"""
+		Parse all directive options or use default values.
+		"""
+		super()._CheckOptions()
+
+		self._baselineID = self._ParseStringOption("baseline")
+
+		try:
+			testSummary = self._testSummaries[self._baselineID]
+		except KeyError as ex:
+			raise ReportExtensionError(f"No unit testing configuration item for '{self._baselineID}'.") from ex
+		self._baselineReport = testSummary["xml_report"]
+
+		self.env.note_dependency(str(self._baselineReport.resolve()))
+		from sphinx_reports import ReportDomain
+
+		ReportDomain.Get(self.env).NoteReport(self.env.docname, self.configPrefix, self._baselineID)
+
+	def _Compare(self, baseline: "TestsuiteSummary[Any]", current: "TestsuiteSummary[Any]") -> None:
+		"""
+		Compare two testsuite summaries.
+
+		Both reports are joined by testcase keys (and testsuite keys) using a hash join: the baseline is indexed in a
+		dictionary, then the current report is probed against that index in a single pass.
+
+		:param baseline: The baseline testsuite summary.
+		:param current:  The current testsuite summary.
+		"""
+		isFailing = self._IsFailing
+		passing = self._passing
+		changes: Dict[str, List[Tuple[str, Nullable["Testcase"], Nullable["Testcase"]]]] = {
+			"newly failing": [],
+			"newly passing": [],
+			"added":         [],
+			"removed":       [],
+		}
+
+		baselineTestcases = dict(self._iterateTestcasesWithKey(baseline))
+		for key, testcase in self._iterateTestcasesWithKey(current):
+			if (previous := baselineTestcases.pop(key, None)) is None:
+				changes["added"].append((key, None, testcase))
+			elif isFailing(testcase._status) and not isFailing(previous._status):
+				changes["newly failing"].append((key, previous, testcase))
+			elif testcase._status in passing and isFailing(previous._status):
+				changes["newly passing"].append((key, previous, testcase))
+
+		changes["removed"] = [(key, testcase, None) for key, testcase in baselineTestcases.items()]
+
+		self._testcaseChanges = changes
+
+		baselineTestsuites = {key: testsuite._totalDuration for key, testsuite in self._iterateTestsuitesWithKey(baseline)}
+		deltas = []
+		for key, testsuite in self._iterateTestsuitesWithKey(current):
+			deltas.append((key, baselineTestsuites.pop(key, None), testsuite._totalDuration))
+		deltas.extend((key, duration, None) for key, duration in baselineTestsuites.items())
+
+		self._testsuiteDeltas = deltas
+
+	def _GenerateTestcaseTable(self) -> nodes.table:
+		columns = [
+			("Change", 2),
+			("Testcase", 6),
+			("Baseline", 1),
+			("Current", 1),
+			("Runtime (HH:MM:SS.sss)", 2),
+		]
+
+		cssClasses = ["report-unittest-diff-table", f"report-unittest-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=f"{self._baselineID}-{self._reportID}-testcases",
+			columns=columns,
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		for change, testcases in self._testcaseChanges.items():
+			for key, previous, testcase in sorted(testcases, key=lambda item: item[0]):
+				tableRow = nodes.row("", classes=["report-testcase", f"testcase-{change.replace(' ', '-')}"])
+				tableBody += tableRow
+
+				tableRow += nodes.entry("", nodes.Text(change))
+				tableRow += nodes.entry("", nodes.Text(key.replace("::", " ➜ ")))
+				tableRow += nodes.entry("", nodes.Text("" if previous is None else self._convertTestcaseStatusToSymbol(previous._status)))
+				tableRow += nodes.entry("", nodes.Text("" if testcase is None else self._convertTestcaseStatusToSymbol(testcase._status)))
+				duration = testcase._totalDuration if testcase is not None else None if previous is None else previous._totalDuration
+				tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(duration)))
+
+		tableRow = nodes.row("", classes=["report-summary"])
+		tableBody += tableRow
+
+		tableRow += nodes.entry("", nodes.Text(
+			", ".join(f"{len(testcases)} {change}" for change, testcases in self._testcaseChanges.items())
+		), morecols=4)
+
+		return tableGroup.parent
+
+	def _GenerateTestsuiteTable(self) -> nodes.table:
+		columns = [
+			("Testsuite", 6),
+			("Baseline (HH:MM:SS.sss)", 2),
+			("Current (HH:MM:SS.sss)", 2),
+			("Delta", 2),
+			("Change in %", 1),
+		]
+
+		cssClasses = ["report-unittest-diff-table", f"report-unittest-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=f"{self._baselineID}-{self._reportID}-testsuites",
+			columns=columns,
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		for key, previous, duration in self._testsuiteDeltas:
+			level = key.count("::")
+			name = key[key.rfind("::") + 2:] if level > 0 else key
+
+			tableRow = nodes.row("", classes=["report-testsuite"])
+			tableBody += tableRow
+
+			tableRow += nodes.entry("", nodes.Text(f"{'  ' * level}{name}"))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(previous)))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(duration)))
+			if previous is not None and duration is not None:
+				delta = duration - previous
+				sign = "-" if delta < timedelta() else "+"
+				tableRow += nodes.entry("", nodes.Text(f"{sign}{self._formatTimedelta(abs(delta))}"))
+				tableRow += nodes.entry("", nodes.Text(f"{delta / previous:+.1%}" if previous > timedelta() else ""))
+			else:
+				tableRow += nodes.entry("", nodes.Text(""))
+				tableRow += nodes.entry("", nodes.Text(""))
+
+		return tableGroup.parent
+
+	def run(self) -> List[nodes.Node]:
+		container = nodes.container()
+
+		try:
+			self._CheckOptions()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			baseline = self._LoadTestsuiteSummary(self._baselineID)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when loading JUnit document '{self._baselineReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			current = self._LoadTestsuiteSummary(self._reportID)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when loading JUnit document '{self._xmlReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		self._Compare(baseline, current)
+
+		try:
+			container += self._GenerateTestcaseTable()
+			container += self._GenerateTestsuiteTable()
+		except Exception as ex:
+			message = f"Caught {ex.__class__.__name__} when generating the comparison of '{self._baselineReport}' and '{self._xmlReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		return [container]
+
+
+@export
+class UnittestUtilization(UnittestBase):
+	"""
+	This directive will be replaced by tables describing the parallel execution of testsuites.
+
+	The execution timeline is reconstructed from the ``timestamp``, ``time`` and ``hostname`` attributes of JUnit
+	testsuites. Each hostname (e.g. a pytest-xdist worker or CI shard) is treated as a worker. Optionally, an SVG Gantt
+	chart is rendered for HTML output.
+	"""
+	has_content = False
+	required_arguments = 0
+	optional_arguments = 3
+
+	option_spec = UnittestBase.option_spec | {
+		"gantt": flag
+	}
+
+	directiveName: str = "unittest-utilization"
+
+	_gantt:    bool
+	_timeline: ExecutionTimeline
+	_ignored:  int
+
+	def _CheckOptions(self) -> None:
+		"""
+		Parse all directive options or use default values.
+		"""
+		super()._CheckOptions()
+
+		self._gantt = "gantt" in self.options
+
+	def _CreateTimeline(self) -> None:
+		executions = []
+		ignored = 0
+		for hostname, name, startTime, duration in self._testsuiteExecutions[self._reportID]:
+			if startTime is None or duration is None:
+				ignored += 1
+				continue
+
+			# Timestamps without timezone are interpreted as UTC, so aware and naive timestamps can be mixed.
+			if startTime.tzinfo is None:
+				startTime = startTime.replace(tzinfo=timezone.utc)
+
+			executions.append((hostname, name, startTime.timestamp(), duration.total_seconds()))
+
+		self._timeline = ExecutionTimeline(executions)
+		self._ignored = ignored
+
+	def _GenerateSummaryTable(self) -> nodes.table:
+		cssClasses = ["report-unittest-utilization-table", f"report-unittest-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=f"{self._reportID}-utilization",
+			columns=[("Metric", 3), ("Value", 2)],
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		wallClock = self._timeline.WallClock
+		duration = self._timeline.Duration
+		critical = self._timeline.CriticalWorker
+
+		for metric, value in (
+			("Wall-clock time", self._formatTimedelta(timedelta(seconds=wallClock))),
+			("Summed testsuite time", self._formatTimedelta(timedelta(seconds=duration))),
+			("Effective parallelism", f"{duration / wallClock:.2f}" if wallClock > 0.0 else ""),
+			("Workers", f"{len(self._timeline.Workers)}"),
+			("Critical path (worker)", "" if critical is None else critical.Name),
+			("Testsuites without timestamp", f"{self._ignored}"),
+		):
+			tableBody += nodes.row(
+				"",
+				nodes.entry("", nodes.Text(metric)),
+				nodes.entry("", nodes.Text(value)),
+			)
+
+		return tableGroup.parent
+
+	def _GenerateWorkerTable(self) -> nodes.table:
+		columns = [
+			("Worker", 3),
+			("Testsuites", 1),
+			("Start", 2),
+			("End", 2),
+			("Busy", 2),
+			("Idle", 2),
+			("Utilization", 1),
+			("Gaps", 1),
+			("Largest Gap", 2),
+		]
+
+		cssClasses = ["report-unittest-utilization-table", f"report-unittest-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=f"{self._reportID}-workers",
+			columns=columns,
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		wallClock = self._timeline.WallClock
+		critical = self._timeline.CriticalWorker
+
+		for worker in sorted(self._timeline.Workers.values(), key=lambda w: w.Name):
+			busy = worker.Busy
+			gaps = worker.Gaps
+
+			tableRow = nodes.row("", classes=["report-worker"] + (["report-critical"] if worker is critical else []))
+			tableBody += tableRow
+
+			tableRow += nodes.entry("", nodes.Text(worker.Name))
+			tableRow += nodes.entry("", nodes.Text(f"{len(worker.Intervals)}"))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=worker.Start))))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=worker.End))))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=busy))))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=wallClock - busy))))
+			tableRow += nodes.entry("", nodes.Text(f"{busy / wallClock:.1%}" if wallClock > 0.0 else ""))
+			tableRow += nodes.entry("", nodes.Text(f"{len(gaps)}"))
+			tableRow += nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=max((end - start for start, end in gaps), default=0.0)))))
+
+		return tableGroup.parent
+
+	def _GenerateCriticalPathTable(self) -> nodes.table:
+		cssClasses = ["report-unittest-utilization-table", f"report-unittest-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=f"{self._reportID}-critical-path",
+			columns=[("Testsuite (critical path)", 5), ("Start", 2), ("Duration", 2)],
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		if (critical := self._timeline.CriticalWorker) is not None:
+			for name, start, end in critical.Intervals:
+				tableBody += nodes.row(
+					"",
+					nodes.entry("", nodes.Text(name)),
+					nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=start)))),
+					nodes.entry("", nodes.Text(self._formatTimedelta(timedelta(seconds=end - start)))),
+					classes=["report-testsuite"]
+				)
+
+		return tableGroup.parent
+
+	def _GenerateGanttSVG(self) -> str:
+		workers = sorted(self._timeline.Workers.values(), key=lambda w: w.Name)
+		wallClock = self._timeline.WallClock or 1.0
+		critical = self._timeline.CriticalWorker
+
+		labelWidth = 120
+		plotWidth =  720
+		rowHeight =  20
+		width =      labelWidth + plotWidth
+		height =     len(workers) * rowHeight + 20
+		scale =      plotWidth / wallClock
+
+		lines = [
+			f'<svg xmlns="http://www.w3.org/2000/svg" class="report-gantt" viewBox="0 0 {width} {height}" width="{width}" height="{height}" role="img">',
+			f'<title>Testsuite execution timeline for {escape(self._reportID)}</title>',
+		]
+		for row, worker in enumerate(workers):
+			y = row * rowHeight
+			cssClass = "report-gantt-critical" if worker is critical else "report-gantt-suite"
+			lines.append(f'<text class="report-gantt-worker" x="{labelWidth - 4}" y="{y + rowHeight - 6}" text-anchor="end">{escape(worker.Name)}</text>')
+			for name, start, end in worker.Intervals:
+				lines.append(
+					f'<rect class="{cssClass}" x="{labelWidth + start * scale:.1f}" y="{y + 2}" width="{max((end - start) * scale, 0.5):.1f}" height="{rowHeight - 4}">'
+					f'<title>{escape(name)}: {self._formatTimedelta(timedelta(seconds=start))} + {self._formatTimedelta(timedelta(seconds=end - start))}</title></rect>'
+				)
+
+		axisY = len(workers) * rowHeight
+		lines.append(f'<line class="report-gantt-axis" x1="{labelWidth}" y1="{axisY}" x2="{width}" y2="{axisY}"/>')
+		lines.append(f'<text class="report-gantt-tick" x="{labelWidth}" y="{axisY + 14}">0</text>')
+		lines.append(f'<text class="report-gantt-tick" x="{width}" y="{axisY + 14}" text-anchor="end">{self._formatTimedelta(timedelta(seconds=self._timeline.WallClock))}</text>')
+		lines.append("</svg>")
+
+		return "\n".join(lines)
+
+	def run(self) -> List[nodes.Node]:
+		container = nodes.container()
+
+		try:
+			self._CheckOptions()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			self._LoadTestsuiteSummary(self._reportID)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when loading JUnit document '{self._xmlReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		self._CreateTimeline()
+
+		try:
+			container += self._GenerateSummaryTable()
+			if self._gantt:
+				svg = InlineSVG("", classes=["report-unittest-gantt"] + self._cssClasses)
+				svg["svg"] = self._GenerateGanttSVG()
+				container += svg
+			container += self._GenerateWorkerTable()
+			container += self._GenerateCriticalPathTable()
+		except Exception as ex:
+			message = f"Caught {ex.__class__.__name__} when generating the utilization report for JUnit document '{self._xmlReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		return [container]
+
+
+@export
+class UnittestFlamegraph(UnittestBase):
+	"""
+	This directive will be replaced by an icicle chart (top-down flame graph) of the testsuite hierarchy.
+
+	Each testsuite and testcase is drawn as a rectangle, whose width is proportional to its total duration. In HTML, the
+	chart is rendered as an inline SVG graphic. Other formats show a table of testsuite durations.
+	"""
+	has_content = False
+	required_arguments = 0
+	optional_arguments = 2
+
+	option_spec = UnittestBase.option_spec
+
+	directiveName: str = "unittest-flamegraph"
+
+	_width:     ClassVar[int] =   960
+	_rowHeight: ClassVar[int] =   18
+	_minWidth:  ClassVar[float] = 0.5  #: Rectangles narrower than this (in pixels) are not drawn.
+
+	_testsuite: "TestsuiteSummary[Any]"
+
+	def _GenerateFlamegraphSVG(self) -> str:
+		"""
+		Lay out and render the icicle chart in a single depth-first pass.
+
+		Children are placed next to each other starting at their parent's left edge. They are clipped at the parent's right
+		edge, if the durations of children exceed the parent's duration (e.g. due to rounding in the report).
+
+		:return: The SVG graphic as string.
+		"""
+		total = self._testsuite.TotalDuration
+		totalSeconds = total.total_seconds() if total is not None else 0.0
+		scale = self._width / totalSeconds if totalSeconds > 0.0 else 0.0
+		rowHeight = self._rowHeight
+		minWidth = self._minWidth
+
+		rects: List[str] = []
+		maxDepth = 0
+
+		def draw(name: str, cssClass: str, x: float, width: float, depth: int, seconds: float) -> None:
+			nonlocal maxDepth
+			maxDepth = max(maxDepth, depth)
+
+			label = escape(name)
+			share = seconds / totalSeconds if totalSeconds > 0.0 else 0.0
+			y = depth * rowHeight
+			rects.append(
+				f'<g class="{cssClass}"><title>{label}: {self._formatTimedelta(timedelta(seconds=seconds))} ({share:.1%})</title>'
+				f'<rect x="{x:.1f}" y="{y}" width="{width:.1f}" height="{rowHeight - 1}"/>'
+			)
+			if (characters := int(width / 6.5)) >= 4:
+				text = label if len(name) <= characters else escape(name[:characters - 1]) + "…"
+				rects.append(f'<text x="{x + 3:.1f}" y="{y + rowHeight - 5}">{text}</text>')
+			rects.append("</g>")
+
+		def layout(testsuite: "TestsuiteBase[Any]", x: float, right: float, depth: int) -> None:
+			for ts in testsuite._testsuites.values():
+				seconds = ts._totalDuration.total_seconds() if ts._totalDuration is not None else 0.0
+				width = min(seconds * scale, right - x)
+				if width >= minWidth:
+					draw(ts._name, f"report-flame-testsuite testsuite-{ts._status.name.lower()}", x, width, depth, seconds)
+					layout(ts, x, x + width, depth + 1)
+				x += width
+
+			for testcase in getattr(testsuite, "_testcases", {}).values():
+				seconds = testcase._totalDuration.total_seconds() if testcase._totalDuration is not None else 0.0
+				width = min(seconds * scale, right - x)
+				if width >= minWidth:
+					draw(testcase._name, f"report-flame-testcase testcase-{testcase._status.name.lower()}", x, width, depth, seconds)
+				x += width
+
+		draw(self._testsuite.Name, "report-flame-root", 0.0, float(self._width), 0, totalSeconds)
+		layout(self._testsuite, 0.0, float(self._width), 1)
+
+		height = (maxDepth + 1) * rowHeight
+		return "\n".join([
+			f'<svg xmlns="http://www.w3.org/2000/svg" class="report-flamegraph" viewBox="0 0 {self._width} {height}" width="{self._width}" height="{height}" role="img">',
+			f'<title>Testsuite runtime flame graph for {escape(self._reportID)}</title>',
+			*rects,
+			"</svg>"
+		])
+
+	def _LoadOrGenerateSVG(self) -> str:
+		"""
+		Return the icicle chart from the cache directory or generate and cache it.
+
+		The cache file name is derived from the reportid, the sphinx-reports version, the report's SHA-256 hash and the
+		layout parameters. When a new chart is cached, superseded charts of the same reportid are removed.
+
+		:return: The SVG graphic as string.
+		"""
+		from sphinx_reports import __version__
+
+		reportKey = sha256(self._reportID.encode("utf-8")).hexdigest()[:16]
+		key = sha256(
+			f"{__version__}:{self._reportID}:{self._ReportHash(self._reportID)}:{self._width}:{self._rowHeight}:{self._minWidth}".encode("utf-8")
+		).hexdigest()
+		cacheDirectory = self._CacheDirectory()
+		cacheFile = cacheDirectory / f"flamegraph-{reportKey}-{key[:32]}.svg"
+
+		if cacheFile.exists():
+			return cacheFile.read_text(encoding="utf-8")
+
+		svg = self._GenerateFlamegraphSVG()
+		for supersededFile in cacheDirectory.glob(f"flamegraph-{reportKey}-*.svg"):
+			supersededFile.unlink(missing_ok=True)
+		cacheFile.write_text(svg, encoding="utf-8")
+
+		return svg
+
+	def _GenerateTestsuiteTable(self) -> nodes.table:
+		cssClasses = ["report-unittest-flamegraph-table", f"report-unittest-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		tableGroup = self._CreateSingleTableHeader(
+			identifier=f"{self._reportID}-flamegraph",
+			columns=[("Testsuite", 6), ("Runtime (HH:MM:SS.sss)", 2), ("Share in %", 1)],
+			classes=cssClasses
+		)
+		tableBody = nodes.tbody()
+		tableGroup += tableBody
+
+		total = self._testsuite.TotalDuration
+
+		def renderTestsuite(testsuite: "TestsuiteBase[Any]", level: int) -> None:
+			tableBody.append(nodes.row(
+				"",
+				nodes.entry("", nodes.Text(f"{'  ' * level}{testsuite.Name}")),
+				nodes.entry("", nodes.Text(self._formatTimedelta(testsuite.TotalDuration))),
+				nodes.entry("", nodes.Text(
+					f"{testsuite.TotalDuration / total:.1%}" if total and testsuite.TotalDuration is not None else ""
+				)),
+				classes=["report-testsuite"]
+			))
+
+			for ts in self._sortedValues(testsuite._testsuites):
+				renderTestsuite(ts, level + 1)
+
+		renderTestsuite(self._testsuite, 0)
+
+		return tableGroup.parent
+
+	def run(self) -> List[nodes.Node]:
+		container = nodes.container()
+
+		try:
+			self._CheckOptions()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			self._testsuite = self._LoadTestsuiteSummary(self._reportID)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when loading JUnit document '{self._xmlReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			svg = InlineSVG("", classes=["report-unittest-flamegraph"] + self._cssClasses)
+			svg["svg"] = self._LoadOrGenerateSVG()
+			svg += self._GenerateTestsuiteTable()
+			container += svg
+		except Exception as ex:
+			message = f"Caught {ex.__class__.__name__} when generating the flame graph for JUnit document '{self._xmlReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		return [container]
+
+
+@export
+class UnittestFailureDetails(UnittestBase):
+	"""
+	This directive will be replaced by the failure messages and captured outputs of failed and errored testcases.
+
+	Details are read on demand using a byte-offset index into the JUnit XML file (or the details embedded in an artifact),
+	so only the details of rendered testcases are loaded. The number of testcases and the length of each detail text are
+	limited.
+	"""
+	has_content = False
+	required_arguments = 0
+	optional_arguments = 5
+
+	option_spec = UnittestBase.option_spec | {
+		"max-testcases":  nonnegative_int,
+		"max-characters": positive_int,
+		"output":         flag
+	}
+
+	directiveName: str = "unittest-failure-details"
+
+	_maxTestcases:  int
+	_maxCharacters: int
+	_output:        bool
+
+	def _CheckOptions(self) -> None:
+		"""
+		Parse all directive options or use default values.
+		"""
+		super()._CheckOptions()
+
+		self._maxTestcases = self.options.get("max-testcases", 50)
+		self._maxCharacters = self.options.get("max-characters", 4000)
+		self._output = "output" in self.options
+
+	def _GenerateDetails(self, junitIndex: JUnitIndex) -> List[nodes.Element]:
+		kinds = ("failure", "error", "system-out", "system-err") if self._output else ("failure", "error")
+
+		failed = [tc for tc in junitIndex.Testcases if tc.Status in (TestcaseStatus.Failed, TestcaseStatus.Errored)]
+		rendered = failed if self._maxTestcases == 0 else failed[:self._maxTestcases]
+
+		result: List[nodes.Element] = []
+		with junitIndex.Open() as file:
+			for testcase in rendered:
+				section = nodes.container(classes=["report-unittest-failure", f"report-unittest-{self._reportID}"] + self._cssClasses)
+				section += nodes.paragraph(
+					"",
+					"",
+					nodes.Text(f"{self._convertTestcaseStatusToSymbol(testcase.Status)} "),
+					nodes.strong("", testcase.FullName),
+					nodes.Text(f" ({testcase.Testsuite})" if testcase.Testsuite != "" else "")
+				)
+
+				for span in testcase.Details:
+					if span.Kind not in kinds:
+						continue
+
+					attributes, text, truncated = junitIndex.ReadDetail(file, span, self._maxCharacters)
+					if span.Kind in ("failure", "error"):
+						headline = ": ".join(part for part in (attributes.get("type", span.Kind), attributes.get("message", "")) if part != "")
+						section += nodes.paragraph("", headline, classes=[f"report-unittest-{span.Kind}"])
+					else:
+						section += nodes.rubric("", span.Kind)
+
+					text = text.strip("\n")
+					if truncated:
+						text += f"\n... (truncated after {self._maxCharacters} characters)"
+					if text != "":
+						section += nodes.literal_block(text, text)
+
+				result.append(section)
+
+		if len(rendered) < len(failed):
+			result.append(nodes.paragraph("", f"{len(failed) - len(rendered)} more failed testcases are not shown."))
+		elif len(failed) == 0:
+			result.append(nodes.paragraph("", "No failed testcases."))
+
+		return result
+
+	def run(self) -> List[nodes.Node]:
+		container = nodes.container()
+
+		try:
+			self._CheckOptions()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			junitIndex = self._LoadJUnitIndex(self._reportID)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when indexing JUnit document '{self._xmlReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			container += self._GenerateDetails(junitIndex)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when reading failure details from JUnit document '{self._xmlReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		return [container]
+
+
+@export
+class UnittestBadge(UnittestBase):
+	"""
+	This directive will be replaced by a single line summarizing a JUnit report.
+
+	The line shows the number of testcases, failed, errored and skipped testcases as well as the total runtime. The
+	numbers are computed by a counting scanner, which doesn't create an object model of the report.
+	"""
+	has_content = False
+	required_arguments = 0
+	optional_arguments = 2
+
+	option_spec = UnittestBase.option_spec
+
+	directiveName: str = "unittest-badge"
+
+	def _GenerateBadge(self, counts: JUnitCounts) -> nodes.paragraph:
+		status = "failed" if counts.Failed + counts.Errored > 0 else "passed"
+		symbol = self._convertTestcaseStatusToSymbol(TestcaseStatus.Failed if status == "failed" else TestcaseStatus.Passed)
+
+		parts = [f"{symbol} {counts.Tests} tests"]
+		if counts.Failed > 0:
+			parts.append(f"{counts.Failed} failed")
+		if counts.Errored > 0:
+			parts.append(f"{counts.Errored} errored")
+		if counts.Skipped > 0:
+			parts.append(f"{counts.Skipped} skipped")
+		parts.append(f"total runtime {self._formatTimedelta(timedelta(seconds=counts.Duration))}")
+
+		cssClasses = ["report-unittest-badge", f"report-unittest-badge-{status}", f"report-unittest-{self._reportID}"]
+		cssClasses.extend(self._cssClasses)
+
+		return nodes.paragraph("", ", ".join(parts), classes=cssClasses)
+
+	def run(self) -> List[nodes.Node]:
+		container = nodes.container()
+
+		try:
+			self._CheckOptions()
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when checking options for directive '{self.directiveName}'."
+			return self._internalError(container, __name__, message, ex)
+
+		try:
+			counts = self._LoadJUnitCounts(self._reportID)
+		except ReportExtensionError as ex:
+			message = f"Caught {ex.__class__.__name__} when scanning JUnit document '{self._xmlReport}'."
+			return self._internalError(container, __name__, message, ex)
+
+		container += self._GenerateBadge(counts)
+
+		return [container]
@@ -31,21 +31,17 @@
 """
 Workarounds for Sphinx and Docutils problems.
 """
-from docutils.nodes      import table
-from docutils.transforms import Transform
-from sphinx.util.logging import getLogger
+from docutils.nodes                    import table
+from sphinx.transforms.post_transforms import SphinxPostTransform
+from sphinx.util.logging                import getLogger
 
 logger = getLogger(__name__)
 
-class FixLatexTableWidths(Transform):
+class FixLatexTableWidths(SphinxPostTransform):
 	default_priority = 500
+	formats = ("latex", )
 
-	def apply(self):
-		sphinxEnvironment = self.document.settings.env
-
-		if sphinxEnvironment.app.builder.format != "latex":
-			return
-
+	def run(self, **kwargs):
 		# Tables used with Landscape node
 		tableClasses = ("report-unittest-table", "report-codecov-table")
 
@@ -37,6 +37,8 @@ Supported reports:
 * :ref:`DOCCOV`
 * :ref:`CODECOV`
 * :ref:`DEP`
+* :ref:`IMPORTTIME`
+* :ref:`IMPORTGRAPH`
 
 """
 __author__ =            "Patrick Lehmann"
@@ -54,9 +56,10 @@ __issue_tracker_url__ = "https://GitHub.com/pyTooling/sphinx-reports/issues"
 
 from hashlib               import md5
 from pathlib               import Path
-from typing                import TYPE_CHECKING, Any, Tuple, Dict, Optional as Nullable, TypedDict, List, Callable, Type
+from typing                import TYPE_CHECKING, AbstractSet, Any, Tuple, Dict, Optional as Nullable, TypedDict, List, Callable, Type, Set, cast
 
-from docutils.nodes        import Element
+from docutils.nodes        import Element, document
+from docutils.parsers.rst  import Directive
 from docutils.transforms   import Transform
 from sphinx.addnodes       import pending_xref
 from sphinx.application    import Sphinx
@@ -65,15 +68,20 @@ from sphinx.config         import Config
 from sphinx.domains        import Domain
 from sphinx.environment    import BuildEnvironment
 from sphinx.util.logging   import getLogger
+from sphinx.util.parallel  import parallel_available
 from pyTooling.Decorators  import export
 from pyTooling.Common      import readResourceFile
 
-from sphinx_reports            import static as ResourcePackage
-from sphinx_reports.Common     import ReportExtensionError, visitFunc, departFunc
-from sphinx_reports.Node       import Landscape
-from sphinx_reports.Workaround import FixLatexTableWidths
-from sphinx_reports.HTML       import translateLandscape as translateLandscapeAsHTML
-from sphinx_reports.LaTeX      import translateLandscape as translateLandscapeAsLaTeX
+from sphinx_reports                 import static as ResourcePackage
+from sphinx_reports.Common          import ReportExtensionError, visitFunc, departFunc
+from sphinx_reports.Sphinx          import cacheDirectory
+from sphinx_reports.Store           import ReportStore
+from sphinx_reports.Instrumentation import Instrumentation
+from sphinx_reports.Profiling       import Profiler
+from sphinx_reports.Node            import Landscape, InlineSVG, DocCoveragePlaceholder
+from sphinx_reports.Workaround      import FixLatexTableWidths
+from sphinx_reports.HTML            import translateLandscape as translateLandscapeAsHTML, translateInlineSVG as translateInlineSVGAsHTML
+from sphinx_reports.LaTeX           import translateLandscape as translateLandscapeAsLaTeX, translateInlineSVG as translateInlineSVGAsLaTeX
 
 
 @export
@@ -99,7 +107,16 @@ class ReportDomain(Domain):
 	* :rst:dir:`report:doc-coverage`
 	* :rst:dir:`report:doc-coverage-legend`
 	* :rst:dir:`report:dependency-table`
+	* :rst:dir:`report:import-time`
+	* :rst:dir:`report:import-graph`
 	* :rst:dir:`report:unittest-summary`
+	* :rst:dir:`report:unittest-duration-histogram`
+	* :rst:dir:`report:unittest-regressions`
+	* :rst:dir:`report:unittest-diff`
+	* :rst:dir:`report:unittest-utilization`
+	* :rst:dir:`report:unittest-flamegraph`
+	* :rst:dir:`report:unittest-failure-details`
+	* :rst:dir:`report:unittest-badge`
 
 	.. rubric:: New roles:
 
@@ -116,6 +133,14 @@ class ReportDomain(Domain):
 	* ``report_codecov_packages``
 	* ``report_doccov_packages``
 	* ``report_unittest_testsuites``
+	* ``report_unittest_histogram``
+	* ``report_importtime_logs``
+	* ``report_importtime_levels``
+	* ``report_importgraph_packages``
+	* ``report_importgraph_heavy_imports``
+	* ``report_importgraph_workers``
+	* ``report_instrumentation``
+	* ``report_profile``
 
 	"""
 
@@ -134,24 +159,43 @@ class ReportDomain(Domain):
 			"html": translateLandscapeAsHTML,
 			"latex": translateLandscapeAsLaTeX
 		},
-	)
-	transformations: Tuple[Type[Transform], ...] = (
-		FixLatexTableWidths,
+		{ "name": "InlineSVG",
+			"node": InlineSVG,
+			"html": translateInlineSVGAsHTML,
+			"latex": translateInlineSVGAsLaTeX
+		},
 	)
 
 	from sphinx_reports.CodeCoverage import CodeCoverage, CodeCoverageLegend, ModuleCoverage
-	from sphinx_reports.DocCoverage  import DocStrCoverage, DocCoverageLegend
+	from sphinx_reports.DocCoverage  import DocStrCoverage, DocCoverageLegend, ResolveDocCoveragePlaceholders
 	from sphinx_reports.Dependency   import DependencyTable
-	from sphinx_reports.Unittest     import UnittestSummary
+	from sphinx_reports.ImportTime   import ImportTime
+	from sphinx_reports.ImportGraph  import ImportGraph
+	from sphinx_reports.Unittest     import UnittestSummary, UnittestDurationHistogram, UnittestRegressions, UnittestDiff, UnittestUtilization, UnittestFlamegraph
+	from sphinx_reports.Unittest     import UnittestFailureDetails, UnittestBadge
+
+	transformations: Tuple[Type[Transform], ...] = (
+		ResolveDocCoveragePlaceholders,
+		FixLatexTableWidths,
+	)
 
 	directives = {
-		"code-coverage":        CodeCoverage,
-		"code-coverage-legend": CodeCoverageLegend,
-		"module-coverage":      ModuleCoverage,
-		"doc-coverage":         DocStrCoverage,
-		"doc-coverage-legend":  DocCoverageLegend,
-		"dependency-table":     DependencyTable,
-		"unittest-summary":     UnittestSummary,
+		"code-coverage":               CodeCoverage,
+		"code-coverage-legend":        CodeCoverageLegend,
+		"module-coverage":             ModuleCoverage,
+		"doc-coverage":                DocStrCoverage,
+		"doc-coverage-legend":         DocCoverageLegend,
+		"dependency-table":            DependencyTable,
+		"import-time":                 ImportTime,
+		"import-graph":                ImportGraph,
+		"unittest-summary":            UnittestSummary,
+		"unittest-duration-histogram": UnittestDurationHistogram,
+		"unittest-regressions":        UnittestRegressions,
+		"unittest-diff":               UnittestDiff,
+		"unittest-utilization":        UnittestUtilization,
+		"unittest-flamegraph":         UnittestFlamegraph,
+		"unittest-failure-details":    UnittestFailureDetails,
+		"unittest-badge":              UnittestBadge,
 	}  #: A dictionary of all directives in this domain.
 
 	roles = {
@@ -165,13 +209,19 @@ class ReportDomain(Domain):
 	from sphinx_reports.CodeCoverage import CodeCoverageBase
 	from sphinx_reports.DocCoverage  import DocCoverageBase
 	from sphinx_reports.Dependency   import DependencyTable
-	from sphinx_reports.Unittest     import UnittestSummary
+	from sphinx_reports.ImportTime   import ImportTimeBase
+	from sphinx_reports.ImportGraph  import ImportGraphBase
+	from sphinx_reports.Unittest     import UnittestBase
 
 	configValues: Dict[str, Tuple[Any, str, Any]] = {
 		**CodeCoverageBase.configValues,
 		**DocCoverageBase.configValues,
-		**UnittestSummary.configValues,
+		**UnittestBase.configValues,
 		**DependencyTable.configValues,
+		**ImportTimeBase.configValues,
+		**ImportGraphBase.configValues,
+		**Instrumentation.configValues,
+		**Profiler.configValues,
 	}  #: A dictionary of all configuration values used by this domain. (name: (default, rebuilt, type))
 
 	del CodeCoverageBase
@@ -181,16 +231,247 @@ class ReportDomain(Domain):
 	del DocCoverageBase
 	del DocStrCoverage
 	del DocCoverageLegend
+	del ResolveDocCoveragePlaceholders
 	del DependencyTable
+	del ImportTimeBase
+	del ImportTime
+	del ImportGraphBase
+	del ImportGraph
+	del UnittestBase
 	del UnittestSummary
+	del UnittestDurationHistogram
+	del UnittestRegressions
+	del UnittestDiff
+	del UnittestUtilization
+	del UnittestFlamegraph
+	del UnittestFailureDetails
+	del UnittestBadge
 
 	initial_data = {
-		# "reports": {}
+		"reports":               {},  # docname -> set of (configPrefix, reportid) used by the document
+		"doccov_objects":        {},  # docname -> {object name -> (object type, documented)}
+		"doccov_placeholders":   {},  # docname -> set of reportids
+		"doccov_results":        {},  # reportid -> {object name -> (object type, documented)}
+		"doccov_documents":      {},  # docname -> set of reportids (directory mode)
+		"doccov_sources":        {},  # reportid -> sorted list of source files (directory mode)
+		"importgraph_documents": {},  # docname -> set of reportids
+		"importgraph_sources":   {},  # reportid -> sorted list of source files
+		"instrumentation":       {},  # docname -> list of spans recorded by a parallel read worker
 	}  #: A dictionary of all global data fields used by this domain.
 
-	# @property
-	# def Reports(self) -> Dict[str, Any]:
-	# 	return self.data["reports"]
+	data_version = 4  #: Version of the data structure in :attr:`initial_data`. A pickled environment with a different version is discarded.
+
+	@classmethod
+	def Get(cls, env: BuildEnvironment) -> "ReportDomain":
+		"""
+		Return the ``report`` domain of a Sphinx build environment.
+
+		:param env: The Sphinx build environment.
+		:returns:   The report domain instance.
+		"""
+		return cast("ReportDomain", env.get_domain(cls.name))
+
+	@property
+	def Reports(self) -> Dict[str, Set[Tuple[str, str]]]:
+		"""
+		Reports used by each document read.
+
+		Every document read is listed, even if it doesn't use a report. Thus, an unknown document is a new document.
+
+		:return: Dictionary of docnames to sets of directive configuration prefixes and reportids.
+		"""
+		return cast(Dict[str, Set[Tuple[str, str]]], self.data["reports"])
+
+	def NoteReport(self, docname: str, configPrefix: str, reportID: str) -> None:
+		"""
+		Record a report used by a document.
+
+		:param docname:      Name of the document.
+		:param configPrefix: Configuration prefix of the directive family (e.g. ``doccov``).
+		:param reportID:     The report's reportid.
+		"""
+		self.data["reports"].setdefault(docname, set()).add((configPrefix, reportID))
+
+	@property
+	def DocCoverageObjects(self) -> Dict[str, Dict[str, Tuple[str, bool]]]:
+		"""
+		Objects and their documentation state collected from autodoc per document.
+
+		:return: Dictionary of docnames to dictionaries of object names to object type and documentation state.
+		"""
+		return cast(Dict[str, Dict[str, Tuple[str, bool]]], self.data["doccov_objects"])
+
+	@property
+	def DocCoveragePlaceholders(self) -> Dict[str, Set[str]]:
+		"""
+		Documents containing documentation coverage placeholders.
+
+		:return: Dictionary of docnames to sets of reportids.
+		"""
+		return cast(Dict[str, Set[str]], self.data["doccov_placeholders"])
+
+	@property
+	def DocCoverageDocuments(self) -> Dict[str, Set[str]]:
+		"""
+		Documents containing documentation coverage tables of packages analyzed from a source directory.
+
+		:return: Dictionary of docnames to sets of reportids.
+		"""
+		return cast(Dict[str, Set[str]], self.data["doccov_documents"])
+
+	@property
+	def DocCoverageSources(self) -> Dict[str, List[str]]:
+		"""
+		Source files of packages analyzed from a source directory, as found when documents were read.
+
+		:return: Dictionary of reportids to sorted lists of relative source file paths.
+		"""
+		return cast(Dict[str, List[str]], self.data["doccov_sources"])
+
+	def NoteDocCoverageSources(self, docname: str, reportID: str, sourceFiles: List[str]) -> None:
+		"""
+		Record a document containing a documentation coverage table and the package's source files.
+
+		:param docname:     Name of the document.
+		:param reportID:    The package's reportid.
+		:param sourceFiles: Sorted relative paths of the package's source files.
+		"""
+		self.data["doccov_documents"].setdefault(docname, set()).add(reportID)
+		self.data["doccov_sources"][reportID] = sourceFiles
+
+	@property
+	def ImportGraphDocuments(self) -> Dict[str, Set[str]]:
+		"""
+		Documents containing import graphs.
+
+		:return: Dictionary of docnames to sets of reportids.
+		"""
+		return cast(Dict[str, Set[str]], self.data["importgraph_documents"])
+
+	@property
+	def ImportGraphSources(self) -> Dict[str, List[str]]:
+		"""
+		Source files of packages in import graphs, as found when documents were read.
+
+		:return: Dictionary of reportids to sorted lists of relative source file paths.
+		"""
+		return cast(Dict[str, List[str]], self.data["importgraph_sources"])
+
+	def NoteImportGraphSources(self, docname: str, reportID: str, sourceFiles: List[str]) -> None:
+		"""
+		Record a document containing an import graph and the package's source files.
+
+		:param docname:     Name of the document.
+		:param reportID:    The package's reportid.
+		:param sourceFiles: Sorted relative paths of the package's source files.
+		"""
+		self.data["importgraph_documents"].setdefault(docname, set()).add(reportID)
+		self.data["importgraph_sources"][reportID] = sourceFiles
+
+	def NoteDocCoverageObject(self, docname: str, name: str, objectType: str, documented: bool) -> None:
+		"""
+		Record an object's documentation state while reading a document.
+
+		:param docname:    Name of the document, which documents the object.
+		:param name:       Fully qualified name of the object.
+		:param objectType: Type of the object (``module``, ``class``, ...).
+		:param documented: True, if the object has a docstring.
+		"""
+		docObjects = self.data["doccov_objects"].setdefault(docname, {})
+		_, wasDocumented = docObjects.get(name, (objectType, False))
+		docObjects[name] = (objectType, documented or wasDocumented)
+
+	def SetDocCoverageResult(self, reportID: str, objects: Dict[str, Tuple[str, bool]]) -> bool:
+		"""
+		Store the objects of a package computed at ``env-updated``.
+
+		:param reportID: The package's reportid.
+		:param objects:  Dictionary of object names to object type and documentation state.
+		:return:         True, if the result differs from the previously stored result.
+		"""
+		results: Dict[str, Dict[str, Tuple[str, bool]]] = self.data["doccov_results"]
+		changed = results.get(reportID) != objects
+		results[reportID] = objects
+
+		return changed
+
+	def DocCoverageResult(self, reportID: str) -> Dict[str, Tuple[str, bool]]:
+		"""
+		Return the objects of a package computed at ``env-updated``.
+
+		:param reportID: The package's reportid.
+		:return:         Dictionary of object names to object type and documentation state.
+		"""
+		return cast(Dict[str, Tuple[str, bool]], self.data["doccov_results"].get(reportID, {}))
+
+	def clear_doc(self, docname: str) -> None:
+		"""
+		Remove data collected from a document, before it's read again or after it was removed.
+
+		:param docname: Name of the document.
+		"""
+		self.data["reports"].pop(docname, None)
+		self.data["doccov_objects"].pop(docname, None)
+		self.data["doccov_placeholders"].pop(docname, None)
+		self.data["doccov_documents"].pop(docname, None)
+		self.data["importgraph_documents"].pop(docname, None)
+		self.data["instrumentation"].pop(docname, None)
+
+	def process_doc(self, env: BuildEnvironment, docname: str, doctree: document) -> None:
+		"""
+		Collect data from a document after it was read.
+
+		The document is registered in :attr:`Reports` and documentation coverage placeholders are recorded, so they can be
+		resolved after all documents were read. In a parallel read worker, recorded instrumentation spans are moved into
+		the domain data, so they are merged into the main process.
+
+		:param env:      The Sphinx build environment.
+		:param docname:  Name of the document.
+		:param doctree:  The document's doctree.
+		"""
+		self.data["reports"].setdefault(docname, set())
+
+		for placeholder in doctree.findall(DocCoveragePlaceholder):
+			self.data["doccov_placeholders"].setdefault(docname, set()).add(placeholder["reportid"])
+
+		if len(spans := Instrumentation.TakeWorkerSpans()) > 0:
+			self.data["instrumentation"][docname] = spans
+
+	def merge_domaindata(self, docnames: AbstractSet[str], otherdata: Dict[str, Any]) -> None:
+		"""
+		Merge data collected from documents read in a parallel worker process.
+
+		:param docnames:  Names of the documents read by the worker.
+		:param otherdata: The worker's domain data.
+		"""
+		for key in ("reports", "doccov_objects", "doccov_placeholders", "doccov_documents", "importgraph_documents", "instrumentation"):
+			for docname in docnames:
+				if docname in otherdata[key]:
+					self.data[key][docname] = otherdata[key][docname]
+
+		self.data["doccov_sources"].update(otherdata["doccov_sources"])
+		self.data["importgraph_sources"].update(otherdata["importgraph_sources"])
+
+	def directive(self, name: str) -> Nullable[Type[Directive]]:
+		"""
+		Return the directive class for a directive name.
+
+		If profiling is configured, selected directive runs are profiled. If instrumentation is enabled, each directive run
+		is recorded as a ``render`` span.
+
+		:param name: Name of the directive without domain prefix.
+		:return:     The directive class or ``None``, if the directive doesn't exist.
+		"""
+		directiveClass = super().directive(name)
+		if directiveClass is None:
+			return None
+
+		if Profiler.IsEnabled():
+			directiveClass = Profiler.InstrumentDirective(directiveClass, name)
+		if Instrumentation.IsEnabled():
+			directiveClass = Instrumentation.InstrumentDirective(directiveClass, f"{self.name}:{name}")
+
+		return directiveClass
 
 	@staticmethod
 	def CheckConfigurationVariables(sphinxApplication: Sphinx, config: Config) -> None:
@@ -209,12 +490,17 @@ class ReportDomain(Domain):
 		"""
 		from sphinx_reports.CodeCoverage import CodeCoverageBase
 		from sphinx_reports.DocCoverage  import DocCoverageBase
-		from sphinx_reports.Unittest     import UnittestSummary
+		from sphinx_reports.ImportTime   import ImportTimeBase
+		from sphinx_reports.ImportGraph  import ImportGraphBase
+		from sphinx_reports.Unittest     import UnittestBase
 
 		checkConfigurations = (
 			CodeCoverageBase.CheckConfiguration,
 			DocCoverageBase.CheckConfiguration,
-			UnittestSummary.CheckConfiguration,
+			ImportTimeBase.CheckConfiguration,
+			ImportGraphBase.CheckConfiguration,
+			UnittestBase.CheckConfiguration,
+			Profiler.CheckConfiguration,
 		)
 
 		for checkConfiguration in checkConfigurations:
@@ -267,7 +553,7 @@ class ReportDomain(Domain):
 		"""
 		Call back for Sphinx ``builder-inited`` event.
 
-		This callback will read the linked report files
+		This callback will open the report store in Sphinx's cache directory and read the linked report files.
 
 		.. seealso::
 
@@ -277,14 +563,201 @@ class ReportDomain(Domain):
 		:param sphinxApplication: The Sphinx application.
 		"""
 		from sphinx_reports.CodeCoverage import CodeCoverageBase
-		from sphinx_reports.Unittest     import UnittestSummary
+		from sphinx_reports.Unittest     import UnittestBase
+
+		ReportStore.OpenDefault(cacheDirectory(sphinxApplication.env) / "reports.store")
+
+		with Instrumentation.Span("load", "read code coverage reports"):
+			CodeCoverageBase.ReadReports(sphinxApplication)
+		with Instrumentation.Span("load", "read unittest reports"):
+			UnittestBase.ReadReports(sphinxApplication)
+
+	@staticmethod
+	def WriteReportStore(sphinxApplication: Sphinx, exception: Nullable[Exception]) -> None:
+		"""
+		Call back for Sphinx ``build-finished`` event.
+
+		This callback will write reports converted while reading documents into the report store, so the next build can
+		reuse them.
+
+		:param sphinxApplication: The Sphinx application.
+		:param exception:         The exception, which stopped the build, if any.
+		"""
+		try:
+			with Instrumentation.Span("write", "report store"):
+				ReportStore.Default().Commit()
+		except ReportExtensionError as ex:
+			logger = getLogger(__name__)
+			logger.warning(f"Caught {ex.__class__.__name__} when writing the report store.\n  {ex}")
+
+	@staticmethod
+	def PreloadReports(sphinxApplication: Sphinx, env: BuildEnvironment, docnames: List[str]) -> None:
+		"""
+		Call back for Sphinx ``env-before-read-docs`` event.
+
+		If documents are read in parallel, Sphinx forks worker processes, which start with a copy of the main process'
+		memory. Reports loaded by a worker are discarded with the worker. Therefore, reports needed by the documents to be
+		read are loaded and analyzed here once, so all workers share them (copy-on-write) instead of loading them again
+		per worker. Converted report models are also written to the report store, so the next build doesn't convert them
+		again. They are kept in the main process, so workers neither convert nor deserialize them. Pages of these models,
+		which are touched by a worker, become private copies, so peak memory still grows with the number of workers. In
+		a serial build, reports are loaded on first use.
+
+		Reports are selected by the reports used by these documents in the previous build. If a document is new, all
+		configured reports are loaded.
+
+		:param sphinxApplication: The Sphinx application.
+		:param env:               The Sphinx build environment.
+		:param docnames:          Documents to be read.
+		"""
+		if not (parallel_available and sphinxApplication.parallel > 1 and sphinxApplication.is_parallel_allowed("read")):
+			return
+
+		from sphinx_reports.CodeCoverage import CodeCoverageBase
+		from sphinx_reports.DocCoverage  import DocStrCoverage
+		from sphinx_reports.Dependency   import DependencyTable
+		from sphinx_reports.ImportGraph  import ImportGraphBase
+		from sphinx_reports.ImportTime   import ImportTimeBase
+		from sphinx_reports.Unittest     import UnittestBase
+
+		preloaders = {
+			CodeCoverageBase.configPrefix: CodeCoverageBase.PreloadReports,
+			DocStrCoverage.configPrefix:   DocStrCoverage.PreloadReports,
+			DependencyTable.configPrefix:  DependencyTable.PreloadReports,
+			ImportGraphBase.configPrefix:  ImportGraphBase.PreloadReports,
+			ImportTimeBase.configPrefix:   ImportTimeBase.PreloadReports,
+			UnittestBase.configPrefix:     UnittestBase.PreloadReports,
+		}
+
+		reports: Dict[str, Nullable[Set[str]]] = {configPrefix: set() for configPrefix in preloaders}
+		reportDomain = ReportDomain.Get(env)
+		if all(docname in reportDomain.Reports for docname in docnames):
+			for docname in docnames:
+				for configPrefix, reportID in reportDomain.Reports[docname]:
+					if (reportIDs := reports.get(configPrefix)) is not None:
+						reportIDs.add(reportID)
+		else:
+			reports = {configPrefix: None for configPrefix in preloaders}
+
+		for configPrefix, preloader in preloaders.items():
+			if (reportIDs := reports[configPrefix]) is None or len(reportIDs) > 0:
+				preloader(env, reportIDs)
+
+		try:
+			with Instrumentation.Span("write", "report store"):
+				ReportStore.Default().Commit()
+		except ReportExtensionError as ex:
+			logger = getLogger(__name__)
+			logger.warning(f"Caught {ex.__class__.__name__} when writing the report store.\n  {ex}")
+
+	@staticmethod
+	def ConnectAutodocEvents(sphinxApplication: Sphinx, config: Config) -> None:
+		"""
+		Call back for Sphinx ``config-inited`` event.
+
+		This callback will connect to autodoc's events, if the autodoc extension is loaded.
+
+		:param sphinxApplication: The Sphinx application.
+		:param config:            Sphinx configuration parsed from ``conf.py``.
+		"""
+		from sphinx_reports.DocCoverage import DocStrCoverage
+
+		if "autodoc-process-docstring" in sphinxApplication.events.events:
+			sphinxApplication.connect("autodoc-process-docstring", DocStrCoverage.CollectAutodocDocstring)
+
+	@staticmethod
+	def ComputeCoverage(sphinxApplication: Sphinx, env: BuildEnvironment) -> List[str]:
+		"""
+		Call back for Sphinx ``env-updated`` event.
+
+		This callback will compute documentation coverage from objects collected while reading.
+
+		:param sphinxApplication: The Sphinx application.
+		:param env:               The Sphinx build environment.
+		:return:                  Documents to be written again.
+		"""
+		from sphinx_reports.DocCoverage import DocStrCoverage
+
+		with Instrumentation.Span("aggregate", "autodoc coverage"):
+			return DocStrCoverage.ComputeAutodocCoverage(sphinxApplication, env)
+
+	@staticmethod
+	def CheckSourceFiles(sphinxApplication: Sphinx, env: BuildEnvironment, added: Set[str], changed: Set[str], removed: Set[str]) -> List[str]:
+		"""
+		Call back for Sphinx ``env-get-outdated`` event.
+
+		This callback will find documents with documentation coverage tables or import graphs, whose packages got new source
+		files.
+
+		:param sphinxApplication: The Sphinx application.
+		:param env:               The Sphinx build environment.
+		:param added:             Added documents.
+		:param changed:           Changed documents.
+		:param removed:           Removed documents.
+		:return:                  Documents to be read again.
+		"""
+		from sphinx_reports.DocCoverage import DocStrCoverage
+		from sphinx_reports.ImportGraph import ImportGraphBase
+
+		return sorted(
+			set(DocStrCoverage.CheckSourceFiles(sphinxApplication, env, added, changed, removed)) |
+			set(ImportGraphBase.CheckSourceFiles(sphinxApplication, env, added, changed, removed))
+		)
+
+	@staticmethod
+	def StartInstrumentation(sphinxApplication: Sphinx) -> None:
+		"""
+		Call back for Sphinx ``builder-inited`` event.
+
+		This callback will start recording instrumentation spans, if ``report_instrumentation`` is enabled. Spans returned
+		by read workers of a previous build are dropped.
+
+		:param sphinxApplication: The Sphinx application.
+		"""
+		if sphinxApplication.config.report_instrumentation:
+			Instrumentation.Enable()
+		else:
+			Instrumentation.Disable()
+
+		ReportDomain.Get(sphinxApplication.env).data["instrumentation"].clear()
+
+	@staticmethod
+	def WriteInstrumentation(sphinxApplication: Sphinx, exception: Nullable[Exception]) -> None:
+		"""
+		Call back for Sphinx ``build-finished`` event.
+
+		This callback will log a summary of the recorded instrumentation spans and write a statistics file and a Chrome
+		trace event file into the output directory.
+
+		:param sphinxApplication: The Sphinx application.
+		:param exception:         The exception, which stopped the build, if any.
+		"""
+		if not Instrumentation.IsEnabled():
+			return
+
+		workerSpans = [span for spans in ReportDomain.Get(sphinxApplication.env).data["instrumentation"].values() for span in spans]
+		metadata = {
+			"builder":  sphinxApplication.builder.name,
+			"parallel": sphinxApplication.parallel,
+			"failed":   exception is not None,
+		}
+
+		try:
+			statistics = Instrumentation.Write(Path(sphinxApplication.outdir), workerSpans, metadata)
+		except OSError as ex:
+			logger = getLogger(__name__)
+			logger.warning(f"Caught {ex.__class__.__name__} when writing instrumentation data.\n  {ex}")
+			return
 
-		CodeCoverageBase.ReadReports(sphinxApplication)
-		UnittestSummary.ReadReports(sphinxApplication)
+		Instrumentation.LogSummary(statistics)
 
 	callbacks: Dict[str, List[Callable]] = {
-		"config-inited":    [CheckConfigurationVariables],    # (app, config)
-		"builder-inited":   [AddCSSFiles, ReadReports],       # (app)
+		"config-inited":        [CheckConfigurationVariables, ConnectAutodocEvents],  # (app, config)
+		"builder-inited":       [StartInstrumentation, AddCSSFiles, ReadReports],     # (app)
+		"env-get-outdated":     [CheckSourceFiles],                                   # (app, env, added, changed, removed)
+		"env-before-read-docs": [PreloadReports],                                     # (app, env, docnames)
+		"env-updated":          [ComputeCoverage],                                    # (app, env)
+		"build-finished":       [WriteReportStore, WriteInstrumentation],             # (app, exception)
 	}  #: A dictionary of all events/callbacks <https://www.sphinx-doc.org/en/master/extdev/appapi.html#sphinx-core-events>`__ used by this domain.
 
 	def resolve_xref(
@@ -348,6 +821,6 @@ def setup(sphinxApplication: Sphinx) -> "setup_ReturnType":
 	return {
 		"version": __version__,                          # version of the extension
 		"env_version": int(__version__.split(".")[0]),   # version of the data structure stored in the environment
-		'parallel_read_safe': True,                      # TODO: Not yet evaluated
+		'parallel_read_safe': True,                      # Per-document data is stored in the domain and merged from read workers.
 		'parallel_write_safe': True,                     # Internal data structure is used read-only, thus no problems will occur by parallel writing.
 	}
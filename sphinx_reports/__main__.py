@@ -0,0 +1,193 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""
+**Command line interface to pre-convert reports into artifacts outside of Sphinx.**
+
+.. code-block:: bash
+
+   python -m sphinx_reports convert [-j JOBS] [-o DIRECTORY] [--name NAME] [KIND:[NAME=]]REPORT ...
+   python -m sphinx_reports validate ARTIFACT ...
+
+See :mod:`sphinx_reports.Artifact` for the artifact format.
+"""
+from argparse import ArgumentParser
+from os       import cpu_count
+from pathlib  import Path
+from re       import fullmatch
+from sys      import exit, stderr
+from typing   import Dict, List, Optional as Nullable, Tuple
+
+from sphinx_reports.Artifact import ARTIFACT_SUFFIX, ReportArtifact, ReportArtifactError
+
+
+_Task = Tuple[str, Path, Path, Nullable[str]]  # kind, source, artifact file, package name
+
+
+def _ErrorMessage(ex: BaseException) -> str:
+	messages = [str(ex)]
+	cause = ex.__cause__
+	while cause is not None:
+		messages.append(f"{cause.__class__.__name__}: {cause}")
+		cause = cause.__cause__
+
+	return "\n  ".join(messages)
+
+
+def _Convert(task: _Task) -> Tuple[Nullable[str], Nullable[str]]:
+	"""
+	Convert and validate a single report. Runs in a worker process.
+
+	:param task: Kind, source, artifact file and package name.
+	:returns:    A tuple of a description of the artifact and an error message. One of both is ``None``.
+	"""
+	kind, source, file, name = task
+	try:
+		ReportArtifact.Create(kind, source, file, name)
+		return ReportArtifact.Validate(file), None
+	except Exception as ex:
+		return None, _ErrorMessage(ex)
+
+
+def _Tasks(reports: List[str], outputDirectory: Nullable[Path], name: Nullable[str]) -> List[_Task]:
+	tasks: List[_Task] = []
+	artifacts: Dict[Path, Path] = {}
+	for report in reports:
+		prefix, _, path = report.partition(":")
+		kind: Nullable[str] = prefix
+		packageName = name
+		if path == "" or prefix not in ReportArtifact.kinds:
+			kind, source = None, Path(report)
+		elif (match := fullmatch(r"([\w.]+)=(.+)", path)) is not None:
+			packageName, source = match[1], Path(match[2])
+		else:
+			source = Path(path)
+
+		if not source.exists():
+			raise ValueError(f"Report '{source}' doesn't exist.")
+		elif kind is None:
+			kind = ReportArtifact.DetectKind(source)
+
+		if kind not in ReportArtifact.namedKinds:
+			packageName = None
+		elif packageName is None:
+			raise ValueError(f"The {kind} report '{source}' needs a package name. Use '--name NAME' or '{kind}:NAME={source}'.")
+
+		file = (source.parent if outputDirectory is None else outputDirectory) / f"{source.name}{ARTIFACT_SUFFIX}"
+		if file in artifacts:
+			raise ValueError(f"Reports '{artifacts[file]}' and '{source}' would be written to the same artifact '{file}'.")
+		artifacts[file] = source
+
+		tasks.append((kind, source, file, packageName))
+
+	return tasks
+
+
+def Convert(reports: List[str], outputDirectory: Nullable[Path] = None, name: Nullable[str] = None, jobs: int = 0) -> int:
+	"""
+	Convert reports into artifacts in parallel and validate them.
+
+	:param reports:         Reports as ``[<kind>:[<name>=]]<path>``. The kind is detected, if omitted. The package name of
+	                        code and documentation coverage reports is required, unless ``name`` is given.
+	:param outputDirectory: Directory for artifacts. By default, an artifact is written next to its report.
+	:param name:            Package name of code and documentation coverage reports without a name of their own.
+	:param jobs:            Number of worker processes. ``0`` uses one worker per CPU; ``1`` converts serially.
+	:returns:               Exit code.
+	"""
+	try:
+		tasks = _Tasks(reports, outputDirectory, name)
+	except (ValueError, ReportArtifactError) as ex:
+		print(f"ERROR: {ex}", file=stderr)
+		return 2
+
+	if outputDirectory is not None:
+		outputDirectory.mkdir(parents=True, exist_ok=True)
+
+	workers = min(len(tasks), jobs if jobs > 0 else (cpu_count() or 1))
+	if workers <= 1:
+		results = [_Convert(task) for task in tasks]
+	else:
+		from concurrent.futures import ProcessPoolExecutor
+
+		with ProcessPoolExecutor(max_workers=workers) as executor:
+			results = list(executor.map(_Convert, tasks))
+
+	exitCode = 0
+	for (kind, source, file, _), (description, error) in zip(tasks, results):
+		if error is None:
+			print(f"{source} -> {file}: {description}")
+		else:
+			print(f"ERROR: Converting {kind} report '{source}' failed: {error}", file=stderr)
+			exitCode = 1
+
+	return exitCode
+
+
+def Validate(artifacts: List[Path]) -> int:
+	"""
+	Validate artifacts.
+
+	:param artifacts: Artifact files.
+	:returns:         Exit code.
+	"""
+	exitCode = 0
+	for file in artifacts:
+		try:
+			print(f"{file}: {ReportArtifact.Validate(file)}")
+		except Exception as ex:
+			print(f"ERROR: Artifact '{file}' is invalid: {_ErrorMessage(ex)}", file=stderr)
+			exitCode = 1
+
+	return exitCode
+
+
+def Main(arguments: Nullable[List[str]] = None) -> int:
+	parser = ArgumentParser(prog="python -m sphinx_reports", description="Pre-convert reports into artifacts for sphinx-reports.")
+	commands = parser.add_subparsers(dest="command", required=True)
+
+	convert = commands.add_parser("convert", help="Convert reports into artifacts.")
+	convert.add_argument("reports", nargs="+", metavar="[KIND:[NAME=]]REPORT", help=f"Report file or package directory. KIND is one of {', '.join(ReportArtifact.kinds)} and detected, if omitted. NAME is the package name of a coverage report.")
+	convert.add_argument("-o", "--output-directory", type=Path, default=None, help="Directory for artifacts (default: next to each report).")
+	convert.add_argument("-j", "--jobs", type=int, default=0, help="Number of worker processes (default: one per CPU).")
+	convert.add_argument("--name", default=None, help="Package name of coverage reports without a NAME of their own.")
+
+	validate = commands.add_parser("validate", help="Validate artifacts.")
+	validate.add_argument("artifacts", nargs="+", type=Path, metavar="ARTIFACT", help="Artifact file.")
+
+	options = parser.parse_args(arguments)
+	if options.command == "convert":
+		return Convert(options.reports, options.output_directory, options.name, options.jobs)
+	else:
+		return Validate(options.artifacts)
+
+
+if __name__ == "__main__":
+	exit(Main())
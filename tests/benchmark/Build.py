@@ -0,0 +1,366 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+End-to-end benchmark of ``sphinx-build`` on a generated project using every directive against large synthetic reports.
+
+Measured scenarios:
+
+* ``html-cold``:     HTML build with a fresh environment.
+* ``html-warm``:     Rebuild without any change.
+* ``html-change``:   Rebuild after regenerating a single unittest report.
+* ``html-parallel``: HTML build with a fresh environment and ``-j <jobs>``.
+* ``latex-cold``:    LaTeX build (without running LaTeX) with a fresh environment.
+
+Every build runs ``python -m sphinx`` in a subprocess, so class-level caches of one build can't speed up the next one.
+The harness doesn't access the network. Results are written as JSON, which can be compared to the results of another
+sphinx-reports version with ``--baseline``.
+
+Run with: ``python -m tests.benchmark.Build --size 10000 --jobs 4 --output report/benchmark/build.json``
+"""
+from argparse   import ArgumentParser
+from json       import dumps, loads
+from os         import environ
+from pathlib    import Path
+from platform   import python_version
+from statistics import median
+from subprocess import run
+from sys        import executable
+from tempfile   import TemporaryDirectory
+from textwrap   import dedent
+from time       import perf_counter
+from typing     import Any, Dict, Iterable, List, Optional as Nullable, Tuple
+from unittest   import TestCase
+
+from sphinx import __version__ as sphinxVersion
+
+from sphinx_reports import __version__ as sphinxReportsVersion, ReportDomain
+
+from tests.benchmark.Generators import CoverageJSON, JUnitXML, PythonPackage, ImportTimeLog
+
+
+FORMAT_VERSION = 1  #: Version of the JSON result format. Results of different format versions aren't comparable.
+
+EXCLUDED_DIRECTIVES = {
+	"module-coverage": "renders a fixed source file instead of the referenced report",
+}  #: Directives not used by the generated project, with the reason.
+
+# Legends use the vertical table style, as the horizontal style isn't implemented yet.
+DOCUMENTS: Dict[str, str] = {
+	"codecov": dedent("""\
+		.. report:code-coverage::
+		   :reportid: synthetic
+
+		.. report:code-coverage-legend::
+		   :reportid: synthetic
+		   :style: vertical-table
+		"""),
+	"doccov": dedent("""\
+		.. report:doc-coverage::
+		   :reportid: synthetic
+
+		.. report:doc-coverage-legend::
+		   :reportid: synthetic
+		   :style: vertical-table
+		"""),
+	"dependency": dedent("""\
+		.. report:dependency-table::
+		   :source: requirements.txt
+		"""),
+	"importtime": dedent("""\
+		.. report:import-time::
+		   :reportid: synthetic
+		"""),
+	"importgraph": dedent("""\
+		.. report:import-graph::
+		   :reportid: synthetic
+		"""),
+	"unittest": dedent("""\
+		.. report:unittest-badge::
+		   :reportid: synthetic
+
+		.. report:unittest-summary::
+		   :reportid: synthetic
+
+		.. report:unittest-duration-histogram::
+		   :reportid: synthetic
+
+		.. report:unittest-regressions::
+		   :reportid: synthetic
+
+		.. report:unittest-diff::
+		   :reportid: synthetic
+		   :baseline: baseline
+
+		.. report:unittest-utilization::
+		   :reportid: synthetic
+
+		.. report:unittest-flamegraph::
+		   :reportid: synthetic
+
+		.. report:unittest-failure-details::
+		   :reportid: synthetic
+		"""),
+	"plain": "Some text.\n",
+}  #: Generated documents (docname -> content without title).
+
+
+def GenerateProject(directory: Path, size: int) -> Path:
+	"""
+	Write a Sphinx project using every directive and the synthetic reports it references.
+
+	Code coverage and unittest reports contain ``size`` files or testcases, the import-time log contains ``size``
+	modules, and the analyzed Python package contains ``size // 10`` modules (at least 10), as docstring and import
+	analysis is much more expensive per file.
+
+	:param directory: Directory to create the project in.
+	:param size:      Size of the synthetic reports.
+	:return:          Path of the Sphinx source directory.
+	"""
+	source = directory / "source"
+	reports = directory / "reports"
+	source.mkdir(parents=True, exist_ok=True)
+
+	coverage = CoverageJSON(reports / "coverage.json", size)
+	package = PythonPackage(directory / "package", max(10, size // 10))
+	importTime = ImportTimeLog(reports / "importtime.log", size)
+	unittest = JUnitXML(reports / "unittest.xml", size)
+	baseline = JUnitXML(reports / "baseline.xml", size, seed=1)
+	(source / "requirements.txt").write_text("Sphinx>=7.0\ndocutils>=0.20\n", encoding="utf-8")
+
+	(source / "conf.py").write_text(dedent(f"""\
+		project = "Benchmark"
+		extensions = ["sphinx_reports"]
+		report_codecov_packages = {{
+			"synthetic": {{"name": "synthetic", "json_report": {str(coverage)!r}, "fail_below": 80, "levels": "default"}}
+		}}
+		report_doccov_packages = {{
+			"synthetic": {{"name": "synthetic", "directory": {str(package)!r}, "fail_below": 80, "levels": "default"}}
+		}}
+		report_importgraph_packages = {{
+			"synthetic": {{"name": "synthetic", "directory": {str(package)!r}}}
+		}}
+		report_importtime_logs = {{
+			"synthetic": {{"logs": {str(importTime)!r}}}
+		}}
+		report_unittest_testsuites = {{
+			"synthetic": {{"xml_report": {str(unittest)!r}, "history": {{"database": {str(reports / "history.sqlite")!r}}}}},
+			"baseline":  {{"xml_report": {str(baseline)!r}}}
+		}}
+		"""), encoding="utf-8")
+
+	toctree = "\n".join(f"   {docname}" for docname in DOCUMENTS)
+	(source / "index.rst").write_text(f"Benchmark\n#########\n\n.. toctree::\n\n{toctree}\n", encoding="utf-8")
+	for docname, content in DOCUMENTS.items():
+		(source / f"{docname}.rst").write_text(f"{docname}\n{'#' * len(docname)}\n\n{content}", encoding="utf-8")
+
+	return source
+
+
+def UsedDirectives() -> List[str]:
+	"""
+	Return the names of all directives used by the generated documents.
+	"""
+	return sorted({line.split("::")[0][len(".. report:"):] for content in DOCUMENTS.values() for line in content.splitlines() if line.startswith(".. report:")})
+
+
+def Build(source: Path, output: Path, builder: str = "html", jobs: int = 1, fresh: bool = False) -> float:
+	"""
+	Run ``python -m sphinx`` in a subprocess and return the wall-clock duration in seconds.
+
+	:param source:        Sphinx source directory.
+	:param output:        Output directory. The doctrees are written to ``<output>/.doctrees``.
+	:param builder:       Sphinx builder name.
+	:param jobs:          Number of parallel processes.
+	:param fresh:         If true, don't reuse a saved environment.
+	:return:              Duration of the build in seconds.
+	:raises RuntimeError: If the build fails.
+	"""
+	command = [executable, "-m", "sphinx", "-b", builder, "-q", "-j", str(jobs), str(source), str(output)]
+	if fresh:
+		command.insert(3, "-E")
+
+	start = perf_counter()
+	process = run(command, capture_output=True, text=True, env=environ | {"PYTHONHASHSEED": "0"})
+	duration = perf_counter() - start
+
+	if process.returncode != 0:
+		raise RuntimeError(f"Build '{' '.join(command)}' failed with exit code {process.returncode}:\n{process.stderr}")
+
+	return duration
+
+
+def Benchmark(directory: Path, size: int, jobs: int = 4, repeat: int = 3) -> Dict[str, Any]:
+	"""
+	Generate a project and measure all scenarios.
+
+	:param directory: Working directory for the project and build outputs.
+	:param size:      Size of the synthetic reports.
+	:param jobs:      Number of parallel processes of the ``html-parallel`` scenario.
+	:param repeat:    Number of measurements per scenario.
+	:return:          Results as JSON-compatible dictionary.
+	"""
+	source = GenerateProject(directory, size)
+	html = directory / "build" / "html"
+	unittest = directory / "reports" / "unittest.xml"
+
+	scenarios: Dict[str, Tuple[str, int, List[float]]] = {}
+
+	def measure(name: str, builder: str, parallel: int, builds: Iterable[float]) -> None:
+		scenarios[name] = (builder, parallel, list(builds))
+
+	def changeAndBuild(seed: int) -> float:
+		JUnitXML(unittest, size, seed=seed)
+		return Build(source, html)
+
+	measure("html-cold",     "html",  1,    (Build(source, html, fresh=True) for _ in range(repeat)))
+	measure("html-warm",     "html",  1,    (Build(source, html) for _ in range(repeat)))
+	measure("html-change",   "html",  1,    (changeAndBuild(2 + i) for i in range(repeat)))
+	measure("html-parallel", "html",  jobs, (Build(source, directory / "build" / "parallel", jobs=jobs, fresh=True) for _ in range(repeat)))
+	measure("latex-cold",    "latex", 1,    (Build(source, directory / "build" / "latex", "latex", fresh=True) for _ in range(repeat)))
+
+	return {
+		"format":     FORMAT_VERSION,
+		"versions":   {
+			"sphinx-reports": sphinxReportsVersion,
+			"sphinx":         sphinxVersion,
+			"python":         python_version(),
+		},
+		"parameters": {
+			"size":       size,
+			"jobs":       jobs,
+			"repeat":     repeat,
+			"directives": UsedDirectives(),
+		},
+		"scenarios":  {
+			name: {
+				"builder": builder,
+				"jobs":    parallel,
+				"times":   [round(duration, 6) for duration in durations],
+				"best":    round(min(durations), 6),
+				"median":  round(median(durations), 6),
+			} for name, (builder, parallel, durations) in scenarios.items()
+		}
+	}
+
+
+def Compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, float]:
+	"""
+	Return the ratio of the best durations per scenario (``results / baseline``); ratios above 1.0 are slowdowns.
+
+	:param results:     Results of the current run.
+	:param baseline:    Results of a previous run, e.g. of another sphinx-reports version.
+	:return:            Ratio per scenario measured in both runs.
+	:raises ValueError: If the results were measured with a different format or different parameters.
+	"""
+	if results["format"] != baseline["format"]:
+		raise ValueError(f"Result format {results['format']} differs from baseline format {baseline['format']}.")
+
+	for parameter in ("size", "jobs"):
+		if results["parameters"][parameter] != baseline["parameters"][parameter]:
+			raise ValueError(f"Parameter '{parameter}' differs: {results['parameters'][parameter]} vs. {baseline['parameters'][parameter]} (baseline).")
+
+	return {
+		name: scenario["best"] / baseline["scenarios"][name]["best"]
+		for name, scenario in results["scenarios"].items()
+		if name in baseline["scenarios"]
+	}
+
+
+def Main(arguments: Nullable[List[str]] = None) -> int:
+	parser = ArgumentParser(prog="python -m tests.benchmark.Build", description="End-to-end sphinx-build benchmark of sphinx-reports.")
+	parser.add_argument("--size",     type=int,  default=10000, help="Size of the synthetic reports (default: 10000).")
+	parser.add_argument("--jobs",     type=int,  default=4,     help="Number of processes of the parallel build (default: 4).")
+	parser.add_argument("--repeat",   type=int,  default=3,     help="Number of measurements per scenario (default: 3).")
+	parser.add_argument("--output",   type=Path, default=Path("report/benchmark/build.json"), help="JSON result file.")
+	parser.add_argument("--baseline", type=Path, default=None,  help="JSON result file of a previous run to compare with.")
+	parser.add_argument("--keep",     type=Path, default=None,  help="Generate the project in this directory and keep it.")
+	options = parser.parse_args(arguments)
+
+	if options.keep is not None:
+		options.keep.mkdir(parents=True, exist_ok=True)
+		results = Benchmark(options.keep, options.size, options.jobs, options.repeat)
+	else:
+		with TemporaryDirectory() as directory:
+			results = Benchmark(Path(directory), options.size, options.jobs, options.repeat)
+
+	options.output.parent.mkdir(parents=True, exist_ok=True)
+	options.output.write_text(dumps(results, indent=2) + "\n", encoding="utf-8")
+
+	print(f"sphinx-reports {sphinxReportsVersion}, Sphinx {sphinxVersion}, Python {python_version()}, size {options.size}")
+	ratios = {}
+	if options.baseline is not None:
+		try:
+			ratios = Compare(results, loads(options.baseline.read_text(encoding="utf-8")))
+		except ValueError as ex:
+			print(f"ERROR: Results aren't comparable to baseline '{options.baseline}': {ex}")
+			return 1
+
+	for name, scenario in results["scenarios"].items():
+		ratio = f"  ×{ratios[name]:.2f} vs. baseline" if name in ratios else ""
+		print(f"  {name:<14} best {scenario['best']:8.3f} s  median {scenario['median']:8.3f} s{ratio}")
+
+	return 0
+
+
+class BuildHarness(TestCase):
+	def test_AllDirectivesUsed(self) -> None:
+		self.assertListEqual(sorted(set(ReportDomain.directives) - set(EXCLUDED_DIRECTIVES)), UsedDirectives())
+
+	def test_SmallBenchmark(self) -> None:
+		with TemporaryDirectory() as directory:
+			results = Benchmark(Path(directory), 20, jobs=2, repeat=1)
+
+			html = Path(directory) / "build" / "html"
+			self.assertIn("report-unittest", (html / "unittest.html").read_text(encoding="utf-8"))
+
+			# A single-report change must rebuild only the documents referencing the changed report.
+			before = {docname: (html / f"{docname}.html").stat().st_mtime_ns for docname in ("unittest", "plain")}
+			JUnitXML(Path(directory) / "reports" / "unittest.xml", 20, seed=99)
+			Build(Path(directory) / "source", html)
+			self.assertNotEqual(before["unittest"], (html / "unittest.html").stat().st_mtime_ns)
+			self.assertEqual(before["plain"], (html / "plain.html").stat().st_mtime_ns)
+			self.assertTrue((Path(directory) / "build" / "latex" / "benchmark.tex").exists())
+
+		self.assertEqual(FORMAT_VERSION, results["format"])
+		self.assertEqual(sphinxReportsVersion, results["versions"]["sphinx-reports"])
+		self.assertListEqual(["html-cold", "html-warm", "html-change", "html-parallel", "latex-cold"], list(results["scenarios"]))
+		self.assertEqual(2, results["scenarios"]["html-parallel"]["jobs"])
+		self.assertEqual("latex", results["scenarios"]["latex-cold"]["builder"])
+
+		ratios = Compare(results, results)
+		self.assertTrue(all(ratio == 1.0 for ratio in ratios.values()))
+
+		with self.assertRaises(ValueError):
+			Compare(results, results | {"parameters": results["parameters"] | {"size": 10}})
+
+
+if __name__ == "__main__":
+	exit(Main())
@@ -0,0 +1,255 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Deterministic generators of synthetic reports and packages for benchmarks.
+
+All generators take a size and a seed, so the same input produces byte-identical files.
+"""
+from json    import dumps
+from pathlib import Path
+from random  import Random
+from typing  import List
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def _ModulePaths(packageName: str, files: int, modulesPerPackage: int = 20) -> List[str]:
+	"""
+	Distribute ``files`` source files into a two-level package hierarchy.
+
+	Every package gets an ``__init__.py``, so the number of files is exactly ``files``.
+	"""
+	paths = [f"{packageName}/__init__.py"]
+	index = 0
+	while len(paths) < files:
+		subPackage = f"{packageName}/sub{index // (modulesPerPackage * 10)}"
+		package = f"{subPackage}/pkg{index // modulesPerPackage}"
+		if index % (modulesPerPackage * 10) == 0:
+			paths.append(f"{subPackage}/__init__.py")
+		if index % modulesPerPackage == 0 and len(paths) < files:
+			paths.append(f"{package}/__init__.py")
+		if len(paths) < files:
+			paths.append(f"{package}/module{index}.py")
+		index += 1
+
+	return paths[:files]
+
+
+def CoverageJSON(file: Path, files: int, packageName: str = "synthetic", seed: int = 0) -> Path:
+	"""
+	Write a Coverage.py JSON report (format 3) with ``files`` source files.
+
+	:param file:        Path of the JSON file to write.
+	:param files:       Number of source files in the report.
+	:param packageName: Name of the top-level package.
+	:param seed:        Seed of the random number generator.
+	:return:            The written file.
+	"""
+	random = Random(seed)
+
+	fileRecords = {}
+	for path in _ModulePaths(packageName, files):
+		statements = random.randint(5, 400)
+		excluded = random.randint(0, statements // 20)
+		covered = random.randint(0, statements)
+		branches = random.randint(0, statements // 2) * 2
+		coveredBranches = random.randint(0, branches)
+		partialBranches = random.randint(0, branches - coveredBranches)
+		fileRecords[path] = {
+			"executed_lines": [],
+			"summary": {
+				"covered_lines":        covered,
+				"num_statements":       statements,
+				"percent_covered":      100.0 * (covered + coveredBranches) / max(1, statements + branches),
+				"percent_covered_display": "0",
+				"missing_lines":        statements - covered,
+				"excluded_lines":       excluded,
+				"num_branches":         branches,
+				"num_partial_branches": partialBranches,
+				"covered_branches":     coveredBranches,
+				"missing_branches":     branches - coveredBranches,
+			},
+			"missing_lines":  [],
+			"excluded_lines": [],
+		}
+
+	report = {
+		"meta": {
+			"format":          3,
+			"version":         "7.6.0",
+			"timestamp":       "2024-01-01T00:00:00.000000",
+			"branch_coverage": True,
+			"show_contexts":   False,
+		},
+		"files": fileRecords,
+		"totals": {},
+	}
+
+	file.parent.mkdir(parents=True, exist_ok=True)
+	file.write_text(dumps(report), encoding="utf-8")
+	return file
+
+
+def JUnitXML(file: Path, testcases: int, testcasesPerTestsuite: int = 25, seed: int = 0) -> Path:
+	"""
+	Write a JUnit XML report with ``testcases`` testcases.
+
+	About 5 % of the testcases fail, 3 % are skipped and 1 % are errored. Testsuites are distributed over four hosts.
+
+	:param file:                  Path of the XML file to write.
+	:param testcases:             Number of testcases in the report.
+	:param testcasesPerTestsuite: Number of testcases per testsuite.
+	:param seed:                  Seed of the random number generator.
+	:return:                      The written file.
+	"""
+	random = Random(seed)
+
+	lines = ['<?xml version="1.0" encoding="UTF-8"?>', '<testsuites name="synthetic">']
+	index = 0
+	testsuite = 0
+	while index < testcases:
+		testsuiteName = f"Group{testsuite // 10}.Suite{testsuite}"
+		lines.append(f'  <testsuite name="{testsuiteName}" timestamp="2024-01-01T00:{testsuite // 60 % 60:02}:{testsuite % 60:02}" hostname="host{testsuite % 4}">')
+		for _ in range(min(testcasesPerTestsuite, testcases - index)):
+			duration = random.expovariate(20.0)
+			outcome = random.random()
+			if outcome < 0.05:
+				lines.append(f'    <testcase name="test{index}" classname="{testsuiteName}" time="{duration:.6f}" assertions="{random.randint(1, 9)}">')
+				lines.append(f'      <failure message="Assertion failed in test{index}" type="AssertionError">Traceback of test{index}</failure>')
+				lines.append('    </testcase>')
+			elif outcome < 0.08:
+				lines.append(f'    <testcase name="test{index}" classname="{testsuiteName}" time="0.0"><skipped message="skipped"/></testcase>')
+			elif outcome < 0.09:
+				lines.append(f'    <testcase name="test{index}" classname="{testsuiteName}" time="{duration:.6f}"><error message="RuntimeError" type="RuntimeError"/></testcase>')
+			else:
+				lines.append(f'    <testcase name="test{index}" classname="{testsuiteName}" time="{duration:.6f}" assertions="{random.randint(1, 9)}"/>')
+			index += 1
+		lines.append('  </testsuite>')
+		testsuite += 1
+	lines.append('</testsuites>')
+
+	file.parent.mkdir(parents=True, exist_ok=True)
+	file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+	return file
+
+
+def PythonPackage(directory: Path, files: int, packageName: str = "synthetic", seed: int = 0) -> Path:
+	"""
+	Write a Python package with ``files`` source files containing partially documented classes and functions.
+
+	Modules import siblings and ``json``/``typing``, so the package has a non-trivial import graph.
+
+	:param directory:   Directory to create the package in.
+	:param files:       Number of source files.
+	:param packageName: Name of the top-level package.
+	:param seed:        Seed of the random number generator.
+	:return:            Path of the package directory.
+	"""
+	random = Random(seed)
+
+	paths = _ModulePaths(packageName, files)
+	modules = [path[:-3].replace("/", ".").removesuffix(".__init__") for path in paths]
+	for path, module in zip(paths, modules):
+		lines = []
+		if random.random() < 0.7:
+			lines.append(f'"""Module {module}."""')
+		lines.append("from json   import dumps")
+		lines.append("from typing import Any")
+		for imported in random.sample(modules, k=min(2, len(modules))):
+			if imported != module and not imported.startswith(f"{module}."):
+				lines.append(f"import {imported}")
+		lines.append("")
+
+		for classIndex in range(random.randint(1, 3)):
+			lines.append(f"class Class{classIndex}:")
+			if random.random() < 0.6:
+				lines.append(f'\t"""Class {classIndex}."""')
+			for methodIndex in range(random.randint(1, 4)):
+				lines.append(f"\tdef method{methodIndex}(self, value: Any) -> str:")
+				if random.random() < 0.5:
+					lines.append(f'\t\t"""Method {methodIndex}."""')
+				lines.append("\t\treturn dumps(value)")
+			lines.append("")
+
+		lines.append("def function(value: Any) -> str:")
+		if random.random() < 0.5:
+			lines.append('\t"""Function."""')
+		lines.append("\treturn dumps(value)")
+
+		file = directory / path
+		file.parent.mkdir(parents=True, exist_ok=True)
+		file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+	return directory / packageName
+
+
+def ImportTimeLog(file: Path, modules: int, seed: int = 0) -> Path:
+	"""
+	Write a ``python -X importtime`` log with ``modules`` imported modules in a tree of depth up to 6.
+
+	:param file:    Path of the log file to write.
+	:param modules: Number of imported modules.
+	:param seed:    Seed of the random number generator.
+	:return:        The written file.
+	"""
+	random = Random(seed)
+
+	# Generate the tree in pre-order, then emit it in post-order like Python does.
+	entries = []  # (depth, name, self time)
+	depth = 0
+	for index in range(modules):
+		depth = random.randint(0, min(depth + 1, 5)) if index > 0 else 0
+		entries.append((depth, f"module{index}", random.randint(10, 2000)))
+
+	lines = ["import time: self [us] | cumulative | imported package"]
+	stack = []  # (depth, name, self time, cumulative time)
+
+	def emit(entry) -> None:
+		entryDepth, name, selfTime, cumulative = entry
+		lines.append(f"import time: {selfTime:>9} | {cumulative:>10} | {'  ' * entryDepth} {name}")
+		if len(stack) > 0 and stack[-1][0] == entryDepth - 1:
+			parentDepth, parentName, parentSelf, parentCumulative = stack.pop()
+			stack.append((parentDepth, parentName, parentSelf, parentCumulative + cumulative))
+
+	for entryDepth, name, selfTime in entries:
+		while len(stack) > 0 and stack[-1][0] >= entryDepth:
+			emit(stack.pop())
+		stack.append((entryDepth, name, selfTime, selfTime))
+	while len(stack) > 0:
+		emit(stack.pop())
+
+	file.parent.mkdir(parents=True, exist_ok=True)
+	file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+	return file
@@ -0,0 +1,158 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Peak memory of ``sphinx-build`` with serial and parallel reading of a generated project (see :mod:`tests.benchmark.Build`).
+
+The proportional set size (PSS) of the ``sphinx-build`` process and all its worker processes is sampled from
+:file:`/proc/<pid>/smaps_rollup`. PSS splits pages shared by forked workers evenly between them, so the sum over all
+processes is the memory actually used. Preloaded report models are inherited copy-on-write by forked read workers; pages
+touched by a worker (e.g. by reference counting) become private copies. Thus, peak memory grows with the number of
+workers.
+
+Run with: ``python -m tests.benchmark.Memory --size 10000 --jobs 1 8``
+"""
+from argparse   import ArgumentParser
+from os         import environ
+from pathlib    import Path
+from subprocess import Popen, DEVNULL, PIPE
+from sys        import executable, platform
+from tempfile   import TemporaryDirectory
+from time       import sleep
+from typing     import Dict, Iterable, List, Optional as Nullable
+from unittest   import TestCase, skipUnless
+
+from tests.benchmark.Build import GenerateProject
+
+
+def _Children(pid: int) -> List[int]:
+	children = []
+	for task in Path(f"/proc/{pid}/task").iterdir():
+		try:
+			children.extend(int(child) for child in (task / "children").read_text().split())
+		except OSError:
+			pass
+
+	return children
+
+
+def _ProcessTree(pid: int) -> List[int]:
+	pids = [pid]
+	for current in pids:
+		try:
+			pids.extend(_Children(current))
+		except OSError:
+			pass
+
+	return pids
+
+
+def _PSS(pid: int) -> int:
+	try:
+		for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+			if line.startswith("Pss:"):
+				return int(line.split()[1]) * 1024
+	except OSError:
+		pass
+
+	return 0
+
+
+def PeakMemory(source: Path, output: Path, jobs: int, interval: float = 0.02) -> Dict[str, int]:
+	"""
+	Run a fresh HTML build and sample the memory of all its processes.
+
+	:param source:        Sphinx source directory.
+	:param output:        Output directory.
+	:param jobs:          Number of parallel processes.
+	:param interval:      Sampling interval in seconds.
+	:return:              Peak PSS sum over all processes and peak number of processes.
+	:raises RuntimeError: If the build fails.
+	"""
+	command = [executable, "-m", "sphinx", "-E", "-b", "html", "-q", "-j", str(jobs), str(source), str(output)]
+	process = Popen(command, stdout=DEVNULL, stderr=PIPE, text=True, env=environ | {"PYTHONHASHSEED": "0"})
+
+	peakPSS = 0
+	peakProcesses = 0
+	while process.poll() is None:
+		pids = _ProcessTree(process.pid)
+		peakPSS = max(peakPSS, sum(_PSS(pid) for pid in pids))
+		peakProcesses = max(peakProcesses, len(pids))
+		sleep(interval)
+
+	_, errors = process.communicate()
+	if process.returncode != 0:
+		raise RuntimeError(f"Build '{' '.join(command)}' failed with exit code {process.returncode}:\n{errors}")
+
+	return {"pss": peakPSS, "processes": peakProcesses}
+
+
+def Benchmark(directory: Path, size: int, jobs: Iterable[int]) -> Dict[int, Dict[str, int]]:
+	"""
+	Generate a project and measure the peak memory of builds with each number of parallel processes.
+
+	:param directory: Working directory for the project and build outputs.
+	:param size:      Size of the synthetic reports.
+	:param jobs:      Numbers of parallel processes.
+	:return:          Peak memory per number of parallel processes.
+	"""
+	source = GenerateProject(directory, size)
+
+	return {parallel: PeakMemory(source, directory / "build" / f"j{parallel}", parallel) for parallel in jobs}
+
+
+def Main(arguments: Nullable[List[str]] = None) -> int:
+	parser = ArgumentParser(prog="python -m tests.benchmark.Memory", description="Peak memory of serial and parallel sphinx-build runs.")
+	parser.add_argument("--size", type=int, default=10000,   help="Size of the synthetic reports (default: 10000).")
+	parser.add_argument("--jobs", type=int, default=[1, 8],  nargs="+", help="Numbers of parallel processes (default: 1 8).")
+	options = parser.parse_args(arguments)
+
+	with TemporaryDirectory() as directory:
+		results = Benchmark(Path(directory), options.size, options.jobs)
+
+	serial = results[min(results)]["pss"]
+	for parallel, result in results.items():
+		print(f"  -j {parallel:<3} peak PSS {result['pss'] / 2**20:8.1f} MiB  ×{result['pss'] / serial:.2f}  ({result['processes']} processes)")
+
+	return 0
+
+
+@skipUnless(platform == "linux", "Memory is sampled from /proc.")
+class MemoryHarness(TestCase):
+	def test_SmallBenchmark(self) -> None:
+		with TemporaryDirectory() as directory:
+			results = Benchmark(Path(directory), 20, (1, 2))
+
+		self.assertGreater(results[1]["pss"], 0)
+		self.assertGreaterEqual(results[2]["processes"], results[1]["processes"])
+
+
+if __name__ == "__main__":
+	exit(Main())
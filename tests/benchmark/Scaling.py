@@ -0,0 +1,327 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Micro-benchmarks measuring how report conversion, aggregation and table generation scale with the report size.
+
+Each benchmark is measured for sizes from 10 up to ``SPHINX_REPORTS_BENCHMARK_MAX_SIZE`` (default: 10 000; use 100 000
+for full scaling curves). The scaling exponent is fitted on a log-log scale for sizes of at least 100 (smaller sizes are
+dominated by constant overhead). A benchmark fails, if the exponent exceeds :attr:`ScalingBenchmark.maxExponent`, e.g.
+because of quadratic behavior. Scaling curves are written to :file:`report/benchmark/<benchmark>.json`.
+
+Run with: ``python -m pytest -s tests/benchmark``
+"""
+from json       import dumps
+from math       import log
+from os         import environ
+from pathlib    import Path
+from tempfile   import TemporaryDirectory
+from time       import perf_counter
+from typing     import Any, Callable, ClassVar, List, Tuple
+from unittest   import TestCase
+
+from sphinx_reports.Adapter.Coverage    import Analyzer
+from sphinx_reports.Adapter.DocCoverage import IncrementalDocStrCoverage
+from sphinx_reports.Adapter.ImportGraph import ImportGraphAnalyzer
+from sphinx_reports.Adapter.ImportTime  import ImportTimeReader
+from sphinx_reports.Adapter.JUnit       import JUnitCounts
+from sphinx_reports.CodeCoverage        import CodeCoverage, CodeCoverageBase
+from sphinx_reports.DocCoverage         import DocStrCoverage, DocCoverageBase
+from sphinx_reports.ImportGraph         import ImportGraph
+from sphinx_reports.ImportTime          import ImportTime, ImportTimeBase
+from sphinx_reports.Unittest            import UnittestBase, UnittestSummary, ShowTestcases
+
+from tests.benchmark.Generators import CoverageJSON, JUnitXML, PythonPackage, ImportTimeLog
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def _Renderer(directiveClass: type, **attributes: Any) -> Any:
+	"""
+	Create a directive instance without a reST parser state, like :meth:`DocStrCoverage.GeneratePlaceholderTable`.
+	"""
+	renderer = directiveClass.__new__(directiveClass)
+	renderer._reportID = "benchmark"
+	renderer._cssClasses = []
+	for name, value in attributes.items():
+		setattr(renderer, f"_{name}", value)
+
+	return renderer
+
+
+class ScalingBenchmark(TestCase):
+	maxSize:     ClassVar[int] =   int(environ.get("SPHINX_REPORTS_BENCHMARK_MAX_SIZE", "10000"))
+	maxExponent: ClassVar[float] = 1.35  #: Upper bound of the fitted exponent (1.0 is linear, 2.0 is quadratic).
+	fitFrom:     ClassVar[int] =   100   #: Smallest size used to fit the exponent.
+	minDuration: ClassVar[float] = 0.05  #: Repeat a measurement until this duration (in seconds) is reached.
+
+	_directory: TemporaryDirectory
+	_root:      Path
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._root = Path(self._directory.name)
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def _Sizes(self, maxSize: int = 0) -> List[int]:
+		maxSize = min(self.maxSize, maxSize) if maxSize > 0 else self.maxSize
+		sizes = []
+		size = 10
+		while size <= maxSize:
+			sizes.append(size)
+			size *= 10
+
+		return sizes
+
+	def _Measure(self, run: Callable[[], Any]) -> float:
+		"""
+		Return the best duration of several runs. Fast runs are repeated until :attr:`minDuration` is reached.
+		"""
+		best = float("inf")
+		total = 0.0
+		runs = 0
+		while runs < 3 or (total < self.minDuration and runs < 1000):
+			start = perf_counter()
+			run()
+			duration = perf_counter() - start
+			best = min(best, duration)
+			total += duration
+			runs += 1
+
+			if duration > 1.0:
+				break
+
+		return best
+
+	@staticmethod
+	def _FitExponent(curve: List[Tuple[int, float]]) -> float:
+		"""
+		Fit ``duration = c * size ** exponent`` by linear least squares on a log-log scale.
+		"""
+		xs = [log(size) for size, _ in curve]
+		ys = [log(max(duration, 1e-9)) for _, duration in curve]
+		meanX = sum(xs) / len(xs)
+		meanY = sum(ys) / len(ys)
+
+		return sum((x - meanX) * (y - meanY) for x, y in zip(xs, ys)) / sum((x - meanX) ** 2 for x in xs)
+
+	def _Scale(self, name: str, prepare: Callable[[int, Path], Any], run: Callable[[Any], Any], maxSize: int = 0) -> None:
+		"""
+		Measure ``run`` for all sizes, report the scaling curve and assert the complexity bound.
+
+		:param name:    Name of the benchmark.
+		:param prepare: Creates the input for a size in a given directory (not measured).
+		:param run:     The measured operation.
+		:param maxSize: Optional lower size limit for expensive benchmarks.
+		"""
+		curve: List[Tuple[int, float]] = []
+		for size in self._Sizes(maxSize):
+			data = prepare(size, self._root / f"{name}-{size}")
+			curve.append((size, self._Measure(lambda: run(data))))
+
+		fitted = [(size, duration) for size, duration in curve if size >= self.fitFrom]
+		exponent = self._FitExponent(fitted) if len(fitted) >= 2 else float("nan")
+
+		print(f"\n{name}: exponent {exponent:.2f}")
+		for size, duration in curve:
+			print(f"  {size:>7}: {duration * 1000:10.3f} ms  ({duration / size * 1e6:8.3f} us/item)")
+
+		reportDirectory = Path("report") / "benchmark"
+		reportDirectory.mkdir(parents=True, exist_ok=True)
+		(reportDirectory / f"{name}.json").write_text(dumps({
+			"benchmark": name,
+			"exponent":  exponent,
+			"curve":     [{"size": size, "seconds": duration} for size, duration in curve],
+		}, indent=2), encoding="utf-8")
+
+		if len(fitted) >= 2:
+			self.assertLess(exponent, self.maxExponent, f"{name} scales with exponent {exponent:.2f}.")
+
+
+class Harness(TestCase):
+	def test_FitExponent(self) -> None:
+		sizes = (100, 1000, 10000, 100000)
+
+		self.assertAlmostEqual(1.0, ScalingBenchmark._FitExponent([(n, 2e-6 * n) for n in sizes]))
+		self.assertAlmostEqual(2.0, ScalingBenchmark._FitExponent([(n, 1e-9 * n * n) for n in sizes]))
+		self.assertLess(ScalingBenchmark._FitExponent([(n, 1e-7 * n * log(n)) for n in sizes]), ScalingBenchmark.maxExponent)
+		self.assertGreater(ScalingBenchmark._FitExponent([(n, 1e-9 * n ** 1.5) for n in sizes]), ScalingBenchmark.maxExponent)
+
+
+class CodeCoverageBenchmark(ScalingBenchmark):
+	@staticmethod
+	def _Convert(size: int, directory: Path) -> Any:
+		coverage = Analyzer("synthetic", CoverageJSON(directory / "coverage.json", size)).Convert()
+		return coverage
+
+	def test_Convert(self) -> None:
+		self._Scale(
+			"codecov-convert",
+			lambda size, directory: Analyzer("synthetic", CoverageJSON(directory / "coverage.json", size)),
+			lambda analyzer: analyzer.Convert()
+		)
+
+	def test_Aggregate(self) -> None:
+		def aggregate(coverage) -> None:
+			def walk(package) -> None:
+				package.AggregatedStatementCoverage
+				package.AggregatedBranchCoverage
+				for subPackage in package._packages.values():
+					walk(subPackage)
+
+			walk(coverage)
+
+		self._Scale("codecov-aggregate", self._Convert, aggregate)
+
+	def test_Table(self) -> None:
+		levels = CodeCoverageBase.defaultCoverageDefinitions["default"]
+		self._Scale(
+			"codecov-table",
+			lambda size, directory: _Renderer(CodeCoverage, coverage=self._Convert(size, directory), levels=levels, noBranchCoverage=False),
+			lambda renderer: renderer._GenerateCoverageTable()
+		)
+
+
+class DocCoverageBenchmark(ScalingBenchmark):
+	@staticmethod
+	def _Package(size: int, directory: Path) -> Path:
+		return PythonPackage(directory, size)
+
+	def test_Analyze(self) -> None:
+		def analyze(package: Path) -> None:
+			# Without a cache file, all files are analyzed each time.
+			analyzer = IncrementalDocStrCoverage("synthetic", package, None, 1)
+			analyzer.Analyze()
+
+		self._Scale("doccov-analyze", self._Package, analyze, maxSize=1000)
+
+	def test_ConvertAndAggregate(self) -> None:
+		def prepare(size: int, directory: Path) -> IncrementalDocStrCoverage:
+			analyzer = IncrementalDocStrCoverage("synthetic", self._Package(size, directory), None, 1)
+			analyzer.Analyze()
+			return analyzer
+
+		self._Scale("doccov-aggregate", prepare, lambda analyzer: analyzer.Convert().Aggregate())
+
+	def test_Table(self) -> None:
+		levels = DocCoverageBase.defaultCoverageDefinitions["default"]
+
+		def prepare(size: int, directory: Path) -> DocStrCoverage:
+			analyzer = IncrementalDocStrCoverage("synthetic", self._Package(size, directory), None, 1)
+			analyzer.Analyze()
+			coverage = analyzer.Convert()
+			coverage.Aggregate()
+			return _Renderer(DocStrCoverage, coverage=coverage, levels=levels)
+
+		self._Scale("doccov-table", prepare, lambda renderer: renderer._GenerateCoverageTable())
+
+
+class UnittestBenchmark(ScalingBenchmark):
+	def test_Load(self) -> None:
+		self._Scale(
+			"unittest-load",
+			lambda size, directory: JUnitXML(directory / "junit.xml", size),
+			UnittestBase._ConvertTestsuiteSummary
+		)
+
+	def test_Counts(self) -> None:
+		self._Scale(
+			"unittest-counts",
+			lambda size, directory: JUnitXML(directory / "junit.xml", size),
+			JUnitCounts.Scan
+		)
+
+	def test_SummaryTable(self) -> None:
+		def prepare(size: int, directory: Path) -> UnittestSummary:
+			testsuiteSummary, _ = UnittestBase._ConvertTestsuiteSummary(JUnitXML(directory / "junit.xml", size))
+			return _Renderer(
+				UnittestSummary,
+				testsuite=testsuiteSummary,
+				hideTestsuiteSummary=False,
+				testsuiteSummaryName="",
+				showTestcases=ShowTestcases.all,
+				noAssertions=False
+			)
+
+		self._Scale("unittest-summary-table", prepare, lambda renderer: renderer._GenerateTestSummaryTable())
+
+
+class ImportTimeBenchmark(ScalingBenchmark):
+	def test_Convert(self) -> None:
+		self._Scale(
+			"importtime-convert",
+			lambda size, directory: ImportTimeLog(directory / "importtime.log", size),
+			lambda log: ImportTimeReader("synthetic", [log]).Convert()
+		)
+
+	def test_Tables(self) -> None:
+		levels = ImportTimeBase.defaultLevelDefinitions["default"]
+
+		def prepare(size: int, directory: Path) -> ImportTime:
+			report = ImportTimeReader("synthetic", [ImportTimeLog(directory / "importtime.log", size)]).Convert()
+			return _Renderer(
+				ImportTime,
+				report=report,
+				levels=levels,
+				top=10,
+				maxDepth=0,
+				threshold=0.0,
+				packages={module.Name.rpartition(".")[0] for module in report.IterateModules()}
+			)
+
+		def run(renderer: ImportTime) -> None:
+			renderer._GenerateTopOffendersTable()
+			renderer._GenerateImportTreeTable()
+
+		self._Scale("importtime-tables", prepare, run)
+
+
+class ImportGraphBenchmark(ScalingBenchmark):
+	@staticmethod
+	def _Analyzer(size: int, directory: Path) -> ImportGraphAnalyzer:
+		analyzer = ImportGraphAnalyzer("synthetic", PythonPackage(directory, size), None, 1)
+		analyzer.Analyze()
+		return analyzer
+
+	def test_Convert(self) -> None:
+		self._Scale("importgraph-convert", self._Analyzer, lambda analyzer: analyzer.Convert(("json", )))
+
+	def test_Table(self) -> None:
+		self._Scale(
+			"importgraph-table",
+			lambda size, directory: _Renderer(ImportGraph, graph=self._Analyzer(size, directory).Convert(("json", )), packageName="synthetic"),
+			lambda renderer: renderer._GenerateImportTable()
+		)
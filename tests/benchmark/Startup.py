@@ -0,0 +1,62 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Import-time benchmark keeping the startup cost of ``sphinx_reports`` below a stated budget.
+
+The import is measured in a fresh interpreter after the modules Sphinx loads before it loads extensions. Wall-clock
+budgets depend on the machine, so the budget can be changed with ``SPHINX_REPORTS_BENCHMARK_IMPORT_BUDGET`` (in
+milliseconds, default: 60).
+
+Run with: ``python -m pytest -s tests/benchmark/Startup.py``
+"""
+from os       import environ
+from typing   import ClassVar
+from unittest import TestCase
+
+from tests.unit.Startup import ImportSphinxReports
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class StartupBenchmark(TestCase):
+	budget: ClassVar[float] = float(environ.get("SPHINX_REPORTS_BENCHMARK_IMPORT_BUDGET", "60")) / 1000  #: Budget for ``import sphinx_reports`` in seconds (best of :attr:`runs`).
+	runs:   ClassVar[int] =   5
+
+	def test_ImportTimeBudget(self) -> None:
+		# The first run may compile and cache bytecode, thus the best run is compared to the budget.
+		duration = min(ImportSphinxReports()["duration"] for _ in range(self.runs))
+
+		print(f"import sphinx_reports: {duration * 1000:.1f} ms (budget: {self.budget * 1000:.0f} ms)")
+		self.assertLess(duration, self.budget, f"Importing sphinx_reports took {duration * 1000:.1f} ms.")
@@ -0,0 +1,199 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for pre-converted report artifacts and the ``python -m sphinx_reports`` command line interface."""
+from contextlib import redirect_stderr, redirect_stdout
+from io         import StringIO
+from json       import dumps
+from pathlib    import Path
+from shutil     import copytree
+from tempfile   import TemporaryDirectory
+from textwrap   import dedent
+from unittest   import TestCase
+
+from sphinx.application import Sphinx
+
+from sphinx_reports.__main__ import Main
+from sphinx_reports.Artifact import ReportArtifact, ReportArtifactError
+from sphinx_reports.Store    import ReportStore
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def _Summary(statements: int, covered: int) -> dict:
+	return {
+		"covered_lines": covered, "num_statements": statements, "percent_covered": 100.0 * covered / statements,
+		"percent_covered_display": "0", "missing_lines": statements - covered, "excluded_lines": 0,
+		"num_branches": 4, "num_partial_branches": 1, "covered_branches": 2, "missing_branches": 2
+	}
+
+
+class Artifacts(TestCase):
+	_directory: TemporaryDirectory
+	_root:      Path
+	_reports:   Path
+
+	_document = dedent("""\
+		Index
+		#####
+
+		.. report:code-coverage::
+		   :reportid: src
+
+		.. report:doc-coverage::
+		   :reportid: src
+
+		.. report:unittest-summary::
+		   :reportid: src
+
+		.. report:unittest-badge::
+		   :reportid: src
+
+		.. report:unittest-failure-details::
+		   :reportid: src
+		""")
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._root = Path(self._directory.name)
+		self._reports = self._root / "reports"
+		self._reports.mkdir()
+
+		tests = Path(__file__).parent.parent
+		(self._reports / "coverage.json").write_text(dumps({
+			"meta":   {"format": 3, "version": "7.6.0", "timestamp": "2024-01-01T00:00:00", "branch_coverage": False, "show_contexts": False},
+			"files":  {
+				"partially/__init__.py": {"executed_lines": [], "summary": _Summary(10, 8), "missing_lines": [], "excluded_lines": []},
+				"partially/module.py":   {"executed_lines": [], "summary": _Summary(40, 10), "missing_lines": [], "excluded_lines": []},
+			},
+			"totals": {}
+		}), encoding="utf-8")
+		(self._reports / "junit.xml").write_bytes((tests / "data" / "unittest" / "junit-complete.xml").read_bytes())
+		copytree(tests / "packages" / "partially", self._reports / "partially")
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def _Main(self, *arguments: str) -> int:
+		with redirect_stdout(StringIO()), redirect_stderr(StringIO()):
+			return Main(list(arguments))
+
+	def _Convert(self) -> Path:
+		artifacts = self._root / "artifacts"
+		self.assertEqual(0, self._Main(
+			"convert", "-j", "2", "-o", str(artifacts), "--name", "partially",
+			str(self._reports / "coverage.json"), str(self._reports / "junit.xml"), f"doccov:{self._reports / 'partially'}"
+		))
+
+		return artifacts
+
+	def _Build(self, name: str, codecov: Path, doccov: Path, unittest: Path) -> str:
+		source = self._root / name
+		source.mkdir()
+		(source / "conf.py").write_text(dedent(f"""\
+			extensions = ["sphinx_reports"]
+			report_codecov_packages = {{"src": {{"name": "partially", "json_report": {str(codecov)!r}, "fail_below": 80, "levels": "default"}}}}
+			report_doccov_packages = {{"src": {{"name": "partially", "{'directory' if doccov.is_dir() else 'json_report'}": {str(doccov)!r}, "fail_below": 80, "levels": "default"}}}}
+			report_unittest_testsuites = {{"src": {{"xml_report": {str(unittest)!r}}}}}
+			"""), encoding="utf-8")
+		(source / "index.rst").write_text(self._document, encoding="utf-8")
+
+		application = Sphinx(source, source, source / "_build", source / "_doctrees", "html", status=None, warning=StringIO(), freshenv=True)
+		application.build()
+
+		html = (source / "_build" / "index.html").read_text(encoding="utf-8")
+		return html[html.index("<section"):html.rindex("</section>")]
+
+	def test_Convert(self) -> None:
+		artifacts = self._Convert()
+
+		self.assertSetEqual({"coverage.json.spxrpt", "junit.xml.spxrpt", "partially.spxrpt"}, {file.name for file in artifacts.iterdir()})
+		for file in artifacts.iterdir():
+			self.assertTrue(ReportArtifact.IsArtifact(file))
+		self.assertListEqual(["unittest", "unittest/counts", "unittest/index"], ReportStore(artifacts / "junit.xml.spxrpt").Keys)
+		self.assertEqual(8, ReportArtifact.Load(artifacts / "junit.xml.spxrpt", "unittest/counts").Tests)
+
+		self.assertEqual(0, self._Main("validate", *(str(file) for file in artifacts.iterdir())))
+
+	def test_SameOutput(self) -> None:
+		artifacts = self._Convert()
+
+		original = self._Build("original", self._reports / "coverage.json", self._reports / "partially", self._reports / "junit.xml")
+		converted = self._Build("converted", artifacts / "coverage.json.spxrpt", artifacts / "partially.spxrpt", artifacts / "junit.xml.spxrpt")
+
+		self.assertIn("report-codecov-table", original)
+		self.assertIn("report-doccov-table", original)
+		self.assertIn("report-unittest-failure", original)
+		self.assertEqual(original, converted)
+
+	def test_PerReportName(self) -> None:
+		artifacts = self._root / "artifacts"
+		self.assertEqual(0, self._Main(
+			"convert", "-o", str(artifacts), "--name", "default",
+			f"codecov:partially={self._reports / 'coverage.json'}", f"doccov:{self._reports / 'partially'}", str(self._reports / "junit.xml")
+		))
+
+		self.assertEqual("partially", ReportArtifact.Load(artifacts / "coverage.json.spxrpt", "codecov").Name)
+		self.assertEqual("default", ReportArtifact.Load(artifacts / "partially.spxrpt", "doccov").Name)
+
+	def test_DetectKind(self) -> None:
+		self.assertEqual("codecov", ReportArtifact.DetectKind(self._reports / "coverage.json"))
+		self.assertEqual("unittest", ReportArtifact.DetectKind(self._reports / "junit.xml"))
+		self.assertEqual("doccov", ReportArtifact.DetectKind(self._reports / "partially"))
+		with self.assertRaises(ReportArtifactError):
+			ReportArtifact.DetectKind(self._reports / "partially" / "__init__.py")
+
+	def test_Errors(self) -> None:
+		self.assertEqual(2, self._Main("convert", str(self._reports / "missing.xml")))
+		self.assertEqual(2, self._Main("convert", "-o", str(self._root), str(self._reports / "junit.xml"), f"unittest:{self._reports / 'junit.xml'}"))
+		self.assertEqual(1, self._Main("convert", f"codecov:partially={self._reports / 'junit.xml'}", "-o", str(self._root)))
+		# Coverage reports need a package name.
+		self.assertEqual(2, self._Main("convert", "-o", str(self._root), str(self._reports / "coverage.json")))
+		with self.assertRaises(ReportArtifactError):
+			ReportArtifact.Create("codecov", self._reports / "coverage.json", self._root / "coverage.spxrpt")
+
+		artifact = ReportArtifact.Create("unittest", self._reports / "junit.xml", self._root / "junit.spxrpt")
+		with self.assertRaises(ReportArtifactError):
+			ReportArtifact.Load(artifact, "codecov")
+
+		(self._root / "broken.spxrpt").write_bytes(artifact.read_bytes()[:100])
+		self.assertEqual(1, self._Main("validate", str(self._root / "broken.spxrpt")))
+
+		store = ReportStore(self._root / "old.spxrpt")
+		store.Put("codecov", "0.0.1:0123", {})
+		store.Commit()
+		store.Close()
+		with self.assertRaises(ReportArtifactError):
+			ReportArtifact.Load(self._root / "old.spxrpt", "codecov")
@@ -28,11 +28,16 @@
 # SPDX-License-Identifier: Apache-2.0                                                                                  #
 # ==================================================================================================================== #
 #
-"""Unit tests for the data model."""
-from pathlib  import Path
-from unittest import TestCase
+"""Unit tests for the data model and directives."""
+from pathlib       import Path
+from tempfile      import TemporaryDirectory
+from unittest      import TestCase
+from unittest.mock import patch
 
+from sphinx_reports.Common                 import ReportExtensionError
+from sphinx_reports.CodeCoverage           import CodeCoverageBase, ModuleCoverage as ModuleCoverageDirective
 from sphinx_reports.DataModel.CodeCoverage import ModuleCoverage, PackageCoverage
+from sphinx_reports.Store                  import ReportStore
 
 
 if __name__ == "__main__":
@@ -51,3 +56,65 @@ class Instantiation(TestCase):
 		cov = ModuleCoverage("myModule", Path("__init__.py"))
 
 		self.assertEqual(cov.Name, "myModule")
+
+
+class ModuleRecord(TestCase):
+	_directory: TemporaryDirectory
+	_report:    Path
+	_store:     ReportStore
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._report = Path(self._directory.name) / "coverage.json"
+		self._report.write_text("{}")
+
+		root = PackageCoverage("pkg", Path("pkg/__init__.py"))
+		module = ModuleCoverage("module", Path("pkg/module.py"), root)
+		module._totalStatements = 42
+		module._coverage = 0.5
+		ModuleCoverage("MyModule", Path("pkg/MyModule.py"), root)._coverage = 0.25
+
+		stat = self._report.stat()
+		file = Path(self._directory.name) / "reports.store"
+		store = ReportStore(file)
+		store.Put(f"{CodeCoverageBase.configPrefix}/pkg", f"{stat.st_mtime_ns}:{stat.st_size}", root)
+		store.Commit()
+		store.Close()
+		self._store = ReportStore(file)
+
+		configurations = {"pkg": {"name": "pkg", "json_report": self._report, "fail_below": 0.8, "levels": {}}}
+		for context in (
+			patch.dict(CodeCoverageBase._packageConfigurations, configurations),
+			patch.object(ReportStore, "Default", return_value=self._store)
+		):
+			context.start()
+			self.addCleanup(context.stop)
+
+	def tearDown(self) -> None:
+		self._store.Close()
+		self._directory.cleanup()
+
+	def test_ReadInPlace(self) -> None:
+		with patch.object(CodeCoverageBase, "_LoadCoverage", side_effect=AssertionError("converted")):
+			record = CodeCoverageBase._LoadModuleCoverage("pkg", "pkg.module")
+
+		self.assertEqual(42, record.Counters["TotalStatements"])
+		self.assertEqual(0.5, record.Coverage)
+		self.assertEqual(0, len(self._store._models))
+
+	def test_Outdated(self) -> None:
+		self._report.write_text("{ }")
+		with patch.object(CodeCoverageBase, "_LoadCoverage", side_effect=ReportExtensionError("converted")) as load:
+			with self.assertRaises(ReportExtensionError):
+				CodeCoverageBase._LoadModuleCoverage("pkg", "pkg.module")
+
+		load.assert_called_once_with("pkg")
+
+	def test_UnknownModule(self) -> None:
+		with self.assertRaises(ReportExtensionError):
+			CodeCoverageBase._LoadModuleCoverage("pkg", "pkg.other")
+
+	def test_MixedCase(self) -> None:
+		moduleName = ModuleCoverageDirective.option_spec["module"](" pkg.MyModule ")
+		self.assertEqual("pkg.MyModule", moduleName)
+		self.assertEqual(0.25, CodeCoverageBase._LoadModuleCoverage("pkg", moduleName).Coverage)
@@ -0,0 +1,134 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for the compact binary formats of converted report models."""
+from pathlib  import Path
+from unittest import TestCase
+
+from sphinx_reports.Codec                  import CodeCoverageCodec, CodecError
+from sphinx_reports.DataModel.CodeCoverage import PackageCoverage, ModuleCoverage
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+def _Model() -> PackageCoverage:
+	root = PackageCoverage("pkg", Path("__init__.py"))
+	sub = PackageCoverage("sub", Path("pkg/sub/__init__.py"), root)
+	ModuleCoverage("zeta", Path("pkg/zeta.py"), root)
+	ModuleCoverage("alpha", Path("pkg/alpha.py"), root)
+	ModuleCoverage("mödule", Path("pkg/sub/mödule.py"), sub)
+
+	for index, coverage in enumerate((root, sub, root["zeta"], root["alpha"], sub["mödule"]), start=1):
+		coverage._totalStatements = 10 * index
+		coverage._excludedStatements = index
+		coverage._coveredStatements = 5 * index
+		coverage._missingStatements = 5 * index
+		coverage._totalBranches = 4 * index
+		coverage._coveredBranches = 2 * index
+		coverage._partialBranches = index
+		coverage._missingBranches = index
+		coverage._coverage = 1 / index
+
+	return root
+
+
+class CodeCoverage(TestCase):
+	def _AssertEqual(self, expected, actual) -> None:
+		self.assertIs(type(expected), type(actual))
+		self.assertEqual(vars(expected).keys(), vars(actual).keys())
+		for field in ("_name", "_file", "_totalStatements", "_excludedStatements", "_coveredStatements", "_missingStatements", "_totalBranches", "_coveredBranches", "_partialBranches", "_missingBranches", "_coverage"):
+			self.assertEqual(getattr(expected, field), getattr(actual, field), field)
+
+		if isinstance(expected, PackageCoverage):
+			self.assertListEqual(list(expected.Modules), list(actual.Modules))
+			self.assertListEqual(list(expected.Packages), list(actual.Packages))
+			for name, module in expected.Modules.items():
+				self.assertIs(actual, actual.Modules[name].Parent)
+				self._AssertEqual(module, actual.Modules[name])
+			for name, package in expected.Packages.items():
+				self.assertIs(actual, actual.Packages[name].Parent)
+				self._AssertEqual(package, actual.Packages[name])
+
+	def test_RoundTrip(self) -> None:
+		model = _Model()
+		decoded = CodeCoverageCodec.Decode(CodeCoverageCodec.Encode(model))
+
+		self.assertIsNone(decoded.Parent)
+		self._AssertEqual(model, decoded)
+		self.assertEqual(model.AggregatedTotalStatements, decoded.AggregatedTotalStatements)
+
+	def test_RandomAccess(self) -> None:
+		with CodeCoverageCodec.View(CodeCoverageCodec.Encode(_Model())) as view:
+			self.assertEqual(5, len(view))
+
+			record = view["pkg.sub.mödule"]
+			self.assertEqual("mödule", record.Name)
+			self.assertEqual(Path("pkg/sub/mödule.py"), record.File)
+			self.assertFalse(record.IsPackage)
+			self.assertEqual(50, record.Counters["TotalStatements"])
+			self.assertAlmostEqual(0.2, record.Coverage)
+
+			parent = view.Record(record.Parent)
+			self.assertEqual("pkg.sub", parent.QualifiedName)
+			self.assertTrue(parent.IsPackage)
+			self.assertEqual(-1, view["pkg"].Parent)
+
+			for name in ("pkg.alpha", "pkg.zeta", "pkg.sub"):
+				self.assertEqual(name, view[name].QualifiedName)
+			with self.assertRaises(KeyError):
+				view.Find("pkg.beta")
+			with self.assertRaises(IndexError):
+				view.Record(5)
+
+	def test_Errors(self) -> None:
+		payload = CodeCoverageCodec.Encode(_Model())
+
+		with self.assertRaises(CodecError):
+			CodeCoverageCodec.Decode(b"SRCX" + payload[4:])
+		with self.assertRaises(CodecError):
+			CodeCoverageCodec.Decode(payload[:4] + b"\x02\x00" + payload[6:])
+		with self.assertRaises(CodecError):
+			CodeCoverageCodec.Decode(payload[:len(payload) // 2])
+
+		model = _Model()
+		model._totalStatements = 2**32
+		with self.assertRaises(CodecError):
+			CodeCoverageCodec.Encode(model)
+
+	def test_UnknownField(self) -> None:
+		model = _Model()
+		model["sub"]["mödule"]._extra = 1
+		with self.assertRaises(CodecError):
+			CodeCoverageCodec.Encode(model)
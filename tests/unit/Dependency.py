@@ -0,0 +1,276 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the dependency resolver."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from typing   import Iterable
+from unittest import TestCase
+
+from sphinx_reports.Adapter.Dependency       import DependencyError, DistributionIndex, DependencyScanner
+from sphinx_reports.Adapter.DependencySource import DependencySource
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Resolver(TestCase):
+	_directory: TemporaryDirectory
+	_index:     DistributionIndex
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+
+		self._AddDistribution("App", "1.0", ["Lib_A>=1.0", "lib-b", "Tool[extra] ; extra == 'cli'", "Ancient ; python_version < '3.0'"], license="MIT")
+		self._AddDistribution("lib_a", "1.2", ["lib-b<3", "lib-c"], classifiers=["License :: OSI Approved :: BSD License"])
+		self._AddDistribution("lib_b", "2.0", ["lib-a"])
+		self._AddDistribution("Tool", "0.1", ["lib-c", "lib-d ; extra == 'extra'"], licenseExpression="Apache-2.0")
+		self._AddDistribution("lib_d", "4.0", [])
+
+		self._index = DistributionIndex([self._directory.name])
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def _AddDistribution(self, name: str, version: str, requirements: Iterable[str], license: str = None, licenseExpression: str = None, classifiers: Iterable[str] = ()) -> None:
+		lines = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}"]
+		if license is not None:
+			lines.append(f"License: {license}")
+		if licenseExpression is not None:
+			lines.append(f"License-Expression: {licenseExpression}")
+		lines.extend(f"Classifier: {classifier}" for classifier in classifiers)
+		lines.extend(f"Requires-Dist: {requirement}" for requirement in requirements)
+
+		distInfo = Path(self._directory.name) / f"{name}-{version}.dist-info"
+		distInfo.mkdir()
+		(distInfo / "METADATA").write_text("\n".join(lines) + "\n")
+
+	def test_Index(self) -> None:
+		self.assertEqual(5, len(self._index))
+		self.assertIn("LIB-A", self._index)
+		self.assertNotIn("lib-c", self._index)
+		self.assertIsNone(self._index.Metadata("lib-c"))
+
+	def test_Tree(self) -> None:
+		scanner = DependencyScanner("app", self._index)
+		app = scanner.Distribution
+
+		self.assertEqual("App", app.Name)
+		self.assertEqual("1.0", str(app.Version))
+		self.assertListEqual(["MIT"], [str(license) for license in app.Licenses])
+		self.assertListEqual(["lib_a", "lib_b"], list(app.Dependencies))
+		self.assertEqual(">=1.0", str(app.Requirements["lib_a"]))
+		self.assertIsNone(app.Requirements["lib_b"])
+
+		libA = app.Dependencies["lib_a"]
+		self.assertListEqual(["BSD License"], [str(license) for license in libA.Licenses])
+		self.assertListEqual(["lib_b", "lib-c"], list(libA.Dependencies))
+		self.assertFalse(libA.Dependencies["lib-c"].IsInstalled)
+
+		# Shared dependencies and cycles are represented by a single instance.
+		self.assertIs(app.Dependencies["lib_b"], libA.Dependencies["lib_b"])
+		self.assertIs(libA, app.Dependencies["lib_b"].Dependencies["lib_a"])
+		self.assertListEqual(["lib_a", "lib_b", "lib-c"], [d.Name for d in app.IterateTransitiveDependencies()])
+
+	def test_Extras(self) -> None:
+		scanner = DependencyScanner("app[cli]", self._index)
+		app = scanner.Distribution
+
+		self.assertListEqual(["lib_a", "lib_b", "Tool"], list(app.Dependencies))
+		tool = app.Dependencies["Tool"]
+		self.assertListEqual(["Apache-2.0"], [str(license) for license in tool.Licenses])
+		self.assertListEqual(["lib-c", "lib_d"], list(tool.Dependencies))
+		self.assertIs(tool.Dependencies["lib-c"], app.Dependencies["lib_a"].Dependencies["lib-c"])
+
+	def test_MetadataReadOnce(self) -> None:
+		DependencyScanner("app[cli]", self._index)
+		metadata = dict(self._index._metadata)
+		self.assertEqual(5, len(metadata))
+
+		DependencyScanner("lib-a", self._index)
+		for name, md in self._index._metadata.items():
+			self.assertIs(metadata[name], md)
+
+	def test_NotInstalled(self) -> None:
+		with self.assertRaises(DependencyError):
+			DependencyScanner("lib-c", self._index)
+
+
+class Source(TestCase):
+	_directory: TemporaryDirectory
+	_path:      Path
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._path = Path(self._directory.name)
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def test_RequirementsFile(self) -> None:
+		(self._path / "unit").mkdir()
+		(self._path / "requirements.txt").write_text("pyTooling >= 8.15\nsphinx >= 9.1, < 10.0  # comment\n")
+		(self._path / "unit" / "requirements.txt").write_text("-r ../requirements.txt\n\n--index-url https://example.org\npytest ~= 9.1 --hash=sha256:00\nmypy[reports] ~= 2.1 ; python_version >= '3.12'\n")
+
+		source = DependencySource.Load(self._path / "unit" / "requirements.txt")
+		root = source.Distribution
+		self.assertListEqual(["pyTooling", "sphinx", "pytest", "mypy"], list(root.Dependencies))
+		self.assertEqual("~=9.1", str(root.Requirements["pytest"]))
+		self.assertEqual("<10.0,>=9.1", str(root.Requirements["sphinx"]))
+		self.assertEqual(2, len(source.Files))
+
+		# Cached as long as the content of all files is unchanged.
+		self.assertIs(source, DependencySource.Load(self._path / "unit" / "requirements.txt"))
+
+		(self._path / "requirements.txt").write_text("pyTooling >= 8.15\n")
+		changed = DependencySource.Load(self._path / "unit" / "requirements.txt")
+		self.assertIsNot(source, changed)
+		self.assertListEqual(["pyTooling", "pytest", "mypy"], list(changed.Distribution.Dependencies))
+
+	def test_PyProject(self) -> None:
+		(self._path / "requirements.txt").write_text("pyTooling >= 8.15\n")
+		(self._path / "pyproject.toml").write_text("""
+[build-system]
+requires = ["setuptools >= 83.0"]
+
+[project]
+name = "demo"
+version = "1.0"
+dynamic = ["dependencies"]
+
+[project.optional-dependencies]
+doc = ["sphinx >= 9.1"]
+
+[tool.setuptools.dynamic]
+dependencies = { file = ["requirements.txt"] }
+""")
+
+		root = DependencySource(self._path / "pyproject.toml").Distribution
+		self.assertEqual("demo", root.Name)
+		self.assertListEqual(["pyTooling", "demo[doc]", "demo (build-system)"], list(root.Dependencies))
+		self.assertListEqual(["sphinx"], list(root.Dependencies["demo[doc]"].Dependencies))
+
+	def test_SharedInclude(self) -> None:
+		(self._path / "common.txt").write_text("packaging\n-r a.txt\n")
+		(self._path / "a.txt").write_text("-r common.txt\nfoo\n")
+		(self._path / "b.txt").write_text("-r common.txt\nbar\n")
+		(self._path / "pyproject.toml").write_text("""
+[project]
+name = "x"
+dynamic = ["optional-dependencies"]
+
+[tool.setuptools.dynamic]
+optional-dependencies = { a = { file = ["a.txt"] }, b = { file = ["b.txt"] } }
+""")
+
+		source = DependencySource(self._path / "pyproject.toml")
+		root = source.Distribution
+		# Each extra gets the shared include, while the include cycle (common.txt -> a.txt) is read once.
+		self.assertListEqual(["packaging", "foo"], list(root.Dependencies["x[a]"].Dependencies))
+		self.assertListEqual(["packaging", "foo", "bar"], list(root.Dependencies["x[b]"].Dependencies))
+		self.assertEqual(4, len(source.Files))
+
+	def test_UvLock(self) -> None:
+		(self._path / "uv.lock").write_text("""
+version = 1
+
+[[package]]
+name = "demo"
+version = "1.0"
+source = { editable = "." }
+dependencies = [{ name = "requests" }]
+
+[[package]]
+name = "requests"
+version = "2.31.0"
+dependencies = [{ name = "idna" }, { name = "demo" }]
+
+[[package]]
+name = "idna"
+version = "3.6"
+""")
+
+		root = DependencySource(self._path / "uv.lock").Distribution
+		# 'demo' and 'requests' form a cycle, so the first package in the cycle becomes a root.
+		self.assertListEqual(["demo"], list(root.Dependencies))
+		self.assertIs(root.Dependencies["demo"], root.Dependencies["demo"].Dependencies["requests"].Dependencies["demo"])
+
+		(self._path / "uv.lock").write_text((self._path / "uv.lock").read_text().replace(', { name = "demo" }', ""))
+		root = DependencySource(self._path / "uv.lock").Distribution
+		demo = root.Dependencies["demo"]
+		self.assertEqual("1.0", str(demo.Version))
+		self.assertEqual("3.6", str(demo.Dependencies["requests"].Dependencies["idna"].Version))
+
+	def test_PoetryLock(self) -> None:
+		(self._path / "poetry.lock").write_text("""
+[[package]]
+name = "demo"
+version = "1.0"
+
+[package.dependencies]
+numpy = [
+	{ version = ">=1.26", markers = "python_version >= \\"3.12\\"" },
+	{ version = ">=1.24", markers = "python_version < \\"3.12\\"" },
+]
+requests = "*"
+idna = { version = "3.6", optional = true }
+
+[[package]]
+name = "numpy"
+version = "2.0.0"
+
+[[package]]
+name = "requests"
+version = "2.31.0"
+
+[[package]]
+name = "idna"
+version = "3.6"
+""")
+
+		root = DependencySource(self._path / "poetry.lock").Distribution
+		demo = root.Dependencies["demo"]
+		self.assertListEqual(["numpy", "requests", "idna"], list(demo.Dependencies))
+		self.assertEqual(">=1.26 | >=1.24", str(demo.Requirements["numpy"]))
+		self.assertIsNone(demo.Requirements["requests"])
+		self.assertEqual("3.6", str(demo.Requirements["idna"]))
+
+	def test_NotUTF8(self) -> None:
+		(self._path / "requirements.txt").write_bytes("pyTooling # \u00e4\n".encode("latin-1"))
+		with self.assertRaises(DependencyError):
+			DependencySource(self._path / "requirements.txt")
+
+	def test_Unsupported(self) -> None:
+		(self._path / "setup.cfg").write_text("")
+		with self.assertRaises(DependencyError):
+			DependencySource(self._path / "setup.cfg")
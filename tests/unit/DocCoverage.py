@@ -0,0 +1,237 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the incremental documentation coverage analyzer."""
+from os       import utime
+from pathlib  import Path
+from shutil   import copytree
+from tempfile import TemporaryDirectory
+from time     import time_ns
+from unittest import TestCase
+
+from sphinx_reports.Adapter.DocCoverage import IncrementalDocStrCoverage, DocCoverageJSONReport, AutodocCoverage
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Incremental(TestCase):
+	_directory: TemporaryDirectory
+	_package:   Path
+	_cacheFile: Path
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._package = Path(self._directory.name) / "partially"
+		self._cacheFile = Path(self._directory.name) / "cache" / "doccov.json"
+		copytree(Path(__file__).parent.parent / "packages" / "partially", self._package)
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def _Analyze(self) -> IncrementalDocStrCoverage:
+		analyzer = IncrementalDocStrCoverage("partially", self._package, self._cacheFile)
+		analyzer.Analyze()
+
+		return analyzer
+
+	def _TouchAll(self, mtime: int) -> None:
+		for file in (*self._package.iterdir(), self._package):
+			utime(file, ns=(mtime, mtime))
+
+	def test_ColdAndWarm(self) -> None:
+		analyzer = self._Analyze()
+		self.assertListEqual(["MyModule.py", "__init__.py"], analyzer.AnalyzedFiles)
+		self.assertTrue(self._cacheFile.exists())
+
+		coverage = analyzer.Convert()
+		coverage.Aggregate()
+
+		analyzer = self._Analyze()
+		self.assertListEqual([], analyzer.AnalyzedFiles)
+
+		cached = analyzer.Convert()
+		cached.Aggregate()
+		self.assertEqual(coverage.AggregatedExpected, cached.AggregatedExpected)
+		self.assertEqual(coverage.AggregatedCovered, cached.AggregatedCovered)
+		self.assertIn("MyModule", cached.Modules)
+
+	def test_ChangedFile(self) -> None:
+		self._Analyze()
+
+		moduleFile = self._package / "MyModule.py"
+		moduleFile.write_text(moduleFile.read_text() + "\n\ndef Function() -> None:\n\tpass\n")
+
+		analyzer = self._Analyze()
+		self.assertListEqual(["MyModule.py"], analyzer.AnalyzedFiles)
+
+	def test_TouchedFile(self) -> None:
+		self._Analyze()
+
+		initFile = self._package / "__init__.py"
+		stat = initFile.stat()
+		utime(initFile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+		analyzer = self._Analyze()
+		self.assertListEqual([], analyzer.AnalyzedFiles)
+
+	def test_RacilyChangedFile(self) -> None:
+		self._TouchAll(time_ns())
+		self._Analyze()
+
+		# Same size and modification time, as if the file was changed within the same timestamp granule.
+		moduleFile = self._package / "MyModule.py"
+		stat = moduleFile.stat()
+		moduleFile.write_text(moduleFile.read_text().replace("def Method", "def Mxthod"))
+		utime(moduleFile, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+		analyzer = self._Analyze()
+		self.assertListEqual(["MyModule.py"], analyzer.AnalyzedFiles)
+
+	def test_RacilyAddedFile(self) -> None:
+		self._TouchAll(time_ns())
+		self._Analyze()
+
+		# Same directory modification time, as if the file was added within the same timestamp granule.
+		stat = self._package.stat()
+		(self._package / "Added.py").write_text("")
+		utime(self._package, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+		analyzer = self._Analyze()
+		self.assertListEqual(["Added.py"], analyzer.AnalyzedFiles)
+
+	def test_OldFilesAreTrusted(self) -> None:
+		self._TouchAll(1_000_000_000)
+		self._Analyze()
+
+		stat = self._package.stat()
+		(self._package / "Added.py").write_text("")
+		utime(self._package, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+		analyzer = self._Analyze()
+		self.assertListEqual([], analyzer.AnalyzedFiles)
+
+	def test_DeletedFile(self) -> None:
+		self._Analyze()
+
+		(self._package / "MyModule.py").unlink()
+
+		analyzer = self._Analyze()
+		coverage = analyzer.Convert()
+		self.assertNotIn("MyModule", coverage.Modules)
+
+	def test_ScanSourceFiles(self) -> None:
+		analyzer = self._Analyze()
+		self.assertListEqual(["MyModule.py", "__init__.py"], analyzer.ScanSourceFiles())
+
+		(self._package / "sub").mkdir()
+		(self._package / "sub" / "__init__.py").write_text("")
+		(self._package / "notes.txt").write_text("")
+
+		analyzer = IncrementalDocStrCoverage("partially", self._package, self._cacheFile)
+		self.assertListEqual(["MyModule.py", "__init__.py", "sub/__init__.py"], analyzer.ScanSourceFiles())
+
+	def test_Parallel(self) -> None:
+		serial = IncrementalDocStrCoverage("partially", self._package, workers=1)
+		serial.Analyze()
+		parallel = IncrementalDocStrCoverage("partially", self._package, workers=2)
+		parallel.Analyze()
+
+		self.assertListEqual(serial.AnalyzedFiles, parallel.AnalyzedFiles)
+
+		serialCoverage = serial.Convert()
+		serialCoverage.Aggregate()
+		parallelCoverage = parallel.Convert()
+		parallelCoverage.Aggregate()
+		self.assertEqual(str(serialCoverage), str(parallelCoverage))
+		self.assertEqual(str(serialCoverage["MyModule"]), str(parallelCoverage["MyModule"]))
+
+
+class JSONReport(TestCase):
+	def test_RoundTrip(self) -> None:
+		analyzer = IncrementalDocStrCoverage("partially", Path(__file__).parent.parent / "packages" / "partially")
+		analyzer.Analyze()
+		coverage = analyzer.Convert()
+		coverage.Aggregate()
+
+		with TemporaryDirectory() as directory:
+			jsonFile = Path(directory) / "doccov.json"
+			analyzer.WriteJSONReport(jsonFile)
+			report = DocCoverageJSONReport("partially", jsonFile).Convert()
+
+		report.Aggregate()
+		self.assertEqual(str(coverage), str(report))
+		self.assertEqual(str(coverage["MyModule"]), str(report["MyModule"]))
+
+	def test_AbsolutePaths(self) -> None:
+		with TemporaryDirectory() as directory:
+			jsonFile = Path(directory) / "doccov.json"
+			jsonFile.write_text(
+				'{"directory": "/src/pkg", "files": {"/src/pkg/__init__.py": {"needed": 2, "found": 1, "missing": 1}, '
+				'"/src/pkg/Mod.py": {"needed": 4, "found": 4, "missing": 0}}}'
+			)
+			coverage = DocCoverageJSONReport("pkg", jsonFile).Convert()
+
+		coverage.Aggregate()
+		self.assertEqual(6, coverage.AggregatedExpected)
+		self.assertEqual(5, coverage.AggregatedCovered)
+		self.assertIn("Mod", coverage.Modules)
+
+
+class Autodoc(TestCase):
+	def test_Modules(self) -> None:
+		coverage = AutodocCoverage("pkg", {
+			"pkg":             ("module",   True),
+			"pkg.Function":    ("function", False),
+			"pkg.mod":         ("module",   False),
+			"pkg.mod.Class":   ("class",    True),
+			"pkg.mod.Class.M": ("method",   True),
+			"other.Function":  ("function", False),
+		})
+
+		self.assertNotIn("other.Function", coverage.Objects)
+
+		packageCoverage = coverage.Convert()
+		packageCoverage.Aggregate()
+		self.assertEqual(2, packageCoverage.Expected)
+		self.assertEqual(1, packageCoverage.Covered)
+		self.assertEqual(3, packageCoverage["mod"].Expected)
+		self.assertEqual(2, packageCoverage["mod"].Covered)
+		self.assertEqual(5, packageCoverage.AggregatedExpected)
+
+	def test_PackageOnly(self) -> None:
+		packageCoverage = AutodocCoverage("pkg", {"pkg": ("module", True), "pkg.Class": ("class", False)}).Convert()
+		packageCoverage.Aggregate()
+
+		self.assertEqual(0, len(packageCoverage.Modules))
+		self.assertEqual(2, packageCoverage.Expected)
@@ -0,0 +1,104 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for the testcase duration history."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from sphinx_reports.Adapter.History import DurationHistory, HistoryError
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class History(TestCase):
+	_directory: TemporaryDirectory
+	_history:   DurationHistory
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._history = DurationHistory(Path(self._directory.name) / "history" / "durations.sqlite")
+
+		#                 b1     b2    b3    b4    b5
+		durations = {
+			"slow":     (1.0,  1.0,  1.0,  1.0,  2.0),   # 2x slower
+			"noise":    (0.01, 0.01, 0.01, 0.01, 0.05),  # 5x slower, but below the minimum
+			"stable":   (1.0,  1.0,  1.0,  1.0,  1.1),   # below the threshold
+			"windowed": (10.0, 1.0,  1.0,  1.0,  1.5),   # slower compared to the last 3 builds only
+		}
+		for index in range(5):
+			self._history.AddBuild(f"b{index + 1}", [(name, values[index]) for name, values in durations.items()])
+
+	def tearDown(self) -> None:
+		self._history.Close()
+		self._directory.cleanup()
+
+	def test_Regressions(self) -> None:
+		self.assertListEqual(
+			[("slow", 1.0, 2.0, 3), ("windowed", 1.0, 1.5, 3)],
+			self._history.Regressions("b5", window=3, threshold=1.2, minimum=0.1)
+		)
+
+	def test_Window(self) -> None:
+		# The baseline of 'windowed' includes the slow first build.
+		self.assertListEqual([("slow", 1.0, 2.0, 4)], self._history.Regressions("b5", window=4, threshold=1.2, minimum=0.1))
+		# Only builds before the checked build form the baseline.
+		self.assertListEqual([], self._history.Regressions("b1", window=3, threshold=1.2, minimum=0.0))
+
+	def test_ThresholdAndMinimum(self) -> None:
+		self.assertListEqual(["slow"], [name for name, *_ in self._history.Regressions("b5", window=3, threshold=1.6, minimum=0.1)])
+		self.assertListEqual(["slow"], [name for name, *_ in self._history.Regressions("b5", window=3, threshold=1.2, minimum=0.6)])
+		self.assertListEqual(
+			["slow", "windowed", "stable", "noise"],
+			[name for name, *_ in self._history.Regressions("b5", window=3, threshold=1.05, minimum=0.0)]
+		)
+
+	def test_ReRecordBuild(self) -> None:
+		self._history.AddBuild("b3", [("slow", 5.0), ("windowed", 1.0)])
+
+		# 'b3' keeps its position in the history, so its baseline are 'b1' and 'b2'.
+		self.assertListEqual([("slow", 1.0, 5.0, 2)], self._history.Regressions("b3", window=3, threshold=1.2, minimum=0.1))
+		# Durations of 'b3' are replaced, so 'stable' and 'noise' have 2 samples and 'slow' got a higher baseline.
+		self.assertListEqual([("windowed", 1.0, 1.5, 3)], self._history.Regressions("b5", window=3, threshold=1.2, minimum=0.1))
+
+	def test_UnknownBuild(self) -> None:
+		with self.assertRaises(HistoryError):
+			self._history.Regressions("b6", window=3, threshold=1.2, minimum=0.1)
+
+	def test_Persistent(self) -> None:
+		self._history.Close()
+		self._history = DurationHistory(self._history.DatabaseFile)
+
+		self.assertEqual(2, len(self._history.Regressions("b5", window=3, threshold=1.2, minimum=0.1)))
@@ -0,0 +1,199 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the import graph analyzer and directive."""
+from io       import StringIO
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from unittest import TestCase
+
+from sphinx.application import Sphinx
+
+from sphinx_reports.Adapter.ImportGraph import ImportGraphAnalyzer
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Analyzer(TestCase):
+	_directory: TemporaryDirectory
+	_package:   Path
+	_cacheFile: Path
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._package = Path(self._directory.name) / "pkg"
+		self._cacheFile = Path(self._directory.name) / "cache" / "importgraph.json"
+
+		self._WriteFile("__init__.py", """\
+			from .a import A
+			""")
+		self._WriteFile("a.py", """\
+			from typing import TYPE_CHECKING
+			import os
+			import numpy as np
+			from pkg.sub import b
+
+			if TYPE_CHECKING:
+				from pkg.c import C
+
+			class A:
+				def method(self):
+					import pandas
+			""")
+		self._WriteFile("sub/__init__.py", "")
+		self._WriteFile("sub/b.py", """\
+			try:
+				from ..c import C
+			except ImportError:
+				import requests
+			""")
+		self._WriteFile("c.py", """\
+			from . import a
+			""")
+		self._WriteFile("broken.py", "def (:\n")
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def _WriteFile(self, relativePath: str, content: str) -> None:
+		file = self._package / relativePath
+		file.parent.mkdir(parents=True, exist_ok=True)
+		file.write_text(dedent(content), encoding="utf-8")
+
+	def _Analyze(self) -> ImportGraphAnalyzer:
+		analyzer = ImportGraphAnalyzer("pkg", self._package, self._cacheFile)
+		analyzer.Analyze()
+
+		return analyzer
+
+	def test_Imports(self) -> None:
+		graph = self._Analyze().Convert()
+
+		self.assertListEqual(["pkg", "pkg.a", "pkg.broken", "pkg.c", "pkg.sub", "pkg.sub.b"], sorted(graph.Modules))
+		self.assertListEqual(["pkg.a"], graph.Modules["pkg"].Imports)
+		self.assertListEqual(["pkg.sub.b"], graph.Modules["pkg.a"].Imports)
+		self.assertListEqual(["pkg.c"], graph.Modules["pkg.sub.b"].Imports)
+		self.assertListEqual(["pkg.a"], graph.Modules["pkg.c"].Imports)
+		self.assertListEqual(["pkg", "pkg.c"], graph.Modules["pkg.a"].ImportedBy)
+		self.assertEqual(2, graph.Modules["pkg.a"].FanIn)
+		self.assertEqual(1, graph.Modules["pkg.a"].FanOut)
+
+	def test_ExternalImports(self) -> None:
+		graph = self._Analyze().Convert()
+
+		self.assertListEqual(["numpy"], graph.Modules["pkg.a"].ExternalImports)
+		self.assertListEqual(["numpy"], graph.Modules["pkg.a"].HeavyImports)
+		self.assertListEqual(["requests"], graph.Modules["pkg.sub.b"].HeavyImports)
+		self.assertListEqual([("pkg.a", ["numpy"]), ("pkg.sub.b", ["requests"])], graph.HeavyImports)
+
+		graph = self._Analyze().Convert(heavyImports=["numpy"])
+		self.assertListEqual(["requests"], graph.Modules["pkg.sub.b"].ExternalImports)
+		self.assertListEqual([], graph.Modules["pkg.sub.b"].HeavyImports)
+
+	def test_Cycles(self) -> None:
+		graph = self._Analyze().Convert()
+
+		self.assertListEqual([["pkg.a", "pkg.sub.b", "pkg.c"]], graph.Cycles)
+		self.assertTrue(graph.Modules["pkg.c"].InCycle)
+		self.assertFalse(graph.Modules["pkg"].InCycle)
+
+	def test_SyntaxError(self) -> None:
+		graph = self._Analyze().Convert()
+
+		self.assertIsNotNone(graph.Modules["pkg.broken"].Error)
+		self.assertListEqual([], graph.Modules["pkg.broken"].Imports)
+
+	def test_Incremental(self) -> None:
+		analyzer = self._Analyze()
+		self.assertEqual(6, len(analyzer.AnalyzedFiles))
+
+		analyzer = self._Analyze()
+		self.assertListEqual([], analyzer.AnalyzedFiles)
+
+		self._WriteFile("c.py", "")
+		analyzer = self._Analyze()
+		self.assertListEqual(["c.py"], analyzer.AnalyzedFiles)
+		self.assertListEqual([], analyzer.Convert().Cycles)
+
+
+class Build(TestCase):
+	_directory: TemporaryDirectory
+	_package:   Path
+	_source:    Path
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._package = Path(self._directory.name) / "pkg"
+		self._package.mkdir()
+		(self._package / "__init__.py").write_text("")
+		(self._package / "a.py").write_text("import os\n")
+
+		self._source = Path(self._directory.name) / "source"
+		self._source.mkdir()
+		(self._source / "conf.py").write_text(dedent(f"""\
+			extensions = ["sphinx_reports"]
+			report_importgraph_packages = {{
+				"addedfiles": {{"name": "pkg", "directory": {str(self._package)!r}}}
+			}}
+			"""), encoding="utf-8")
+		(self._source / "index.rst").write_text("Index\n#####\n\n.. toctree::\n\n   graph\n   plain\n", encoding="utf-8")
+		(self._source / "graph.rst").write_text("Graph\n#####\n\n.. report:import-graph::\n   :reportid: addedfiles\n", encoding="utf-8")
+		(self._source / "plain.rst").write_text("Plain\n#####\n\nSome text.\n", encoding="utf-8")
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def _Build(self, freshenv: bool) -> Sphinx:
+		outputDirectory = Path(self._directory.name) / "build"
+		application = Sphinx(
+			self._source, self._source, outputDirectory / "html", outputDirectory / "doctrees", "html",
+			status=None, warning=StringIO(), freshenv=freshenv
+		)
+		application.build()
+
+		return application
+
+	def test_AddedModule(self) -> None:
+		application = self._Build(freshenv=True)
+		self.assertNotIn("⚙️b<", (application.outdir / "graph.html").read_text(encoding="utf-8"))
+		plainModified = (application.outdir / "plain.html").stat().st_mtime_ns
+
+		# A new module importing an existing module changes the existing module's fan-in.
+		(self._package / "b.py").write_text("from pkg import a\n")
+		application = self._Build(freshenv=False)
+
+		self.assertIn("⚙️b<", (application.outdir / "graph.html").read_text(encoding="utf-8"))
+		self.assertEqual(plainModified, (application.outdir / "plain.html").stat().st_mtime_ns)
+		self.assertListEqual(["__init__.py", "a.py", "b.py"], application.env.get_domain("report").ImportGraphSources["addedfiles"])
@@ -0,0 +1,97 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the import time log parser."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from sphinx_reports.Adapter.ImportTime import ImportTimeError, ImportTimeLog, ImportTimeReader
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+LOG = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   _io
+import time:        50 |         50 |     _codecs
+import time:       200 |        250 |   codecs
+import time:      1000 |       1350 | encodings
+some other stderr output
+import time:       300 |        300 | json.decoder
+import time:       400 |        700 | json
+"""
+
+
+class Parser(TestCase):
+	def test_Tree(self) -> None:
+		imports = ImportTimeLog.Parse(LOG.splitlines(keepends=True))
+
+		self.assertListEqual(["encodings", "json.decoder", "json"], [module.Name for module in imports])
+		encodings = imports[0]
+		self.assertEqual(1000, encodings.SelfTime)
+		self.assertEqual(1350, encodings.CumulativeTime)
+		self.assertListEqual(["_io", "codecs"], list(encodings.Imports))
+		self.assertListEqual(["_codecs"], list(encodings.Imports["codecs"].Imports))
+		self.assertIs(encodings, encodings.Imports["codecs"].Parent)
+		self.assertListEqual(["encodings", "_io", "codecs", "_codecs"], [module.Name for module in encodings.IterateModules()])
+
+	def test_Duplicates(self) -> None:
+		log = "import time:  10 |  10 |   nt\nimport time:  20 |  20 |   nt\nimport time:   5 |  35 | os\n"
+		os = ImportTimeLog.Parse(log.splitlines())[0]
+
+		self.assertEqual(30, os.Imports["nt"].SelfTime)
+
+	def test_Merge(self) -> None:
+		with TemporaryDirectory() as directory:
+			first = Path(directory) / "first.log"
+			second = Path(directory) / "second.log"
+			first.write_text(LOG)
+			second.write_text(LOG.replace("|       200 |", "|       400 |").replace("  400 |        700 | json", "  600 |        900 | json"))
+
+			report = ImportTimeReader("test", [first, second]).Convert()
+
+		self.assertEqual(2, report.Runs)
+		self.assertEqual(6, report.ModuleCount)
+		self.assertEqual(1350 + 300 + 800, report.TotalTime)
+		self.assertEqual(500, report.Imports["json"].SelfTime)
+		self.assertListEqual(["encodings", "json"], [module.Name for module in report.TopOffenders(2)])
+
+	def test_NoImportTimeOutput(self) -> None:
+		with TemporaryDirectory() as directory:
+			log = Path(directory) / "empty.log"
+			log.write_text("Traceback (most recent call last):\n")
+
+			with self.assertRaises(ImportTimeError):
+				ImportTimeLog(log)
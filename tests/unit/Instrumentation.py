@@ -0,0 +1,109 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the build instrumentation."""
+from os       import getpid
+from unittest import TestCase
+
+from sphinx_reports.Instrumentation import Instrumentation
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Spans(TestCase):
+	def tearDown(self) -> None:
+		Instrumentation.Disable()
+
+	def test_Disabled(self) -> None:
+		Instrumentation.Disable()
+
+		with Instrumentation.Span("load", "report", report="unittest/a") as args:
+			args["nodes"] = 1
+
+		self.assertEqual({"report": "unittest/a", "nodes": 1}, args)
+		self.assertEqual([], Instrumentation._spans)
+
+	def test_Enabled(self) -> None:
+		Instrumentation.Enable()
+
+		with Instrumentation.Span("convert", "unittest/a", report="unittest/a"):
+			with Instrumentation.Span("aggregate", "testsuite summary") as args:
+				args["testcases"] = 3
+
+		self.assertEqual(["aggregate", "convert"], [span[0] for span in Instrumentation._spans])
+		self.assertEqual({"testcases": 3}, Instrumentation._spans[0][6])
+		self.assertEqual([], Instrumentation.TakeWorkerSpans())
+
+	def test_SpanRecordedOnException(self) -> None:
+		Instrumentation.Enable()
+
+		with self.assertRaises(ValueError):
+			with Instrumentation.Span("render", "report:unittest-summary"):
+				raise ValueError()
+
+		self.assertEqual(1, len(Instrumentation._spans))
+
+
+class Statistics(TestCase):
+	def test_NestedSpans(self) -> None:
+		pid = getpid()
+		spans = [
+			("convert",   "unittest/a",        1_000, 10_000_000, pid, 1, {"report": "unittest/a"}),
+			("load",      "a.xml",             2_000,  4_000_000, pid, 1, {}),
+			("aggregate", "testsuite summary", 7_000_000, 1_000_000, pid, 1, {}),
+			("render",    "report:unittest-summary", 20_000_000, 2_000_000, pid, 1, {"report": "unittest/a", "nodes": 7}),
+			("load",      "other thread",      3_000,  1_000_000, pid, 2, {}),
+		]
+
+		statistics = Instrumentation.Statistics(spans, 30_000_000)
+
+		self.assertAlmostEqual(5.0, statistics["phases"]["convert"]["duration_ms"])
+		self.assertAlmostEqual(5.0, statistics["phases"]["load"]["duration_ms"])
+		self.assertAlmostEqual(1.0, statistics["phases"]["aggregate"]["duration_ms"])
+		self.assertDictEqual({"convert": 5.0, "load": 4.0, "aggregate": 1.0, "render": 2.0}, statistics["reports"]["unittest/a"])
+		self.assertDictEqual({"count": 1, "duration_ms": 2.0, "nodes": 7}, statistics["directives"]["report:unittest-summary"])
+		self.assertEqual(7, statistics["nodes"])
+
+	def test_TraceEvents(self) -> None:
+		Instrumentation._mainPID = getpid()
+		Instrumentation._buildStart = 0
+		spans = [("load", "a.xml", 2_000, 4_000, getpid(), 1, {})]
+
+		events = Instrumentation.TraceEvents(spans)["traceEvents"]
+
+		self.assertEqual("M", events[0]["ph"])
+		self.assertDictEqual(
+			{"name": "a.xml", "cat": "load", "ph": "X", "ts": 2.0, "dur": 4.0, "pid": getpid(), "tid": 1, "args": {}},
+			events[1]
+		)
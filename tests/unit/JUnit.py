@@ -0,0 +1,148 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the JUnit XML adapters."""
+from pathlib   import Path
+from tempfile  import TemporaryDirectory
+from unittest  import TestCase
+
+from sphinx_reports.Adapter.JUnit import JUnitCounts, JUnitIndex, JUnitIndexError
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+_junitXML = """<?xml version="1.0" encoding="UTF-8"?>
+<testsuites>
+	<testsuite name="pkg" time="3.0">
+		<testcase classname="pkg.test_a" name="test_ok" time="0.5"><system-out>hello</system-out></testcase>
+		<testcase classname="pkg.test_a" name="test_bad" time="1.0">
+			<failure message="assert 1 == 2" type="AssertionError"><![CDATA[def test_bad():
+>       assert 1 == 2]]></failure>
+			<system-out>line &lt;1&gt; ✓</system-out>
+		</testcase>
+		<testcase classname="pkg.test_b" name="test_err" time="1.5"><error message="boom" type="RuntimeError"/></testcase>
+		<testcase classname="pkg.test_b" name="test_skip"><skipped/></testcase>
+	</testsuite>
+</testsuites>
+"""
+
+
+class Counts(TestCase):
+	def test_Scan(self) -> None:
+		with TemporaryDirectory() as directory:
+			xmlFile = Path(directory) / "junit.xml"
+			xmlFile.write_text(_junitXML, encoding="utf-8")
+			counts = JUnitCounts.Scan(xmlFile)
+
+		self.assertEqual(4, counts.Tests)
+		self.assertEqual(1, counts.Passed)
+		self.assertEqual(1, counts.Failed)
+		self.assertEqual(1, counts.Errored)
+		self.assertEqual(1, counts.Skipped)
+		self.assertAlmostEqual(3.0, counts.Duration)
+
+
+class Index(TestCase):
+	_directory: TemporaryDirectory
+	_index:     JUnitIndex
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		xmlFile = Path(self._directory.name) / "junit.xml"
+		xmlFile.write_text(_junitXML, encoding="utf-8")
+		self._index = JUnitIndex(xmlFile)
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def test_Testcases(self) -> None:
+		testcases = self._index.Testcases
+
+		self.assertListEqual(["test_ok", "test_bad", "test_err", "test_skip"], [tc.Name for tc in testcases])
+		self.assertListEqual(
+			["Passed", "Failed", "Errored", "Skipped"],
+			[tc.Status.name for tc in testcases]
+		)
+		self.assertEqual("pkg", testcases[0].Testsuite)
+		self.assertEqual("pkg.test_a.test_bad", testcases[1].FullName)
+		self.assertIsNone(testcases[3].Duration)
+		self.assertListEqual(["failure", "system-out"], [span.Kind for span in testcases[1].Details])
+
+	def test_ReadDetail(self) -> None:
+		failure, output = self._index.Testcases[1].Details
+
+		with self._index.Open() as file:
+			attributes, text, truncated = self._index.ReadDetail(file, failure, 1000)
+			self.assertDictEqual({"message": "assert 1 == 2", "type": "AssertionError"}, attributes)
+			self.assertEqual("def test_bad():\n>       assert 1 == 2", text)
+			self.assertFalse(truncated)
+
+			_, text, truncated = self._index.ReadDetail(file, output, 1000)
+			self.assertEqual("line <1> ✓", text)
+			self.assertFalse(truncated)
+
+			_, text, truncated = self._index.ReadDetail(file, failure, 8, chunkSize=4)
+			self.assertEqual("def test", text)
+			self.assertTrue(truncated)
+
+	def test_EmptyElement(self) -> None:
+		error, = self._index.Testcases[2].Details
+
+		with self._index.Open() as file:
+			attributes, text, truncated = self._index.ReadDetail(file, error, 100)
+
+		self.assertEqual("boom", attributes["message"])
+		self.assertEqual("", text)
+		self.assertFalse(truncated)
+
+	def test_Deleted(self) -> None:
+		self._index._xmlFile.unlink()
+
+		with self.assertRaises(JUnitIndexError):
+			self._index.Open()
+
+	def test_Embed(self) -> None:
+		embedded = self._index.Embed()
+		self.assertIsNone(self._index._content)
+		self._index._xmlFile.unlink()
+
+		self.assertListEqual(["Passed", "Failed", "Errored", "Skipped"], [tc.Status.name for tc in embedded.Testcases])
+		self.assertListEqual([[], ["failure", "system-out"], ["error"], []], [[span.Kind for span in tc.Details] for tc in embedded.Testcases])
+
+		failure, output = embedded.Testcases[1].Details
+		with embedded.Open() as file:
+			attributes, text, _ = embedded.ReadDetail(file, failure, 1000)
+			self.assertEqual("AssertionError", attributes["type"])
+			self.assertEqual("def test_bad():\n>       assert 1 == 2", text)
+			self.assertEqual("line <1> ✓", embedded.ReadDetail(file, output, 1000)[1])
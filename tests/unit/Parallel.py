@@ -0,0 +1,162 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests comparing parallel and serial Sphinx builds."""
+from io       import StringIO
+from json     import loads
+from os       import getpid
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from unittest import TestCase
+
+from sphinx.application import Sphinx
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class ParallelBuild(TestCase):
+	_directory: TemporaryDirectory
+	_source:    Path
+
+	_documents = {
+		"doccov":     ".. report:doc-coverage::\n   :reportid: partially\n",
+		"importgraph": ".. report:import-graph::\n   :reportid: self\n",
+		"importtime": ".. report:import-time::\n   :reportid: tool\n",
+		"dependency": ".. report:dependency-table::\n   :source: requirements.txt\n",
+		"unittest":   ".. report:unittest-summary::\n   :reportid: basic\n",
+		"plain1":     "Some text.\n",
+		"plain2":     "Some text.\n",
+		"plain3":     "Some text.\n",
+		"plain4":     "Some text.\n",
+	}
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._source = Path(self._directory.name) / "source"
+		self._source.mkdir()
+
+		root = Path(__file__).parent.parent.parent
+		importTimeLog = self._source / "importtime.log"
+		importTimeLog.write_text(dedent("""\
+			import time: self [us] | cumulative | imported package
+			import time:       120 |        120 |   _io
+			import time:       300 |        420 | tool
+			import time:       200 |        200 |   tool.cli
+			"""), encoding="utf-8")
+		(self._source / "requirements.txt").write_text("packaging>=24\n", encoding="utf-8")
+
+		(self._source / "conf.py").write_text(dedent(f"""\
+			extensions = ["sphinx_reports"]
+			report_doccov_packages = {{
+				"partially": {{"name": "partially", "directory": {str(root / "tests" / "packages" / "partially")!r}, "fail_below": 80, "levels": "default"}}
+			}}
+			report_importgraph_packages = {{
+				"self": {{"name": "sphinx_reports", "directory": {str(root / "sphinx_reports")!r}}}
+			}}
+			report_importtime_logs = {{
+				"tool": {{"logs": {str(importTimeLog)!r}}}
+			}}
+			report_unittest_testsuites = {{
+				"basic": {{"xml_report": {str(root / "tests" / "data" / "unittest" / "junit-basic.xml")!r}}}
+			}}
+			"""), encoding="utf-8")
+
+		toctree = "\n".join(f"   {docname}" for docname in self._documents)
+		(self._source / "index.rst").write_text(f"Index\n#####\n\n.. toctree::\n\n{toctree}\n", encoding="utf-8")
+		for docname, content in self._documents.items():
+			(self._source / f"{docname}.rst").write_text(f"{docname}\n{'#' * len(docname)}\n\n{content}", encoding="utf-8")
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def _Build(self, name: str, parallel: int, instrumentation: bool = False) -> Sphinx:
+		outputDirectory = Path(self._directory.name) / name
+		application = Sphinx(
+			self._source, self._source, outputDirectory / "html", outputDirectory / "doctrees", "html",
+			status=None, warning=StringIO(), freshenv=True, parallel=parallel,
+			confoverrides={"report_instrumentation": instrumentation}
+		)
+		application.build()
+
+		return application
+
+	def test_ParallelEqualsSerial(self) -> None:
+		parallelApplication = self._Build("parallel", 8)
+		serialApplication = self._Build("serial", 1)
+
+		for docname in ("index", *self._documents):
+			with self.subTest(docname=docname):
+				parallelHTML = (parallelApplication.outdir / f"{docname}.html").read_text(encoding="utf-8")
+				serialHTML = (serialApplication.outdir / f"{docname}.html").read_text(encoding="utf-8")
+				self.assertEqual(serialHTML, parallelHTML)
+
+		self.assertIn("report-importgraph-table", (parallelApplication.outdir / "importgraph.html").read_text(encoding="utf-8"))
+
+		parallelDomain = parallelApplication.env.get_domain("report")
+		serialDomain = serialApplication.env.get_domain("report")
+		self.assertDictEqual(serialDomain.Reports, parallelDomain.Reports)
+		self.assertSetEqual({("importgraph", "self")}, parallelDomain.Reports["importgraph"])
+		self.assertSetEqual({("doccov", "partially")}, parallelDomain.Reports["doccov"])
+		self.assertSetEqual(set(), parallelDomain.Reports["plain1"])
+
+		self.assertTrue((parallelApplication.doctreedir / "sphinx-reports" / "reports.store").exists())
+
+	def test_Instrumentation(self) -> None:
+		application = self._Build("instrumented", 8, instrumentation=True)
+
+		statistics = loads((application.outdir / "sphinx-reports.stats.json").read_text(encoding="utf-8"))
+		self.assertEqual(8, statistics["parallel"])
+		self.assertEqual(5, statistics["phases"]["render"]["count"])
+		self.assertSetEqual(
+			{"report:doc-coverage", "report:import-graph", "report:import-time", "report:dependency-table", "report:unittest-summary"},
+			set(statistics["directives"])
+		)
+		self.assertGreater(statistics["nodes"], 0)
+		self.assertIn("unittest/basic", statistics["reports"])
+		self.assertIn("render", statistics["reports"]["unittest/basic"])
+
+		trace = loads((application.outdir / "sphinx-reports.trace.json").read_text(encoding="utf-8"))
+		spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+		self.assertEqual(5, sum(1 for span in spans if span["cat"] == "render"))
+		# Documents are read by forked workers, so render spans are recorded by other processes than the main process.
+		self.assertGreater(len({span["pid"] for span in spans}), 1)
+
+		# Reports in the report store are preloaded and shared with the workers, so workers neither convert nor deserialize them.
+		storedReports = ("unittest/basic", "importtime/tool")
+		workerLoads = [span for span in spans if span["pid"] != getpid() and span["cat"] in ("load", "convert") and span["args"].get("report") in storedReports]
+		self.assertListEqual([], workerLoads)
+		self.assertEqual(1, sum(1 for span in spans if span["cat"] == "convert" and span["args"].get("report") == "unittest/basic"))
+
+		self.assertFalse((self._Build("plain", 1).outdir / "sphinx-reports.stats.json").exists())
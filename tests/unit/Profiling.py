@@ -0,0 +1,147 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for profiling report directives."""
+from io       import StringIO
+from pathlib  import Path
+from pstats   import Stats
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from unittest import TestCase
+
+from sphinx.application import Sphinx
+
+from sphinx_reports.Common    import ReportExtensionError
+from sphinx_reports.Profiling import Profiler
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class _Application:
+	outdir = "/tmp/out"
+
+
+class Configuration(TestCase):
+	def tearDown(self) -> None:
+		self._Check({})
+
+	def _Check(self, profile: dict) -> None:
+		Profiler.CheckConfiguration(_Application(), {"report_profile": profile})
+
+	def test_Disabled(self) -> None:
+		self._Check({})
+
+		self.assertFalse(Profiler.IsEnabled())
+
+	def test_Selection(self) -> None:
+		self._Check({"directives": ["report:unittest-summary", "code-coverage"], "reportids": ["src"], "top": 10})
+
+		self.assertTrue(Profiler.IsEnabled())
+		self.assertSetEqual({"unittest-summary", "code-coverage"}, Profiler._directives)
+		self.assertSetEqual({"src"}, Profiler._reportIDs)
+		self.assertSetEqual({"cprofile"}, Profiler._profilers)
+		self.assertEqual(10, Profiler._top)
+
+	def test_Invalid(self) -> None:
+		for profile in (
+			{"directive": ["unittest-summary"]},
+			{"reportids": "src"},
+			{"profilers": ["yappi"]},
+			{"top": 0},
+		):
+			with self.subTest(profile=profile):
+				with self.assertRaises(ReportExtensionError):
+					self._Check(profile)
+
+
+class ProfiledBuild(TestCase):
+	_directory: TemporaryDirectory
+	_source:    Path
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._source = Path(self._directory.name) / "source"
+		self._source.mkdir()
+
+		junitReport = Path(__file__).parent.parent / "data" / "unittest" / "junit-basic.xml"
+		(self._source / "conf.py").write_text(dedent(f"""\
+			extensions = ["sphinx_reports"]
+			report_unittest_testsuites = {{
+				"basic": {{"xml_report": {str(junitReport)!r}}}
+			}}
+			report_profile = {{
+				"reportids": ["basic"],
+				"profilers": ["cprofile", "tracemalloc"],
+				"top":       5,
+			}}
+			"""), encoding="utf-8")
+		(self._source / "index.rst").write_text(dedent("""\
+			Index
+			#####
+
+			.. report:unittest-summary::
+			   :reportid: basic
+
+			.. report:unittest-badge::
+			   :reportid: basic
+
+			.. report:unittest-badge::
+			   :reportid: basic
+			"""), encoding="utf-8")
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def test_ProfileFiles(self) -> None:
+		application = Sphinx(
+			self._source, self._source, Path(self._directory.name) / "html", Path(self._directory.name) / "doctrees", "html",
+			status=None, warning=StringIO(), freshenv=True
+		)
+		application.build()
+
+		profileDirectory = application.outdir / Profiler.directory
+		self.assertSetEqual(
+			{
+				"basic.unittest-summary.index.L4.prof", "basic.unittest-summary.index.L4.allocations.txt",
+				"basic.unittest-badge.index.L7.prof", "basic.unittest-badge.index.L7.allocations.txt",
+				"basic.unittest-badge.index.L10.prof", "basic.unittest-badge.index.L10.allocations.txt",
+			},
+			{file.name for file in profileDirectory.iterdir()}
+		)
+
+		stats = Stats(str(profileDirectory / "basic.unittest-summary.index.L4.prof"))
+		self.assertTrue(any(function[2] == "_LoadTestsuiteSummary" for function in stats.stats))
+
+		allocations = (profileDirectory / "basic.unittest-summary.index.L4.allocations.txt").read_text(encoding="utf-8")
+		self.assertTrue(allocations.startswith("Top 5 allocations of directive 'unittest-summary' (reportid: basic, document: index)"))
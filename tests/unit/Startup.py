@@ -0,0 +1,95 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests keeping heavy modules out of the import of ``sphinx_reports``."""
+from json       import loads
+from os         import environ
+from pathlib    import Path
+from subprocess import run
+from sys        import executable
+from typing     import Any, Dict
+from unittest   import TestCase
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+# Sphinx has loaded these modules before it loads extensions, so they don't count for the extension's startup cost.
+_importScript = """\
+import json, sys, time
+import sphinx.application, sphinx.builders.html, sphinx.writers.html5, sphinx.writers.latex
+import sphinx.directives.code, sphinx.util.docutils, sphinx.domains.python
+before = set(sys.modules)
+start = time.perf_counter()
+import sphinx_reports
+duration = time.perf_counter() - start
+print(json.dumps({"duration": duration, "modules": sorted(set(sys.modules) - before)}))
+"""
+
+
+def ImportSphinxReports() -> Dict[str, Any]:
+	"""
+	Import ``sphinx_reports`` in a fresh interpreter, after the modules Sphinx loads before it loads extensions.
+
+	:returns:             A dictionary with the import's ``duration`` in seconds and the newly imported ``modules``.
+	:raises RuntimeError: If the interpreter exits with an error.
+	"""
+	env = environ.copy()
+	env.pop("PYTHONDONTWRITEBYTECODE", None)
+	env["PYTHONPATH"] = str(Path(__file__).parents[2])
+
+	result = run([executable, "-c", _importScript], capture_output=True, text=True, env=env, timeout=120)
+	if result.returncode != 0:
+		raise RuntimeError(f"Importing sphinx_reports failed:\n{result.stderr}")
+
+	return loads(result.stdout.splitlines()[-1])
+
+
+class Startup(TestCase):
+	heavyModules = (
+		"lxml",
+		"packaging",
+		"pyEDAA.Reports.Unittesting.JUnit",
+		"pyEDAA.Reports.DocumentationCoverage",
+		"pyTooling.Configuration",
+		"docstr_coverage",
+		"sqlite3",
+		"concurrent.futures.process",
+	)  #: Modules, which must be imported on first use of a report and not when loading the extension.
+
+	def test_HeavyModulesAreNotImported(self) -> None:
+		modules = ImportSphinxReports()["modules"]
+
+		for heavyModule in self.heavyModules:
+			with self.subTest(module=heavyModule):
+				self.assertEqual([], [m for m in modules if m == heavyModule or m.startswith(f"{heavyModule}.")])
@@ -0,0 +1,183 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Unit tests for the report store."""
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from sphinx_reports.DataModel.CodeCoverage import PackageCoverage, ModuleCoverage
+from sphinx_reports.Store                  import ReportStore, ReportStoreError
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Store(TestCase):
+	_directory: TemporaryDirectory
+	_file:      Path
+	_converted: int
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._file = Path(self._directory.name) / "cache" / "reports.store"
+		self._converted = 0
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def _Convert(self, value: int):
+		self._converted += 1
+		return {"value": value, "items": list(range(value))}
+
+	def test_InMemory(self) -> None:
+		store = ReportStore()
+		self.assertEqual(3, store.Get("a", "1", lambda: self._Convert(3))["value"])
+		self.assertEqual(3, store.Get("a", "1", lambda: self._Convert(3))["value"])
+		self.assertEqual(1, self._converted)
+
+		store.Commit(release=True)
+		self.assertEqual(3, store.Get("a", "1", lambda: self._Convert(3))["value"])
+		self.assertEqual(1, self._converted)
+
+	def test_CommitAndReopen(self) -> None:
+		store = ReportStore(self._file)
+		store.Get("a", "1", lambda: self._Convert(3))
+		store.Get("b", "1", lambda: self._Convert(5))
+		store.Commit()
+		store.Close()
+		self.assertTrue(self._file.exists())
+
+		store = ReportStore(self._file)
+		self.assertEqual(2, len(store))
+		self.assertDictEqual({"value": 5, "items": [0, 1, 2, 3, 4]}, store.Get("b", "1", lambda: self._Convert(5)))
+		self.assertEqual(2, self._converted)
+		store.Close()
+
+	def test_Release(self) -> None:
+		store = ReportStore(self._file)
+		first = store.Get("a", "1", lambda: self._Convert(3))
+		store.Commit(release=True)
+
+		second = store.Get("a", "1", lambda: self._Convert(3))
+		self.assertEqual(first, second)
+		self.assertIsNot(first, second)
+		self.assertEqual(1, self._converted)
+		store.Close()
+
+	def test_Fingerprint(self) -> None:
+		store = ReportStore(self._file)
+		store.Get("a", "1", lambda: self._Convert(3))
+		store.Commit()
+
+		self.assertEqual(4, store.Get("a", "2", lambda: self._Convert(4))["value"])
+		store.Get("b", "1", lambda: self._Convert(1))
+		store.Commit()
+		store.Close()
+
+		store = ReportStore(self._file)
+		self.assertEqual(4, store.Get("a", "2", lambda: self._Convert(0))["value"])
+		self.assertEqual(1, store.Get("b", "1", lambda: self._Convert(0))["value"])
+		self.assertEqual(3, self._converted)
+		store.Close()
+
+	def test_Corrupted(self) -> None:
+		self._file.parent.mkdir(parents=True)
+		self._file.write_bytes(b"SPXRPTST\x01\x00\xff\xff\xff\xff")
+
+		store = ReportStore(self._file)
+		self.assertEqual(0, len(store))
+		self.assertEqual(3, store.Get("a", "1", lambda: self._Convert(3))["value"])
+		store.Commit()
+		store.Close()
+
+		self.assertEqual(1, len(ReportStore(self._file)))
+
+	def test_PutAndLoad(self) -> None:
+		store = ReportStore(self._file)
+		store.Put("b", "2", self._Convert(2))
+		store.Put("a", "1", self._Convert(1))
+		self.assertListEqual(["a", "b"], store.Keys)
+		store.Commit()
+		store.Close()
+
+		self.assertTrue(ReportStore.IsStoreFile(self._file))
+		self.assertFalse(ReportStore.IsStoreFile(self._file.parent / "missing.store"))
+
+		store = ReportStore(self._file)
+		self.assertEqual("2", store.Fingerprint("b"))
+		self.assertEqual(2, store.Load("b")["value"])
+		with self.assertRaises(ReportStoreError):
+			store.Load("c")
+		with self.assertRaises(ReportStoreError):
+			store.Fingerprint("c")
+		store.Close()
+
+	def test_View(self) -> None:
+		root = PackageCoverage("pkg", Path("__init__.py"))
+		module = ModuleCoverage("module", Path("pkg/module.py"), root)
+		module._totalStatements = 42
+
+		store = ReportStore(self._file)
+		store.Put("codecov", "1", root)
+		store.Put("other", "1", self._Convert(1))
+		with store.View("codecov") as view:
+			self.assertEqual(42, view["pkg.module"].Counters["TotalStatements"])
+		store.Commit()
+
+		view = store.View("codecov")
+		self.assertEqual(42, view["pkg.module"].Counters["TotalStatements"])
+		with self.assertRaises(ReportStoreError):
+			store.View("other")
+		store.Close()
+		view.Release()
+
+		store = ReportStore(self._file)
+		self.assertEqual(42, store.Load("codecov")["module"].TotalStatements)
+		store.Close()
+
+	def test_UnknownFieldIsPickled(self) -> None:
+		root = PackageCoverage("pkg", Path("__init__.py"))
+		module = ModuleCoverage("module", Path("pkg/module.py"), root)
+		module._extra = 42
+
+		store = ReportStore(self._file)
+		store.Put("codecov", "1", root)
+		store.Commit()
+		store.Close()
+
+		store = ReportStore(self._file)
+		with self.assertRaises(ReportStoreError):
+			store.View("codecov")
+		self.assertEqual(42, store.Load("codecov")["module"]._extra)
+		store.Close()
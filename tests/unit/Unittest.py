@@ -0,0 +1,359 @@
+# ==================================================================================================================== #
+#            _     _                                           _                                                       #
+#  ___ _ __ | |__ (_)_ __ __  __     _ __ ___ _ __   ___  _ __| |_ ___                                                 #
+# / __| '_ \| '_ \| | '_ \\ \/ /____| '__/ _ \ '_ \ / _ \| '__| __/ __|                                                #
+# \__ \ |_) | | | | | | | |>  <_____| | |  __/ |_) | (_) | |  | |_\__ \                                                #
+# |___/ .__/|_| |_|_|_| |_/_/\_\    |_|  \___| .__/ \___/|_|   \__|___/                                                #
+#     |_|                                    |_|                                                                       #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2026-2026 Patrick Lehmann - Bötzingen, Germany                                                             #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+#
+"""Unit tests for the unittest data model and directives."""
+from datetime                import timedelta
+from pathlib                 import Path
+from tempfile                import TemporaryDirectory
+from types                   import SimpleNamespace
+from unittest                import TestCase
+from unittest.mock           import patch
+from xml.etree.ElementTree   import fromstring
+
+from pyEDAA.Reports import Unittesting
+
+from sphinx_reports.DataModel.Unittest import DurationHistogram, ExecutionTimeline
+from sphinx_reports.Common             import ReportExtensionError
+from sphinx_reports.Adapter.JUnit      import JUnitIndex
+from sphinx_reports.Unittest           import UnittestBase, UnittestDiff, UnittestFailureDetails, UnittestFlamegraph
+
+
+Status = Unittesting.TestcaseStatus
+
+
+if __name__ == "__main__":
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unittest <testcase module>'")
+	exit(1)
+
+
+class Histogram(TestCase):
+	def test_Edges(self) -> None:
+		histogram = DurationHistogram(0.001, 10.0, 1)
+
+		self.assertEqual(5, len(histogram.Edges))
+		self.assertAlmostEqual(0.001, histogram.Edges[0])
+		self.assertAlmostEqual(10.0, histogram.Edges[-1])
+		self.assertEqual(6, len(histogram.Counts))
+
+	def test_Binning(self) -> None:
+		histogram = DurationHistogram(0.01, 1.0, 1)
+		histogram.Add([0.0, 0.005, 0.01, 0.05, 0.5, 1.0, 20.0])
+
+		self.assertListEqual([2, 2, 1, 2], histogram.Counts)
+		self.assertEqual(7, histogram.TotalCount)
+		self.assertAlmostEqual(21.565, histogram.TotalDuration)
+		self.assertAlmostEqual(21.0, histogram.Durations[3])
+
+	def test_Bucket(self) -> None:
+		histogram = DurationHistogram(0.1, 10.0, 1)
+
+		self.assertEqual((0.0, 0.1), histogram.Bucket(0))
+		self.assertEqual(float("inf"), histogram.Bucket(3)[1])
+
+	def test_InvalidBounds(self) -> None:
+		with self.assertRaises(ValueError):
+			DurationHistogram(1.0, 0.1)
+
+
+class Timeline(TestCase):
+	def test_Empty(self) -> None:
+		timeline = ExecutionTimeline([])
+
+		self.assertEqual(0, len(timeline.Workers))
+		self.assertEqual(0.0, timeline.WallClock)
+		self.assertIsNone(timeline.CriticalWorker)
+
+	def test_Workers(self) -> None:
+		timeline = ExecutionTimeline([
+			("gw0", "a", 100.0, 10.0),
+			("gw1", "b", 100.0, 4.0),
+			("gw1", "c", 106.0, 8.0),
+			("gw0", "d", 110.0, 1.0),
+		])
+
+		self.assertEqual(2, len(timeline.Workers))
+		self.assertEqual(14.0, timeline.WallClock)
+		self.assertEqual(23.0, timeline.Duration)
+		self.assertEqual("gw1", timeline.CriticalWorker.Name)
+
+		worker = timeline.Workers["gw1"]
+		self.assertEqual(12.0, worker.Busy)
+		self.assertListEqual([(4.0, 6.0)], worker.Gaps)
+
+
+class HistogramConfiguration(TestCase):
+	def setUp(self) -> None:
+		context = patch.object(UnittestBase, "_histogramConfiguration", UnittestBase._histogramConfiguration)
+		context.start()
+		self.addCleanup(context.stop)
+
+	def _Check(self, histogram) -> dict:
+		UnittestBase._CheckHistogramConfiguration({"report_unittest_histogram": histogram})
+		return dict(UnittestBase._histogramConfiguration)
+
+	def test_Defaults(self) -> None:
+		self.assertDictEqual({"lower": 0.001, "upper": 100.0, "buckets_per_decade": 1}, self._Check({}))
+		self.assertDictEqual({"lower": 0.01, "upper": 100.0, "buckets_per_decade": 2}, self._Check({"lower": "0.01", "buckets_per_decade": 2}))
+
+	def test_Invalid(self) -> None:
+		for histogram in (
+			None,
+			[("lower", 0.01)],
+			{"lower": None},
+			{"upper": "many"},
+			{"lower": 1.0, "upper": 0.1},
+			{"buckets_per_decade": None},
+			{"buckets_per_decade": 11},
+		):
+			with self.subTest(histogram=histogram):
+				with self.assertRaises(ReportExtensionError):
+					self._Check(histogram)
+
+
+class HistoryConfiguration(TestCase):
+	def test_Defaults(self) -> None:
+		history = UnittestBase._CheckHistoryConfiguration("demo", {"database": "history.sqlite", "build_id": 42})
+
+		self.assertDictEqual(
+			{"database": Path("history.sqlite"), "build_id": "42", "window": 5, "threshold": 1.2, "minimum": 0.1},
+			dict(history)
+		)
+		self.assertIsNone(UnittestBase._CheckHistoryConfiguration("demo", None))
+
+	def test_Invalid(self) -> None:
+		for history in (
+			{},
+			{"database": "history.sqlite", "window": "many"},
+			{"database": "history.sqlite", "window": None},
+			{"database": "history.sqlite", "window": 0},
+			{"database": "history.sqlite", "threshold": "fast"},
+			{"database": "history.sqlite", "threshold": 0.9},
+			{"database": "history.sqlite", "minimum": []},
+			{"database": "history.sqlite", "minimum": -1},
+		):
+			with self.subTest(history=history):
+				with self.assertRaises(ReportExtensionError):
+					UnittestBase._CheckHistoryConfiguration("demo", history)
+
+
+class Diff(TestCase):
+	_data = Path(__file__).parent.parent / "data" / "unittest"
+
+	def _Compare(self, baselineStatuses=None, currentStatuses=None) -> UnittestDiff:
+		baseline, _ = UnittestDiff._ConvertTestsuiteSummary(self._data / "junit-diff-baseline.xml")
+		current, _ = UnittestDiff._ConvertTestsuiteSummary(self._data / "junit-diff-current.xml")
+		for summary, statuses in ((baseline, baselineStatuses), (current, currentStatuses)):
+			testcases = dict(UnittestDiff._iterateTestcasesWithKey(summary))
+			for key, status in (statuses or {}).items():
+				testcases[key]._status = status
+
+		directive = UnittestDiff.__new__(UnittestDiff)
+		directive._Compare(baseline, current)
+
+		return directive
+
+	def test_Testcases(self) -> None:
+		changes = {change: [key for key, _, _ in testcases] for change, testcases in self._Compare()._testcaseChanges.items()}
+
+		self.assertDictEqual({
+			"newly failing": ["Alpha::Alpha::stable", "Beta::Beta::broken"],
+			"newly passing": ["Alpha::Alpha::fixed"],
+			"added":         ["Alpha::Alpha::new", "Gamma::Gamma::first"],
+			"removed":       ["Alpha::Alpha::dropped", "Legacy::Legacy::old"],
+		}, changes)
+
+	def _Changes(self, baselineStatuses=None, currentStatuses=None) -> dict:
+		changes = self._Compare(baselineStatuses, currentStatuses)._testcaseChanges
+		return {change: [key for key, _, _ in changes[change]] for change in ("newly failing", "newly passing")}
+
+	def test_PassedWithWarnings(self) -> None:
+		changes = self._Changes(currentStatuses={"Alpha::Alpha::fixed": Status.Passed | Status.Warned})
+		self.assertListEqual(["Alpha::Alpha::fixed"], changes["newly passing"])
+
+	def test_FailedWithWarnings(self) -> None:
+		# Failing in both runs isn't a change, regardless of warnings.
+		changes = self._Changes(baselineStatuses={
+			"Alpha::Alpha::stable": Status.Failed | Status.Warned,
+			"Beta::Beta::broken":   Status.Errored | Status.Warned,
+		})
+		self.assertDictEqual({"newly failing": [], "newly passing": ["Alpha::Alpha::fixed"]}, changes)
+
+		changes = self._Changes(baselineStatuses={"Alpha::Alpha::fixed": Status.Failed | Status.Warned})
+		self.assertIn("Alpha::Alpha::fixed", changes["newly passing"])
+
+		changes = self._Changes(currentStatuses={"Alpha::Alpha::fixed": Status.Errored | Status.Warned})
+		self.assertNotIn("Alpha::Alpha::fixed", changes["newly failing"])
+		self.assertNotIn("Alpha::Alpha::fixed", changes["newly passing"])
+
+	def test_Unknown(self) -> None:
+		changes = self._Changes(baselineStatuses={"Alpha::Alpha::fixed": Status.Unknown, "Alpha::Alpha::stable": Status.Unknown})
+		self.assertDictEqual({"newly failing": ["Alpha::Alpha::stable", "Beta::Beta::broken"], "newly passing": []}, changes)
+
+		changes = self._Changes(currentStatuses={"Alpha::Alpha::fixed": Status.Unknown, "Alpha::Alpha::stable": Status.Unknown})
+		self.assertDictEqual({"newly failing": ["Beta::Beta::broken"], "newly passing": []}, changes)
+
+	def test_Testsuites(self) -> None:
+		deltas = {key: (previous, current) for key, previous, current in self._Compare()._testsuiteDeltas}
+
+		self.assertEqual((timedelta(seconds=3), timedelta(seconds=4)), deltas["Alpha"])
+		self.assertEqual((timedelta(seconds=2), timedelta(seconds=1)), deltas["Beta"])
+		self.assertEqual((None, timedelta(seconds=0.5)), deltas["Gamma"])
+		self.assertEqual((timedelta(seconds=1), None), deltas["Legacy"])
+		# Testsuites of the current report come first, followed by removed testsuites.
+		self.assertListEqual(["Alpha", "Beta", "Gamma", "Legacy"], [key for key in deltas if "::" not in key])
+
+
+def _Testcase(name: str, seconds: float) -> SimpleNamespace:
+	return SimpleNamespace(_name=name, _totalDuration=timedelta(seconds=seconds), _status=Unittesting.TestcaseStatus.Passed)
+
+
+def _Testsuite(name: str, seconds: float, testsuites=(), testcases=()) -> SimpleNamespace:
+	return SimpleNamespace(
+		_name=name, Name=name, _totalDuration=timedelta(seconds=seconds), TotalDuration=timedelta(seconds=seconds),
+		_status=Unittesting.TestsuiteStatus.Passed, _testsuites={ts._name: ts for ts in testsuites}, _testcases={tc._name: tc for tc in testcases}
+	)
+
+
+class Flamegraph(TestCase):
+	_directory: TemporaryDirectory
+	_generated: int
+
+	def setUp(self) -> None:
+		self._directory = TemporaryDirectory()
+		self._generated = 0
+
+	def tearDown(self) -> None:
+		self._directory.cleanup()
+
+	def _Directive(self, reportID: str, reportHash: str = "hash") -> UnittestFlamegraph:
+		directive = UnittestFlamegraph.__new__(UnittestFlamegraph)
+		directive._reportID = reportID
+		directive._testsuite = _Testsuite("root", 10.0, testsuites=[
+			_Testsuite("a", 6.0, testcases=[_Testcase("a1", 5.0), _Testcase("a2", 0.001), _Testcase("a3", 2.0)]),
+			_Testsuite("b", 4.0, testcases=[_Testcase("b1", 4.0)]),
+		])
+		directive._CacheDirectory = lambda: Path(self._directory.name)
+		directive._ReportHash = lambda _: reportHash
+
+		generate = directive._GenerateFlamegraphSVG
+
+		def countingGenerate() -> str:
+			self._generated += 1
+			return generate()
+
+		directive._GenerateFlamegraphSVG = countingGenerate
+		return directive
+
+	def _CacheFiles(self) -> int:
+		return len(list(Path(self._directory.name).glob("flamegraph-*.svg")))
+
+	def test_Layout(self) -> None:
+		svg = fromstring(self._Directive("demo")._GenerateFlamegraphSVG())
+		namespace = "{http://www.w3.org/2000/svg}"
+		rects = {
+			group.find(f"{namespace}title").text.split(":")[0]: group.find(f"{namespace}rect").attrib
+			for group in svg.iter(f"{namespace}g")
+		}
+
+		self.assertEqual("Testsuite runtime flame graph for demo", svg.find(f"{namespace}title").text)
+		# 'a2' is narrower than the minimum width, but still advances the next testcase's position.
+		self.assertSetEqual({"root", "a", "a1", "a3", "b", "b1"}, set(rects))
+		self.assertEqual(("0.0", "960.0"), (rects["root"]["x"], rects["root"]["width"]))
+		self.assertEqual(("0.0", "576.0", "18"), (rects["a"]["x"], rects["a"]["width"], rects["a"]["y"]))
+		self.assertEqual(("576.0", "384.0"), (rects["b"]["x"], rects["b"]["width"]))
+		self.assertEqual(("480.0", "36"), (rects["a1"]["width"], rects["a1"]["y"]))
+		# 'a3' is clipped at the right edge of its testsuite.
+		self.assertEqual(("480.1", "95.9"), (rects["a3"]["x"], rects["a3"]["width"]))
+
+	def test_MinWidth(self) -> None:
+		directive = self._Directive("demo")
+		directive._minWidth = 400.0
+
+		svg = directive._GenerateFlamegraphSVG()
+		self.assertIn("<title>a1:", svg)
+		self.assertNotIn("<title>a3:", svg)
+		self.assertNotIn("<title>b:", svg)
+		self.assertNotIn("<title>b1:", svg)
+
+	def test_Cache(self) -> None:
+		first = self._Directive("demo")._LoadOrGenerateSVG()
+		self.assertEqual(1, self._generated)
+
+		self.assertEqual(first, self._Directive("demo")._LoadOrGenerateSVG())
+		self.assertEqual(1, self._generated)
+
+		# Reportids with identical reports get charts with their own title.
+		other = self._Directive("other")._LoadOrGenerateSVG()
+		self.assertEqual(2, self._generated)
+		self.assertIn("flame graph for other", other)
+		self.assertEqual(2, self._CacheFiles())
+
+		# A changed report replaces the cached chart of this reportid.
+		self._Directive("demo", "changed")._LoadOrGenerateSVG()
+		self.assertEqual(3, self._generated)
+		self.assertEqual(2, self._CacheFiles())
+
+		with patch("sphinx_reports.__version__", "0.0.0"):
+			self._Directive("demo", "changed")._LoadOrGenerateSVG()
+		self.assertEqual(4, self._generated)
+		self.assertEqual(2, self._CacheFiles())
+
+
+class FailureDetails(TestCase):
+	def test_DeletedReport(self) -> None:
+		with TemporaryDirectory() as directory:
+			xmlFile = Path(directory) / "junit.xml"
+			xmlFile.write_text(
+				"""<testsuites><testsuite name="pkg"><testcase classname="pkg.test" name="test_bad">"""
+				"""<failure message="boom"/></testcase></testsuite></testsuites>""",
+				encoding="utf-8"
+			)
+			junitIndex = JUnitIndex(xmlFile)
+			xmlFile.unlink()
+
+		directive = UnittestFailureDetails.__new__(UnittestFailureDetails)
+		directive._output = False
+		directive._maxTestcases = 0
+		with self.assertRaises(ReportExtensionError):
+			directive._GenerateDetails(junitIndex)
+
+
+class DeletedReport(TestCase):
+	def test_Loaders(self) -> None:
+		with TemporaryDirectory() as directory:
+			xmlReport = Path(directory) / "junit.xml"
+
+		with patch.dict(UnittestBase._testSummaries, {"gone": {"xml_report": xmlReport}}):
+			for loader in (UnittestBase._LoadTestsuiteSummary, UnittestBase._LoadJUnitIndex, UnittestBase._LoadJUnitCounts, UnittestBase._ReportHash):
+				with self.subTest(loader=loader.__name__):
+					with self.assertRaises(ReportExtensionError):
+						loader("gone")